@@ -7,6 +7,7 @@ from db.models.user import UserBase
 from db.models.booking import BookingBase
 from db.models.gift import GiftBase
 from db.models.promocode import PromocodeBase
+from db.models.calendar_outbox import CalendarOutboxBase
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
@@ -0,0 +1,57 @@
+"""Add booking date indexes
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d6e7f8a9b0c1"
+down_revision: Union[str, None] = "c5d6e7f8a9b0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same predicate as BookingBase.__table_args__: active prepaid bookings
+ACTIVE_BOOKING_WHERE = {
+    "postgresql_where": sa.text(
+        "is_prepaymented = true AND is_canceled = false AND is_done = false"
+    ),
+    "sqlite_where": sa.text("is_prepaymented = 1 AND is_canceled = 0 AND is_done = 0"),
+}
+
+
+def upgrade() -> None:
+    op.create_index("ix_booking_start_date", "booking", ["start_date"], unique=False)
+    op.create_index(
+        "ix_booking_user_id_start_date",
+        "booking",
+        ["user_id", "start_date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_booking_active_start_date",
+        "booking",
+        ["start_date"],
+        unique=False,
+        **ACTIVE_BOOKING_WHERE,
+    )
+    op.create_index(
+        "ix_booking_active_end_date",
+        "booking",
+        ["end_date"],
+        unique=False,
+        **ACTIVE_BOOKING_WHERE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_booking_active_end_date", table_name="booking")
+    op.drop_index("ix_booking_active_start_date", table_name="booking")
+    op.drop_index("ix_booking_user_id_start_date", table_name="booking")
+    op.drop_index("ix_booking_start_date", table_name="booking")
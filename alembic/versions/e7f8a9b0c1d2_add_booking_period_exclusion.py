@@ -0,0 +1,70 @@
+"""Add booking period exclusion constraint
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7f8a9b0c1d2"
+down_revision: Union[str, None] = "d6e7f8a9b0c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match CLEANING_HOURS in src/config/config.py and
+# SLOT_TAKEN_CONSTRAINT in src/services/database/booking_repository.py
+CLEANING_HOURS = 2
+CONSTRAINT_NAME = "booking_period_excl"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # Adding the constraint fails on existing overlaps, so name them up front
+    conflicts = bind.execute(
+        sa.text(
+            "SELECT a.id, b.id FROM booking a JOIN booking b ON a.id < b.id "
+            "WHERE a.is_prepaymented AND NOT a.is_canceled AND NOT a.is_done "
+            "AND b.is_prepaymented AND NOT b.is_canceled AND NOT b.is_done "
+            f"AND a.start_date < b.end_date + interval '{CLEANING_HOURS} hours' "
+            f"AND b.start_date < a.end_date + interval '{CLEANING_HOURS} hours'"
+        )
+    ).fetchall()
+    if conflicts:
+        pairs = ", ".join(f"{a}/{b}" for a, b in conflicts)
+        raise RuntimeError(
+            f"Overlapping active bookings must be resolved before migrating: {pairs}"
+        )
+
+    # Booking time plus the cleaning that follows it, computed by the database
+    # so every writer (bot, web API) is covered without knowing about it
+    op.execute(
+        sa.text(
+            "ALTER TABLE booking ADD COLUMN period tsrange GENERATED ALWAYS AS "
+            f"(tsrange(start_date, end_date + interval '{CLEANING_HOURS} hours', '[)')) STORED"
+        )
+    )
+    op.execute(
+        sa.text(
+            f"ALTER TABLE booking ADD CONSTRAINT {CONSTRAINT_NAME} "
+            "EXCLUDE USING gist (period WITH &&) "
+            "WHERE (is_prepaymented AND NOT is_canceled AND NOT is_done)"
+        )
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute(sa.text(f"ALTER TABLE booking DROP CONSTRAINT {CONSTRAINT_NAME}"))
+    op.execute(sa.text("ALTER TABLE booking DROP COLUMN period"))
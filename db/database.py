@@ -7,16 +7,52 @@ from db.models.base import Base
 from db.models.user import UserBase
 from db.models.booking import BookingBase
 from db.models.gift import GiftBase
+from db.models.calendar_outbox import CalendarOutboxBase
 from sqlalchemy import create_engine
-from src.config.config import DATABASE_URL
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.config.config import DATABASE_URL, DB_ECHO
+from src.services.query_metrics_service import QueryMetricsService
+
+# Async drivers used by the bot at runtime; Alembic keeps the sync driver
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str):
+    """Convert a sync DATABASE_URL (postgresql://...) to its asyncio driver URL."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        return url
+
+    url = url.set(drivername=ASYNC_DRIVERS[backend])
+    # asyncpg does not understand libpq's sslmode, it expects ssl instead
+    if backend == "postgresql" and "sslmode" in url.query:
+        sslmode = url.query["sslmode"]
+        url = url.difference_update_query(["sslmode"]).update_query_dict(
+            {"ssl": sslmode}
+        )
+    return url
+
 
 engine = create_engine(
     DATABASE_URL,
-    echo=True,
+    echo=DB_ECHO,
     pool_pre_ping=True,    # test connection before use, discard stale ones
     pool_recycle=1800,     # recycle connections older than 30 min
 )
 
+async_engine = create_async_engine(
+    get_async_database_url(DATABASE_URL),
+    echo=DB_ECHO,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
+QueryMetricsService().instrument(async_engine.sync_engine)
+
 
 def create_db_and_tables() -> None:
     # Base.metadata.create_all(engine)  # Disabled: using Alembic migrations instead
@@ -6,15 +6,33 @@ from db.models.decorator.type_decorator import IntEnumType
 from src.models.enum.tariff import Tariff
 from datetime import datetime
 from db.models.base import Base
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import relationship
 from src.config.config import PREPAYMENT
 
+# Predicate of the partial indexes, written the way SQLAlchemy renders
+# `is_canceled == False` on each dialect so the planners can match it
+ACTIVE_BOOKING_WHERE = {
+    "postgresql_where": text(
+        "is_prepaymented = true AND is_canceled = false AND is_done = false"
+    ),
+    "sqlite_where": text("is_prepaymented = 1 AND is_canceled = 0 AND is_done = 0"),
+}
+
 
 class BookingBase(Base):
     __tablename__ = "booking"
+    __table_args__ = (
+        Index("ix_booking_start_date", "start_date"),
+        Index("ix_booking_user_id_start_date", "user_id", "start_date"),
+        Index("ix_booking_active_start_date", "start_date", **ACTIVE_BOOKING_WHERE),
+        Index("ix_booking_active_end_date", "end_date", **ACTIVE_BOOKING_WHERE),
+    )
+    # PostgreSQL also has a generated `period` tsrange column (booking plus
+    # cleaning time) with the booking_period_excl exclusion constraint over
+    # active bookings; both live only in migration e7f8a9b0c1d2.
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("user.id"), nullable=False)
     start_date: Mapped[datetime] = mapped_column(DateTime, unique=False, nullable=False)
@@ -45,7 +63,7 @@ class BookingBase(Base):
     source: Mapped[str | None] = mapped_column(String, nullable=True)  # "web" | "telegram"
     user = relationship("UserBase")
     gift = relationship("GiftBase")
-    promocode = relationship("PromocodeBase")
+    promocode = relationship("PromocodeBase", lazy="joined")
 
     def __repr__(self) -> str:
         return f"BookingBase(id={self.id}, user={self.user_id}, tariff={self.tariff}, start_date={self.start_date}, end_date={self.end_date})"
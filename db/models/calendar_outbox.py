@@ -0,0 +1,31 @@
+import sys
+import os
+from datetime import datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from db.models.base import Base
+from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class CalendarOutboxBase(Base):
+    __tablename__ = "calendar_outbox"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    booking_id: Mapped[int] = mapped_column(ForeignKey("booking.id"), nullable=False)
+    action: Mapped[str] = mapped_column(String(16), nullable=False)  # CalendarAction value
+    status: Mapped[str] = mapped_column(
+        String(16), nullable=False, default="pending", index=True
+    )  # "pending" | "done" | "failed"
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Bumped when a later change is merged into this entry
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.now
+    )
+    last_error: Mapped[str | None] = mapped_column(String, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"CalendarOutboxBase(id={self.id}, booking={self.booking_id}, action={self.action}, status={self.status})"
@@ -0,0 +1,79 @@
+import os
+import sys
+import tempfile
+from dataclasses import dataclass
+from typing import IO, Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from aiohttp import BodyPartReader, web
+
+from src.config.config import RECEIPT_MAX_BYTES, RECEIPT_SPOOL_BYTES
+
+CHUNK_SIZE = 64 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """The uploaded file is larger than the allowed size."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Upload exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+@dataclass
+class ReceiptUpload:
+    """Fields of a receipt form; file is positioned at its start."""
+
+    booking_id: Optional[str] = None
+    file: Optional[IO[bytes]] = None
+    filename: str = "receipt"
+    content_type: str = ""
+    size: int = 0
+
+    @property
+    def is_image(self) -> bool:
+        return "image" in self.content_type
+
+    def close(self):
+        if self.file:
+            self.file.close()
+
+
+async def read_receipt_upload(
+    request: web.Request,
+    max_bytes: int = RECEIPT_MAX_BYTES,
+    spool_bytes: int = RECEIPT_SPOOL_BYTES,
+) -> ReceiptUpload:
+    """
+    Read a multipart receipt form chunk by chunk.
+
+    The file goes into a SpooledTemporaryFile, so small receipts stay in
+    memory and larger ones are written to disk instead of being buffered
+    whole. Raises UploadTooLargeError as soon as the file passes max_bytes.
+    """
+    if request.content_length and request.content_length > max_bytes + CHUNK_SIZE:
+        raise UploadTooLargeError(max_bytes)
+
+    upload = ReceiptUpload()
+    reader = await request.multipart()
+    try:
+        async for part in reader:
+            if not isinstance(part, BodyPartReader):
+                continue
+            if part.name == "booking_id":
+                upload.booking_id = (await part.text()).strip()
+            elif part.name == "file" and part.filename and not upload.file:
+                upload.file = tempfile.SpooledTemporaryFile(max_size=spool_bytes)
+                upload.filename = part.filename
+                upload.content_type = part.headers.get("Content-Type", "")
+                while chunk := await part.read_chunk(CHUNK_SIZE):
+                    upload.size += len(chunk)
+                    if upload.size > max_bytes:
+                        raise UploadTooLargeError(max_bytes)
+                    upload.file.write(chunk)
+                upload.file.seek(0)
+    except Exception:
+        upload.close()
+        raise
+    return upload
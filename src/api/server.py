@@ -1,112 +1,150 @@
-import asyncio
-import io
 import os
 import sys
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
-from flask import Flask, jsonify, request
+from aiohttp import web
 from telegram import Bot
 
-from src.config.config import ADMIN_CHAT_ID, TELEGRAM_TOKEN
+from src.api.receipt_upload import ReceiptUpload, UploadTooLargeError, read_receipt_upload
+from src.config.config import ADMIN_CHAT_ID
 from src.handlers.admin_handler import _create_booking_keyboard
 from src.helpers.string_helper import generate_booking_info_message
 from src.services.database.booking_repository import BookingRepository
+from src.services.availability_service import AvailabilityService
+from src.services.logger_service import LoggerService
+from src.services.metrics_service import MetricsService
 
-flask_app = Flask(__name__)
+# Served on the bot's event loop and sending through application.bot, so
+# requests share its HTTP session and rate limiter and the async DB engine
+BOT_KEY = web.AppKey("bot", Bot)
 
+_runner: web.AppRunner | None = None
 
-def _run_async(coro):
-    return asyncio.run(coro)
 
-
-def _get_booking_and_chat_id(booking_id: int):
-    repo = BookingRepository()
-    booking = repo.get_booking_by_id(booking_id)
+async def _get_booking_and_chat_id(booking_id: int):
+    booking = await BookingRepository().get_booking_by_id(booking_id)
     if not booking:
         return None, None
     user_chat_id = (booking.user.chat_id or 0) if booking.user else 0
     return booking, user_chat_id
 
 
-@flask_app.route("/api/receipt", methods=["POST"])
-def receipt():
-    booking_id = request.form.get("booking_id")
-    file = request.files.get("file")
+async def receipt(request: web.Request) -> web.Response:
+    try:
+        upload = await read_receipt_upload(request)
+    except UploadTooLargeError as e:
+        return web.json_response({"error": "File too large", "max_bytes": e.max_bytes}, status=413)
+
+    try:
+        return await _send_receipt(request.app[BOT_KEY], upload)
+    finally:
+        upload.close()
+
 
-    if not booking_id or not file:
-        return jsonify({"error": "Missing booking_id or file"}), 400
+async def _send_receipt(bot: Bot, upload: ReceiptUpload) -> web.Response:
+    if not upload.booking_id or not upload.file:
+        return web.json_response({"error": "Missing booking_id or file"}, status=400)
 
-    booking, user_chat_id = _get_booking_and_chat_id(int(booking_id))
+    booking, user_chat_id = await _get_booking_and_chat_id(int(upload.booking_id))
     if not booking:
-        return jsonify({"error": "Booking not found"}), 404
+        return web.json_response({"error": "Booking not found"}, status=404)
 
     caption = generate_booking_info_message(booking, booking.user)
     reply_markup = _create_booking_keyboard(user_chat_id, booking.id, is_payment_by_cash=False)
 
-    file_data = file.read()
-    content_type = file.content_type or ""
-    filename = file.filename or "receipt"
-
-    async def send():
-        async with Bot(TELEGRAM_TOKEN) as bot:
-            if "image" in content_type:
-                msg = await bot.send_photo(
-                    chat_id=ADMIN_CHAT_ID,
-                    photo=io.BytesIO(file_data),
-                    caption=caption,
-                    reply_markup=reply_markup,
-                )
-                return msg.photo[-1].file_id
-            else:
-                msg = await bot.send_document(
-                    chat_id=ADMIN_CHAT_ID,
-                    document=io.BytesIO(file_data),
-                    filename=filename,
-                    caption=caption,
-                    reply_markup=reply_markup,
-                )
-                return msg.document.file_id
-
     try:
-        file_id = _run_async(send())
+        if upload.is_image:
+            msg = await bot.send_photo(
+                chat_id=ADMIN_CHAT_ID,
+                photo=upload.file,
+                filename=upload.filename,
+                caption=caption,
+                reply_markup=reply_markup,
+            )
+            file_id = msg.photo[-1].file_id
+        else:
+            msg = await bot.send_document(
+                chat_id=ADMIN_CHAT_ID,
+                document=upload.file,
+                filename=upload.filename,
+                caption=caption,
+                reply_markup=reply_markup,
+            )
+            file_id = msg.document.file_id
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        LoggerService.error(__name__, "receipt", e, **{"booking_id": upload.booking_id})
+        return web.json_response({"error": str(e)}, status=500)
 
-    return jsonify({"file_id": file_id})
+    await BookingRepository().update_booking(booking.id, receipt_file_id=file_id)
+    return web.json_response({"file_id": file_id})
 
 
-@flask_app.route("/api/new-booking", methods=["POST"])
-def new_booking():
-    data = request.get_json(silent=True) or {}
-    booking_id = data.get("booking_id")
+async def new_booking(request: web.Request) -> web.Response:
+    try:
+        data = await request.json()
+    except ValueError:
+        data = {}
+    booking_id = data.get("booking_id") if isinstance(data, dict) else None
 
     if not booking_id:
-        return jsonify({"error": "Missing booking_id"}), 400
+        return web.json_response({"error": "Missing booking_id"}, status=400)
 
-    booking, user_chat_id = _get_booking_and_chat_id(int(booking_id))
+    booking, user_chat_id = await _get_booking_and_chat_id(int(booking_id))
     if not booking:
-        return jsonify({"error": "Booking not found"}), 404
+        return web.json_response({"error": "Booking not found"}, status=404)
+
+    # Web bookings bypass BookingRepository writes, so refresh the index here
+    AvailabilityService().apply_booking(booking)
 
     text = f"🆕 Новое бронирование #{booking_id}\n\n"
     text += generate_booking_info_message(booking, booking.user)
     reply_markup = _create_booking_keyboard(user_chat_id, booking.id, is_payment_by_cash=False)
 
-    async def send():
-        async with Bot(TELEGRAM_TOKEN) as bot:
-            await bot.send_message(
-                chat_id=ADMIN_CHAT_ID,
-                text=text,
-                reply_markup=reply_markup,
-            )
-
     try:
-        _run_async(send())
+        await request.app[BOT_KEY].send_message(
+            chat_id=ADMIN_CHAT_ID,
+            text=text,
+            reply_markup=reply_markup,
+        )
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-    return jsonify({"ok": True})
-
-
-def run(host: str = "0.0.0.0", port: int = 8080):
-    flask_app.run(host=host, port=port, use_reloader=False)
+        LoggerService.error(__name__, "new_booking", e, **{"booking_id": booking_id})
+        return web.json_response({"error": str(e)}, status=500)
+
+    return web.json_response({"ok": True})
+
+
+async def metrics(request: web.Request) -> web.Response:
+    return web.Response(
+        body=MetricsService().render().encode("utf-8"),
+        headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+    )
+
+
+def create_app(bot: Bot) -> web.Application:
+    app = web.Application()
+    app[BOT_KEY] = bot
+    app.add_routes(
+        [
+            web.post("/api/receipt", receipt),
+            web.post("/api/new-booking", new_booking),
+            web.get("/metrics", metrics),
+        ]
+    )
+    return app
+
+
+async def start(bot: Bot, host: str = "0.0.0.0", port: int = 8080):
+    """Serve the API on the running event loop."""
+    global _runner
+    _runner = web.AppRunner(create_app(bot))
+    await _runner.setup()
+    await web.TCPSite(_runner, host, port).start()
+    LoggerService.info(__name__, f"HTTP server started on port {port}")
+
+
+async def stop():
+    global _runner
+    if _runner:
+        await _runner.cleanup()
+        _runner = None
@@ -4,6 +4,8 @@ from datetime import datetime, date, timedelta
 from src.helpers import string_helper, date_time_helper
 from src.constants import CALENDAR_CALLBACK, ACTION, IGNORE
 import calendar
+from functools import lru_cache
+from typing import Optional
 
 
 def create_callback_data(action, year, month, day, prefix: str):
@@ -15,6 +17,11 @@ def create_callback_data(action, year, month, day, prefix: str):
     )
 
 
+# Keyboards are immutable, so one built for a month, its availability and
+# its limits is reused for every user and every PREV/NEXT click
+KEYBOARD_CACHE_SIZE = 256
+
+
 def create_calendar(
     selected_date: date = None,
     min_date: date = None,
@@ -26,6 +33,42 @@ def create_calendar(
     if selected_date == None:
         selected_date = date.now()
 
+    return _build_calendar(
+        selected_date.year,
+        selected_date.month,
+        callback_prefix,
+        get_available_mask(selected_date.year, selected_date.month, available_days),
+        min_date,
+        max_date,
+        action_text,
+    )
+
+
+def get_available_mask(year: int, month: int, available_days) -> Optional[int]:
+    """Bit (day - 1) is set for each available day; None when every day is shown."""
+    if available_days is None:
+        return None
+
+    available = set(available_days)
+    mask = 0
+    for day in range(1, calendar.monthrange(year, month)[1] + 1):
+        if date(year, month, day) in available:
+            mask |= 1 << (day - 1)
+    return mask
+
+
+@lru_cache(maxsize=KEYBOARD_CACHE_SIZE)
+def _build_calendar(
+    year: int,
+    month: int,
+    callback_prefix: str,
+    available_mask: Optional[int],
+    min_date: date,
+    max_date: date,
+    action_text: str,
+) -> InlineKeyboardMarkup:
+    selected_date = date(year, month, 1)
+
     data_ignore = create_callback_data(
         str(IGNORE), selected_date.year, selected_date.month, 0, callback_prefix
     )
@@ -62,10 +105,9 @@ def create_calendar(
             ):
                 # Day is before minimum date
                 row.append(InlineKeyboardButton(" ", callback_data=data_ignore))
-            elif available_days is not None:
-                # Check if day is in available days list
-                current_date = date(selected_date.year, selected_date.month, day)
-                if current_date in available_days:
+            elif available_mask is not None:
+                # Check if day is in available days
+                if available_mask >> (day - 1) & 1:
                     row.append(
                         InlineKeyboardButton(
                             str(day),
@@ -82,7 +124,7 @@ def create_calendar(
                     # Day is not available - show as disabled
                     row.append(InlineKeyboardButton("⛔", callback_data=data_ignore))
             else:
-                # No available_days list provided - show all days
+                # No available days provided - show all days
                 row.append(
                     InlineKeyboardButton(
                         str(day),
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from datetime import datetime, time, timedelta
 from src.helpers import string_helper
@@ -19,71 +20,77 @@ def create_callback_data(action, time: time, prefix: str):
 from datetime import time
 
 
+# Same reuse as calendar_picker: keyboards are immutable
+KEYBOARD_CACHE_SIZE = 256
+
+
 def create_hours_picker(date=None, free_slots=None, action_text="", callback_prefix=""):
     hour = 0
     now = datetime.now()
     if date == now.date():
         hour = now.hour + 1
 
-    keyboard = []
-    row = []
+    available_mask = None
+    # If free_slots is provided, mark which slots are available
+    if free_slots is not None:
+        available_times = get_available_times(free_slots, hour)
+        available_mask = 0
+        for i, time_slot in enumerate(get_time_slots(hour)):
+            if time_slot in available_times:
+                available_mask |= 1 << i
+
+    return _build_hours_picker(hour, available_mask, action_text, callback_prefix)
 
-    # Create all time slots from current hour to 23:59
+
+def get_time_slots(hour: int) -> list:
+    """All time slots from hour to 23:59."""
     all_time_slots = [time(h, 0) for h in range(hour, 24)]
     all_time_slots.append(time(23, 59))
+    return all_time_slots
+
+
+def get_available_times(free_slots, hour: int) -> set:
+    """Hourly times inside free_slots from hour on, plus each slot end."""
+    available_times = set()
+    for slot in free_slots:
+        start_time, end_time = slot
+        current_time = start_time
+        while current_time <= end_time:
+            if current_time.hour >= hour:
+                available_times.add(current_time)
+            next_time = (
+                datetime.combine(datetime.min, current_time) + timedelta(hours=1)
+            ).time()
+            if next_time <= current_time:
+                break
+            current_time = next_time
+
+        if current_time != end_time and end_time not in available_times:
+            available_times.add(end_time)
+    return available_times
+
+
+@lru_cache(maxsize=KEYBOARD_CACHE_SIZE)
+def _build_hours_picker(hour, available_mask, action_text, callback_prefix):
+    keyboard = []
+    row = []
 
-    # If free_slots is provided, mark which slots are available
-    if free_slots is not None:
-        # Convert free_slots to a set of available times for quick lookup
-        available_times = set()
-        for slot in free_slots:
-            start_time, end_time = slot
-            current_time = start_time
-            while current_time <= end_time:
-                if current_time.hour >= hour:
-                    available_times.add(current_time)
-                next_time = (
-                    datetime.combine(now.date(), current_time) + timedelta(hours=1)
-                ).time()
-                if next_time <= current_time:
-                    break
-                current_time = next_time
-
-            if current_time != end_time and end_time not in available_times:
-                available_times.add(end_time)
-
-        # Create buttons for each time slot
-        for i in range(0, len(all_time_slots)):
-            time_slot = all_time_slots[i]
-            time_str = time_slot.strftime("%H:%M")
+    all_time_slots = get_time_slots(hour)
+    for i in range(0, len(all_time_slots)):
+        time_slot = all_time_slots[i]
+        time_str = time_slot.strftime("%H:%M")
 
-            if time_slot in available_times:
-                # Available slot - create clickable button
-                callback_data = create_callback_data(
-                    str(HOURS), time_slot, callback_prefix
-                )
-                row.append(InlineKeyboardButton(time_str, callback_data=callback_data))
-            else:
-                # Occupied slot - show shorter text to avoid truncation
-                row.append(
-                    InlineKeyboardButton(f"⛔ {time_str}", callback_data="occupied")
-                )
-
-            if len(row) == 4:
-                keyboard.append(row)
-                row = []
-    else:
-        # No free_slots provided - show all slots as available
-        for i in range(0, len(all_time_slots)):
-            time_str = all_time_slots[i].strftime("%H:%M")
-            callback_data = create_callback_data(
-                str(HOURS), all_time_slots[i], callback_prefix
-            )
+        if available_mask is None or available_mask >> i & 1:
+            # Available slot - create clickable button
+            callback_data = create_callback_data(str(HOURS), time_slot, callback_prefix)
             row.append(InlineKeyboardButton(time_str, callback_data=callback_data))
+        else:
+            # Occupied slot - show shorter text to avoid truncation
+            row.append(InlineKeyboardButton(f"⛔ {time_str}", callback_data="occupied"))
 
-            if len(row) == 4:
-                keyboard.append(row)
-                row = []
+        if len(row) == 4:
+            keyboard.append(row)
+            row = []
 
     if row:
         keyboard.append(row)
@@ -3,6 +3,8 @@ from telegram import Update
 from telegram.ext import ContextTypes
 from telegram.error import BadRequest
 from src.services.logger_service import LoggerService
+from src.services.metrics_service import MetricsService
+from src.services.query_metrics_service import QueryMetricsService
 
 
 def safe_callback_query(recovery_function=None):
@@ -22,8 +24,11 @@ def safe_callback_query(recovery_function=None):
     def decorator(handler_func):
         @wraps(handler_func)
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+            handler_name = f"{handler_func.__module__}.{handler_func.__name__}"
+            QueryMetricsService().set_handler(handler_name)
             try:
-                return await handler_func(update, context, *args, **kwargs)
+                with MetricsService().handler_duration.time(handler_name):
+                    return await handler_func(update, context, *args, **kwargs)
             except BadRequest as e:
                 error_msg = str(e).lower()
 
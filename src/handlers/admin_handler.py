@@ -8,7 +8,7 @@ from src.decorators.callback_error_handler import safe_callback_query
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from src.services.navigation_service import NavigationService
 from src.services.settings_service import SettingsService
-from src.services.file_service import FileService
+from src.services.media_cache_service import MediaCacheService
 from src.services.calculation_rate_service import CalculationRateService
 from db.models.gift import GiftBase
 from matplotlib.dates import relativedelta
@@ -24,10 +24,13 @@ from src.constants import (
     CREATE_PROMO_DISCOUNT,
     CREATE_PROMO_TARIFF,
 )
-from src.services.calendar_service import CalendarService
+from src.services.calendar_sync_service import CalendarSyncService
+from src.services.broadcast_service import BroadcastService
+from src.models.enum.calendar_action import CalendarAction
 from db.models.user import UserBase
 from db.models.booking import BookingBase
 from src.services.database_service import DatabaseService
+from src.services.database import SlotTakenError
 from src.models.enum.tariff import Tariff
 from src.config.config import (
     ADMIN_CHAT_ID,
@@ -50,9 +53,10 @@ from telegram.ext import (
 from src.helpers import string_helper, tariff_helper
 
 database_service = DatabaseService()
-calendar_service = CalendarService()
+calendar_sync_service = CalendarSyncService()
+broadcast_service = BroadcastService()
 calculation_rate_service = CalculationRateService()
-file_service = FileService()
+media_cache_service = MediaCacheService()
 settings_service = SettingsService()
 navigation_service = NavigationService()
 
@@ -278,39 +282,26 @@ async def cancel_password_change(update: Update, context: ContextTypes.DEFAULT_T
     return END
 
 
-def _get_booking_list_data():
+async def _get_booking_list_data():
     """Get booking list data (bookings, keyboard, message) - shared logic"""
-    # Get future bookings
-    future_bookings = get_future_bookings()
-    
-    # Get unpaid bookings (waiting for admin confirmation)
-    unpaid_bookings = database_service.get_unpaid_bookings()
-    
-    # Combine and deduplicate by booking ID
-    all_bookings_dict = {}
-    for booking in future_bookings:
-        all_bookings_dict[booking.id] = booking
-    for booking in unpaid_bookings:
-        all_bookings_dict[booking.id] = booking
-    
-    bookings = list(all_bookings_dict.values())
-    
-    # Sort by start_date
-    bookings.sort(key=lambda b: b.start_date)
+    # Future bookings and unpaid ones (waiting for admin confirmation),
+    # deduplicated and sorted by start_date in the query.
+    # Telegram limit: max 100 buttons
+    today = date.today()
+    bookings = await database_service.get_admin_booking_list(
+        today, today + relativedelta(months=PERIOD_IN_MONTHS), limit=100
+    )
 
     if not bookings:
         return None, None, None
 
-    # Telegram limit: max 100 buttons
-    bookings = bookings[:100]
-
     # Create inline keyboard (max 8 buttons per row, 1 per row for readability)
     keyboard = []
     for booking in bookings:
         label = string_helper.format_booking_button_label(booking)
-        user = database_service.get_user_by_id(booking.user_id)
-        # Add user contact to button for context
+        # Add user contact to button for context (user is loaded with the booking)
         # Handle case when user is None
+        user = booking.user
         user_contact = user.contact if user and user.contact else "N/A"
         # Add emoji for canceled bookings
         cancel_emoji = "❌ " if booking.is_canceled else ""
@@ -341,7 +332,7 @@ async def get_booking_list(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("⛔ Эта команда не доступна в этом чате.")
         return END
 
-    bookings, reply_markup, message = _get_booking_list_data()
+    bookings, reply_markup, message = await _get_booking_list_data()
 
     if not bookings:
         await update.message.reply_text("🔍 Не найдено активных бронирований.")
@@ -362,7 +353,7 @@ async def back_to_booking_list(update: Update, context: ContextTypes.DEFAULT_TYP
     """Return to booking list from detail view"""
     await update.callback_query.answer()
 
-    bookings, reply_markup, message = _get_booking_list_data()
+    bookings, reply_markup, message = await _get_booking_list_data()
 
     if not bookings:
         await update.callback_query.edit_message_text("🔍 Не найдено активных бронирований.")
@@ -394,7 +385,7 @@ async def get_statistics(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
         # Get statistics
         stats_service = StatisticsService()
-        stats = stats_service.get_complete_statistics()
+        stats = await stats_service.get_complete_statistics()
 
         # Format message
         message = format_statistics_message(stats)
@@ -452,13 +443,13 @@ async def _start_broadcast_with_filter(
 
     # Get chat IDs based on filter
     if filter_type == "all":
-        chat_ids = database_service.get_all_user_chat_ids()
+        chat_ids = await database_service.get_all_user_chat_ids()
         filter_label = "всем пользователям"
     elif filter_type == "with_bookings":
-        chat_ids = database_service.get_user_chat_ids_with_bookings()
+        chat_ids = await database_service.get_user_chat_ids_with_bookings()
         filter_label = "пользователям С бронями"
     elif filter_type == "without_bookings":
-        chat_ids = database_service.get_user_chat_ids_without_bookings()
+        chat_ids = await database_service.get_user_chat_ids_without_bookings()
         filter_label = "пользователям БЕЗ броней"
     else:
         await update.message.reply_text("❌ Неверный тип фильтра.")
@@ -484,7 +475,7 @@ async def _start_broadcast_with_filter(
         f"📢 <b>Рассылка сообщений</b>\n\n"
         f"🎯 Аудитория: <b>{filter_label}</b>\n"
         f"👥 Количество получателей: <b>{total_users}</b>\n"
-        f"⏱ Примерное время: <b>~{total_users} секунд</b>\n\n"
+        f"⏱ Примерное время: <b>~{_get_broadcast_seconds(chat_ids)} секунд</b>\n\n"
         f"✏️ Введите текст сообщения для рассылки:"
     )
 
@@ -519,7 +510,7 @@ async def handle_broadcast_input(update: Update, context: ContextTypes.DEFAULT_T
 
     # Fallback: if no chat_ids in context, get all users
     if not chat_ids:
-        chat_ids = database_service.get_all_user_chat_ids()
+        chat_ids = await database_service.get_all_user_chat_ids()
         filter_type = "all"
 
     # Get filter label for confirmation message
@@ -536,24 +527,12 @@ async def handle_broadcast_input(update: Update, context: ContextTypes.DEFAULT_T
     await update.message.reply_text(
         f"✅ Начинаю рассылку ({filter_label})\n"
         f"👥 Количество: {len(chat_ids)} пользователей\n"
-        f"📤 Это займет примерно {len(chat_ids)} секунд."
+        f"📤 Это займет примерно {_get_broadcast_seconds(chat_ids)} секунд."
     )
 
-    # Execute broadcast with rate limiting
-    result = await execute_broadcast(context, chat_ids, message_text)
-
-    # Send completion summary
-    summary = (
-        f"✅ <b>Рассылка завершена!</b>\n\n"
-        f"📊 Статистика:\n"
-        f"• Всего пользователей: {result['total_users']}\n"
-        f"• Успешно отправлено: {result['sent']}\n"
-        f"• Не доставлено: {result['failed']}\n"
-        f"• Время выполнения: {result['duration_seconds']:.1f} сек"
-    )
-
-    await context.bot.send_message(
-        chat_id=ADMIN_CHAT_ID, text=summary, parse_mode="HTML"
+    # Runs in background, progress and summary are shown in one edited message
+    context.application.create_task(
+        execute_broadcast(context, chat_ids, message_text), update=update
     )
 
     # Clear context
@@ -582,59 +561,23 @@ async def execute_broadcast(
     context: ContextTypes.DEFAULT_TYPE, chat_ids: list[int], message: str
 ) -> dict:
     """
-    Execute broadcast with rate limiting and error handling
+    Execute broadcast through BroadcastService
 
-    Rate limiting strategy:
-    - 1 message per second per chat (Telegram limit)
-    - ~30 messages per second globally (free tier)
-    - Use 1.1 second delay to stay safe (~27 msg/sec)
+    Sends concurrently under a global token bucket (below Telegram's ~30 msg/s),
+    keeps progress in Redis so a restart resumes it and edits a single progress
+    message in the admin chat, which ends up holding the summary.
     """
-    import time
-
-    start_time = time.time()
-    total_users = len(chat_ids)
-    sent_count = 0
-    failed_count = 0
-
-    for index, chat_id in enumerate(chat_ids):
-        try:
-            # CRITICAL: Rate limiting - 1 msg/sec per chat
-            # Use asyncio.sleep() for non-blocking delay
-            await context.bot.send_message(
-                chat_id=chat_id, text=message, parse_mode="HTML"
-            )
-            sent_count += 1
-
-            # Progress update every 10 users
-            if (index + 1) % 10 == 0:
-                await context.bot.send_message(
-                    chat_id=ADMIN_CHAT_ID,
-                    text=f"📤 Прогресс: {index + 1}/{total_users} ({sent_count} отправлено, {failed_count} ошибок)",
-                )
-
-            # CRITICAL: Rate limit delay
-            # 1.1 seconds = safe rate (~0.9 msg/sec per chat, ~27 msg/sec globally)
-            await asyncio.sleep(1.1)
-
-        except Exception as e:
-            # Handle common errors: bot blocked, chat deleted
-            failed_count += 1
-            error_str = str(e)
-
-            # Only log unexpected errors (not blocks/deletions)
-            if "Forbidden" not in error_str and "Chat not found" not in error_str:
-                LoggerService.error(
-                    __name__, f"Broadcast error for chat {chat_id}", exception=e
-                )
+    result = await broadcast_service.start(context.bot, chat_ids, message)
+    if result is None:
+        await context.bot.send_message(
+            chat_id=ADMIN_CHAT_ID,
+            text="⏳ Предыдущая рассылка ещё не завершена. Попробуйте позже.",
+        )
+    return result
 
-    duration = time.time() - start_time
 
-    return {
-        "total_users": total_users,
-        "sent": sent_count,
-        "failed": failed_count,
-        "duration_seconds": duration,
-    }
+def _get_broadcast_seconds(chat_ids: list[int]) -> int:
+    return max(1, round(len(chat_ids) / broadcast_service.messages_per_second))
 
 
 def _create_booking_keyboard(
@@ -708,7 +651,7 @@ async def accept_booking_payment(
     document,
     is_payment_by_cash=False,
 ):
-    user = database_service.get_user_by_id(booking.user_id)
+    user = await database_service.get_user_by_id(booking.user_id)
     message = string_helper.generate_booking_info_message(
         booking, user, is_payment_by_cash
     )
@@ -743,8 +686,8 @@ async def edit_accept_booking_payment(
     user_chat_id: int,
     is_payment_by_cash,
 ):
-    booking = database_service.get_booking_by_id(booking_id)
-    user = database_service.get_user_by_id(booking.user_id)
+    booking = await database_service.get_booking_by_id(booking_id)
+    user = booking.user
     message = string_helper.generate_booking_info_message(
         booking, user, is_payment_by_cash
     )
@@ -796,7 +739,7 @@ async def accept_gift_payment(
 async def inform_cancel_booking(
     update: Update, context: ContextTypes.DEFAULT_TYPE, booking: BookingBase
 ):
-    user = database_service.get_user_by_id(booking.user_id)
+    user = await database_service.get_user_by_id(booking.user_id)
     message = (
         f"Отмена бронирования!\n"
         f"Контакт клиента: {user.contact}\n"
@@ -812,7 +755,7 @@ async def inform_changing_booking_date(
     booking: BookingBase,
     old_start_date: date,
 ):
-    user = database_service.get_user_by_id(booking.user_id)
+    user = await database_service.get_user_by_id(booking.user_id)
     message = (
         f"Отмена бронирования!\n"
         f"Контакт клиента: {user.contact}\n"
@@ -883,7 +826,7 @@ async def request_price_input(
         update.callback_query.message.message_id
     )
 
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     keyboard = [[InlineKeyboardButton("Отмена", callback_data="cancel_price_input")]]
     reply_markup = InlineKeyboardMarkup(keyboard)
 
@@ -905,8 +848,8 @@ async def _update_booking_message(
     message_id: int,
 ):
     """Helper function to update booking message with new data"""
-    booking = database_service.get_booking_by_id(booking_id)
-    user = database_service.get_user_by_id(booking.user_id)
+    booking = await database_service.get_booking_by_id(booking_id)
+    user = booking.user
 
     message_text = string_helper.generate_booking_info_message(
         booking, user, is_payment_by_cash
@@ -961,7 +904,7 @@ async def handle_price_input(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return ENTER_PRICE
 
     # Update booking
-    database_service.update_booking(booking_id, price=new_price)
+    await database_service.update_booking(booking_id, price=new_price)
     await update.message.reply_text(f"✅ Стоимость изменена на {new_price} руб.")
 
     # Update original message
@@ -988,7 +931,7 @@ async def cancel_price_input(update: Update, context: ContextTypes.DEFAULT_TYPE)
     is_payment_by_cash = context.user_data.get("price_edit_is_payment_by_cash")
 
     if booking_id:
-        booking = database_service.get_booking_by_id(booking_id)
+        booking = await database_service.get_booking_by_id(booking_id)
         await accept_booking_payment(
             update, context, booking, user_chat_id, None, None, is_payment_by_cash
         )
@@ -1014,7 +957,7 @@ async def request_prepayment_input(
         update.callback_query.message.message_id
     )
 
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     keyboard = [
         [InlineKeyboardButton("Отмена", callback_data="cancel_prepayment_input")]
     ]
@@ -1056,7 +999,7 @@ async def handle_prepayment_input(update: Update, context: ContextTypes.DEFAULT_
         return ENTER_PREPAYMENT
 
     # Update booking
-    database_service.update_booking(booking_id, prepayment=new_prepayment)
+    await database_service.update_booking(booking_id, prepayment=new_prepayment)
     await update.message.reply_text(f"✅ Предоплата изменена на {new_prepayment} руб.")
 
     # Update original message
@@ -1083,7 +1026,7 @@ async def cancel_prepayment_input(update: Update, context: ContextTypes.DEFAULT_
     is_payment_by_cash = context.user_data.get("prepay_edit_is_payment_by_cash")
 
     if booking_id:
-        booking = database_service.get_booking_by_id(booking_id)
+        booking = await database_service.get_booking_by_id(booking_id)
         await accept_booking_payment(
             update, context, booking, user_chat_id, None, None, is_payment_by_cash
         )
@@ -1097,6 +1040,8 @@ async def approve_booking(
     update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, booking_id: int
 ):
     (booking, user) = await prepare_approve_process(update, context, booking_id)
+    if not booking:
+        return END
     await check_and_send_booking(context, booking)
     # Prepare confirmation message
     confirmation_text = (
@@ -1139,7 +1084,7 @@ async def approve_booking(
 async def cancel_booking(
     update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, booking_id: int
 ):
-    booking = database_service.update_booking(booking_id, is_canceled=True)
+    booking = await database_service.update_booking(booking_id, is_canceled=True)
     if chat_id:
         try:
             await context.bot.send_message(
@@ -1151,7 +1096,7 @@ async def cancel_booking(
             )
         except Exception:
             pass
-    user = database_service.get_user_by_id(booking.user_id)
+    user = booking.user
 
     text = f"Отмена.\n\n {string_helper.generate_booking_info_message(booking, user)}"
     message = update.callback_query.message
@@ -1165,7 +1110,7 @@ async def cancel_booking(
 async def approve_gift(
     update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, gift_id: int
 ):
-    gift = database_service.update_gift(gift_id, is_paymented=True, is_done=True)
+    gift = await database_service.update_gift(gift_id, is_paymented=True, is_done=True)
     await context.bot.send_message(chat_id=chat_id, text=f"{gift.code}")
 
     await context.bot.send_message(
@@ -1185,7 +1130,7 @@ async def approve_gift(
 async def cancel_gift(
     update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, gift_id: int
 ):
-    gift = database_service.get_gift_by_id(gift_id)
+    gift = await database_service.get_gift_by_id(gift_id)
     await context.bot.send_message(
         chat_id=chat_id,
         text="⚠️ <b>Внимание!</b> ⚠️\n"
@@ -1199,26 +1144,38 @@ async def cancel_gift(
     return END
 
 
-def get_future_bookings() -> Sequence[BookingBase]:
+async def get_future_bookings() -> Sequence[BookingBase]:
     today = date.today()
     max_date_booking = today + relativedelta(months=PERIOD_IN_MONTHS)
-    booking_list = database_service.get_booking_by_start_date_period(today, max_date_booking, True)
+    booking_list = await database_service.get_booking_by_start_date_period(today, max_date_booking, True)
     return booking_list
 
 
 async def prepare_approve_process(
     update: Update, context: ContextTypes.DEFAULT_TYPE, booking_id: int
 ):
-    booking = database_service.get_booking_by_id(booking_id)
-    user = database_service.get_user_by_id(booking.user_id)
-    calendar_event_id = calendar_service.add_event(booking, user)
+    booking = await database_service.get_booking_by_id(booking_id)
+    user = booking.user
     price = booking.price
-    booking = database_service.update_booking(
-        booking_id,
-        price=price,
-        is_prepaymented=True,
-        calendar_event_id=calendar_event_id,
-    )
+    try:
+        booking = await database_service.update_booking(
+            booking_id,
+            price=price,
+            is_prepaymented=True,
+        )
+    except SlotTakenError:
+        text = (
+            "❌ Нельзя подтвердить: эти даты (с учётом уборки) уже заняты "
+            "другим подтверждённым бронированием.\n\n"
+            f"{string_helper.generate_booking_info_message(booking, user)}"
+        )
+        message = update.callback_query.message
+        if message.caption:
+            await message.edit_caption(text)
+        else:
+            await message.edit_text(text)
+        return (None, user)
+    await calendar_sync_service.enqueue(booking_id, CalendarAction.ADD)
     await inform_message(update, context, booking, user)
     return (booking, user)
 
@@ -1275,9 +1232,10 @@ async def send_booking_details(
         await asyncio.sleep(1)
 
         # Отправка фото с инструкциями
-        photo = file_service.get_image("key.jpg")
-        await context.bot.send_photo(
-            chat_id=booking.user.chat_id,
+        await media_cache_service.send_photo(
+            context.bot,
+            booking.user.chat_id,
+            "key.jpg",
             caption="Мы предоставляем самостоятельное заселение.\n"
             f"1. Слева отображена ключница, которая располагается за территорией дома. В которой лежат ключи от ворот и дома. Пароль: {settings_service.password}\n"
             "2. Справа отображен ящик, который располагается на территории дома. В ящик нужно положить подписанный договор и оплату за проживание, если вы платите наличкой.\n\n"
@@ -1285,7 +1243,6 @@ async def send_booking_details(
             "Договор и ручка будут лежать в дома на острове на кухне. Вложите деньги и договор с розовый конверт.\n\n"
             "Информация для оплаты (BSB-Bank):\n"
             f"по номеру карты {BANK_CARD_NUMBER}",
-            photo=photo,
         )
 
         # Отправка инструкций по сауне (если есть)
@@ -1458,7 +1415,7 @@ async def handle_promo_name(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return CREATE_PROMO_NAME
 
     # Check if already exists
-    existing = database_service.get_promocode_by_name(promo_name)
+    existing = await database_service.get_promocode_by_name(promo_name)
     if existing:
         await update.message.reply_text(
             f"❌ Промокод <b>{promo_name}</b> уже существует!\n\n"
@@ -1686,7 +1643,7 @@ async def handle_promo_tariff_selection(
 
     # Create promocode in database
     try:
-        promocode = database_service.add_promocode(
+        promocode = await database_service.add_promocode(
             name=promo_data["name"],
             date_from=promo_data["date_from"],
             date_to=promo_data["date_to"],
@@ -1815,7 +1772,7 @@ async def list_promocodes(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     try:
-        promocodes = database_service.list_active_promocodes()
+        promocodes = await database_service.list_active_promocodes()
 
         if not promocodes:
             await update.message.reply_text(
@@ -1893,7 +1850,7 @@ async def handle_delete_promocode_callback(
 
     try:
         # Deactivate promocode
-        success = database_service.deactivate_promocode(promocode_id)
+        success = await database_service.deactivate_promocode(promocode_id)
 
         if success:
             await query.edit_message_text(
@@ -1932,8 +1889,8 @@ async def get_users_without_chat_id(update: Update, context: ContextTypes.DEFAUL
 
     try:
         # Get statistics
-        users_without_chat_id = database_service.get_users_without_chat_id()
-        total_users = database_service.get_total_users_count()
+        users_without_chat_id = await database_service.get_users_without_chat_id()
+        total_users = await database_service.get_total_users_count()
         users_with_chat_id = total_users - len(users_without_chat_id)
 
         # Delete loading message
@@ -67,7 +67,7 @@ async def get_available_dates(update: Update, context: CallbackContext):
         [InlineKeyboardButton("Назад в меню", callback_data=END)],
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
-    from_date, to_date, booking = get_booking(month, year)
+    from_date, to_date, booking = await get_booking(month, year)
     available_date_message = string_helper.generate_available_slots(
         booking, from_date, to_date
     )
@@ -89,7 +89,7 @@ def parse_callback_data(update: Update):
     return (month, year)
 
 
-def get_booking(month, year):
+async def get_booking(month, year):
     today = datetime.today()
     if today.month == month and today.year == year:
         from_date = datetime(day=today.day, month=month, year=year, hour=0)
@@ -102,5 +102,5 @@ def get_booking(month, year):
         hour=23,
         minute=59,
     ) + timedelta(days=1)
-    booking = database_service.get_booking_by_start_date_period(from_date.date(), to_date.date())
+    booking = await database_service.get_booking_by_start_date_period(from_date.date(), to_date.date())
     return (from_date, to_date, booking)
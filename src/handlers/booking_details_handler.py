@@ -18,8 +18,11 @@ from dateutil.relativedelta import relativedelta
 
 from src.services.logger_service import LoggerService
 from src.services.database_service import DatabaseService
+from src.services.database import SlotTakenError
+from src.services.availability_service import AvailabilityService
 from src.services.calculation_rate_service import CalculationRateService
-from src.services.calendar_service import CalendarService
+from src.services.calendar_sync_service import CalendarSyncService
+from src.models.enum.calendar_action import CalendarAction
 from src.decorators.callback_error_handler import safe_callback_query
 from src.helpers import string_helper, tariff_helper, date_time_helper
 from src.date_time_picker import calendar_picker, hours_picker
@@ -45,8 +48,9 @@ from src.handlers.admin_handler import (
 )
 
 database_service = DatabaseService()
+availability_service = AvailabilityService()
 calculation_rate_service = CalculationRateService()
-calendar_service = CalendarService()
+calendar_sync_service = CalendarSyncService()
 
 
 # Task 5: Show booking detail view
@@ -65,12 +69,12 @@ async def show_booking_detail(update: Update, context: ContextTypes.DEFAULT_TYPE
         data = string_helper.parse_manage_booking_callback(update.callback_query.data)
         booking_id = data["booking_id"]
 
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     if not booking:
         await update.callback_query.edit_message_text("❌ Бронирование не найдено.")
         return END
 
-    user = database_service.get_user_by_id(booking.user_id)
+    user = booking.user
 
     # Generate detailed message
     message = (
@@ -131,15 +135,14 @@ async def start_cancel_booking(update: Update, context: ContextTypes.DEFAULT_TYP
     data = string_helper.parse_manage_booking_callback(update.callback_query.data)
     booking_id = data["booking_id"]
 
-    booking = database_service.get_booking_by_id(booking_id)
-    user = database_service.get_user_by_id(booking.user_id)
+    booking = await database_service.get_booking_by_id(booking_id)
+    user = booking.user
 
     # Mark as canceled
-    booking = database_service.update_booking(booking_id, is_canceled=True)
+    booking = await database_service.update_booking(booking_id, is_canceled=True)
 
     # Update Google Calendar event (change color to gray and add "ОТМЕНА")
-    if booking.calendar_event_id:
-        calendar_service.cancel_event(booking.calendar_event_id)
+    await calendar_sync_service.enqueue(booking_id, CalendarAction.CANCEL)
 
     # Notify customer
     await notify_customer_cancellation(context, booking, user)
@@ -192,7 +195,7 @@ async def handle_approve_booking(update: Update, context: ContextTypes.DEFAULT_T
     data = string_helper.parse_manage_booking_callback(update.callback_query.data)
     booking_id = data["booking_id"]
 
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     if not booking:
         await update.callback_query.edit_message_text("❌ Бронирование не найдено.")
         return END
@@ -201,10 +204,12 @@ async def handle_approve_booking(update: Update, context: ContextTypes.DEFAULT_T
         await update.callback_query.edit_message_text("ℹ️ Бронирование ��же подтверждено.")
         return await show_booking_detail(update, context, booking_id=booking_id)
 
-    user = database_service.get_user_by_id(booking.user_id)
+    user = booking.user
 
     # Prepare approve process (sets is_prepaymented=True, creates calendar event)
     (updated_booking, user) = await prepare_approve_process(update, context, booking_id)
+    if not updated_booking:
+        return END
     await check_and_send_booking(context, updated_booking)
 
     # Prepare confirmation message for customer
@@ -279,7 +284,7 @@ async def handle_complete_booking(update: Update, context: ContextTypes.DEFAULT_
     data = string_helper.parse_manage_booking_callback(update.callback_query.data)
     booking_id = data["booking_id"]
 
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     if not booking:
         await update.callback_query.edit_message_text("❌ Бронирование не найдено.")
         return END
@@ -289,7 +294,7 @@ async def handle_complete_booking(update: Update, context: ContextTypes.DEFAULT_
         return await show_booking_detail(update, context, booking_id=booking_id)
 
     # Mark booking as done
-    booking = database_service.update_booking(booking_id, is_done=True)
+    booking = await database_service.update_booking(booking_id, is_done=True)
 
     # Send feedback request to customer
     try:
@@ -305,7 +310,7 @@ async def handle_complete_booking(update: Update, context: ContextTypes.DEFAULT_
         feedback_sent = False
 
     # Update admin message
-    user = database_service.get_user_by_id(booking.user_id)
+    user = booking.user
     user_contact = user.contact if user else "N/A"
 
     if feedback_sent:
@@ -393,8 +398,8 @@ async def start_change_price(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
     data = string_helper.parse_manage_booking_callback(update.callback_query.data)
     booking_id = data["booking_id"]
-    booking = database_service.get_booking_by_id(booking_id)
-    user = database_service.get_user_by_id(booking.user_id)
+    booking = await database_service.get_booking_by_id(booking_id)
+    user = booking.user
 
     # Store context
     context.user_data["manage_booking_id"] = booking_id
@@ -443,12 +448,11 @@ async def handle_price_change_input(update: Update, context: ContextTypes.DEFAUL
     old_price = context.user_data.get("manage_old_value")
 
     # Update booking
-    booking = database_service.update_booking(booking_id, price=new_price)
-    user = database_service.get_user_by_id(booking.user_id)
+    booking = await database_service.update_booking(booking_id, price=new_price)
+    user = booking.user
 
     # Update calendar event description with new price
-    if booking.calendar_event_id:
-        calendar_service.update_event_info(booking.calendar_event_id, booking, user)
+    await calendar_sync_service.enqueue(booking.id, CalendarAction.UPDATE)
 
     # Notify customer
     await notify_customer_price_change(context, booking, user, old_price)
@@ -544,8 +548,8 @@ async def start_change_prepayment(update: Update, context: ContextTypes.DEFAULT_
 
     data = string_helper.parse_manage_booking_callback(update.callback_query.data)
     booking_id = data["booking_id"]
-    booking = database_service.get_booking_by_id(booking_id)
-    user = database_service.get_user_by_id(booking.user_id)
+    booking = await database_service.get_booking_by_id(booking_id)
+    user = booking.user
 
     # Store context
     context.user_data["manage_booking_id"] = booking_id
@@ -594,12 +598,11 @@ async def handle_prepayment_change_input(update: Update, context: ContextTypes.D
     old_prepayment = context.user_data.get("manage_old_value")
 
     # Update booking
-    booking = database_service.update_booking(booking_id, prepayment_price=new_prepayment)
-    user = database_service.get_user_by_id(booking.user_id)
+    booking = await database_service.update_booking(booking_id, prepayment_price=new_prepayment)
+    user = booking.user
 
     # Update calendar event description with new prepayment
-    if booking.calendar_event_id:
-        calendar_service.update_event_info(booking.calendar_event_id, booking, user)
+    await calendar_sync_service.enqueue(booking.id, CalendarAction.UPDATE)
 
 
     # Notify customer
@@ -696,8 +699,8 @@ async def start_change_tariff(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     data = string_helper.parse_manage_booking_callback(update.callback_query.data)
     booking_id = data["booking_id"]
-    booking = database_service.get_booking_by_id(booking_id)
-    user = database_service.get_user_by_id(booking.user_id)
+    booking = await database_service.get_booking_by_id(booking_id)
+    user = booking.user
 
     # Store context
     context.user_data["manage_booking_id"] = booking_id
@@ -746,18 +749,17 @@ async def handle_tariff_selection(update: Update, context: ContextTypes.DEFAULT_
     new_tariff = Tariff(new_tariff_value)
     old_tariff = context.user_data.get("manage_old_value")
 
-    booking = database_service.get_booking_by_id(booking_id)
-    user = database_service.get_user_by_id(booking.user_id)
+    booking = await database_service.get_booking_by_id(booking_id)
+    user = booking.user
 
     # Update booking
-    booking = database_service.update_booking(
+    booking = await database_service.update_booking(
         booking_id,
         tariff=new_tariff
     )
 
     # Update calendar event with new tariff (updates both summary and description)
-    if booking.calendar_event_id:
-        calendar_service.update_event_info(booking.calendar_event_id, booking, user)
+    await calendar_sync_service.enqueue(booking.id, CalendarAction.UPDATE)
 
     # Notify customer
     await notify_customer_tariff_change(context, booking, user, old_tariff)
@@ -863,7 +865,7 @@ async def start_reschedule_booking(update: Update, context: ContextTypes.DEFAULT
     data = string_helper.parse_manage_booking_callback(update.callback_query.data)
     booking_id = data["booking_id"]
 
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     if not booking:
         await update.callback_query.edit_message_text("❌ Бронирование не найдено.")
         return END
@@ -877,12 +879,9 @@ async def start_reschedule_booking(update: Update, context: ContextTypes.DEFAULT
     today = date.today()
     max_date_booking = today + relativedelta(months=PERIOD_IN_MONTHS)
     min_date_booking = today
-    start_period, end_period = date_time_helper.month_bounds(today)
-    feature_booking = database_service.get_booking_by_start_date_period(start_period, end_period)
     # Exclude current booking from occupied slots
-    feature_booking = [b for b in feature_booking if b.id != booking_id]
-    available_days = date_time_helper.get_free_dayes_slots(
-        feature_booking, target_month=today.month, target_year=today.year
+    available_days = await availability_service.get_free_days(
+        today.month, today.year, except_booking_id=booking_id
     )
 
     message = (
@@ -920,7 +919,7 @@ async def handle_reschedule_start_date(update: Update, context: ContextTypes.DEF
         await update.callback_query.edit_message_text("❌ Ошибка: данные бронирования не найдены.")
         return END
 
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     if not booking:
         await update.callback_query.edit_message_text("❌ Бронирование не найдено.")
         return END
@@ -980,7 +979,7 @@ async def show_reschedule_start_date_calendar(
     selected_date: Optional[datetime] = None
 ) -> int:
     """Show calendar for start date selection"""
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     if not booking:
         await update.callback_query.edit_message_text("❌ Бронирование не найдено.")
         return END
@@ -992,12 +991,9 @@ async def show_reschedule_start_date_calendar(
 
     max_date_booking = date.today() + relativedelta(months=PERIOD_IN_MONTHS)
     min_date_booking = date.today()
-    start_period, end_period = date_time_helper.month_bounds(selected_date)
-    feature_booking = database_service.get_booking_by_start_date_period(start_period, end_period)
     # Exclude current booking from occupied slots
-    feature_booking = [b for b in feature_booking if b.id != booking_id]
-    available_days = date_time_helper.get_free_dayes_slots(
-        feature_booking, target_month=selected_date.month, target_year=selected_date.year
+    available_days = await availability_service.get_free_days(
+        selected_date.month, selected_date.year, except_booking_id=booking_id
     )
 
     message = (
@@ -1026,16 +1022,13 @@ async def show_reschedule_start_date_calendar(
 
 async def show_reschedule_start_time(update: Update, context: ContextTypes.DEFAULT_TYPE, booking_id: int) -> int:
     """Show time picker for start time"""
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     start_date = context.user_data.get("reschedule_start_date")
 
-    feature_booking = database_service.get_booking_by_start_date_period(
-        start_date - timedelta(days=2),
-        start_date + timedelta(days=2),
-    )
     # Exclude current booking from occupied slots
-    feature_booking = [b for b in feature_booking if b.id != booking_id]
-    available_slots = date_time_helper.get_free_time_slots(feature_booking, start_date)
+    available_slots = await availability_service.get_free_time_slots(
+        start_date, except_booking_id=booking_id
+    )
 
     message = (
         "⏳ <b>Выберите время начала бронирования.</b>\n"
@@ -1097,19 +1090,16 @@ async def handle_reschedule_start_time(update: Update, context: ContextTypes.DEF
 
 async def show_reschedule_finish_date(update: Update, context: ContextTypes.DEFAULT_TYPE, booking_id: int) -> int:
     """Show calendar for finish date selection"""
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     start_datetime = context.user_data.get("reschedule_start_datetime")
 
     today = date.today()
     max_date_booking = today + relativedelta(months=PERIOD_IN_MONTHS)
     min_date_booking = (start_datetime + timedelta(hours=MIN_BOOKING_HOURS)).date()
 
-    start_period, end_period = date_time_helper.month_bounds(start_datetime.date())
-    feature_booking = database_service.get_booking_by_start_date_period(start_period, end_period)
     # Exclude current booking from occupied slots
-    feature_booking = [b for b in feature_booking if b.id != booking_id]
-    available_days = date_time_helper.get_free_dayes_slots(
-        feature_booking, target_month=start_period.month, target_year=start_period.year
+    available_days = await availability_service.get_free_days(
+        start_datetime.month, start_datetime.year, except_booking_id=booking_id
     )
 
     message = (
@@ -1145,7 +1135,7 @@ async def handle_reschedule_finish_date(update: Update, context: ContextTypes.DE
         await update.callback_query.edit_message_text("❌ Ошибка: данные бронирования не найдены.")
         return END
 
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     start_datetime = context.user_data.get("reschedule_start_datetime")
 
     max_date_booking = date.today() + relativedelta(months=PERIOD_IN_MONTHS)
@@ -1181,22 +1171,19 @@ async def handle_reschedule_finish_date(update: Update, context: ContextTypes.DE
 
 async def show_reschedule_finish_time(update: Update, context: ContextTypes.DEFAULT_TYPE, booking_id: int) -> int:
     """Show time picker for finish time"""
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     start_datetime = context.user_data.get("reschedule_start_datetime")
     finish_date = context.user_data.get("reschedule_finish_date")
 
-    feature_booking = database_service.get_booking_by_start_date_period(
-        finish_date - timedelta(days=2),
-        finish_date + timedelta(days=2),
-    )
-    # Exclude current booking from occupied slots
-    feature_booking = [b for b in feature_booking if b.id != booking_id]
     start_time = (
         time(0, 0)
         if start_datetime.date() != finish_date
         else (start_datetime + timedelta(hours=MIN_BOOKING_HOURS)).time()
     )
-    available_slots = date_time_helper.get_free_time_slots(feature_booking, finish_date, start_time=start_time)
+    # Exclude current booking from occupied slots
+    available_slots = await availability_service.get_free_time_slots(
+        finish_date, start_time=start_time, except_booking_id=booking_id
+    )
 
     message = (
         "⏳ <b>Выберите время завершения бронирования.</b>\n"
@@ -1230,7 +1217,7 @@ async def handle_reschedule_finish_time(update: Update, context: ContextTypes.DE
         await update.callback_query.edit_message_text("❌ Ошибка: данные бронирования не найдены.")
         return END
 
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     start_datetime = context.user_data.get("reschedule_start_datetime")
     finish_date = context.user_data.get("reschedule_finish_date")
 
@@ -1251,7 +1238,7 @@ async def handle_reschedule_finish_time(update: Update, context: ContextTypes.DE
             return await show_reschedule_start_date_calendar(update, context, booking_id, error_message)
 
         # Check for overlapping bookings
-        created_bookings = database_service.get_booking_by_start_date_period(start_datetime, finish_datetime)
+        created_bookings = await database_service.get_booking_by_start_date_period(start_datetime, finish_datetime)
         is_any_booking = any(b.id != booking.id for b in created_bookings)
         if is_any_booking:
             error_message = (
@@ -1280,7 +1267,7 @@ async def handle_reschedule_finish_time(update: Update, context: ContextTypes.DE
 
 async def show_reschedule_confirm(update: Update, context: ContextTypes.DEFAULT_TYPE, booking_id: int) -> int:
     """Show confirmation message for reschedule"""
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     start_datetime = context.user_data.get("reschedule_start_datetime")
     finish_datetime = context.user_data.get("reschedule_finish_datetime")
     old_start_date = context.user_data.get("reschedule_old_start_date")
@@ -1324,7 +1311,7 @@ async def handle_reschedule_confirm(update: Update, context: ContextTypes.DEFAUL
         await update.callback_query.edit_message_text("❌ Ошибка: данные бронирования не найдены.")
         return END
 
-    booking = database_service.get_booking_by_id(booking_id)
+    booking = await database_service.get_booking_by_id(booking_id)
     if not booking:
         await update.callback_query.edit_message_text("❌ Бронирование не найдено.")
         return END
@@ -1338,23 +1325,23 @@ async def handle_reschedule_confirm(update: Update, context: ContextTypes.DEFAUL
         return END
 
     # Update booking (price remains unchanged)
-    updated_booking = database_service.update_booking(
-        booking_id,
-        start_date=start_datetime,
-        end_date=finish_datetime
-    )
+    try:
+        updated_booking = await database_service.update_booking(
+            booking_id,
+            start_date=start_datetime,
+            end_date=finish_datetime
+        )
+    except SlotTakenError:
+        await update.callback_query.edit_message_text(
+            "❌ Эти даты уже заняты другим бронированием. Выберите другое время."
+        )
+        return END
 
     # Get user for calendar update and notifications
-    user = database_service.get_user_by_id(booking.user_id)
+    user = booking.user
 
     # Update calendar event with new time and description
-    if updated_booking.calendar_event_id:
-        calendar_service.move_event(
-            updated_booking.calendar_event_id,
-            start_datetime,
-            finish_datetime,
-            booking=updated_booking,
-            user=user)
+    await calendar_sync_service.enqueue(updated_booking.id, CalendarAction.MOVE)
 
     # Notify customer
     await notify_customer_reschedule(context, updated_booking, user, old_start_date)
@@ -10,6 +10,8 @@ from matplotlib.dates import relativedelta
 from db.models.booking import BookingBase
 from src.date_time_picker import calendar_picker, hours_picker
 from src.services.database_service import DatabaseService
+from src.services.availability_service import AvailabilityService
+from src.services.slot_hold_service import SlotHoldService
 from src.config.config import (
     MIN_BOOKING_HOURS,
     PERIOD_IN_MONTHS,
@@ -53,6 +55,8 @@ MAX_PEOPLE = 6
 rate_service = CalculationRateService()
 date_pricing_service = DatePricingService()
 database_service = DatabaseService()
+availability_service = AvailabilityService()
+slot_hold_service = SlotHoldService()
 redis_service = RedisSessionService()
 navigation_service = NavigationService()
 
@@ -111,6 +115,7 @@ async def back_navigation(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await menu_handler.show_menu(update, context)
     LoggerService.info(__name__, "Back to menu", update)
     redis_service.clear_booking(update)
+    slot_hold_service.release(navigation_service.get_chat_id(update))
     return MENU
 
 
@@ -207,12 +212,15 @@ async def select_tariff(update: Update, context: ContextTypes.DEFAULT_TYPE):
         or tariff == Tariff.INCOGNITA_HOURS
         or tariff == Tariff.INCOGNITA_WORKER
     ):
-        redis_service.update_booking_field(update, "is_sauna_included", True)
-        redis_service.update_booking_field(update, "is_secret_room_included", True)
-        redis_service.update_booking_field(update, "is_white_room_included", True)
-        redis_service.update_booking_field(update, "is_green_room_included", True)
-        redis_service.update_booking_field(
-            update, "is_additional_bedroom_included", True
+        redis_service.update_booking_fields(
+            update,
+            {
+                "is_sauna_included": True,
+                "is_secret_room_included": True,
+                "is_white_room_included": True,
+                "is_green_room_included": True,
+                "is_additional_bedroom_included": True,
+            },
         )
 
         if tariff == Tariff.INCOGNITA_DAY:
@@ -222,13 +230,16 @@ async def select_tariff(update: Update, context: ContextTypes.DEFAULT_TYPE):
             redis_service.update_booking_field(update, "is_photoshoot_included", False)
             return await count_of_people_message(update, context)
     elif tariff == Tariff.DAY or tariff == Tariff.DAY_FOR_COUPLE:
-        redis_service.update_booking_field(update, "is_photoshoot_included", False)
-        redis_service.update_booking_field(update, "is_sauna_included", False)
-        redis_service.update_booking_field(update, "is_secret_room_included", True)
-        redis_service.update_booking_field(update, "is_white_room_included", True)
-        redis_service.update_booking_field(update, "is_green_room_included", True)
-        redis_service.update_booking_field(
-            update, "is_additional_bedroom_included", True
+        redis_service.update_booking_fields(
+            update,
+            {
+                "is_photoshoot_included": False,
+                "is_sauna_included": False,
+                "is_secret_room_included": True,
+                "is_white_room_included": True,
+                "is_green_room_included": True,
+                "is_additional_bedroom_included": True,
+            },
         )
         return await sauna_message(update, context)
     elif tariff == Tariff.HOURS_12 or tariff == Tariff.WORKER:
@@ -280,7 +291,7 @@ async def check_user_contact(update: Update, context: ContextTypes.DEFAULT_TYPE)
             # Save contact to database
             try:
                 chat_id = navigation_service.get_chat_id(update)
-                database_service.update_user_contact(chat_id, cleaned_contact)
+                await database_service.update_user_contact(chat_id, cleaned_contact)
                 LoggerService.info(
                     __name__,
                     "User contact saved to database",
@@ -300,7 +311,7 @@ async def check_user_contact(update: Update, context: ContextTypes.DEFAULT_TYPE)
                 __name__, "User name is valid", update, **{"user_name": user_input}
             )
             if booking.gift_id:
-                if is_any_additional_payment(update):
+                if await is_any_additional_payment(update):
                     return await pay(update, context)
                 else:
                     return await send_approving_to_admin(update, context, is_cash=True)
@@ -399,15 +410,13 @@ async def select_bedroom(update: Update, context: ContextTypes.DEFAULT_TYPE):
     bedroom = bedroom_halper.get_by_str(data)
     LoggerService.info(__name__, "Select bedroom", update, **{"bedroom": bedroom})
 
-    if bedroom == Bedroom.GREEN:
-        redis_service.update_booking_field(update, "is_white_room_included", False)
-        redis_service.update_booking_field(update, "is_green_room_included", True)
-    else:
-        redis_service.update_booking_field(update, "is_white_room_included", True)
-        redis_service.update_booking_field(update, "is_green_room_included", False)
+    is_green = bedroom == Bedroom.GREEN
+    redis_service.update_booking_fields(
+        update,
+        {"is_white_room_included": not is_green, "is_green_room_included": is_green},
+    )
 
-    booking = redis_service.get_booking(update)
-    if booking.gift_id:
+    if redis_service.get_field(update, "booking", "gift_id"):
         return await navigate_next_step_for_gift(update, context)
 
     return await additional_bedroom_message(update, context)
@@ -425,18 +434,20 @@ async def select_additional_bedroom(update: Update, context: ContextTypes.DEFAUL
         __name__, "Select additional bedroom", update, **{"is_added": is_added}
     )
     if is_added:
-        redis_service.update_booking_field(
-            update, "is_additional_bedroom_included", True
+        redis_service.update_booking_fields(
+            update,
+            {
+                "is_additional_bedroom_included": True,
+                "is_white_room_included": True,
+                "is_green_room_included": True,
+            },
         )
-        redis_service.update_booking_field(update, "is_white_room_included", True)
-        redis_service.update_booking_field(update, "is_green_room_included", True)
     else:
         redis_service.update_booking_field(
             update, "is_additional_bedroom_included", False
         )
 
-    booking = redis_service.get_booking(update)
-    if booking.gift_id:
+    if redis_service.get_field(update, "booking", "gift_id"):
         return await navigate_next_step_for_gift(update, context)
 
     return await secret_room_message(update, context)
@@ -517,14 +528,9 @@ async def enter_start_date(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return await back_navigation(update, context)
     elif is_next_month or is_prev_month:
-        start_period, end_period = date_time_helper.month_bounds(selected_date)
-        feature_booking = database_service.get_booking_by_start_date_period(
-            start_period, end_period
-        )
-        available_days = date_time_helper.get_free_dayes_slots(
-            feature_booking,
-            target_month=start_period.month,
-            target_year=start_period.year,
+        available_days = await availability_service.get_free_days(
+            selected_date.month, selected_date.year,
+            hold_owner=navigation_service.get_chat_id(update),
         )
 
         # Update special dates info for the new month
@@ -618,14 +624,9 @@ async def enter_finish_date(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return await start_time_message(update, context)
     elif is_next_month or is_prev_month:
-        start_period, end_period = date_time_helper.month_bounds(selected_date)
-        feature_booking = database_service.get_booking_by_start_date_period(
-            start_period, end_period
-        )
-        available_days = date_time_helper.get_free_dayes_slots(
-            feature_booking,
-            target_month=start_period.month,
-            target_year=start_period.year,
+        available_days = await availability_service.get_free_days(
+            selected_date.month, selected_date.year,
+            hold_owner=navigation_service.get_chat_id(update),
         )
 
         # Update special dates info for the new month
@@ -707,7 +708,7 @@ async def enter_finish_time(update: Update, context: ContextTypes.DEFAULT_TYPE):
             update
         )
         
-        is_any_booking = database_service.is_booking_between_dates(
+        is_any_booking = await database_service.is_booking_between_dates(
             check_start,
             check_end,
         )
@@ -725,6 +726,22 @@ async def enter_finish_time(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 update, context, error_message=error_message
             )
 
+        # Keep the slot for this user until checkout is finished
+        if not slot_hold_service.hold(
+            navigation_service.get_chat_id(update),
+            booking.start_booking_date,
+            finish_booking_date,
+        ):
+            error_message = (
+                "❌ <b>Ошибка!</b>\n\n"
+                "⏳ <b>Выбранные дата и время сейчас оформляет другой гость.</b>\n\n"
+                "🔄 Пожалуйста, выберите другую дату или попробуйте позже."
+            )
+            LoggerService.warning(__name__, "selected slot is held by another user", update)
+            return await start_date_message(
+                update, context, error_message=error_message
+            )
+
         return await comment_message(update, context)
     elif is_action:
         LoggerService.info(
@@ -794,15 +811,18 @@ async def handle_promocode_input(update: Update, context: ContextTypes.DEFAULT_T
     booking = redis_service.get_booking(update)
 
     # Validate against booking start_date and tariff
-    is_valid, message_text, promo = database_service.validate_promocode(
+    is_valid, message_text, promo = await database_service.validate_promocode(
         promo_code, booking.start_booking_date.date(), booking.tariff
     )
 
     if is_valid:
         # Store promocode_id in redis, will be saved to DB later
-        redis_service.update_booking_field(update, "promocode_id", promo.id)
-        redis_service.update_booking_field(
-            update, "promocode_discount", promo.discount_percentage
+        redis_service.update_booking_fields(
+            update,
+            {
+                "promocode_id": promo.id,
+                "promocode_discount": promo.discount_percentage,
+            },
         )
 
         await update.message.reply_text(
@@ -951,7 +971,7 @@ async def confirm_pay(update: Update, context: ContextTypes.DEFAULT_TYPE):
     )
 
     if booking.gift_id:
-        gift = database_service.get_gift_by_id(booking.gift_id)
+        gift = await database_service.get_gift_by_id(booking.gift_id)
         payed_price = gift.price if gift else booking.rental_rate.price
         price = int(price - payed_price)
         message = (
@@ -1000,6 +1020,33 @@ async def pay(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     LoggerService.info(__name__, "Pay", update)
 
+    # The hold may have expired while the user was filling in the details
+    if not slot_hold_service.hold(
+        navigation_service.get_chat_id(update),
+        booking.start_booking_date,
+        booking.finish_booking_date,
+    ):
+        LoggerService.warning(__name__, "slot hold lost before payment", update)
+        message = (
+            "❌ <b>Ошибка!</b>\n\n"
+            "⏳ <b>Выбранные дата и время уже оформляет другой гость.</b>\n\n"
+            "🔄 Пожалуйста, начните бронирование заново и выберите другую дату."
+        )
+        reply_markup = InlineKeyboardMarkup(
+            [[InlineKeyboardButton("Назад в меню", callback_data=f"BOOKING-BACK_{BACK}")]]
+        )
+        if update.message:
+            await update.message.reply_text(
+                text=message, parse_mode="HTML", reply_markup=reply_markup
+            )
+        else:
+            await navigation_service.safe_edit_message_text(
+                callback_query=update.callback_query,
+                text=message,
+                reply_markup=reply_markup,
+            )
+        return BOOKING
+
     # NEW: Calculate prepayment dynamically
     prepayment_service = PrepaymentService()
     prepayment_amount = prepayment_service.calculate_prepayment(
@@ -1071,7 +1118,7 @@ async def cancel_booking(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     booking = redis_service.get_booking(update)
     if booking:
-        database_service.update_booking(booking.id, is_canceled=True)
+        await database_service.update_booking(booking.id, is_canceled=True)
     return await back_navigation(update, context)
 
 
@@ -1263,8 +1310,8 @@ def get_special_dates_info(target_month: int = None, target_year: int = None) ->
     if target_month and target_year:
         filtered_rules = []
         for rule in active_rules:
-            start_date_obj = datetime.strptime(rule.start_date, "%Y-%m-%d")
-            end_date_obj = datetime.strptime(rule.end_date, "%Y-%m-%d")
+            start_date_obj = rule.start_date_obj
+            end_date_obj = rule.end_date_obj
 
             # Check if rule overlaps with target month
             target_month_start = date(target_year, target_month, 1)
@@ -1277,8 +1324,8 @@ def get_special_dates_info(target_month: int = None, target_year: int = None) ->
 
             # Rule overlaps if start <= month_end and end >= month_start
             if (
-                start_date_obj.date() <= target_month_end
-                and end_date_obj.date() >= target_month_start
+                start_date_obj <= target_month_end
+                and end_date_obj >= target_month_start
             ):
                 filtered_rules.append(rule)
 
@@ -1292,8 +1339,8 @@ def get_special_dates_info(target_month: int = None, target_year: int = None) ->
 
     for rule in active_rules:
         # Format date range with DD.MM format
-        start_date_obj = datetime.strptime(rule.start_date, "%Y-%m-%d")
-        end_date_obj = datetime.strptime(rule.end_date, "%Y-%m-%d")
+        start_date_obj = rule.start_date_obj
+        end_date_obj = rule.end_date_obj
 
         if rule.start_date == rule.end_date:
             date_str = start_date_obj.strftime("%d.%m")
@@ -1358,12 +1405,9 @@ async def start_date_message(
         # Use today as reference
         reference_date = today
 
-    start_period, end_period = date_time_helper.month_bounds(reference_date)
-    feature_booking = database_service.get_booking_by_start_date_period(start_period, end_period)
-    available_days = date_time_helper.get_free_dayes_slots(
-        feature_booking,
-        target_month=reference_date.month,
-        target_year=reference_date.year,
+    available_days = await availability_service.get_free_days(
+        reference_date.month, reference_date.year,
+        hold_owner=navigation_service.get_chat_id(update),
     )
 
     special_dates_info = get_special_dates_info(
@@ -1404,12 +1448,9 @@ async def start_time_message(update: Update, context: ContextTypes.DEFAULT_TYPE)
     )
     booking = redis_service.get_booking(update)
 
-    feature_booking = database_service.get_booking_by_start_date_period(
-        booking.start_booking_date.date() - timedelta(days=2),
-        booking.start_booking_date.date() + timedelta(days=2),
-    )
-    available_slots = date_time_helper.get_free_time_slots(
-        feature_booking, booking.start_booking_date.date()
+    available_slots = await availability_service.get_free_time_slots(
+        booking.start_booking_date.date(),
+        hold_owner=navigation_service.get_chat_id(update),
     )
 
     special_date_info = get_special_date_info_for_day(booking.start_booking_date.date())
@@ -1465,12 +1506,9 @@ async def finish_date_message(update: Update, context: ContextTypes.DEFAULT_TYPE
     else:
         reference_date = booking.start_booking_date.date()
 
-    start_period, end_period = date_time_helper.month_bounds(reference_date)
-    feature_booking = database_service.get_booking_by_start_date_period(start_period, end_period)
-    available_days = date_time_helper.get_free_dayes_slots(
-        feature_booking,
-        target_month=reference_date.month,
-        target_year=reference_date.year,
+    available_days = await availability_service.get_free_days(
+        reference_date.month, reference_date.year,
+        hold_owner=navigation_service.get_chat_id(update),
     )
 
     special_dates_info = get_special_dates_info(
@@ -1509,17 +1547,14 @@ async def finish_time_message(update: Update, context: ContextTypes.DEFAULT_TYPE
     )
     booking = redis_service.get_booking(update)
 
-    feature_booking = database_service.get_booking_by_start_date_period(
-        booking.finish_booking_date.date() - timedelta(days=2),
-        booking.finish_booking_date.date() + timedelta(days=2),
-    )
     start_time = (
         time(0, 0)
         if booking.start_booking_date.date() != booking.finish_booking_date.date()
         else (booking.start_booking_date + timedelta(hours=MIN_BOOKING_HOURS)).time()
     )
-    available_slots = date_time_helper.get_free_time_slots(
-        feature_booking, booking.finish_booking_date.date(), start_time=start_time
+    available_slots = await availability_service.get_free_time_slots(
+        booking.finish_booking_date.date(), start_time=start_time,
+        hold_owner=navigation_service.get_chat_id(update),
     )
 
     special_date_info = get_special_date_info_for_day(
@@ -1850,11 +1885,11 @@ async def additional_bedroom_message(
     return BOOKING
 
 
-def is_any_additional_payment(update: Update) -> bool:
+async def is_any_additional_payment(update: Update) -> bool:
     booking = redis_service.get_booking(update)
 
     if booking.gift_id:
-        gift = database_service.get_gift_by_id(booking.gift_id)
+        gift = await database_service.get_gift_by_id(booking.gift_id)
         if gift.has_secret_room != booking.is_secret_room_included:
             return True
         elif gift.has_sauna != booking.is_sauna_included:
@@ -1884,7 +1919,7 @@ async def navigate_next_step_for_gift(
     elif booking.tariff == Tariff.INCOGNITA_HOURS or booking.tariff == Tariff.DAY:
         return await count_of_people_message(update, context)
 
-    gift = database_service.get_gift_by_id(booking.gift_id)
+    gift = await database_service.get_gift_by_id(booking.gift_id)
     if (
         booking.is_white_room_included == False
         and booking.is_green_room_included == False
@@ -1901,12 +1936,12 @@ async def navigate_next_step_for_gift(
     return await count_of_people_message(update, context)
 
 
-def init_fields_for_gift(update: Update):
+async def init_fields_for_gift(update: Update):
     booking = redis_service.get_booking(update)
     if not booking.gift_id:
         return
 
-    gift = database_service.get_gift_by_id(booking.gift_id)
+    gift = await database_service.get_gift_by_id(booking.gift_id)
     if gift.has_secret_room:
         redis_service.update_booking_field(update, "is_secret_room_included", True)
     if gift.has_sauna:
@@ -1923,7 +1958,7 @@ async def init_gift_code(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not update.message or not update.message.text:
         return await write_code_message(update, context, True)
 
-    gift = database_service.get_gift_by_code(update.message.text)
+    gift = await database_service.get_gift_by_code(update.message.text)
     if not gift:
         return await write_code_message(update, context, True)
 
@@ -1942,11 +1977,11 @@ async def init_gift_code(update: Update, context: ContextTypes.DEFAULT_TYPE):
         parse_mode="HTML",
     )
 
-    init_fields_for_gift(update)
+    await init_fields_for_gift(update)
     return await navigate_next_step_for_gift(update, context)
 
 
-def save_booking_information(
+async def save_booking_information(
     update: Update, chat_id: int, is_cash=False
 ) -> BookingBase:
     # booking = database_service.get_booking_by_id(1)
@@ -1974,7 +2009,7 @@ def save_booking_information(
         LoggerService.error(__name__, "Cache booking is None — session expired", chat_id=chat_id)
         return None
 
-    booking = database_service.add_booking(
+    booking = await database_service.add_booking(
         cache_booking.user_contact,
         cache_booking.start_booking_date,
         cache_booking.finish_booking_date,
@@ -2015,8 +2050,11 @@ def save_booking_information(
         )
         return None
 
+    # The saved booking blocks the slot from now on, other users need not wait for the TTL
+    slot_hold_service.release(chat_id)
+
     if is_cash:
-        booking = database_service.update_booking(booking.id, prepayment=0)
+        booking = await database_service.update_booking(booking.id, prepayment=0)
 
     return booking
 
@@ -2125,7 +2163,7 @@ async def send_approving_to_admin(
             )
         return BOOKING
 
-    booking = save_booking_information(update, chat_id, is_cash)
+    booking = await save_booking_information(update, chat_id, is_cash)
     if not booking and update.message:
         await update.message.reply_text(
             text="❌ <b>Ошибка!</b>\n\n"
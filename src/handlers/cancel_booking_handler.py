@@ -4,7 +4,8 @@ from src.services.logger_service import LoggerService
 from src.decorators.callback_error_handler import safe_callback_query
 from src.services.navigation_service import NavigationService
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from src.services.calendar_service import CalendarService
+from src.services.calendar_sync_service import CalendarSyncService
+from src.models.enum.calendar_action import CalendarAction
 from src.services.redis import RedisSessionService
 from datetime import date
 from src.services.database_service import DatabaseService
@@ -21,7 +22,7 @@ from src.constants import (
 )
 
 database_service = DatabaseService()
-calendar_service = CalendarService()
+calendar_sync_service = CalendarSyncService()
 navigation_service = NavigationService()
 redis_service = RedisSessionService()
 
@@ -72,10 +73,10 @@ async def check_user_contact(update: Update, context: ContextTypes.DEFAULT_TYPE)
             # Save contact to database
             try:
                 chat_id = navigation_service.get_chat_id(update)
-                user = database_service.get_user_by_chat_id(chat_id)
+                user = await database_service.get_user_by_chat_id(chat_id)
 
                 if user:
-                    database_service.update_user_contact(chat_id, cleaned_contact)
+                    await database_service.update_user_contact(chat_id, cleaned_contact)
                     LoggerService.info(
                         __name__,
                         "User contact saved to database",
@@ -84,8 +85,8 @@ async def check_user_contact(update: Update, context: ContextTypes.DEFAULT_TYPE)
                     )
                 else:
                     user_name = update.effective_user.username or cleaned_contact
-                    database_service.update_user_chat_id(user_name, chat_id)
-                    database_service.update_user_contact(chat_id, cleaned_contact)
+                    await database_service.update_user_chat_id(user_name, chat_id)
+                    await database_service.update_user_contact(chat_id, cleaned_contact)
                     LoggerService.warning(
                         __name__,
                         "User not found by chat_id, created new user",
@@ -140,10 +141,10 @@ async def confirm_cancel_booking(update: Update, context: ContextTypes.DEFAULT_T
         LoggerService.warning(__name__, "Draft is None or booking_id is missing (double click protection)", update)
         return await back_navigation(update, context)
 
-    booking = database_service.get_booking_by_id(draft.selected_booking_id)
+    booking = await database_service.get_booking_by_id(draft.selected_booking_id)
 
-    updated_booking = database_service.update_booking(booking.id, is_canceled=True)
-    calendar_service.cancel_event(updated_booking.calendar_event_id)
+    updated_booking = await database_service.update_booking(booking.id, is_canceled=True)
+    await calendar_sync_service.enqueue(updated_booking.id, CalendarAction.CANCEL)
     await admin_handler.inform_cancel_booking(update, context, updated_booking)
     keyboard = [[InlineKeyboardButton("Назад в меню", callback_data=END)]]
     reply_markup = InlineKeyboardMarkup(keyboard)
@@ -160,7 +161,7 @@ async def confirm_cancel_booking(update: Update, context: ContextTypes.DEFAULT_T
 
 async def choose_booking_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     draft = redis_service.get_cancel_booking(update)
-    selected_bookings = database_service.get_booking_by_user_contact(draft.user_contact)
+    selected_bookings = await database_service.get_booking_by_user_contact(draft.user_contact)
 
     if not selected_bookings or len(selected_bookings) == 0:
         return await warning_message(update, context)
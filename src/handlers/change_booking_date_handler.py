@@ -6,13 +6,16 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from src.services.logger_service import LoggerService
 from src.decorators.callback_error_handler import safe_callback_query
 from src.models.enum.tariff import Tariff
-from src.services.calendar_service import CalendarService
+from src.services.calendar_sync_service import CalendarSyncService
+from src.models.enum.calendar_action import CalendarAction
 from src.models.rental_price import RentalPrice
 from src.services.calculation_rate_service import CalculationRateService
 from src.services.date_pricing_service import DatePricingService
 from src.services.redis import RedisSessionService
 from db.models.booking import BookingBase
 from src.services.database_service import DatabaseService
+from src.services.database import SlotTakenError
+from src.services.availability_service import AvailabilityService
 from datetime import datetime, date, time, timedelta
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import ContextTypes, CallbackQueryHandler
@@ -31,8 +34,9 @@ from src.constants import (
 )
 
 database_service = DatabaseService()
+availability_service = AvailabilityService()
 calculation_rate_service = CalculationRateService()
-calendar_service = CalendarService()
+calendar_sync_service = CalendarSyncService()
 navigation_service = NavigationService()
 date_pricing_service = DatePricingService()
 redis_service = RedisSessionService()
@@ -96,10 +100,10 @@ async def check_user_contact(update: Update, context: ContextTypes.DEFAULT_TYPE)
             # Save contact to database
             try:
                 chat_id = navigation_service.get_chat_id(update)
-                user = database_service.get_user_by_chat_id(chat_id)
+                user = await database_service.get_user_by_chat_id(chat_id)
 
                 if user:
-                    database_service.update_user_contact(chat_id, cleaned_contact)
+                    await database_service.update_user_contact(chat_id, cleaned_contact)
                     LoggerService.info(
                         __name__,
                         "User contact saved to database",
@@ -108,8 +112,8 @@ async def check_user_contact(update: Update, context: ContextTypes.DEFAULT_TYPE)
                     )
                 else:
                     user_name = update.effective_user.username or cleaned_contact
-                    database_service.update_user_chat_id(user_name, chat_id)
-                    database_service.update_user_contact(chat_id, cleaned_contact)
+                    await database_service.update_user_chat_id(user_name, chat_id)
+                    await database_service.update_user_contact(chat_id, cleaned_contact)
                     LoggerService.warning(
                         __name__,
                         "User not found by chat_id, created new user",
@@ -146,7 +150,7 @@ async def choose_booking(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     draft = redis_service.get_change_booking(update)
     # Find booking from database by selected_bookings
-    selected_bookings_list = database_service.get_booking_by_user_contact(draft.user_contact)
+    selected_bookings_list = await database_service.get_booking_by_user_contact(draft.user_contact)
     booking = next((b for b in selected_bookings_list if str(b.id) == data), None)
 
     if not booking:
@@ -165,15 +169,21 @@ async def choose_booking(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
 
     # Store booking data in Redis
-    redis_service.update_change_booking_field(update, "selected_booking_id", booking.id)
-    redis_service.update_change_booking_field(update, "old_booking_date", booking.start_date)
-    redis_service.update_change_booking_field(update, "booking_price", booking.price)
-    redis_service.update_change_booking_field(update, "booking_tariff", booking.tariff.name)
-    redis_service.update_change_booking_field(update, "booking_has_sauna", booking.has_sauna)
-    redis_service.update_change_booking_field(update, "booking_has_photoshoot", booking.has_photoshoot)
-    redis_service.update_change_booking_field(update, "booking_has_secret_room", booking.has_secret_room)
-    redis_service.update_change_booking_field(update, "booking_has_white_bedroom", booking.has_white_bedroom)
-    redis_service.update_change_booking_field(update, "booking_has_green_bedroom", booking.has_green_bedroom)
+    redis_service.update_fields(
+        update,
+        "change_booking",
+        {
+            "selected_booking_id": booking.id,
+            "old_booking_date": booking.start_date,
+            "booking_price": booking.price,
+            "booking_tariff": booking.tariff.name,
+            "booking_has_sauna": booking.has_sauna,
+            "booking_has_photoshoot": booking.has_photoshoot,
+            "booking_has_secret_room": booking.has_secret_room,
+            "booking_has_white_bedroom": booking.has_white_bedroom,
+            "booking_has_green_bedroom": booking.has_green_bedroom,
+        },
+    )
 
     LoggerService.info(__name__, "Choose booking", update, **{"booking_id": booking.id})
     return await start_date_message(update, context)
@@ -193,7 +203,7 @@ async def enter_start_date(update: Update, context: ContextTypes.DEFAULT_TYPE):
     ) = await calendar_picker.process_calendar_selection(update, context)
     if selected:
         draft = redis_service.get_change_booking(update)
-        booking = database_service.get_booking_by_id(draft.selected_booking_id)
+        booking = await database_service.get_booking_by_id(draft.selected_booking_id)
 
         if not tariff_helper.is_booking_available(booking.tariff, selected_date):
             LoggerService.warning(
@@ -226,20 +236,12 @@ async def enter_start_date(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return await back_navigation(update, context)
     elif is_next_month or is_prev_month:
         query = update.callback_query
-        start_period, end_period = date_time_helper.month_bounds(selected_date)
-        feature_booking = database_service.get_booking_by_start_date_period(
-            start_period, end_period
-        )
-
         # Exclude current user's booking from occupied slots
         draft = redis_service.get_change_booking(update)
-        if draft and draft.selected_booking_id:
-            feature_booking = [b for b in feature_booking if b.id != draft.selected_booking_id]
-
-        available_days = date_time_helper.get_free_dayes_slots(
-            feature_booking,
-            target_month=start_period.month,
-            target_year=start_period.year,
+        available_days = await availability_service.get_free_days(
+            selected_date.month,
+            selected_date.year,
+            except_booking_id=draft.selected_booking_id if draft else None,
         )
 
         # Update special dates info for the new month
@@ -324,20 +326,12 @@ async def enter_finish_date(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return await start_time_message(update, context)
     elif is_next_month or is_prev_month:
         query = update.callback_query
-        start_period, end_period = date_time_helper.month_bounds(selected_date)
-        feature_booking = database_service.get_booking_by_start_date_period(
-            start_period, end_period
-        )
-
         # Exclude current user's booking from occupied slots
         draft = redis_service.get_change_booking(update)
-        if draft and draft.selected_booking_id:
-            feature_booking = [b for b in feature_booking if b.id != draft.selected_booking_id]
-
-        available_days = date_time_helper.get_free_dayes_slots(
-            feature_booking,
-            target_month=start_period.month,
-            target_year=start_period.year,
+        available_days = await availability_service.get_free_days(
+            selected_date.month,
+            selected_date.year,
+            except_booking_id=draft.selected_booking_id if draft else None,
         )
 
         # Update special dates info for the new month
@@ -386,8 +380,8 @@ async def enter_finish_time(update: Update, context: ContextTypes.DEFAULT_TYPE):
             **{"finish_time": finish_booking_date.time()},
         )
 
-        booking = database_service.get_booking_by_id(draft.selected_booking_id)
-        created_bookings = database_service.get_booking_by_start_date_period(
+        booking = await database_service.get_booking_by_id(draft.selected_booking_id)
+        created_bookings = await database_service.get_booking_by_start_date_period(
             draft.start_booking_date, finish_booking_date
         )
 
@@ -468,7 +462,7 @@ async def confirm_booking(update: Update, context: ContextTypes.DEFAULT_TYPE):
         LoggerService.warning(__name__, "Draft is None or booking_id is missing (double click protection)", update)
         return await back_navigation(update, context)
 
-    booking = database_service.get_booking_by_id(draft.selected_booking_id)
+    booking = await database_service.get_booking_by_id(draft.selected_booking_id)
 
     # Calculate new price based on new dates
     selected_duration = draft.finish_booking_date - draft.start_booking_date
@@ -487,25 +481,26 @@ async def confirm_booking(update: Update, context: ContextTypes.DEFAULT_TYPE):
         is_second_room=booking.has_green_bedroom or booking.has_white_bedroom,
     )
 
-    updated_booking = database_service.update_booking(
-        booking.id,
-        start_date=draft.start_booking_date,
-        end_date=draft.finish_booking_date,
-        is_date_changed=True,
-        price=new_price,
-    )
-
-    # Get user for calendar update
-    user = database_service.get_user_by_id(booking.user_id)
+    try:
+        updated_booking = await database_service.update_booking(
+            booking.id,
+            start_date=draft.start_booking_date,
+            end_date=draft.finish_booking_date,
+            is_date_changed=True,
+            price=new_price,
+        )
+    except SlotTakenError:
+        keyboard = [[InlineKeyboardButton("Назад в меню", callback_data=END)]]
+        await navigation_service.safe_edit_message_text(
+            callback_query=update.callback_query,
+            text="❌ Эти даты уже заняты другим бронированием. Выберите другое время.",
+            reply_markup=InlineKeyboardMarkup(keyboard),
+        )
+        redis_service.clear_change_booking(update)
+        return CHANGE_BOOKING_DATE
 
     # Update Google Calendar event with new time and description
-    if updated_booking.calendar_event_id:
-        calendar_service.move_event(
-            updated_booking.calendar_event_id,
-            draft.start_booking_date,
-            draft.finish_booking_date,
-            booking=updated_booking,
-            user=user)
+    await calendar_sync_service.enqueue(updated_booking.id, CalendarAction.MOVE)
 
     keyboard = [[InlineKeyboardButton("Назад в меню", callback_data=END)]]
     reply_markup = InlineKeyboardMarkup(keyboard)
@@ -543,7 +538,7 @@ async def choose_booking_message(
     error_message: Optional[str] = None,
 ):
     draft = redis_service.get_change_booking(update)
-    booking_list = database_service.get_booking_by_user_contact(draft.user_contact)
+    booking_list = await database_service.get_booking_by_user_contact(draft.user_contact)
     selected_bookings = list(
         filter(lambda x: x.start_date.date() >= date.today(), booking_list)
     )
@@ -596,16 +591,12 @@ async def start_date_message(
     today = date.today()
     max_date_booking = today + relativedelta(months=PERIOD_IN_MONTHS)
     min_date_booking = today
-    start_period, end_period = date_time_helper.month_bounds(today)
-    feature_booking = database_service.get_booking_by_start_date_period(start_period, end_period)
-
     # Exclude current user's booking from occupied slots
     draft = redis_service.get_change_booking(update)
-    if draft and draft.selected_booking_id:
-        feature_booking = [b for b in feature_booking if b.id != draft.selected_booking_id]
-
-    available_days = date_time_helper.get_free_dayes_slots(
-        feature_booking, target_month=today.month, target_year=today.year
+    available_days = await availability_service.get_free_days(
+        today.month,
+        today.year,
+        except_booking_id=draft.selected_booking_id if draft else None,
     )
 
     special_dates_info = get_special_dates_info(today.month, today.year)
@@ -641,19 +632,11 @@ async def start_date_message(
 @safe_callback_query()
 async def start_time_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     draft = redis_service.get_change_booking(update)
-    booking = database_service.get_booking_by_id(draft.selected_booking_id)
-
-    feature_booking = database_service.get_booking_by_start_date_period(
-        draft.start_booking_date.date() - timedelta(days=2),
-        draft.start_booking_date.date() + timedelta(days=2),
-    )
+    booking = await database_service.get_booking_by_id(draft.selected_booking_id)
 
     # Exclude current user's booking from occupied slots
-    if draft and draft.selected_booking_id:
-        feature_booking = [b for b in feature_booking if b.id != draft.selected_booking_id]
-
-    available_slots = date_time_helper.get_free_time_slots(
-        feature_booking, draft.start_booking_date.date()
+    available_slots = await availability_service.get_free_time_slots(
+        draft.start_booking_date.date(), except_booking_id=draft.selected_booking_id
     )
 
     special_date_info = get_special_date_info_for_day(draft.start_booking_date.date())
@@ -698,15 +681,11 @@ async def finish_date_message(update: Update, context: ContextTypes.DEFAULT_TYPE
     max_date_booking = today + relativedelta(months=PERIOD_IN_MONTHS)
     min_date_booking = (draft.start_booking_date + timedelta(hours=MIN_BOOKING_HOURS)).date()
 
-    start_period, end_period = date_time_helper.month_bounds(draft.start_booking_date.date())
-    feature_booking = database_service.get_booking_by_start_date_period(start_period, end_period)
-
     # Exclude current user's booking from occupied slots
-    if draft and draft.selected_booking_id:
-        feature_booking = [b for b in feature_booking if b.id != draft.selected_booking_id]
-
-    available_days = date_time_helper.get_free_dayes_slots(
-        feature_booking, target_month=start_period.month, target_year=start_period.year
+    available_days = await availability_service.get_free_days(
+        draft.start_booking_date.month,
+        draft.start_booking_date.year,
+        except_booking_id=draft.selected_booking_id,
     )
 
     special_dates_info = get_special_dates_info(
@@ -741,22 +720,16 @@ async def finish_date_message(update: Update, context: ContextTypes.DEFAULT_TYPE
 @safe_callback_query()
 async def finish_time_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     draft = redis_service.get_change_booking(update)
-    feature_booking = database_service.get_booking_by_start_date_period(
-        draft.finish_booking_date.date() - timedelta(days=2),
-        draft.finish_booking_date.date() + timedelta(days=2),
-    )
-
-    # Exclude current user's booking from occupied slots
-    if draft and draft.selected_booking_id:
-        feature_booking = [b for b in feature_booking if b.id != draft.selected_booking_id]
-
     start_time = (
         time(0, 0)
         if draft.start_booking_date.date() != draft.finish_booking_date.date()
         else (draft.start_booking_date + timedelta(hours=MIN_BOOKING_HOURS)).time()
     )
-    available_slots = date_time_helper.get_free_time_slots(
-        feature_booking, draft.finish_booking_date.date(), start_time=start_time
+    # Exclude current user's booking from occupied slots
+    available_slots = await availability_service.get_free_time_slots(
+        draft.finish_booking_date.date(),
+        start_time=start_time,
+        except_booking_id=draft.selected_booking_id,
     )
 
     special_date_info = get_special_date_info_for_day(draft.finish_booking_date.date())
@@ -791,7 +764,7 @@ async def finish_time_message(update: Update, context: ContextTypes.DEFAULT_TYPE
 
 async def confirm_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     draft = redis_service.get_change_booking(update)
-    booking = database_service.get_booking_by_id(draft.selected_booking_id)
+    booking = await database_service.get_booking_by_id(draft.selected_booking_id)
 
     keyboard = [
         [
@@ -877,8 +850,8 @@ def get_special_dates_info(target_month: int = None, target_year: int = None) ->
             continue
 
         # Check if rule overlaps with target month
-        rule_start = datetime.strptime(rule.start_date, "%Y-%m-%d").date()
-        rule_end = datetime.strptime(rule.end_date, "%Y-%m-%d").date()
+        rule_start = rule.start_date_obj
+        rule_end = rule.end_date_obj
         month_start = date(target_year, target_month, 1)
 
         # Get last day of month
@@ -423,8 +423,8 @@ async def send_feedback_to_admin(update: Update, context: ContextTypes.DEFAULT_T
 
     # Get user contact from database
     database_service = DatabaseService()
-    booking = database_service.get_booking_by_id(feedback_data.booking_id)
-    user = database_service.get_user_by_id(booking.user_id)
+    booking = await database_service.get_booking_by_id(feedback_data.booking_id)
+    user = await database_service.get_user_by_id(booking.user_id)
     user_contact = user.contact
 
     # Format message for admin
@@ -450,7 +450,7 @@ async def send_feedback_to_admin(update: Update, context: ContextTypes.DEFAULT_T
     # Mark feedback as submitted in database
     promocode_name = None
     if booking:
-        database_service.update_booking(booking.id, feedback_submitted=True)
+        await database_service.update_booking(booking.id, feedback_submitted=True)
 
         # Create feedback promocode valid for 3 months
         promocode_name = f"ОТЗЫВ-{feedback_data.booking_id}"
@@ -458,7 +458,7 @@ async def send_feedback_to_admin(update: Update, context: ContextTypes.DEFAULT_T
         expiry_date = today + timedelta(days=90)  # 3 months
 
         try:
-            promocode = database_service.add_promocode(
+            promocode = await database_service.add_promocode(
                 name=promocode_name,
                 date_from=today,
                 date_to=expiry_date,
@@ -147,10 +147,10 @@ async def check_user_contact(update: Update, context: ContextTypes.DEFAULT_TYPE)
             # Save contact to database
             try:
                 chat_id = navigation_service.get_chat_id(update)
-                user = database_service.get_user_by_chat_id(chat_id)
+                user = await database_service.get_user_by_chat_id(chat_id)
 
                 if user:
-                    database_service.update_user_contact(chat_id, cleaned_contact)
+                    await database_service.update_user_contact(chat_id, cleaned_contact)
                     LoggerService.info(
                         __name__,
                         "User contact saved to database",
@@ -159,8 +159,8 @@ async def check_user_contact(update: Update, context: ContextTypes.DEFAULT_TYPE)
                     )
                 else:
                     user_name = update.effective_user.username or cleaned_contact
-                    database_service.update_user_chat_id(user_name, chat_id)
-                    database_service.update_user_contact(chat_id, cleaned_contact)
+                    await database_service.update_user_chat_id(user_name, chat_id)
+                    await database_service.update_user_contact(chat_id, cleaned_contact)
                     LoggerService.warning(
                         __name__,
                         "User not found by chat_id, created new user",
@@ -424,11 +424,11 @@ async def additional_bedroom_message(
     return GIFT_CERTIFICATE
 
 
-def save_gift_information(update: Update):
+async def save_gift_information(update: Update):
     """Save gift certificate information from Redis to database"""
     draft = redis_service.get_gift_certificate(update)
     code = string_helper.get_generated_code()
-    gift = database_service.add_gift(
+    gift = await database_service.add_gift(
         draft.user_contact,
         draft.tariff,
         draft.is_sauna_included,
@@ -484,7 +484,7 @@ async def handle_photo(update: Update, context: ContextTypes.DEFAULT_TYPE):
             update
         )
 
-    gift = save_gift_information(update)
+    gift = await save_gift_information(update)
     await admin_handler.accept_gift_payment(
         update, context, gift, chat_id, photo, document
     )
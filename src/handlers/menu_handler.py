@@ -355,7 +355,7 @@ async def handle_menu_callback_fallback(
         return await show_menu(update, context)
 
 
-def _capture_and_store_user_chat_id(update: Update) -> None:
+async def _capture_and_store_user_chat_id(update: Update) -> None:
     """Capture and store user's chat_id in the database."""
     navigation_service = NavigationService()
     chat_id = navigation_service.get_chat_id(update)
@@ -363,7 +363,7 @@ def _capture_and_store_user_chat_id(update: Update) -> None:
 
     try:
         database_service = DatabaseService()
-        database_service.update_user_chat_id(user_name, chat_id)
+        await database_service.update_user_chat_id(user_name, chat_id)
     except Exception as e:
         LoggerService.error(
             __name__,
@@ -378,7 +378,7 @@ async def show_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     await job.init_job(update, context)
 
     # Capture and store user's chat_id
-    _capture_and_store_user_chat_id(update)
+    await _capture_and_store_user_chat_id(update)
 
     # Testing code - commented out
     # service = DatabaseService()
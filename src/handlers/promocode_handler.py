@@ -75,7 +75,7 @@ async def handle_promo_name(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return CREATE_PROMO_NAME
 
     # Check if already exists
-    existing = database_service.get_promocode_by_name(promo_name)
+    existing = await database_service.get_promocode_by_name(promo_name)
     if existing:
         await update.message.reply_text(
             f"❌ Промокод <b>{promo_name}</b> уже существует!\n\n"
@@ -551,7 +551,7 @@ async def create_promocode_with_tariffs(
 
     # Create promocode in database
     try:
-        promocode = database_service.add_promocode(
+        promocode = await database_service.add_promocode(
             name=promo_data["name"],
             promocode_type=promo_data["type"],
             date_from=promo_data["date_from"],
@@ -707,7 +707,7 @@ async def list_promocodes(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     try:
-        promocodes = database_service.list_active_promocodes()
+        promocodes = await database_service.list_active_promocodes()
 
         if not promocodes:
             await update.message.reply_text(
@@ -795,7 +795,7 @@ async def handle_delete_promocode_callback(
 
     try:
         # Deactivate promocode
-        success = database_service.deactivate_promocode(promocode_id)
+        success = await database_service.deactivate_promocode(promocode_id)
 
         if success:
             await query.edit_message_text(
@@ -53,10 +53,10 @@ async def check_user_contact(update: Update, context: ContextTypes.DEFAULT_TYPE)
             # Save contact to database
             try:
                 chat_id = navigation_service.get_chat_id(update)
-                user = database_service.get_user_by_chat_id(chat_id)
+                user = await database_service.get_user_by_chat_id(chat_id)
 
                 if user:
-                    database_service.update_user_contact(chat_id, cleaned_contact)
+                    await database_service.update_user_contact(chat_id, cleaned_contact)
                     LoggerService.info(
                         __name__,
                         "User contact saved to database",
@@ -65,8 +65,8 @@ async def check_user_contact(update: Update, context: ContextTypes.DEFAULT_TYPE)
                     )
                 else:
                     user_name = update.effective_user.username or cleaned_contact
-                    database_service.update_user_chat_id(user_name, chat_id)
-                    database_service.update_user_contact(chat_id, cleaned_contact)
+                    await database_service.update_user_chat_id(user_name, chat_id)
+                    await database_service.update_user_contact(chat_id, cleaned_contact)
                     LoggerService.warning(
                         __name__,
                         "User not found by chat_id, created new user",
@@ -94,7 +94,7 @@ async def check_user_contact(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
 
 async def display_bookings(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    booking_list = database_service.get_booking_by_user_contact(user_contact)
+    booking_list = await database_service.get_booking_by_user_contact(user_contact)
     message = ""
     if not booking_list or len(booking_list) == 0:
         LoggerService.info(__name__, "Booking not found", update)
@@ -50,13 +50,55 @@ def parse_date(date_string: str, date_format="%d.%m.%Y") -> datetime:
         return None
 
 
+def merge_intervals(intervals: Iterable[Tuple]) -> List[Tuple]:
+    """Sort [start, end) intervals and merge the overlapping or touching ones"""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def get_free_intervals(
+    busy_intervals: Iterable[Tuple], window_start, window_end
+) -> List[Tuple]:
+    """
+    Sweep over merged busy intervals and return the gaps within [window_start, window_end)
+    Works for any comparable bounds (datetimes, minutes)
+    """
+    free = []
+    cursor = window_start
+    for start, end in merge_intervals(busy_intervals):
+        if start >= window_end:
+            break
+        if cursor < start:
+            free.append((cursor, start))
+        if end > cursor:
+            cursor = end
+    if cursor < window_end:
+        free.append((cursor, window_end))
+    return free
+
+
 def get_free_time_slots(
     bookings: Iterable,
     day: date,
     start_time: time = time(0, 0),
 ) -> List[Tuple[time, time]]:
     cleaning = timedelta(hours=CLEANING_HOURS)
+    busy_intervals = [(b.start_date - cleaning, b.end_date + cleaning) for b in bookings]
+    return get_free_time_slots_for_intervals(busy_intervals, day, start_time)
+
 
+def get_free_time_slots_for_intervals(
+    busy_intervals: Iterable[Tuple[datetime, datetime]],
+    day: date,
+    start_time: time = time(0, 0),
+) -> List[Tuple[time, time]]:
+    """Hourly free slots of a day for (start, end) intervals that already include cleaning time"""
     day0 = datetime.combine(day, time(0, 0))
     DAY_END_EXCL = 24 * 60
     LAST_MINUTE = 23 * 60 + 59
@@ -90,37 +132,11 @@ def get_free_time_slots(
 
     day_start_min = clamp(minutes_from_day_start(day_start_dt))
 
-    # 1) собираем занятые интервалы [s,e) в пределах окна дня
-    busy: List[Tuple[int, int]] = []
-    for b in sorted(bookings, key=lambda x: x.start_date):
-        occ_start = b.start_date - cleaning
-        occ_end = b.end_date + cleaning
-        s = minutes_from_day_start(occ_start)
-        e = minutes_from_day_start(occ_end)
-        s = max(s, day_start_min)
-        e = min(e, DAY_END_EXCL)
-        if s < e:
-            busy.append((s, e))
-
-    busy.sort()
-    merged: List[Tuple[int, int]] = []
-    for s, e in busy:
-        if not merged or s > merged[-1][1]:
-            merged.append((s, e))
-        else:
-            merged[-1] = (merged[-1][0], max(merged[-1][1], e))
-
-    free: List[Tuple[int, int]] = []
-    cursor = day_start_min
-    for s, e in merged:
-        if cursor < s:
-            free.append((cursor, s))
-        cursor = max(cursor, e)
-    if cursor < DAY_END_EXCL:
-        free.append((cursor, DAY_END_EXCL))
-
-    if not merged and not free and day_start_min < DAY_END_EXCL:
-        free.append((day_start_min, DAY_END_EXCL))
+    busy = [
+        (minutes_from_day_start(occ_start), minutes_from_day_start(occ_end))
+        for occ_start, occ_end in busy_intervals
+    ]
+    free = get_free_intervals(busy, day_start_min, DAY_END_EXCL)
 
     slots: List[Tuple[time, time]] = []
     for fs, fe in free:
@@ -157,6 +173,19 @@ def get_free_dayes_slots(
     Considers current time for today's date
     Shows all days in month, not just days with bookings
     """
+    busy_intervals = [
+        (booking.start_date - cleaning_time, booking.end_date + cleaning_time)
+        for booking in bookings
+    ]
+    return get_free_days_for_intervals(busy_intervals, target_month, target_year)
+
+
+def get_free_days_for_intervals(
+    busy_intervals: Iterable[Tuple[datetime, datetime]],
+    target_month: int = None,
+    target_year: int = None,
+):
+    """Same as get_free_dayes_slots, for intervals that already include cleaning time"""
     now = datetime.now()
     today = now.date()
 
@@ -171,11 +200,11 @@ def get_free_dayes_slots(
     # Initialize available days
     available_days = _initialize_month_availability(start_of_month, end_of_month, today)
 
-    if not bookings:
+    if not busy_intervals:
         return available_days
 
     # Process bookings and update availability
-    date_bookings = _group_bookings_by_date(bookings, cleaning_time)
+    date_bookings = _group_intervals_by_date(busy_intervals)
     available_days = _update_availability_with_bookings(
         available_days, date_bookings, today, now
     )
@@ -212,21 +241,14 @@ def _initialize_month_availability(
     return available_days
 
 
-def _group_bookings_by_date(bookings, cleaning_time: timedelta) -> dict:
-    """Group bookings by date with cleaning time adjustments"""
+def _group_intervals_by_date(busy_intervals) -> dict:
+    """Group busy intervals (cleaning time included) by every date they touch"""
     date_bookings = {}
 
-    for booking in bookings:
-        start_date = booking.start_date.date()
-        end_date = booking.end_date.date()
-
-        # Add cleaning time adjustments
-        adjusted_start = booking.start_date - cleaning_time
-        adjusted_end = booking.end_date + cleaning_time
-
-        # Add to all dates this booking covers
-        current_date = start_date
-        while current_date <= end_date:
+    for adjusted_start, adjusted_end in busy_intervals:
+        # Add to all dates this interval covers
+        current_date = adjusted_start.date()
+        while current_date <= adjusted_end.date():
             if current_date not in date_bookings:
                 date_bookings[current_date] = []
 
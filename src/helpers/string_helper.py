@@ -6,8 +6,8 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from db.models.gift import GiftBase
 from db.models.booking import BookingBase
 from db.models.user import UserBase
-from src.helpers import tariff_helper
-from datetime import timedelta
+from src.helpers import tariff_helper, date_time_helper
+from datetime import datetime, time, timedelta
 from random import choice
 from string import ascii_uppercase
 from src.config.config import CLEANING_HOURS
@@ -75,59 +75,44 @@ def generate_available_slots(
     if len(bookings) == 0:
         return "Весь месяц свободен."
 
-    all_slots = []
-    current_time = from_datetime
-
-    while current_time < to_datetime:
-        all_slots.append(current_time)
-        current_time += time_step
-
-    extended_busy_slots = [
-        {
-            "start": booking.start_date - cleaning_time,
-            "end": booking.end_date + cleaning_time,
-        }
+    busy_slots = [
+        (booking.start_date - cleaning_time, booking.end_date + cleaning_time)
         for booking in bookings
     ]
+    free_slots = date_time_helper.get_free_intervals(
+        busy_slots, from_datetime, to_datetime
+    )
 
-    available_slots = [
-        slot
-        for slot in all_slots
-        if all(
-            not (busy["start"] <= slot < busy["end"]) for busy in extended_busy_slots
-        )
-    ]
-
+    # Slots are the grid from_datetime + k * time_step, each free gap gives
+    # a run of consecutive slots, split at midnight because of per-day grouping
     grouped_slots = {}
-    for slot in available_slots:
-        date_str = slot.strftime("%d-%m")
-        if date_str not in grouped_slots:
-            grouped_slots[date_str] = []
-        grouped_slots[date_str].append(slot)
+    for free_start, free_end in free_slots:
+        segment_start = free_start
+        while segment_start < free_end:
+            next_day = datetime.combine(segment_start.date() + timedelta(days=1), time(0, 0))
+            segment_end = min(free_end, next_day)
+            first_slot = _ceil_to_step(segment_start, from_datetime, time_step)
+            last_slot = _ceil_to_step(segment_end, from_datetime, time_step) - time_step
+            if first_slot <= last_slot:
+                day_ranges = grouped_slots.setdefault(first_slot.strftime("%d-%m"), [])
+                if day_ranges and day_ranges[-1][1] + time_step == first_slot:
+                    day_ranges[-1] = (day_ranges[-1][0], last_slot)
+                else:
+                    day_ranges.append((first_slot, last_slot))
+            segment_start = segment_end
 
     message = ""
-    for date, times in grouped_slots.items():
+    for date, day_ranges in grouped_slots.items():
         time_ranges = []
-        start_time = times[0]
+        for index, (start_time, end_time) in enumerate(day_ranges):
+            if start_time == end_time:
+                time_ranges.append(start_time.strftime("%H:%M"))
+                continue
 
-        for i in range(1, len(times)):
-            if (times[i] - times[i - 1]) > time_step:
-                end_time = times[i - 1]
-                if start_time == end_time:
-                    time_ranges.append(start_time.strftime("%H:%M"))
-                else:
-                    time_ranges.append(
-                        f"{start_time.strftime('%H:%M')} - {end_time.strftime('%H:%M')}"
-                    )
-                start_time = times[i]
-
-        end_time = times[-1]
-        if start_time == end_time:
-            time_ranges.append(start_time.strftime("%H:%M"))
-        else:
+            is_last_range = index == len(day_ranges) - 1
             end_str = (
                 "23:59"
-                if end_time.hour == 23 and end_time.minute == 0
+                if is_last_range and end_time.hour == 23 and end_time.minute == 0
                 else end_time.strftime("%H:%M")
             )
             time_ranges.append(f"{start_time.strftime('%H:%M')} - {end_str}")
@@ -137,6 +122,11 @@ def generate_available_slots(
     return message
 
 
+def _ceil_to_step(moment: datetime, origin: datetime, step: timedelta) -> datetime:
+    """First point of the origin + k * step grid that is not earlier than moment"""
+    return origin - ((origin - moment) // step) * step
+
+
 def generate_booking_info_message(
     booking: BookingBase,
     user: UserBase,
@@ -216,9 +206,8 @@ def generate_booking_info_message(
 
     # Add promocode info if used
     if booking.promocode_id:
-        from src.services.database_service import DatabaseService
-        database_service = DatabaseService()
-        promocode = database_service.get_promocode_by_id(booking.promocode_id)
+        # BookingBase.promocode is eagerly joined, so no extra query is needed here
+        promocode = booking.promocode
         if promocode:
             message += f"Промокод: {promocode.name} (-{promocode.discount_percentage}%)\n"
 
@@ -1,7 +1,6 @@
 import os
 import time
 import sys
-import threading
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from src.services.logger_service import LoggerService
@@ -13,8 +12,11 @@ from src.handlers import menu_handler, admin_handler, feedback_handler, booking_
 from src.config.config import TELEGRAM_TOKEN, ADMIN_CHAT_ID, INFORM_CHAT_ID
 from src.services import job_service
 from src.services.callback_recovery_service import CallbackRecoveryService
+from src.services.broadcast_service import BroadcastService
+from src.services.metrics_service import MetricsService
+from src.services.query_metrics_service import QueryMetricsService
 from src.services.redis import RedisPersistence
-from src.api.server import run as run_http_server
+from src.api import server as http_server
 
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
@@ -22,6 +24,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class InstrumentedApplication(Application):
+    """Application that records queries and duration of every update."""
+
+    async def process_update(self, update: object) -> None:
+        started_at = time.perf_counter()
+        with QueryMetricsService().track_update(update) as scope:
+            try:
+                await super().process_update(update)
+            finally:
+                MetricsService().update_duration.observe(
+                    time.perf_counter() - started_at, scope.handler
+                )
+
+
 async def set_commands(application: Application):
     user_commands = [BotCommand("start", "Открыть 'Главное меню'")]
     admin_commands = user_commands + [
@@ -42,6 +58,19 @@ async def set_commands(application: Application):
     )
 
 
+async def post_init(application: Application):
+    await set_commands(application)
+    # The HTTP API shares the bot loop, its rate limiter and the async engine
+    await http_server.start(application.bot)
+    job_service.JobService().register_background_jobs(application.job_queue)
+    # Continue a broadcast interrupted by the restart
+    application.create_task(BroadcastService().resume(application.bot))
+
+
+async def post_shutdown(application: Application):
+    await http_server.stop()
+
+
 async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Enhanced error handler with callback query recovery"""
 
@@ -83,8 +112,10 @@ if __name__ == "__main__":
     # Build application with persistence
     application = (
         Application.builder()
+        .application_class(InstrumentedApplication)
         .token(TELEGRAM_TOKEN)
-        .post_init(set_commands)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
         .persistence(persistence)
         .rate_limiter(AIORateLimiter(max_retries=3))
         .build()
@@ -140,8 +171,4 @@ if __name__ == "__main__":
     if hasattr(time, 'tzset'):
         time.tzset()
 
-    http_thread = threading.Thread(target=run_http_server, daemon=True)
-    http_thread.start()
-    logger.info("HTTP server started on port 8080")
-
     application.run_polling(allowed_updates=Update.ALL_TYPES)
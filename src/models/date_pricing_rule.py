@@ -32,6 +32,10 @@ class DatePricingRule:
                     f"Start date {self.start_date} cannot be after end date {self.end_date}"
                 )
 
+            # Parsed once here so date checks do not parse strings per call
+            self.start_date_obj = start_date_obj
+            self.end_date_obj = end_date_obj
+
         except ValueError as e:
             if "time data" in str(e):
                 raise ValueError(
@@ -40,9 +44,11 @@ class DatePricingRule:
             raise
 
         # Validate time format if provided
+        self.start_time_obj = None
+        self.end_time_obj = None
         if self.start_time is not None:
             try:
-                datetime.strptime(self.start_time, "%H:%M")
+                self.start_time_obj = datetime.strptime(self.start_time, "%H:%M").time()
             except ValueError:
                 raise ValueError(
                     f"Invalid start_time format. Expected HH:MM, got: {self.start_time}"
@@ -50,7 +56,7 @@ class DatePricingRule:
 
         if self.end_time is not None:
             try:
-                datetime.strptime(self.end_time, "%H:%M")
+                self.end_time_obj = datetime.strptime(self.end_time, "%H:%M").time()
             except ValueError:
                 raise ValueError(
                     f"Invalid end_time format. Expected HH:MM, got: {self.end_time}"
@@ -66,10 +72,7 @@ class DatePricingRule:
         if not self.is_active:
             return False
 
-        start_date_obj = datetime.strptime(self.start_date, "%Y-%m-%d").date()
-        end_date_obj = datetime.strptime(self.end_date, "%Y-%m-%d").date()
-
-        return start_date_obj <= target_date <= end_date_obj
+        return self.start_date_obj <= target_date <= self.end_date_obj
 
     def applies_to_datetime(self, target_datetime: datetime) -> bool:
         """Check if this rule applies to the given date and time."""
@@ -87,8 +90,8 @@ class DatePricingRule:
 
         # Check time range
         target_time = target_datetime.time()
-        start_time_obj = datetime.strptime(self.start_time, "%H:%M").time()
-        end_time_obj = datetime.strptime(self.end_time, "%H:%M").time()
+        start_time_obj = self.start_time_obj
+        end_time_obj = self.end_time_obj
 
         # Handle time ranges that cross midnight
         if start_time_obj <= end_time_obj:
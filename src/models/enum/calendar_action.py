@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class CalendarAction(Enum):
+    ADD = "ADD"
+    MOVE = "MOVE"
+    UPDATE = "UPDATE"
+    CANCEL = "CANCEL"
@@ -42,6 +42,8 @@ class HolidayPrepaymentRule:
                 raise ValueError(
                     f"Invalid recurring date format {self.date}: {e}"
                 )
+            # (month, day) for recurring rules, a date otherwise; see applies_to_date
+            self.date_key = (month, day)
         else:
             # For non-recurring holidays: YYYY-MM-DD
             if not re.match(r'^\d{4}-\d{2}-\d{2}$', self.date):
@@ -50,7 +52,7 @@ class HolidayPrepaymentRule:
                 )
             # Validate date is valid
             try:
-                datetime.strptime(self.date, "%Y-%m-%d")
+                self.date_key = datetime.strptime(self.date, "%Y-%m-%d").date()
             except ValueError as e:
                 raise ValueError(
                     f"Invalid non-recurring date format {self.date}: {e}"
@@ -69,9 +71,7 @@ class HolidayPrepaymentRule:
 
         if self.is_recurring:
             # Check only month and day
-            date_str = target_date.strftime("%m-%d")
-            return date_str == self.date
+            return (target_date.month, target_date.day) == self.date_key
         else:
             # Check full date
-            target_str = target_date.strftime("%Y-%m-%d")
-            return target_str == self.date
+            return target_date == self.date_key
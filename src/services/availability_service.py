@@ -0,0 +1,184 @@
+import asyncio
+import sys
+import os
+from bisect import bisect_left
+from datetime import date, datetime, time, timedelta
+from typing import List, Tuple
+from dateutil.relativedelta import relativedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.config.config import CLEANING_HOURS
+from src.helpers import date_time_helper
+from src.services.logger_service import LoggerService
+from src.services.slot_hold_service import SlotHoldService
+from singleton_decorator import singleton
+
+
+@singleton
+class AvailabilityService:
+    """
+    Process-wide index of occupied intervals used by the booking calendars.
+
+    Active prepaid bookings are loaded once and kept as a list of
+    (start - cleaning, end + cleaning, booking_id) sorted by start.
+    BookingRepository.add_booking/update_booking keep it in sync, so
+    rendering a month or an hours picker does not query PostgreSQL.
+    Slots held by other users during checkout (SlotHoldService) are shown
+    as busy as well.
+    """
+
+    def __init__(self):
+        self._cleaning = timedelta(hours=CLEANING_HOURS)
+        self._starts: List[datetime] = []
+        self._intervals: List[Tuple[datetime, datetime, int]] = []
+        self._by_id: dict[int, Tuple[datetime, datetime, int]] = {}
+        # Longest interval seen, bounds how far back an overlap search must look
+        self._max_span = timedelta(0)
+        self._is_loaded = False
+        self._load_lock = asyncio.Lock()
+        # Bookings written while a reload awaits the database, by id
+        self._applied_during_reload = None
+        self._slot_hold_service = SlotHoldService()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._is_loaded
+
+    async def ensure_loaded(self):
+        """Load the index on first use, raises if it can't be loaded."""
+        if self._is_loaded:
+            return
+
+        async with self._load_lock:
+            if not self._is_loaded:
+                await self._reload()
+
+    async def reload(self):
+        """Rebuild the index from the database."""
+        async with self._load_lock:
+            await self._reload()
+
+    async def _reload(self):
+        # Imported here: BookingRepository notifies this service on writes
+        from src.services.database.booking_repository import BookingRepository
+
+        self._applied_during_reload = {}
+        try:
+            yesterday = date.today() - timedelta(days=1)
+            bookings = await BookingRepository().get_active_bookings(yesterday)
+            self.load(bookings)
+            # The query may have started before these writes were committed
+            for booking in self._applied_during_reload.values():
+                self.apply_booking(booking)
+            LoggerService.info(
+                __name__,
+                "availability index loaded",
+                **{"intervals_count": len(self._intervals)},
+            )
+        except Exception as e:
+            # Free days computed from a missing index would offer booked dates
+            print(f"Error loading availability index: {e}")
+            LoggerService.error(__name__, "reload", e)
+            raise
+        finally:
+            self._applied_during_reload = None
+
+    def load(self, bookings):
+        intervals = sorted(
+            (self._to_interval(booking) for booking in bookings if self._is_active(booking)),
+            key=lambda interval: interval[0],
+        )
+        self._intervals = intervals
+        self._starts = [interval[0] for interval in intervals]
+        self._by_id = {interval[2]: interval for interval in intervals}
+        self._max_span = max(
+            (end - start for start, end, _ in intervals), default=timedelta(0)
+        )
+        self._is_loaded = True
+
+    def apply_booking(self, booking):
+        """Insert, move or drop a booking after it was created or updated."""
+        if not booking:
+            return
+        if self._applied_during_reload is not None:
+            self._applied_during_reload[booking.id] = booking
+        if not self._is_loaded:
+            return
+
+        self.remove_booking(booking.id)
+        if self._is_active(booking):
+            interval = self._to_interval(booking)
+            index = bisect_left(self._starts, interval[0])
+            self._starts.insert(index, interval[0])
+            self._intervals.insert(index, interval)
+            self._by_id[booking.id] = interval
+            self._max_span = max(self._max_span, interval[1] - interval[0])
+
+    def remove_booking(self, booking_id: int):
+        interval = self._by_id.pop(booking_id, None)
+        if not interval:
+            return
+
+        index = bisect_left(self._starts, interval[0])
+        while self._intervals[index][2] != booking_id:
+            index += 1
+        del self._starts[index]
+        del self._intervals[index]
+
+    def get_busy_intervals(
+        self, from_date: datetime, to_date: datetime, except_booking_id: int = None
+    ) -> List[Tuple[datetime, datetime]]:
+        """Occupied intervals (cleaning included) overlapping [from_date, to_date)."""
+        result = []
+        index = bisect_left(self._starts, from_date - self._max_span)
+        while index < len(self._intervals) and self._starts[index] < to_date:
+            start, end, booking_id = self._intervals[index]
+            if end > from_date and booking_id != except_booking_id:
+                result.append((start, end))
+            index += 1
+        return result
+
+    async def get_free_days(
+        self, month: int, year: int, except_booking_id: int = None, hold_owner: int = None
+    ) -> List[date]:
+        await self.ensure_loaded()
+        month_start = datetime(year, month, 1)
+        month_end = month_start + relativedelta(months=1)
+        busy_intervals = self.get_busy_intervals(
+            month_start, month_end, except_booking_id
+        ) + self._slot_hold_service.get_held_intervals(month_start, month_end, hold_owner)
+        return date_time_helper.get_free_days_for_intervals(
+            busy_intervals, target_month=month, target_year=year
+        )
+
+    async def get_free_time_slots(
+        self,
+        day: date,
+        start_time: time = time(0, 0),
+        except_booking_id: int = None,
+        hold_owner: int = None,
+    ) -> List[Tuple[time, time]]:
+        await self.ensure_loaded()
+        day_start = datetime.combine(day, time(0, 0))
+        day_end = day_start + timedelta(days=1)
+        busy_intervals = self.get_busy_intervals(
+            day_start, day_end, except_booking_id
+        ) + self._slot_hold_service.get_held_intervals(day_start, day_end, hold_owner)
+        return date_time_helper.get_free_time_slots_for_intervals(
+            busy_intervals, day, start_time
+        )
+
+    def _to_interval(self, booking) -> Tuple[datetime, datetime, int]:
+        return (
+            booking.start_date - self._cleaning,
+            booking.end_date + self._cleaning,
+            booking.id,
+        )
+
+    @staticmethod
+    def _is_active(booking) -> bool:
+        return (
+            bool(booking.is_prepaymented)
+            and not booking.is_canceled
+            and not booking.is_done
+        )
@@ -0,0 +1,256 @@
+import asyncio
+import sys
+import os
+import time
+from datetime import timedelta
+from typing import Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.services.logger_service import LoggerService
+from src.services.rate_limiter import TokenBucket
+from src.services.redis.redis_connection import RedisConnection
+from src.config.config import ADMIN_CHAT_ID
+from telegram.error import BadRequest, Forbidden, RetryAfter, TelegramError
+from singleton_decorator import singleton
+
+
+@singleton
+class BroadcastService:
+    """
+    Broadcast engine for admin mailings.
+
+    Messages go out through a pool of concurrent senders sharing one token
+    bucket kept below Telegram's ~30 msg/s global limit. Remaining chat ids
+    and counters live in Redis, so a broadcast interrupted by a restart is
+    resumed from where it stopped. The admin sees one progress message that
+    is edited in place and finally replaced by the summary.
+    """
+
+    ACTIVE_KEY = "broadcast:active"
+
+    def __init__(self):
+        self._redis = RedisConnection()
+        self._bucket = TokenBucket(rate=25)
+        self._concurrency = 10
+        self._max_retries = 3
+        self._progress_interval = 5
+        self._ttl = timedelta(days=7)
+
+    @property
+    def messages_per_second(self) -> float:
+        return self._bucket.rate
+
+    def is_running(self) -> bool:
+        return bool(self._redis.client.exists(self.ACTIVE_KEY))
+
+    async def start(self, bot, chat_ids: list[int], message: str) -> Optional[dict]:
+        """Start a broadcast and wait for it, None if another one is running.
+
+        An empty audience returns a zero summary without taking the lock.
+        """
+        if not chat_ids:
+            return self._get_result(0, {"sent": 0, "failed": 0}, time.time())
+
+        broadcast_id = str(int(time.time() * 1000))
+        # The lock expires on its own if the process dies before setting it up
+        if not self._redis.client.set(
+            self.ACTIVE_KEY, broadcast_id, nx=True, ex=self._ttl
+        ):
+            return None
+
+        try:
+            progress_message = await bot.send_message(
+                chat_id=ADMIN_CHAT_ID,
+                text=self._format_progress(len(chat_ids), 0, 0),
+            )
+
+            pipe = self._redis.client.pipeline(transaction=False)
+            pipe.hset(
+                self._get_key(broadcast_id),
+                mapping={
+                    "message": message,
+                    "total": len(chat_ids),
+                    "sent": 0,
+                    "failed": 0,
+                    "started_at": time.time(),
+                    "progress_message_id": progress_message.message_id,
+                },
+            )
+            pipe.sadd(self._get_pending_key(broadcast_id), *chat_ids)
+            for key in (self._get_key(broadcast_id), self._get_pending_key(broadcast_id)):
+                pipe.expire(key, self._ttl)
+            pipe.execute()
+        except Exception:
+            # Without its state the broadcast can't be resumed, release the lock
+            self._delete_keys(broadcast_id)
+            raise
+
+        LoggerService.info(
+            __name__,
+            "Broadcast started",
+            **{"broadcast_id": broadcast_id, "total": len(chat_ids)},
+        )
+        return await self._run(bot, broadcast_id)
+
+    async def resume(self, bot) -> Optional[dict]:
+        """Continue a broadcast interrupted by a restart, if there is one."""
+        broadcast_id = self._redis.client.get(self.ACTIVE_KEY)
+        if not broadcast_id:
+            return None
+
+        if not self._redis.client.exists(self._get_key(broadcast_id)):
+            self._redis.client.delete(self.ACTIVE_KEY)
+            return None
+
+        LoggerService.info(
+            __name__, "Broadcast resumed", **{"broadcast_id": broadcast_id}
+        )
+        return await self._run(bot, broadcast_id)
+
+    async def _run(self, bot, broadcast_id: str) -> dict:
+        state = self._redis.client.hgetall(self._get_key(broadcast_id))
+        pending = self._redis.client.smembers(self._get_pending_key(broadcast_id))
+        message = state["message"]
+        total = int(state["total"])
+
+        queue = asyncio.Queue()
+        for chat_id in pending:
+            queue.put_nowait((int(chat_id), 0))
+
+        counters = {"sent": int(state["sent"]), "failed": int(state["failed"])}
+        workers = [
+            asyncio.create_task(
+                self._send_worker(bot, broadcast_id, message, queue, counters)
+            )
+            for _ in range(min(self._concurrency, queue.qsize()))
+        ]
+        progress_task = asyncio.create_task(
+            self._report_progress(bot, state, total, counters)
+        )
+        try:
+            await queue.join()
+        finally:
+            progress_task.cancel()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(progress_task, *workers, return_exceptions=True)
+
+        result = self._get_result(total, counters, float(state["started_at"]))
+        try:
+            await self._edit_progress(bot, state, self._format_summary(result))
+        finally:
+            self._delete_keys(broadcast_id)
+
+        LoggerService.info(
+            __name__, "Broadcast finished", **{"broadcast_id": broadcast_id, **result}
+        )
+        return result
+
+    async def _send_worker(
+        self, bot, broadcast_id: str, message: str, queue: asyncio.Queue, counters: dict
+    ):
+        while True:
+            chat_id, attempts = await queue.get()
+            try:
+                await self._bucket.acquire()
+                is_sent = await self._send(bot, chat_id, message)
+            except RetryAfter as e:
+                # Flood control: stop every sender, then try this chat again
+                self._bucket.pause(self._get_seconds(e.retry_after))
+                if attempts + 1 < self._max_retries:
+                    queue.put_nowait((chat_id, attempts + 1))
+                    continue
+                is_sent = False
+            finally:
+                queue.task_done()
+
+            counter = "sent" if is_sent else "failed"
+            counters[counter] += 1
+            try:
+                pipe = self._redis.client.pipeline(transaction=False)
+                pipe.srem(self._get_pending_key(broadcast_id), chat_id)
+                pipe.hincrby(self._get_key(broadcast_id), counter, 1)
+                pipe.execute()
+            except Exception as e:
+                # Only resuming is affected, the chat may get the message twice
+                LoggerService.error(__name__, "Broadcast progress not saved", exception=e)
+
+    async def _send(self, bot, chat_id: int, message: str) -> bool:
+        try:
+            await bot.send_message(chat_id=chat_id, text=message, parse_mode="HTML")
+            return True
+        except RetryAfter:
+            raise
+        except (Forbidden, BadRequest):
+            # Bot blocked or chat deleted, expected for part of the audience
+            return False
+        except Exception as e:
+            LoggerService.error(
+                __name__, f"Broadcast error for chat {chat_id}", exception=e
+            )
+            return False
+
+    async def _report_progress(self, bot, state: dict, total: int, counters: dict):
+        reported = None
+        while True:
+            await asyncio.sleep(self._progress_interval)
+            current = (counters["sent"], counters["failed"])
+            if current != reported:
+                reported = current
+                await self._edit_progress(
+                    bot, state, self._format_progress(total, *current)
+                )
+
+    async def _edit_progress(self, bot, state: dict, text: str):
+        try:
+            await bot.edit_message_text(
+                chat_id=ADMIN_CHAT_ID,
+                message_id=int(state["progress_message_id"]),
+                text=text,
+                parse_mode="HTML",
+            )
+        except TelegramError as e:
+            LoggerService.warning(__name__, f"Broadcast progress not updated: {e}")
+
+    def _get_result(self, total: int, counters: dict, started_at: float) -> dict:
+        return {
+            "total_users": total,
+            "sent": counters["sent"],
+            "failed": counters["failed"],
+            "duration_seconds": time.time() - started_at,
+        }
+
+    def _delete_keys(self, broadcast_id: str) -> None:
+        self._redis.client.delete(
+            self.ACTIVE_KEY,
+            self._get_key(broadcast_id),
+            self._get_pending_key(broadcast_id),
+        )
+
+    def _format_progress(self, total: int, sent: int, failed: int) -> str:
+        return (
+            f"📤 Прогресс: {sent + failed}/{total} "
+            f"({sent} отправлено, {failed} ошибок)"
+        )
+
+    def _format_summary(self, result: dict) -> str:
+        return (
+            f"✅ <b>Рассылка завершена!</b>\n\n"
+            f"📊 Статистика:\n"
+            f"• Всего пользователей: {result['total_users']}\n"
+            f"• Успешно отправлено: {result['sent']}\n"
+            f"• Не доставлено: {result['failed']}\n"
+            f"• Время выполнения: {result['duration_seconds']:.1f} сек"
+        )
+
+    @staticmethod
+    def _get_seconds(retry_after) -> float:
+        if isinstance(retry_after, timedelta):
+            return retry_after.total_seconds()
+        return float(retry_after)
+
+    def _get_key(self, broadcast_id: str) -> str:
+        return f"broadcast:{broadcast_id}"
+
+    def _get_pending_key(self, broadcast_id: str) -> str:
+        return f"broadcast:{broadcast_id}:pending"
@@ -1,41 +1,129 @@
 import sys
 import os
+import calendar
+from dataclasses import dataclass
 from datetime import date
 from src.models.enum.tariff import Tariff
 from src.models.rental_price import RentalPrice
 from src.services.file_service import FileService
 from src.services.date_pricing_service import DatePricingService
-from typing import List
+from src.services.prepayment_service import PrepaymentService
+from typing import Dict, List, Optional, Tuple
 from singleton_decorator import singleton
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+DAILY_TARIFFS = (Tariff.DAY.value, Tariff.DAY_FOR_COUPLE.value, Tariff.INCOGNITA_DAY.value)
+
+# Bits of the add-on mask
+SAUNA = 1
+SECRET_ROOM = 2
+SECOND_ROOM = 4
+PHOTOSHOOT = 8
+
+
+@dataclass(frozen=True)
+class CompiledTariff:
+    """A RentalPrice with its lookups precomputed."""
+
+    rental_price: RentalPrice
+    is_daily: bool
+    # Index is the number of days, None where tariff_rate.json has no price
+    multi_day_prices: Tuple[Optional[int], ...]
+    # Index is an add-on mask (SAUNA | SECRET_ROOM | ...)
+    add_on_prices: Tuple[int, ...]
+
+    @classmethod
+    def compile(cls, rental_price: RentalPrice) -> "CompiledTariff":
+        days = {int(day): price for day, price in (rental_price.multi_day_prices or {}).items()}
+        multi_day_prices = tuple(days.get(day) for day in range(max(days, default=-1) + 1))
+
+        add_ons = (
+            (SAUNA, rental_price.sauna_price if rental_price.sauna_price > 0 else 0),
+            (SECRET_ROOM, rental_price.secret_room_price if rental_price.secret_room_price > 0 else 0),
+            (SECOND_ROOM, rental_price.second_bedroom_price if rental_price.second_bedroom_price > 0 else 0),
+            (PHOTOSHOOT, rental_price.photoshoot_price),
+        )
+        add_on_prices = tuple(
+            sum(price for bit, price in add_ons if mask & bit) for mask in range(16)
+        )
+        return cls(
+            rental_price=rental_price,
+            is_daily=rental_price.tariff in DAILY_TARIFFS,
+            multi_day_prices=multi_day_prices,
+            add_on_prices=add_on_prices,
+        )
+
+    def get_multi_day_price(self, days: int) -> Optional[int]:
+        if 0 <= days < len(self.multi_day_prices):
+            return self.multi_day_prices[days]
+        return None
+
+    def get_add_on_price(
+        self,
+        is_sauna: bool,
+        is_secret_room: bool,
+        is_second_room: bool,
+        is_photoshoot: bool,
+        count_people: int,
+    ) -> int:
+        mask = (
+            (SAUNA if is_sauna else 0)
+            | (SECRET_ROOM if is_secret_room else 0)
+            | (SECOND_ROOM if is_second_room else 0)
+            | (PHOTOSHOOT if is_photoshoot else 0)
+        )
+        price = self.add_on_prices[mask]
+        extra_people = count_people - self.rental_price.max_people
+        if extra_people > 0:
+            price += extra_people * self.rental_price.extra_people_price
+        return price
+
+
+@dataclass(frozen=True)
+class DayQuote:
+    """Price of a booking starting on one day, as the booking flow computes it."""
+
+    day: date
+    # Tariff price for the duration, without date rules
+    base_price: int
+    price_override: Optional[int]
+    # price_override if a date rule applies, base_price otherwise
+    price: int
+    prepayment_percentage: int
+    prepayment: float
+
+
+def split_days(duration_hours: int) -> Tuple[int, int]:
+    """Whole days and leftover hours; more than 15 leftover hours count as a day."""
+    total_days, remainder_hours = divmod(duration_hours, 24)
+    if remainder_hours > 15:
+        return total_days + 1, 0
+    return total_days, remainder_hours
+
 
 @singleton
 class CalculationRateService:
     _rates: List[RentalPrice] = []
+    # Compiled from _rates, rebuilt when _rates is replaced
+    _table: Dict[int, CompiledTariff] = {}
+    _table_source: Optional[List[RentalPrice]] = None
 
     def get_by_tariff(self, tariff: Tariff) -> RentalPrice:
         if tariff == Tariff.GIFT:
             return None
 
-        tariffs = self._try_load_tariffs()
-        selected_tariff = next(
-            (rate for rate in tariffs if rate.tariff == tariff.value), None
-        )
-        if selected_tariff is None:
+        compiled = self._get_table().get(tariff.value)
+        if compiled is None:
             raise ValueError(f"No RentalPrice found for tariff: {tariff}")
-        return selected_tariff
+        return compiled.rental_price
 
     def get_price(self, tariff: Tariff = None) -> int:
-        tariffs = self._try_load_tariffs()
         if tariff is not None:
-            price = next(
-                (rate.price for rate in tariffs if rate.tariff == tariff.value), None
-            )
-            if price is None:
+            compiled = self._get_table().get(tariff.value)
+            if compiled is None:
                 raise ValueError(f"No price found for tariff: {tariff}")
-            return price
+            return compiled.rental_price.price
 
         return 0
 
@@ -49,46 +137,22 @@ class CalculationRateService:
         count_people: int = 0,
         duration_hours: int = 0,
     ) -> int:
-        price = 0
+        compiled = self._get_compiled(rental_price)
         extra_hours = duration_hours - rental_price.duration_hours
         if extra_hours > 0:
-            if rental_price.tariff in [
-                Tariff.DAY.value,
-                Tariff.DAY_FOR_COUPLE.value,
-                Tariff.INCOGNITA_DAY.value,
-            ]:
-                total_days = duration_hours // 24
-                remainder_hours = duration_hours % 24
-
-                if remainder_hours > 15 and remainder_hours < 24:
-                    total_days += 1
-                    remainder_hours = 0
-
-                if str(total_days) in rental_price.multi_day_prices:
-                    price += rental_price.multi_day_prices[str(total_days)]
-
+            if compiled.is_daily:
+                total_days, remainder_hours = split_days(duration_hours)
+                price = compiled.get_multi_day_price(total_days) or 0
                 if remainder_hours > 0:
                     price += remainder_hours * rental_price.extra_hour_price
             else:
-                price = rental_price.price
-                price += extra_hours * rental_price.extra_hour_price
+                price = rental_price.price + extra_hours * rental_price.extra_hour_price
         else:
             price = rental_price.price
 
-        if is_sauna and rental_price.sauna_price > 0:
-            price += rental_price.sauna_price
-        if is_secret_room and rental_price.secret_room_price > 0:
-            price += rental_price.secret_room_price
-        if is_second_room and rental_price.second_bedroom_price > 0:
-            price += rental_price.second_bedroom_price
-        if is_photoshoot:
-            price += rental_price.photoshoot_price
-        if count_people > rental_price.max_people:
-            price += (
-                count_people - rental_price.max_people
-            ) * rental_price.extra_people_price
-
-        return price
+        return price + compiled.get_add_on_price(
+            is_sauna, is_secret_room, is_second_room, is_photoshoot, count_people
+        )
 
     def get_price_categories(
         self,
@@ -120,6 +184,69 @@ class CalculationRateService:
             self._rates = file_service.get_tariff_rates()
         return self._rates
 
+    def load_rates(self) -> Tuple[List[RentalPrice], Dict[int, CompiledTariff]]:
+        """Read, validate and compile tariff_rate.json without touching the rates in use."""
+        rates = FileService().get_tariff_rates()
+        table = self._compile(rates)
+        self._validate(rates, table)
+        return rates, table
+
+    def set_rates(self, rates: List[RentalPrice], table: Dict[int, CompiledTariff]):
+        """Swap in rates returned by load_rates."""
+        # Table first: whoever sees the new rates must also see their table
+        self._table = table
+        self._table_source = rates
+        self._rates = rates
+
+    def refresh_rates(self) -> List[RentalPrice]:
+        self.set_rates(*self.load_rates())
+        return self._rates
+
+    def _get_table(self) -> Dict[int, CompiledTariff]:
+        rates = self._try_load_tariffs()
+        if self._table_source is not rates:
+            self._table = self._compile(rates)
+            self._table_source = rates
+        return self._table
+
+    @staticmethod
+    def _compile(rates: List[RentalPrice]) -> Dict[int, CompiledTariff]:
+        table = {}
+        for rate in rates:
+            # First entry wins, as with the linear scan this replaced
+            table.setdefault(rate.tariff, CompiledTariff.compile(rate))
+        return table
+
+    def _validate(self, rates: List[RentalPrice], table: Dict[int, CompiledTariff]):
+        for rate in rates:
+            Tariff(rate.tariff)
+            for field in (
+                "duration_hours",
+                "price",
+                "sauna_price",
+                "secret_room_price",
+                "second_bedroom_price",
+                "extra_hour_price",
+                "extra_people_price",
+                "photoshoot_price",
+                "max_people",
+            ):
+                value = getattr(rate, field)
+                if not isinstance(value, int) or value < 0:
+                    raise ValueError(f"Invalid {field} for tariff {rate.tariff}: {value}")
+
+        # Handlers look tariffs up by value, one must not disappear on reload
+        missing = set(self._table) - set(table)
+        if missing:
+            raise ValueError(f"Tariffs missing from the new rates: {sorted(missing)}")
+
+    def _get_compiled(self, rental_price: RentalPrice) -> CompiledTariff:
+        compiled = self._get_table().get(rental_price.tariff)
+        if compiled is not None and compiled.rental_price is rental_price:
+            return compiled
+        # A RentalPrice that is not from tariff_rate.json, e.g. edited by a caller
+        return CompiledTariff.compile(rental_price)
+
     # Date-aware pricing methods
 
     def get_effective_price_for_date(
@@ -133,21 +260,61 @@ class CalculationRateService:
             return price_override
 
         # Fallback to standard tariff calculation
-        rental_price = self.get_by_tariff(tariff)
-        if rental_price is None:
-            raise ValueError(f"No RentalPrice found for tariff: {tariff}")
+        return self._get_base_price(tariff, duration_hours)
 
-        # Calculate base price using existing logic
-        if duration_hours > 24 and rental_price.multi_day_prices:
-            total_days = duration_hours // 24
-            remainder_hours = duration_hours % 24
+    def quote_month(
+        self, year: int, month: int, tariff: Tariff, duration_hours: int
+    ) -> List[DayQuote]:
+        """Quotes for every day of a month."""
+        last_day = calendar.monthrange(year, month)[1]
+        return self.quote_period(
+            date(year, month, 1), date(year, month, last_day), tariff, duration_hours
+        )
+
+    def quote_period(
+        self, start: date, end: date, tariff: Tariff, duration_hours: int
+    ) -> List[DayQuote]:
+        """
+        Quotes for every day from start to end inclusive, e.g. the whole
+        PERIOD_IN_MONTHS booking horizon.
 
-            if remainder_hours > 15 and remainder_hours < 24:
-                total_days += 1
-                remainder_hours = 0
+        Same numbers as get_effective_price_for_date and
+        PrepaymentService.calculate_prepayment per day, but the tariff price
+        is computed once and date and holiday rules are read for the whole
+        range in one pass over their indexes.
+        """
+        base_price = self._get_base_price(tariff, duration_hours)
+        rules = DatePricingService().get_effective_rules(start, end)
+        percentages = PrepaymentService().get_prepayment_percentages(start, end)
 
-            if str(total_days) in rental_price.multi_day_prices:
-                price = rental_price.multi_day_prices[str(total_days)]
+        quotes = []
+        for offset, (rule, percentage) in enumerate(zip(rules, percentages)):
+            price_override = None
+            if rule is not None and rule.price_override is not None:
+                price_override = rule.get_price_for_duration(duration_hours)
+            price = price_override if price_override is not None else base_price
+            quotes.append(
+                DayQuote(
+                    day=date.fromordinal(start.toordinal() + offset),
+                    base_price=base_price,
+                    price_override=price_override,
+                    price=price,
+                    prepayment_percentage=percentage,
+                    prepayment=round(price * (percentage / 100.0), 2),
+                )
+            )
+        return quotes
+
+    def _get_base_price(self, tariff: Tariff, duration_hours: int) -> int:
+        compiled = self._get_table().get(tariff.value)
+        if compiled is None:
+            raise ValueError(f"No RentalPrice found for tariff: {tariff}")
+        rental_price = compiled.rental_price
+
+        if duration_hours > 24 and compiled.multi_day_prices:
+            total_days, remainder_hours = split_days(duration_hours)
+            price = compiled.get_multi_day_price(total_days)
+            if price is not None:
                 if remainder_hours > 0:
                     price += remainder_hours * rental_price.extra_hour_price
                 return price
@@ -176,24 +343,11 @@ class CalculationRateService:
             booking_date, tariff, duration_hours
         )
 
-        # Get rental price for add-on calculations (always use standard tariff for add-on prices)
-        rental_price = self.get_by_tariff(tariff)
-        if rental_price is None:
+        # Add-on prices always come from the standard tariff (date rules only affect base price)
+        compiled = self._get_table().get(tariff.value)
+        if compiled is None:
             raise ValueError(f"No RentalPrice found for tariff: {tariff}")
 
-        # Add services using standard pricing (date rules only affect base price)
-        additional_price = 0
-        if is_sauna and rental_price.sauna_price > 0:
-            additional_price += rental_price.sauna_price
-        if is_secret_room and rental_price.secret_room_price > 0:
-            additional_price += rental_price.secret_room_price
-        if is_second_room and rental_price.second_bedroom_price > 0:
-            additional_price += rental_price.second_bedroom_price
-        if is_photoshoot:
-            additional_price += rental_price.photoshoot_price
-        if count_people > rental_price.max_people:
-            additional_price += (
-                count_people - rental_price.max_people
-            ) * rental_price.extra_people_price
-
-        return base_price + additional_price
+        return base_price + compiled.get_add_on_price(
+            is_sauna, is_secret_room, is_second_room, is_photoshoot, count_people
+        )
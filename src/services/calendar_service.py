@@ -4,9 +4,11 @@ import json
 import socket
 import sys
 import os
+from typing import Optional
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from src.services.logger_service import LoggerService
+from src.services.metrics_service import MetricsService
 from src.helpers import string_helper, tariff_helper
 from google.auth.exceptions import TransportError
 from google.oauth2 import service_account
@@ -16,6 +18,7 @@ from db.models.user import UserBase
 from db.models.booking import BookingBase
 from singleton_decorator import singleton
 from src.config.config import CALENDAR_ID
+from src.models.enum.calendar_action import CalendarAction
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -41,7 +44,19 @@ _retry_on_network = retry(
 
 @singleton
 class CalendarService:
-    def __init__(self):
+    # Google accepts at most 50 calls in one batch request
+    BATCH_LIMIT = 50
+
+    def __init__(self, http=None):
+        """
+        Args:
+            http: Optional httplib2-compatible transport, tests pass a local
+                stand-in instead of talking to Google
+        """
+        if http is not None:
+            self.service = build("calendar", "v3", http=http, static_discovery=True)
+            return
+
         credentials_base64 = os.getenv("GOOGLE_CREDENTIALS")
         credentials_json = base64.b64decode(credentials_base64).decode("utf-8")
         credentials_dict = json.loads(credentials_json)
@@ -67,19 +82,131 @@ class CalendarService:
         source_label = "🌐" if booking.source == "web" else "📱"
         return f"{source_label} {tariff_helper.get_name(booking.tariff)}"
 
+    @staticmethod
+    def _event_time(value: datetime) -> dict:
+        return {"dateTime": value.isoformat(), "timeZone": "Europe/Minsk"}
+
+    def _event_info(self, booking: BookingBase, user: UserBase) -> dict:
+        return {
+            "summary": self._event_summary(booking),
+            "description": string_helper.generate_booking_info_message(booking, user),
+        }
+
+    @staticmethod
+    def get_booking_event_id(booking_id: int) -> str:
+        """Deterministic event id (base32hex alphabet), a retried insert cannot duplicate the event"""
+        return f"booking{booking_id:06d}"
+
+    def sync_booking(
+        self, action: CalendarAction, booking: BookingBase, user: UserBase
+    ) -> Optional[str]:
+        """Apply an outbox action to the booking's event and return the event id.
+
+        Unlike the public wrappers, errors are raised so the outbox worker can retry.
+        """
+        result = self.sync_bookings([(action, booking, user)])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def sync_bookings(self, items: list) -> list:
+        """Apply (action, booking, user) outbox items, one HTTP request per batch of 50.
+
+        Returns the event id or the raised exception for every item, in order.
+        """
+        results = [None] * len(items)
+        for offset in range(0, len(items), self.BATCH_LIMIT):
+            batch = self.service.new_batch_http_request()
+            batched = []
+            for index in range(offset, min(offset + self.BATCH_LIMIT, len(items))):
+                action, booking, user = items[index]
+                request = self._build_sync_request(action, booking, user)
+                if request is None:
+                    results[index] = booking.calendar_event_id
+                    continue
+
+                batch.add(
+                    request,
+                    callback=self._batch_callback(results, index, action, booking),
+                    request_id=str(index),
+                )
+                batched.append(index)
+
+            if not batched:
+                continue
+            try:
+                self._execute_batch(batch)
+            except Exception as e:
+                # Items answered without a request keep their event id (or None)
+                for index in batched:
+                    if results[index] is None:
+                        results[index] = e
+        return results
+
+    def _build_sync_request(
+        self, action: CalendarAction, booking: BookingBase, user: UserBase
+    ):
+        """Build the request for an outbox item, None when there is nothing to send."""
+        events = self.service.events()
+        if action == CalendarAction.ADD:
+            if booking.calendar_event_id:
+                return None
+            body = {
+                "id": self.get_booking_event_id(booking.id),
+                "start": self._event_time(booking.start_date),
+                "end": self._event_time(booking.end_date),
+                **self._event_info(booking, user),
+            }
+            return events.insert(calendarId=CALENDAR_ID, body=body)
+
+        if not booking.calendar_event_id:
+            return None
+
+        if action == CalendarAction.MOVE:
+            body = {
+                "start": self._event_time(booking.start_date),
+                "end": self._event_time(booking.end_date),
+                **self._event_info(booking, user),
+            }
+        elif action == CalendarAction.UPDATE:
+            body = self._event_info(booking, user)
+        else:
+            body = {"colorId": "8", "summary": f"Отмена {self._event_summary(booking)}"}
+
+        return events.patch(
+            calendarId=CALENDAR_ID, eventId=booking.calendar_event_id, body=body
+        )
+
+    def _batch_callback(
+        self, results: list, index: int, action: CalendarAction, booking: BookingBase
+    ):
+        def callback(request_id, response, exception):
+            if exception is None:
+                results[index] = response["id"]
+            elif (
+                action == CalendarAction.ADD
+                and isinstance(exception, HttpError)
+                and exception.status_code == 409
+            ):
+                # Already inserted by a previous attempt
+                results[index] = self.get_booking_event_id(booking.id)
+            else:
+                results[index] = exception
+
+        return callback
+
+    @_retry_on_network
+    def _execute_batch(self, batch):
+        with MetricsService().calendar_duration.time("batch"):
+            batch.execute()
+        LoggerService.info(__name__, "execute_batch")
+
     @_retry_on_network
     def _add_event(self, booking: BookingBase, user: UserBase) -> str:
         event = {
-            "summary": self._event_summary(booking),
-            "description": string_helper.generate_booking_info_message(booking, user),
-            "start": {
-                "dateTime": booking.start_date.isoformat(),
-                "timeZone": "Europe/Minsk",
-            },
-            "end": {
-                "dateTime": booking.end_date.isoformat(),
-                "timeZone": "Europe/Minsk",
-            },
+            "start": self._event_time(booking.start_date),
+            "end": self._event_time(booking.end_date),
+            **self._event_info(booking, user),
         }
         event = (
             self.service.events()
@@ -139,23 +266,16 @@ class CalendarService:
         self, event_id: str, start_datetime: datetime, finish_datetime: datetime,
         booking: BookingBase = None, user: UserBase = None
     ):
-        event = self.get_event_by_id(event_id)
-        if not event:
-            LoggerService.warning(__name__, f"move_event: event not found, event_id={event_id}")
-            return
-
-        event["start"]["dateTime"] = start_datetime.isoformat()
-        event["end"]["dateTime"] = finish_datetime.isoformat()
-
+        body = {
+            "start": self._event_time(start_datetime),
+            "end": self._event_time(finish_datetime),
+        }
         if booking and user:
-            event["summary"] = self._event_summary(booking)
-            event["description"] = string_helper.generate_booking_info_message(
-                booking, user
-            )
+            body.update(self._event_info(booking, user))
 
         updated_event = (
             self.service.events()
-            .update(calendarId=CALENDAR_ID, eventId=event["id"], body=event)
+            .patch(calendarId=CALENDAR_ID, eventId=event_id, body=body)
             .execute()
         )
 
@@ -181,28 +301,22 @@ class CalendarService:
 
     @_retry_on_network
     def _update_event_info(self, event_id: str, booking: BookingBase, user: UserBase):
-        event = self.get_event_by_id(event_id)
-        if not event:
-            LoggerService.warning(__name__, f"update_event_info: event not found, event_id={event_id}")
-            return
-
-        event["summary"] = self._event_summary(booking)
-        event["description"] = string_helper.generate_booking_info_message(
-            booking, user
-        )
-
         updated_event = (
             self.service.events()
-            .update(calendarId=CALENDAR_ID, eventId=event["id"], body=event)
+            .patch(
+                calendarId=CALENDAR_ID,
+                eventId=event_id,
+                body=self._event_info(booking, user),
+            )
             .execute()
         )
 
         print(f"✅ Информация события обновлена: {updated_event.get('htmlLink')}")
         LoggerService.info(__name__, "update_event_info")
 
-    def cancel_event(self, event_id: str):
+    def cancel_event(self, event_id: str, booking: BookingBase = None):
         try:
-            self._cancel_event(event_id)
+            self._cancel_event(event_id, booking)
         except _NETWORK_ERRORS as e:
             LoggerService.error(__name__, f"cancel_event: network unreachable after retries, event_id={event_id}", e)
         except HttpError as e:
@@ -211,18 +325,23 @@ class CalendarService:
             LoggerService.error(__name__, f"cancel_event: unexpected error, event_id={event_id}", e)
 
     @_retry_on_network
-    def _cancel_event(self, event_id: str):
-        event = self.get_event_by_id(event_id)
-        if not event:
-            LoggerService.warning(__name__, f"cancel_event: event not found, event_id={event_id}")
-            return
+    def _cancel_event(self, event_id: str, booking: BookingBase = None):
+        if booking:
+            summary = self._event_summary(booking)
+        else:
+            # Without the booking the current summary has to be read first
+            event = self._get_event_by_id(event_id)
+            if not event:
+                LoggerService.warning(__name__, f"cancel_event: event not found, event_id={event_id}")
+                return
+            summary = event.get("summary", "")
+            if summary.startswith("Отмена"):
+                return
 
-        event["colorId"] = 8
-        event["summary"] = f"Отмена {event['summary']}"
-        updated_event = (
-            self.service.events()
-            .update(calendarId=CALENDAR_ID, eventId=event_id, body=event)
-            .execute()
-        )
-        print(f"✅ Событие {event['id']} успешно удалено.")
+        self.service.events().patch(
+            calendarId=CALENDAR_ID,
+            eventId=event_id,
+            body={"colorId": "8", "summary": f"Отмена {summary}"},
+        ).execute()
+        print(f"✅ Событие {event_id} успешно удалено.")
         LoggerService.info(__name__, "cancel_event")
@@ -0,0 +1,153 @@
+import asyncio
+import sys
+import os
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.services.logger_service import LoggerService
+from src.services.database.booking_repository import BookingRepository
+from src.services.database.calendar_outbox_repository import CalendarOutboxRepository
+from src.models.enum.calendar_action import CalendarAction
+from googleapiclient.errors import HttpError
+from singleton_decorator import singleton
+from telegram.ext import CallbackContext
+
+
+@singleton
+class CalendarSyncService:
+    """
+    Outbox for Google Calendar synchronisation.
+
+    Handlers enqueue (booking_id, action) rows and return immediately.
+    process_outbox runs as a repeating job, sends the ready actions to Google
+    as one batch request off the event loop (in order per booking), retries
+    with exponential backoff and writes calendar_event_id back to the booking.
+    """
+
+    def __init__(self):
+        self.outbox_repository = CalendarOutboxRepository()
+        self.booking_repository = BookingRepository()
+        self._calendar_service = None
+        self._batch_size = 20
+        self._max_rounds = 10
+        self._max_attempts = 8
+        self._base_delay = timedelta(seconds=30)
+        self._max_delay = timedelta(hours=1)
+        self._lock = asyncio.Lock()
+        self._tasks = set()
+
+    async def enqueue(self, booking_id: int, action: CalendarAction) -> None:
+        await self.outbox_repository.add_entry(booking_id, action)
+
+        # Try right away, the repeating job picks up whatever is left
+        task = asyncio.create_task(self.process_outbox())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def process_outbox(self, context: CallbackContext = None) -> None:
+        if self._lock.locked():
+            return
+
+        async with self._lock:
+            # Each round sends at most one action per booking, so actions of
+            # one booking still run in order; repeat while rounds make progress
+            for _ in range(self._max_rounds):
+                if not await self._process_round():
+                    break
+
+    async def _process_round(self) -> bool:
+        # At most one due entry per booking, the oldest one
+        ready = await self.outbox_repository.get_pending_entries(self._batch_size)
+        if not ready:
+            return False
+
+        bookings = await self.booking_repository.get_bookings_by_ids(
+            [entry.booking_id for entry in ready]
+        )
+        items = []
+        for entry in ready:
+            if entry.booking_id not in bookings:
+                await self.outbox_repository.mark_failed(entry.id, "booking not found")
+                continue
+            items.append(entry)
+
+        results = []
+        if items:
+            try:
+                results = await asyncio.to_thread(
+                    self._get_calendar_service().sync_bookings,
+                    [
+                        (
+                            CalendarAction(entry.action),
+                            bookings[entry.booking_id],
+                            bookings[entry.booking_id].user,
+                        )
+                        for entry in items
+                    ],
+                )
+            except Exception as e:
+                results = [e] * len(items)
+
+        progressed = False
+        for entry, result in zip(items, results):
+            if await self._apply_result(entry, bookings[entry.booking_id], result):
+                progressed = True
+        return progressed or len(items) < len(ready)
+
+    async def _apply_result(self, entry, booking, result) -> bool:
+        action = CalendarAction(entry.action)
+        if isinstance(result, Exception):
+            await self._handle_error(entry, action, result)
+            return False
+
+        if result and result != booking.calendar_event_id:
+            await self.booking_repository.update_booking(
+                booking.id, calendar_event_id=result
+            )
+        if not await self.outbox_repository.mark_done(entry.id, entry.version):
+            # The booking changed while it was being sent, the next round
+            # sends the entry again with the current booking
+            LoggerService.info(
+                __name__,
+                "calendar outbox entry changed while sending",
+                **{"booking_id": booking.id, "action": action.value},
+            )
+            return True
+
+        LoggerService.info(
+            __name__,
+            "calendar outbox entry processed",
+            **{"booking_id": booking.id, "action": action.value},
+        )
+        return True
+
+    async def _handle_error(self, entry, action: CalendarAction, error: Exception):
+        attempts = entry.attempts + 1
+        is_permanent = (
+            isinstance(error, HttpError)
+            and 400 <= error.status_code < 500
+            and error.status_code not in (408, 429)
+        )
+        LoggerService.error(
+            __name__,
+            f"calendar outbox {action.value} failed",
+            exception=error,
+            **{"booking_id": entry.booking_id, "attempts": attempts},
+        )
+
+        if is_permanent or attempts >= self._max_attempts:
+            await self.outbox_repository.mark_failed(entry.id, str(error))
+            return
+
+        delay = min(self._base_delay * 2 ** entry.attempts, self._max_delay)
+        await self.outbox_repository.mark_retry(
+            entry.id, str(error), datetime.now() + delay
+        )
+
+    def _get_calendar_service(self):
+        # Imported lazily: CalendarService needs Google credentials at construction
+        if self._calendar_service is None:
+            from src.services.calendar_service import CalendarService
+
+            self._calendar_service = CalendarService()
+        return self._calendar_service
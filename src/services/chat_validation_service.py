@@ -1,16 +1,40 @@
 import sys
 import os
 import asyncio
+from datetime import timedelta
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from telegram.error import Forbidden, BadRequest, TelegramError
+from telegram.error import Forbidden, BadRequest, RetryAfter, TelegramError
 from singleton_decorator import singleton
 from src.services.logger_service import LoggerService
+from src.services.rate_limiter import TokenBucket
+from src.services.redis.redis_connection import RedisConnection
 
 
 @singleton
 class ChatValidationService:
-    """Service for validating chat IDs and detecting blocked users"""
+    """
+    Service for validating chat IDs and detecting blocked users
+
+    Chats are checked by a pool of concurrent workers sharing a token bucket.
+    RetryAfter pauses the bucket and halves its rate, every checkpoint raises
+    it again. Checked and invalid ids are saved to Redis in batches, so a run
+    interrupted by a restart continues instead of starting over. The caller
+    clears the checkpoint once the invalid ids were deactivated.
+    """
+
+    CHECKED_KEY = "chat_validation:checked"
+    INVALID_KEY = "chat_validation:invalid"
+
+    def __init__(self):
+        self._redis = None
+        self._max_rate = 20
+        self._min_rate = 1
+        self._bucket = TokenBucket(rate=self._max_rate)
+        self._concurrency = 10
+        self._checkpoint_size = 100
+        # Outlives the weekly run, so ids whose deactivation failed are kept
+        self._ttl = timedelta(days=8)
 
     async def is_chat_valid(self, bot, chat_id: int) -> bool:
         """
@@ -25,6 +49,9 @@ class ChatValidationService:
         try:
             await bot.send_chat_action(chat_id=chat_id, action="typing")
             return True
+        except RetryAfter:
+            # Flood control says nothing about the chat, the caller retries
+            raise
         except Forbidden as e:
             # User blocked the bot
             LoggerService.info(
@@ -55,31 +82,143 @@ class ChatValidationService:
         """
         Validate list of chat IDs and return results.
 
+        Chats already checked by an interrupted run are taken from the
+        checkpoint instead of being checked again.
+
         Returns dict with:
         - total_checked: int
         - valid: int
         - invalid: int
         - invalid_ids: list[int]
         """
-        valid_count = 0
-        invalid_count = 0
-        invalid_ids = []
+        redis_client = self._get_redis()
+        checked, checkpoint_invalid = self._load_checkpoint(redis_client)
+        if checked:
+            LoggerService.info(
+                __name__,
+                "Resuming chat validation from checkpoint",
+                **{"already_checked": len(checked)},
+            )
 
+        queue = asyncio.Queue()
         for chat_id in chat_ids:
-            is_valid = await self.is_chat_valid(bot, chat_id)
+            if str(chat_id) not in checked:
+                queue.put_nowait(chat_id)
 
-            if is_valid:
-                valid_count += 1
-            else:
-                invalid_count += 1
-                invalid_ids.append(chat_id)
+        results = []
+        workers = [
+            asyncio.create_task(
+                self._validate_worker(bot, queue, results, redis_client)
+            )
+            for _ in range(min(self._concurrency, queue.qsize()))
+        ]
+        try:
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
-            # Sleep to avoid rate limiting
-            await asyncio.sleep(0.1)
+        new_invalid = {chat_id for chat_id, is_valid in results if not is_valid}
+        invalid_ids = [
+            chat_id
+            for chat_id in chat_ids
+            if chat_id in new_invalid or str(chat_id) in checkpoint_invalid
+        ]
 
         return {
             "total_checked": len(chat_ids),
-            "valid": valid_count,
-            "invalid": invalid_count,
+            "valid": len(chat_ids) - len(invalid_ids),
+            "invalid": len(invalid_ids),
             "invalid_ids": invalid_ids,
         }
+
+    async def _validate_worker(
+        self, bot, queue: asyncio.Queue, results: list, redis_client
+    ):
+        while True:
+            chat_id = await queue.get()
+            try:
+                try:
+                    is_valid = await self._check_with_rate_limit(bot, chat_id)
+                except Exception as e:
+                    # Unknown failure, keep the user rather than deactivate by mistake
+                    LoggerService.error(
+                        __name__,
+                        f"Error validating chat {chat_id}",
+                        exception=e,
+                        **{"chat_id": chat_id},
+                    )
+                    is_valid = True
+                results.append((chat_id, is_valid))
+                if len(results) % self._checkpoint_size == 0:
+                    self._save_checkpoint(
+                        redis_client, results[-self._checkpoint_size:]
+                    )
+            finally:
+                queue.task_done()
+
+    async def _check_with_rate_limit(self, bot, chat_id: int) -> bool:
+        while True:
+            await self._bucket.acquire()
+            try:
+                return await self.is_chat_valid(bot, chat_id)
+            except RetryAfter as e:
+                retry_after = e.retry_after
+                if isinstance(retry_after, timedelta):
+                    retry_after = retry_after.total_seconds()
+                self._bucket.pause(retry_after)
+                self._bucket.rate = max(self._min_rate, self._bucket.rate / 2)
+                LoggerService.warning(
+                    __name__,
+                    "Chat validation hit flood control",
+                    **{"retry_after": retry_after, "rate": self._bucket.rate},
+                )
+
+    def _get_redis(self):
+        # Checkpointing is optional, validation still runs without Redis
+        if self._redis is None:
+            try:
+                self._redis = RedisConnection()
+            except Exception:
+                LoggerService.warning(__name__, "Chat validation runs without checkpoint")
+                return None
+        return self._redis.client
+
+    def _load_checkpoint(self, client) -> tuple[set, set]:
+        if client is None:
+            return set(), set()
+        try:
+            return client.smembers(self.CHECKED_KEY), client.smembers(self.INVALID_KEY)
+        except Exception as e:
+            LoggerService.error(__name__, "Chat validation checkpoint not loaded", exception=e)
+            return set(), set()
+
+    def clear_checkpoint(self) -> None:
+        """Forget the checked and invalid ids once the invalid ones were handled."""
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            client.delete(self.CHECKED_KEY, self.INVALID_KEY)
+        except Exception as e:
+            LoggerService.error(__name__, "Chat validation checkpoint not cleared", exception=e)
+
+    def _save_checkpoint(self, client, results: list) -> None:
+        if client is not None:
+            try:
+                pipe = client.pipeline(transaction=False)
+                pipe.sadd(self.CHECKED_KEY, *(chat_id for chat_id, _ in results))
+                invalid_ids = [chat_id for chat_id, is_valid in results if not is_valid]
+                if invalid_ids:
+                    pipe.sadd(self.INVALID_KEY, *invalid_ids)
+                pipe.expire(self.CHECKED_KEY, self._ttl)
+                pipe.expire(self.INVALID_KEY, self._ttl)
+                pipe.execute()
+            except Exception as e:
+                LoggerService.error(
+                    __name__, "Chat validation checkpoint not saved", exception=e
+                )
+
+        # Additive increase, RetryAfter halves the rate again
+        self._bucket.rate = min(self._max_rate, self._bucket.rate + 1)
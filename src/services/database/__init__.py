@@ -7,11 +7,14 @@ Specialized repositories for database operations organized by entity type.
 from src.services.database.base import BaseRepository
 from src.services.database.user_repository import UserRepository
 from src.services.database.gift_repository import GiftRepository
-from src.services.database.booking_repository import BookingRepository
+from src.services.database.booking_repository import BookingRepository, SlotTakenError
+from src.services.database.statistics_repository import StatisticsRepository
 
 __all__ = [
     "BaseRepository",
     "UserRepository",
     "GiftRepository",
     "BookingRepository",
+    "SlotTakenError",
+    "StatisticsRepository",
 ]
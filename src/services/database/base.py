@@ -1,20 +1,41 @@
 import sys
 import os
+import inspect
+from functools import wraps
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
-from db.database import engine
+from db.database import async_engine
 from db import database
-from sqlalchemy.orm import sessionmaker
+from src.services.metrics_service import MetricsService
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 
 class BaseRepository:
-    """Base repository class with session management."""
+    """Base repository class with async session management."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Time every public async method for repository_call_duration_seconds
+        for name, method in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.iscoroutinefunction(method):
+                setattr(cls, name, _timed(f"{cls.__name__}.{name}", method))
 
     def __init__(self):
-        self.engine = engine
-        self.Session = sessionmaker(bind=self.engine)
+        self.engine = async_engine
+        # expire_on_commit=False: returned objects stay readable after the
+        # session closes, since async sessions cannot lazy-load expired attributes
+        self.Session = async_sessionmaker(bind=self.engine, expire_on_commit=False)
         database.create_db_and_tables()
 
-    def get_session(self):
-        """Get a new database session."""
+    def get_session(self) -> AsyncSession:
+        """Get a new async database session."""
         return self.Session()
+
+
+def _timed(label: str, method):
+    @wraps(method)
+    async def wrapper(*args, **kwargs):
+        with MetricsService().repository_duration.time(label):
+            return await method(*args, **kwargs)
+
+    return wrapper
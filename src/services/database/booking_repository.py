@@ -1,18 +1,31 @@
 import sys
 import os
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import Sequence
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from src.services.database.base import BaseRepository
 from src.services.logger_service import LoggerService
 from src.services.database.user_repository import UserRepository
+from src.services.availability_service import AvailabilityService
 from db.models.booking import BookingBase
 from src.models.enum.tariff import Tariff
 from singleton_decorator import singleton
 from sqlalchemy import and_, distinct, func, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload
 
+# Exclusion constraint over active bookings' period (see migration e7f8a9b0c1d2)
+SLOT_TAKEN_CONSTRAINT = "booking_period_excl"
+
+
+class SlotTakenError(Exception):
+    """The booking's time (with cleaning) overlaps another active booking."""
+
+    def __init__(self, booking_id: int):
+        super().__init__(f"Slot for booking {booking_id} is already taken")
+        self.booking_id = booking_id
+
 
 @singleton
 class BookingRepository(BaseRepository):
@@ -21,8 +34,9 @@ class BookingRepository(BaseRepository):
     def __init__(self):
         super().__init__()
         self.user_service = UserRepository()
+        self.availability_service = AvailabilityService()
 
-    def add_booking(
+    async def add_booking(
         self,
         user_contact: str,
         start_date: datetime,
@@ -50,8 +64,8 @@ class BookingRepository(BaseRepository):
         if end_date and end_date.tzinfo is not None:
             end_date = end_date.replace(tzinfo=None)
 
-        user = self.user_service.get_or_create_user(user_contact)
-        with self.Session() as session:
+        user = await self.user_service.get_or_create_user(user_contact)
+        async with self.Session() as session:
             try:
                 new_booking = BookingBase(
                     user_id=user.id,
@@ -81,33 +95,42 @@ class BookingRepository(BaseRepository):
                     new_booking.prepayment_price = prepayment_price
 
                 session.add(new_booking)
-                session.commit()
+                await session.commit()
+                # Load eager relationships (promocode) before the session closes
+                await session.refresh(new_booking)
 
                 # Increment user booking counters
-                self.user_service.increment_booking_count(user.id)
+                await self.user_service.increment_booking_count(user.id)
 
+                self.availability_service.apply_booking(new_booking)
                 print(f"Booking added: {new_booking}")
                 return new_booking
             except Exception as e:
                 print(f"Error adding booking: {e}")
-                session.rollback()
+                await session.rollback()
                 LoggerService.error(__name__, "add_booking", e)
                 return None
 
-    def get_booking_by_start_date_user(
+    @staticmethod
+    def _on_day(column, day: date) -> tuple:
+        """Half-open range [day, day + 1) instead of date(column) == day, so B-tree indexes apply."""
+        day_start = datetime.combine(day, time.min)
+        return column >= day_start, column < day_start + timedelta(days=1)
+
+    async def get_booking_by_start_date_user(
         self, user_contact: str, start_date: date
     ) -> BookingBase:
         """Get booking for specific user by start date."""
-        user = self.user_service.get_user_by_contact(user_contact)
+        user = await self.user_service.get_user_by_contact(user_contact)
         if not user:
             return None
         try:
-            with self.Session() as session:
-                booking = session.scalar(
+            async with self.Session() as session:
+                booking = await session.scalar(
                     select(BookingBase).where(
                         and_(
                             BookingBase.user_id == user.id,
-                            func.date(BookingBase.start_date) == start_date,
+                            *self._on_day(BookingBase.start_date, start_date),
                             BookingBase.is_canceled == False,
                             BookingBase.is_done == False,
                             BookingBase.is_prepaymented == True,
@@ -119,54 +142,54 @@ class BookingRepository(BaseRepository):
             print(f"Error in get_booking_by_start_date_user: {e}")
             LoggerService.error(__name__, "get_booking_by_start_date_user", e)
 
-    def get_booking_by_start_date(self, start_date: date):
+    async def get_booking_by_start_date(self, start_date: date):
         """Get all bookings starting on a specific date."""
         try:
-            with self.Session() as session:
-                bookings = session.scalars(
+            async with self.Session() as session:
+                bookings = (await session.scalars(
                     select(BookingBase).where(
                         and_(
-                            func.date(BookingBase.start_date) == start_date,
+                            *self._on_day(BookingBase.start_date, start_date),
                             BookingBase.is_canceled == False,
                             BookingBase.is_done == False,
                             BookingBase.is_prepaymented == True,
                         )
                     )
-                ).all()
+                )).all()
                 return bookings
         except Exception as e:
             print(f"Error in get_booking_by_start_date: {e}")
             LoggerService.error(__name__, "get_booking_by_start_date", e)
 
-    def get_booking_by_finish_date(self, end_date: date):
+    async def get_booking_by_finish_date(self, end_date: date):
         """Get all bookings ending on a specific date."""
         try:
-            with self.Session() as session:
-                bookings = session.scalars(
+            async with self.Session() as session:
+                bookings = (await session.scalars(
                     select(BookingBase)
                     .options(joinedload(BookingBase.user))
                     .where(
                         and_(
-                            func.date(BookingBase.end_date) == end_date,
+                            *self._on_day(BookingBase.end_date, end_date),
                             BookingBase.is_canceled == False,
                             BookingBase.is_done == False,
                             BookingBase.is_prepaymented == True,
                         )
                     )
-                ).all()
+                )).all()
                 return bookings
         except Exception as e:
             print(f"Error in get_booking_by_finish_date: {e}")
             LoggerService.error(__name__, "get_booking_by_finish_date", e)
 
-    def get_booking_by_start_date_period(
+    async def get_booking_by_start_date_period(
         self, from_date: date, to_date: date, is_admin: bool = False
     ) -> Sequence[BookingBase]:
         """Get bookings within a date range based on start_date."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 if not is_admin:
-                    bookings = session.scalars(
+                    bookings = (await session.scalars(
                         select(BookingBase)
                         .options(joinedload(BookingBase.user))
                         .where(
@@ -179,9 +202,9 @@ class BookingRepository(BaseRepository):
                             )
                         )
                         .order_by(BookingBase.start_date)
-                    ).all()
+                    )).all()
                 else:
-                    bookings = session.scalars(
+                    bookings = (await session.scalars(
                         select(BookingBase)
                         .options(joinedload(BookingBase.user))
                         .where(
@@ -191,21 +214,43 @@ class BookingRepository(BaseRepository):
                             )
                         )
                         .order_by(BookingBase.start_date)
-                    ).all()
+                    )).all()
 
                 return bookings
         except Exception as e:
             print(f"Error in get_booking_by_start_date_period: {e}")
             LoggerService.error(__name__, "get_booking_by_start_date_period", e)
 
-    def get_booking_by_finish_date_period(
+    async def get_active_bookings(self, from_date: date) -> Sequence[BookingBase]:
+        """Get prepaid, not canceled and not finished bookings ending after from_date."""
+        try:
+            async with self.Session() as session:
+                bookings = (await session.scalars(
+                    select(BookingBase)
+                    .where(
+                        and_(
+                            BookingBase.end_date >= from_date,
+                            BookingBase.is_canceled == False,
+                            BookingBase.is_done == False,
+                            BookingBase.is_prepaymented == True,
+                        )
+                    )
+                    .order_by(BookingBase.start_date)
+                )).all()
+                return bookings
+        except Exception as e:
+            print(f"Error in get_active_bookings: {e}")
+            LoggerService.error(__name__, "get_active_bookings", e)
+            raise
+
+    async def get_booking_by_finish_date_period(
         self, from_date: date, to_date: date, is_admin: bool = False
     ) -> Sequence[BookingBase]:
         """Get bookings within a date range based on end_date."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 if not is_admin:
-                    bookings = session.scalars(
+                    bookings = (await session.scalars(
                         select(BookingBase)
                         .options(joinedload(BookingBase.user))
                         .where(
@@ -218,9 +263,9 @@ class BookingRepository(BaseRepository):
                             )
                         )
                         .order_by(BookingBase.end_date)
-                    ).all()
+                    )).all()
                 else:
-                    bookings = session.scalars(
+                    bookings = (await session.scalars(
                         select(BookingBase)
                         .options(joinedload(BookingBase.user))
                         .where(
@@ -230,22 +275,22 @@ class BookingRepository(BaseRepository):
                             )
                         )
                         .order_by(BookingBase.end_date)
-                    ).all()
+                    )).all()
 
                 return bookings
         except Exception as e:
             print(f"Error in get_booking_by_finish_date_period: {e}")
             LoggerService.error(__name__, "get_booking_by_finish_date_period", e)
 
-    def get_booking_by_day(
+    async def get_booking_by_day(
         self, target_date: date, except_booking_id: int = None
     ) -> Sequence[BookingBase]:
         """Get all bookings overlapping with a specific day."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 start_of_day = datetime.combine(target_date, datetime.min.time())
                 end_of_day = datetime.combine(target_date, datetime.max.time())
-                bookings = session.scalars(
+                bookings = (await session.scalars(
                     select(BookingBase).where(
                         and_(
                             BookingBase.is_canceled == False,
@@ -268,13 +313,13 @@ class BookingRepository(BaseRepository):
                             ),
                         )
                     )
-                ).all()
+                )).all()
                 return bookings
         except Exception as e:
             print(f"Error in get_booking_by_day: {e}")
             LoggerService.error(__name__, "get_booking_by_day", e)
 
-    def get_bookings_by_month(
+    async def get_bookings_by_month(
         self, target_month: int, target_year: int
     ) -> Sequence[BookingBase]:
         """Get all bookings overlapping with a specific month."""
@@ -282,7 +327,7 @@ class BookingRepository(BaseRepository):
             if target_year is None:
                 target_year = datetime.now().year
 
-            with self.Session() as session:
+            async with self.Session() as session:
                 # Get start and end of the month
                 start_of_month = datetime(target_year, target_month, 1)
                 if target_month == 12:
@@ -317,7 +362,7 @@ class BookingRepository(BaseRepository):
 
                 # Order by start date
                 query = query.order_by(BookingBase.start_date)
-                bookings = session.scalars(query).all()
+                bookings = (await session.scalars(query)).all()
                 return bookings
 
         except Exception as e:
@@ -325,8 +370,13 @@ class BookingRepository(BaseRepository):
             LoggerService.error(__name__, "get_bookings_by_month", e)
             return []
 
-    def is_booking_between_dates(self, start: datetime, end: datetime) -> bool:
-        """Check if there are any bookings between the given dates."""
+    async def is_booking_between_dates(self, start: datetime, end: datetime) -> bool:
+        """
+        Check if there are any bookings between the given dates.
+
+        Only an early check for the booking flow; the database enforces the
+        overlap rule when a booking becomes active (see SlotTakenError).
+        """
         try:
             # Strip timezone info to avoid PostgreSQL converting tz-aware values to UTC
             # when comparing against naive timestamps stored in the DB
@@ -340,8 +390,8 @@ class BookingRepository(BaseRepository):
                 f"Checking bookings overlap: requested interval [{start}] - [{end}]"
             )
             
-            with self.Session() as session:
-                overlapping_bookings = session.scalars(
+            async with self.Session() as session:
+                overlapping_bookings = (await session.scalars(
                     select(BookingBase).where(
                         and_(
                             BookingBase.is_canceled == False,
@@ -351,7 +401,7 @@ class BookingRepository(BaseRepository):
                             BookingBase.end_date > start,
                         )
                     )
-                ).first()
+                )).first()
                 
                 if overlapping_bookings:
                     LoggerService.warning(
@@ -371,11 +421,11 @@ class BookingRepository(BaseRepository):
             print(f"Error in is_booking_between_dates: {e}")
             LoggerService.error(__name__, "is_booking_between_dates", e)
 
-    def get_booking_by_id(self, booking_id: int) -> BookingBase:
+    async def get_booking_by_id(self, booking_id: int) -> BookingBase:
         """Get booking by ID with eagerly loaded user relationship."""
         try:
-            with self.Session() as session:
-                booking = session.scalar(
+            async with self.Session() as session:
+                booking = await session.scalar(
                     select(BookingBase)
                     .options(joinedload(BookingBase.user))
                     .where(BookingBase.id == booking_id)
@@ -388,15 +438,34 @@ class BookingRepository(BaseRepository):
             print(f"Error in get_booking_by_id: {e}")
             LoggerService.error(__name__, "get_booking_by_id", e)
 
-    def get_booking_by_user_contact(self, user_contact: str) -> list[BookingBase]:
+    async def get_bookings_by_ids(self, booking_ids: list[int]) -> dict[int, BookingBase]:
+        """Get bookings by IDs in one query, keyed by ID, with users loaded."""
+        if not booking_ids:
+            return {}
+
+        try:
+            async with self.Session() as session:
+                bookings = (await session.scalars(
+                    select(BookingBase)
+                    .options(joinedload(BookingBase.user))
+                    .where(BookingBase.id.in_(booking_ids))
+                )).all()
+                session.expunge_all()
+                return {booking.id: booking for booking in bookings}
+        except Exception as e:
+            print(f"Error in get_bookings_by_ids: {e}")
+            LoggerService.error(__name__, "get_bookings_by_ids", e)
+            return {}
+
+    async def get_booking_by_user_contact(self, user_contact: str) -> list[BookingBase]:
         """Get all active bookings for a user. """
-        user = self.user_service.get_user_by_contact(user_contact)
+        user = await self.user_service.get_user_by_contact(user_contact)
         if not user:
             return []
 
         try:
-            with self.Session() as session:
-                bookings = session.scalars(
+            async with self.Session() as session:
+                bookings = (await session.scalars(
                     select(BookingBase).where(
                         and_(
                             BookingBase.user_id == user.id,
@@ -405,17 +474,17 @@ class BookingRepository(BaseRepository):
                             BookingBase.is_prepaymented == True,
                         )
                     )
-                ).all()
+                )).all()
                 return bookings
         except Exception as e:
             print(f"Error in get_booking_by_user_contact: {e}")
             LoggerService.error(__name__, "get_booking_by_user_contact", e)
 
-    def get_unpaid_bookings(self) -> Sequence[BookingBase]:
+    async def get_unpaid_bookings(self) -> Sequence[BookingBase]:
         """Get all unpaid, active bookings."""
         try:
-            with self.Session() as session:
-                bookings = session.scalars(
+            async with self.Session() as session:
+                bookings = (await session.scalars(
                     select(BookingBase)
                     .where(
                         and_(
@@ -425,20 +494,55 @@ class BookingRepository(BaseRepository):
                         )
                     )
                     .order_by(BookingBase.start_date)
-                ).all()
+                )).all()
                 return bookings
         except Exception as e:
             print(f"Error in get_unpaid_bookings: {e}")
             LoggerService.error(__name__, "get_unpaid_bookings", e)
             return []
 
-    def get_all_chat_ids(self) -> list[int]:
+    async def get_admin_booking_list(
+        self, from_date: date, to_date: date, limit: int = 100
+    ) -> Sequence[BookingBase]:
+        """Get bookings for the admin list with users in one query.
+
+        Includes every booking starting in the period and every unpaid active
+        booking, sorted by start date.
+        """
+        try:
+            async with self.Session() as session:
+                bookings = (await session.scalars(
+                    select(BookingBase)
+                    .options(joinedload(BookingBase.user))
+                    .where(
+                        or_(
+                            and_(
+                                BookingBase.start_date >= from_date,
+                                BookingBase.start_date <= to_date,
+                            ),
+                            and_(
+                                BookingBase.is_prepaymented == False,
+                                BookingBase.is_canceled == False,
+                                BookingBase.is_done == False,
+                            ),
+                        )
+                    )
+                    .order_by(BookingBase.start_date, BookingBase.id)
+                    .limit(limit)
+                )).all()
+                return bookings
+        except Exception as e:
+            print(f"Error in get_admin_booking_list: {e}")
+            LoggerService.error(__name__, "get_admin_booking_list", e)
+            return []
+
+    async def get_all_chat_ids(self) -> list[int]:
         """Get all unique chat IDs from bookings (legacy method)."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 # Use distinct() to get unique chat_ids
                 # Some users may have multiple bookings
-                chat_ids = session.scalars(select(distinct(BookingBase.chat_id))).all()
+                chat_ids = (await session.scalars(select(distinct(BookingBase.chat_id)))).all()
 
                 # Convert to list and return
                 return list(chat_ids)
@@ -447,7 +551,7 @@ class BookingRepository(BaseRepository):
             LoggerService.error(__name__, "get_all_chat_ids", e)
             return []  # Return empty list on error
 
-    def update_booking(
+    async def update_booking(
         self,
         booking_id: int,
         start_date: datetime = None,
@@ -462,11 +566,18 @@ class BookingRepository(BaseRepository):
         prepayment_price: float = None,
         tariff: Tariff = None,
         feedback_submitted: bool = None,
+        receipt_file_id: str = None,
     ) -> BookingBase:
-        """Update booking fields and return with eagerly loaded user."""
-        with self.Session() as session:
+        """
+        Update booking fields and return with eagerly loaded user.
+
+        Raises:
+            SlotTakenError: the database rejected the new dates or prepayment
+                because the slot overlaps another active booking
+        """
+        async with self.Session() as session:
             try:
-                booking = session.scalar(
+                booking = await session.scalar(
                     select(BookingBase)
                     .options(joinedload(BookingBase.user))
                     .where(BookingBase.id == booking_id)
@@ -493,7 +604,7 @@ class BookingRepository(BaseRepository):
                     booking.is_done = is_done
                     # Increment completed bookings counter when marking as done
                     if is_done and not booking.is_canceled:
-                        self.user_service.increment_completed_bookings(booking.user_id)
+                        await self.user_service.increment_completed_bookings(booking.user_id)
                 # Support both prepayment and prepayment_price for backward compatibility
                 if prepayment_price is not None and prepayment_price >= 0:
                     booking.prepayment_price = prepayment_price
@@ -503,19 +614,37 @@ class BookingRepository(BaseRepository):
                     booking.tariff = tariff
                 if feedback_submitted is not None:
                     booking.feedback_submitted = feedback_submitted
+                if receipt_file_id:
+                    booking.receipt_file_id = receipt_file_id
 
-                session.commit()
-                session.refresh(booking)
+                await session.commit()
+                await session.refresh(booking)
                 # Detach from session to avoid lazy load errors
                 session.expunge(booking)
+                self.availability_service.apply_booking(booking)
                 print(f"Booking updated: {booking}")
                 return booking
+            except IntegrityError as e:
+                await session.rollback()
+                if not self._is_slot_taken(e):
+                    print(f"Error updating Booking: {e}")
+                    LoggerService.error(__name__, "update_booking", e)
+                    return
+                LoggerService.warning(
+                    __name__, f"Booking {booking_id} rejected: slot already taken"
+                )
+                raise SlotTakenError(booking_id) from e
             except Exception as e:
-                session.rollback()
+                await session.rollback()
                 print(f"Error updating Booking: {e}")
                 LoggerService.error(__name__, "update_booking", e)
 
-    def get_bookings_count_by_period(
+    @staticmethod
+    def _is_slot_taken(error: IntegrityError) -> bool:
+        """Whether the database rejected the write because of the period exclusion constraint."""
+        return SLOT_TAKEN_CONSTRAINT in str(error.orig)
+
+    async def get_bookings_count_by_period(
         self,
         start_date: datetime = None,
         end_date: datetime = None,
@@ -523,7 +652,7 @@ class BookingRepository(BaseRepository):
     ) -> int:
         """Get count of bookings in a period with optional completion filter."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 query = select(func.count(BookingBase.id)).where(
                     BookingBase.is_prepaymented == True
                 )
@@ -548,19 +677,19 @@ class BookingRepository(BaseRepository):
                         )
                     )
 
-                count = session.scalar(query)
+                count = await session.scalar(query)
                 return int(count) if count else 0
         except Exception as e:
             print(f"Error in get_bookings_count_by_period: {e}")
             LoggerService.error(__name__, "get_bookings_count_by_period", e)
             return 0
 
-    def get_revenue_by_period(
+    async def get_revenue_by_period(
         self, start_date: datetime = None, end_date: datetime = None
     ) -> float:
         """Get total revenue from completed bookings in a period."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 query = select(func.sum(BookingBase.price)).where(
                     and_(
                         BookingBase.is_done == True,
@@ -574,19 +703,19 @@ class BookingRepository(BaseRepository):
                 if end_date:
                     query = query.where(BookingBase.start_date <= end_date)
 
-                result = session.scalar(query)
+                result = await session.scalar(query)
                 return float(result) if result else 0.0
         except Exception as e:
             print(f"Error in get_revenue_by_period: {e}")
             LoggerService.error(__name__, "get_revenue_by_period", e)
             return 0.0
 
-    def get_canceled_bookings_count(
+    async def get_canceled_bookings_count(
         self, start_date: datetime = None, end_date: datetime = None
     ) -> int:
         """Get count of canceled prepaid bookings in a period."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 query = select(func.count(BookingBase.id)).where(
                     and_(
                         BookingBase.is_canceled == True,
@@ -599,19 +728,19 @@ class BookingRepository(BaseRepository):
                 if end_date:
                     query = query.where(BookingBase.start_date <= end_date)
 
-                count = session.scalar(query)
+                count = await session.scalar(query)
                 return int(count) if count else 0
         except Exception as e:
             print(f"Error in get_canceled_bookings_count: {e}")
             LoggerService.error(__name__, "get_canceled_bookings_count", e)
             return 0
 
-    def get_active_bookings_count(
+    async def get_active_bookings_count(
         self, start_date: datetime = None, end_date: datetime = None
     ) -> int:
         """Get count of active/upcoming bookings in a period."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 query = select(func.count(BookingBase.id)).where(
                     and_(
                         BookingBase.is_prepaymented == True,
@@ -625,7 +754,7 @@ class BookingRepository(BaseRepository):
                 if end_date:
                     query = query.where(BookingBase.start_date <= end_date)
 
-                count = session.scalar(query)
+                count = await session.scalar(query)
                 return int(count) if count else 0
         except Exception as e:
             print(f"Error in get_active_bookings_count: {e}")
@@ -0,0 +1,145 @@
+import sys
+import os
+from datetime import datetime
+from typing import Sequence
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.services.database.base import BaseRepository
+from src.services.logger_service import LoggerService
+from db.models.calendar_outbox import CalendarOutboxBase
+from src.models.enum.calendar_action import CalendarAction
+from singleton_decorator import singleton
+from sqlalchemy import func, select, update
+
+
+@singleton
+class CalendarOutboxRepository(BaseRepository):
+    """Service for the Google Calendar outbox queue."""
+
+    async def add_entry(self, booking_id: int, action: CalendarAction) -> CalendarOutboxBase:
+        """Queue a calendar action unless the same one is already pending."""
+        async with self.Session() as session:
+            try:
+                # The worker reads the booking when it runs, so one pending
+                # entry per (booking, action) already covers later changes
+                existing = await session.scalar(
+                    select(CalendarOutboxBase).where(
+                        CalendarOutboxBase.booking_id == booking_id,
+                        CalendarOutboxBase.action == action.value,
+                        CalendarOutboxBase.status == "pending",
+                    )
+                )
+                if existing:
+                    # The worker may be sending an older read of the booking,
+                    # a new version keeps the entry pending after that send
+                    await session.execute(
+                        update(CalendarOutboxBase)
+                        .where(CalendarOutboxBase.id == existing.id)
+                        .values(version=CalendarOutboxBase.version + 1)
+                    )
+                    await session.commit()
+                    return existing
+
+                entry = CalendarOutboxBase(
+                    booking_id=booking_id,
+                    action=action.value,
+                    status="pending",
+                    attempts=0,
+                    version=0,
+                    next_attempt_at=datetime.now(),
+                )
+                session.add(entry)
+                await session.commit()
+                return entry
+            except Exception as e:
+                print(f"Error adding calendar outbox entry: {e}")
+                await session.rollback()
+                LoggerService.error(__name__, "add_entry", e)
+                return None
+
+    async def get_pending_entries(self, limit: int) -> Sequence[CalendarOutboxBase]:
+        """Get the oldest pending entry of each booking, if it is due.
+
+        A booking's later entries wait for its first one (e.g. CANCEL waits
+        for ADD), while bookings in backoff do not hold back the others.
+        """
+        try:
+            async with self.Session() as session:
+                first_ids = (
+                    select(func.min(CalendarOutboxBase.id))
+                    .where(CalendarOutboxBase.status == "pending")
+                    .group_by(CalendarOutboxBase.booking_id)
+                )
+                entries = (await session.scalars(
+                    select(CalendarOutboxBase)
+                    .where(
+                        CalendarOutboxBase.id.in_(first_ids),
+                        CalendarOutboxBase.next_attempt_at <= datetime.now(),
+                    )
+                    .order_by(CalendarOutboxBase.id)
+                    .limit(limit)
+                )).all()
+                return entries
+        except Exception as e:
+            print(f"Error in get_pending_entries: {e}")
+            LoggerService.error(__name__, "get_pending_entries", e)
+            return []
+
+    async def mark_done(self, entry_id: int, version: int) -> bool:
+        """Mark an entry done unless it was merged with a change since it was read."""
+        async with self.Session() as session:
+            try:
+                result = await session.execute(
+                    update(CalendarOutboxBase)
+                    .where(
+                        CalendarOutboxBase.id == entry_id,
+                        CalendarOutboxBase.version == version,
+                    )
+                    .values(status="done", processed_at=datetime.now())
+                )
+                await session.commit()
+                return result.rowcount > 0
+            except Exception as e:
+                print(f"Error marking calendar outbox entry done: {e}")
+                await session.rollback()
+                LoggerService.error(__name__, "mark_done", e)
+                return False
+
+    async def mark_retry(self, entry_id: int, error: str, next_attempt_at: datetime) -> None:
+        await self._update_entry(
+            entry_id, error=error, next_attempt_at=next_attempt_at
+        )
+
+    async def mark_failed(self, entry_id: int, error: str) -> None:
+        await self._update_entry(
+            entry_id, status="failed", error=error, processed_at=datetime.now()
+        )
+
+    async def _update_entry(
+        self,
+        entry_id: int,
+        status: str = None,
+        error: str = None,
+        next_attempt_at: datetime = None,
+        processed_at: datetime = None,
+    ) -> None:
+        async with self.Session() as session:
+            try:
+                entry = await session.get(CalendarOutboxBase, entry_id)
+                if not entry:
+                    return
+
+                if status:
+                    entry.status = status
+                if error:
+                    entry.attempts += 1
+                    entry.last_error = error[:1000]
+                if next_attempt_at:
+                    entry.next_attempt_at = next_attempt_at
+                if processed_at:
+                    entry.processed_at = processed_at
+                await session.commit()
+            except Exception as e:
+                print(f"Error updating calendar outbox entry: {e}")
+                await session.rollback()
+                LoggerService.error(__name__, "_update_entry", e)
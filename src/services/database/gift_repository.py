@@ -17,7 +17,7 @@ from src.config.config import MAX_PERIOD_FOR_GIFT_IN_MONTHS
 class GiftRepository(BaseRepository):
     """Service for gift certificate-related database operations."""
 
-    def add_gift(
+    async def add_gift(
         self,
         buyer_contact: str,
         tariff: Tariff,
@@ -28,7 +28,7 @@ class GiftRepository(BaseRepository):
         code: str,
     ) -> GiftBase:
         """Add a new gift certificate to the database."""
-        with self.Session() as session:
+        async with self.Session() as session:
             try:
                 date_expired = datetime.today() + relativedelta(
                     months=MAX_PERIOD_FOR_GIFT_IN_MONTHS
@@ -44,15 +44,15 @@ class GiftRepository(BaseRepository):
                     code=code,
                 )
                 session.add(new_gift)
-                session.commit()
+                await session.commit()
                 print(f"Gift added: {new_gift}")
                 return new_gift
             except Exception as e:
                 print(f"Error adding gift: {e}")
-                session.rollback()
+                await session.rollback()
                 LoggerService.error(__name__, "add_gift", e)
 
-    def update_gift(
+    async def update_gift(
         self,
         gift_id: int,
         user_id: int = None,
@@ -61,9 +61,9 @@ class GiftRepository(BaseRepository):
         is_done: bool = None,
     ) -> GiftBase:
         """Update gift certificate fields."""
-        with self.Session() as session:
+        async with self.Session() as session:
             try:
-                gift = session.scalar(select(GiftBase).where(GiftBase.id == gift_id))
+                gift = await session.scalar(select(GiftBase).where(GiftBase.id == gift_id))
                 if not gift:
                     print(f"Gift with id {gift_id} not found.")
                     return
@@ -77,19 +77,19 @@ class GiftRepository(BaseRepository):
                 if is_done:
                     gift.is_done = is_done
 
-                session.commit()
+                await session.commit()
                 print(f"Gift updated: {gift}")
                 return gift
             except Exception as e:
-                session.rollback()
+                await session.rollback()
                 print(f"Error updating Gift: {e}")
                 LoggerService.error(__name__, "update_gift", e)
 
-    def get_gift_by_code(self, code: str) -> GiftBase:
+    async def get_gift_by_code(self, code: str) -> GiftBase:
         """Get valid gift certificate by code (paid and not used)."""
         try:
-            with self.Session() as session:
-                gift = session.scalar(
+            async with self.Session() as session:
+                gift = await session.scalar(
                     select(GiftBase).where(
                         (GiftBase.code == code)
                         & (GiftBase.is_paymented == True)
@@ -101,36 +101,36 @@ class GiftRepository(BaseRepository):
             print(f"Error in get_gift_by_code: {e}")
             LoggerService.error(__name__, "get_gift_by_code", e)
 
-    def get_gift_by_id(self, id: int) -> GiftBase:
+    async def get_gift_by_id(self, id: int) -> GiftBase:
         """Get gift certificate by ID."""
         try:
-            with self.Session() as session:
-                gift = session.scalar(select(GiftBase).where(GiftBase.id == id))
+            async with self.Session() as session:
+                gift = await session.scalar(select(GiftBase).where(GiftBase.id == id))
                 return gift
         except Exception as e:
             print(f"Error in get_gift_by_id: {e}")
             LoggerService.error(__name__, "get_gift_by_id", e)
 
-    def get_total_gifts_count(self) -> int:
+    async def get_total_gifts_count(self) -> int:
         """Get total count of gift certificates."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 from sqlalchemy import func
 
-                count = session.scalar(select(func.count(GiftBase.id)))
+                count = await session.scalar(select(func.count(GiftBase.id)))
                 return int(count) if count else 0
         except Exception as e:
             print(f"Error in get_total_gifts_count: {e}")
             LoggerService.error(__name__, "get_total_gifts_count", e)
             return 0
 
-    def get_paid_gifts_count(self) -> int:
+    async def get_paid_gifts_count(self) -> int:
         """Get count of paid gift certificates."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 from sqlalchemy import func
 
-                count = session.scalar(
+                count = await session.scalar(
                     select(func.count(GiftBase.id)).where(GiftBase.is_paymented == True)
                 )
                 return int(count) if count else 0
@@ -139,13 +139,13 @@ class GiftRepository(BaseRepository):
             LoggerService.error(__name__, "get_paid_gifts_count", e)
             return 0
 
-    def get_used_gifts_count(self) -> int:
+    async def get_used_gifts_count(self) -> int:
         """Get count of used gift certificates."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 from sqlalchemy import func
 
-                count = session.scalar(
+                count = await session.scalar(
                     select(func.count(GiftBase.id)).where(GiftBase.is_done == True)
                 )
                 return int(count) if count else 0
@@ -154,13 +154,13 @@ class GiftRepository(BaseRepository):
             LoggerService.error(__name__, "get_used_gifts_count", e)
             return 0
 
-    def get_gift_revenue(self) -> float:
+    async def get_gift_revenue(self) -> float:
         """Get total revenue from paid gift certificates."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 from sqlalchemy import func
 
-                revenue = session.scalar(
+                revenue = await session.scalar(
                     select(func.sum(GiftBase.price)).where(
                         GiftBase.is_paymented == True
                     )
@@ -20,7 +20,7 @@ from sqlalchemy import select
 class PromocodeRepository(BaseRepository):
     """Service for promocode-related database operations."""
 
-    def add_promocode(
+    async def add_promocode(
         self,
         name: str,
         date_from: date,
@@ -30,11 +30,11 @@ class PromocodeRepository(BaseRepository):
         promocode_type: int = 1,
     ) -> PromocodeBase:
         """Add a new promocode to the database."""
-        with self.Session() as session:
+        async with self.Session() as session:
             try:
                 # Check if there's already an active promocode with the same name
                 name_lower = name.lower()
-                existing_active = session.scalar(
+                existing_active = await session.scalar(
                     select(PromocodeBase).where(
                         PromocodeBase.name == name_lower,
                         PromocodeBase.is_active == True
@@ -62,8 +62,8 @@ class PromocodeRepository(BaseRepository):
                     is_active=True,
                 )
                 session.add(new_promocode)
-                session.commit()
-                session.refresh(new_promocode)
+                await session.commit()
+                await session.refresh(new_promocode)
                 # Detach from session to avoid lazy load errors
                 session.expunge(new_promocode)
                 print(f"Promocode added: {new_promocode}")
@@ -73,16 +73,16 @@ class PromocodeRepository(BaseRepository):
                 raise
             except Exception as e:
                 print(f"Error adding promocode: {e}")
-                session.rollback()
+                await session.rollback()
                 LoggerService.error(__name__, "add_promocode", e)
                 raise
 
-    def get_promocode_by_name(self, name: str) -> Optional[PromocodeBase]:
+    async def get_promocode_by_name(self, name: str) -> Optional[PromocodeBase]:
         """Get active promocode by name (all names stored in lowercase)."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 # Search only among active promocodes
-                promocode = session.scalar(
+                promocode = await session.scalar(
                     select(PromocodeBase).where(
                         PromocodeBase.name == name.lower(),
                         PromocodeBase.is_active == True
@@ -97,11 +97,11 @@ class PromocodeRepository(BaseRepository):
             LoggerService.error(__name__, "get_promocode_by_name", e)
             return None
 
-    def get_promocode_by_id(self, promocode_id: int) -> Optional[PromocodeBase]:
+    async def get_promocode_by_id(self, promocode_id: int) -> Optional[PromocodeBase]:
         """Get promocode by ID."""
         try:
-            with self.Session() as session:
-                promocode = session.scalar(
+            async with self.Session() as session:
+                promocode = await session.scalar(
                     select(PromocodeBase).where(PromocodeBase.id == promocode_id)
                 )
                 if promocode:
@@ -113,7 +113,7 @@ class PromocodeRepository(BaseRepository):
             LoggerService.error(__name__, "get_promocode_by_id", e)
             return None
 
-    def validate_promocode(
+    async def validate_promocode(
         self, name: str, booking_date: date, tariff: Tariff
     ) -> tuple[bool, str, Optional[PromocodeBase]]:
         """
@@ -121,9 +121,9 @@ class PromocodeRepository(BaseRepository):
         Returns: (is_valid, error_message, promocode_object)
         """
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 # All names are stored in lowercase
-                promo = session.scalar(
+                promo = await session.scalar(
                     select(PromocodeBase).where(
                         PromocodeBase.name == name.lower(),
                         PromocodeBase.is_active,
@@ -174,13 +174,13 @@ class PromocodeRepository(BaseRepository):
             LoggerService.error(__name__, "validate_promocode", e)
             return (False, "❌ Ошибка при проверке промокода", None)
 
-    def list_active_promocodes(self) -> list[PromocodeBase]:
+    async def list_active_promocodes(self) -> list[PromocodeBase]:
         """Get all active promocodes."""
         try:
-            with self.Session() as session:
-                promocodes = session.scalars(
+            async with self.Session() as session:
+                promocodes = (await session.scalars(
                     select(PromocodeBase).where(PromocodeBase.is_active)
-                ).all()
+                )).all()
                 # Detach all objects from session to avoid lazy load errors
                 for promo in promocodes:
                     session.expunge(promo)
@@ -190,18 +190,18 @@ class PromocodeRepository(BaseRepository):
             LoggerService.error(__name__, "list_active_promocodes", e)
             return []
 
-    def deactivate_promocode(self, promocode_id: int) -> bool:
+    async def deactivate_promocode(self, promocode_id: int) -> bool:
         """Deactivate a promocode (soft delete)."""
         try:
-            with self.Session() as session:
-                promocode = session.scalar(
+            async with self.Session() as session:
+                promocode = await session.scalar(
                     select(PromocodeBase).where(PromocodeBase.id == promocode_id)
                 )
                 if not promocode:
                     return False
 
                 promocode.is_active = False
-                session.commit()
+                await session.commit()
                 print(f"Promocode deactivated: {promocode}")
                 return True
         except Exception as e:
@@ -209,20 +209,20 @@ class PromocodeRepository(BaseRepository):
             LoggerService.error(__name__, "deactivate_promocode", e)
             return False
 
-    def deactivate_expired_promocodes(self) -> int:
+    async def deactivate_expired_promocodes(self) -> int:
         """
         Deactivate all promocodes where date_to has passed.
         Returns: count of deactivated promocodes
         """
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 today = date.today()
-                expired_promocodes = session.scalars(
+                expired_promocodes = (await session.scalars(
                     select(PromocodeBase).where(
                         PromocodeBase.is_active,
                         PromocodeBase.date_to < today
                     )
-                ).all()
+                )).all()
 
                 count = 0
                 for promo in expired_promocodes:
@@ -230,7 +230,7 @@ class PromocodeRepository(BaseRepository):
                     count += 1
                     print(f"Expired promocode deactivated: {promo.name} (expired on {promo.date_to})")
 
-                session.commit()
+                await session.commit()
                 return count
         except Exception as e:
             print(f"Error in deactivate_expired_promocodes: {e}")
@@ -0,0 +1,130 @@
+import sys
+import os
+from datetime import datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from src.services.database.base import BaseRepository
+from src.services.logger_service import LoggerService
+from db.models.booking import BookingBase
+from db.models.gift import GiftBase
+from db.models.user import UserBase
+from singleton_decorator import singleton
+from sqlalchemy import and_, func, select, true
+
+
+@singleton
+class StatisticsRepository(BaseRepository):
+    """Repository for /statistics aggregates, each computed in a single statement."""
+
+    async def get_booking_statistics(
+        self, periods: dict[str, tuple[datetime, datetime]]
+    ) -> dict[str, dict]:
+        """
+        Get booking metrics for several periods in one query.
+
+        Args:
+            periods: name -> (start_date, end_date) on booking start date,
+                None for an open bound
+
+        Returns:
+            name -> dict with total, completed, canceled, active and revenue.
+            Only prepaid bookings are counted, as in the per-metric queries.
+        """
+        is_completed = and_(BookingBase.is_done == True, BookingBase.is_canceled == False)
+        is_active = and_(BookingBase.is_done == False, BookingBase.is_canceled == False)
+        columns = []
+        for name, (start_date, end_date) in periods.items():
+            conditions = []
+            if start_date:
+                conditions.append(BookingBase.start_date >= start_date)
+            if end_date:
+                conditions.append(BookingBase.start_date <= end_date)
+            in_period = and_(true(), *conditions)
+
+            columns += [
+                func.count(BookingBase.id).filter(in_period).label(f"{name}_total"),
+                func.count(BookingBase.id)
+                .filter(in_period, is_completed)
+                .label(f"{name}_completed"),
+                func.count(BookingBase.id)
+                .filter(in_period, BookingBase.is_canceled == True)
+                .label(f"{name}_canceled"),
+                func.count(BookingBase.id)
+                .filter(in_period, is_active)
+                .label(f"{name}_active"),
+                func.sum(BookingBase.price)
+                .filter(in_period, is_completed)
+                .label(f"{name}_revenue"),
+            ]
+
+        try:
+            async with self.Session() as session:
+                row = (await session.execute(
+                    select(*columns).where(BookingBase.is_prepaymented == True)
+                )).mappings().one()
+        except Exception as e:
+            print(f"Error in get_booking_statistics: {e}")
+            LoggerService.error(__name__, "get_booking_statistics", e)
+            row = {}
+
+        return {
+            name: {
+                "total": int(row.get(f"{name}_total") or 0),
+                "completed": int(row.get(f"{name}_completed") or 0),
+                "canceled": int(row.get(f"{name}_canceled") or 0),
+                "active": int(row.get(f"{name}_active") or 0),
+                "revenue": float(row.get(f"{name}_revenue") or 0.0),
+            }
+            for name in periods
+        }
+
+    async def get_user_and_gift_statistics(self) -> dict:
+        """Get user and gift certificate metrics in one query."""
+        users = select(
+            func.count(UserBase.id).label("total_users"),
+            func.count(UserBase.id).filter(UserBase.is_active == True).label("active_users"),
+            func.count(UserBase.id)
+            .filter(UserBase.is_active == False)
+            .label("deactivated_users"),
+            func.count(UserBase.id)
+            .filter(UserBase.has_bookings == True)
+            .label("users_with_bookings"),
+            func.count(UserBase.id)
+            .filter(UserBase.completed_bookings > 0)
+            .label("users_with_completed"),
+        ).subquery()
+        gifts = select(
+            func.count(GiftBase.id).label("total_gifts"),
+            func.count(GiftBase.id).filter(GiftBase.is_paymented == True).label("paid_gifts"),
+            func.count(GiftBase.id).filter(GiftBase.is_done == True).label("used_gifts"),
+            func.sum(GiftBase.price)
+            .filter(GiftBase.is_paymented == True)
+            .label("gift_revenue"),
+        ).subquery()
+
+        try:
+            async with self.Session() as session:
+                # Both subqueries return exactly one row
+                row = (await session.execute(
+                    select(users, gifts).select_from(users.join(gifts, true()))
+                )).mappings().one()
+        except Exception as e:
+            print(f"Error in get_user_and_gift_statistics: {e}")
+            LoggerService.error(__name__, "get_user_and_gift_statistics", e)
+            row = {}
+
+        result = {
+            key: int(row.get(key) or 0)
+            for key in (
+                "total_users",
+                "active_users",
+                "deactivated_users",
+                "users_with_bookings",
+                "users_with_completed",
+                "total_gifts",
+                "paid_gifts",
+                "used_gifts",
+            )
+        }
+        result["gift_revenue"] = float(row.get("gift_revenue") or 0.0)
+        return result
@@ -7,49 +7,49 @@ from src.services.logger_service import LoggerService
 from db.models.user import UserBase
 from db.models.booking import BookingBase
 from singleton_decorator import singleton
-from sqlalchemy import and_, select
+from sqlalchemy import and_, select, update
 
 
 @singleton
 class UserRepository(BaseRepository):
     """Repository for user-related database operations."""
 
-    def add_user(self, contact: str) -> UserBase:
+    async def add_user(self, contact: str) -> UserBase:
         """Add a new user to the database."""
-        with self.Session() as session:
+        async with self.Session() as session:
             try:
                 new_user = UserBase(contact=contact)
                 session.add(new_user)
-                session.commit()
+                await session.commit()
                 print(f"User added: {new_user}")
                 return new_user
             except Exception as e:
-                session.rollback()
+                await session.rollback()
                 print(f"Error adding user: {e}")
                 LoggerService.error(__name__, "add_user", e)
 
-    def get_or_create_user(self, contact: str) -> UserBase:
+    async def get_or_create_user(self, contact: str) -> UserBase:
         """Get existing user or create new one."""
-        with self.Session() as session:
+        async with self.Session() as session:
             try:
-                user = session.scalar(
+                user = await session.scalar(
                     select(UserBase).where(UserBase.contact == contact)
                 )
                 if user:
                     print(f"User already exists: {user}")
                     return user
 
-                new_user = self.add_user(contact)
+                new_user = await self.add_user(contact)
                 return new_user
             except Exception as e:
                 print(f"Error in get_or_create_user: {e}")
                 LoggerService.error(__name__, "get_or_create_user", e)
 
-    def get_user_by_contact(self, contact: str) -> UserBase:
+    async def get_user_by_contact(self, contact: str) -> UserBase:
         """Get user by contact (username or phone)."""
         try:
-            with self.Session() as session:
-                user = session.scalar(
+            async with self.Session() as session:
+                user = await session.scalar(
                     select(UserBase).where(UserBase.contact == contact)
                 )
                 return user
@@ -57,21 +57,21 @@ class UserRepository(BaseRepository):
             print(f"Error in get_user_by_contact: {e}")
             LoggerService.error(__name__, "get_user_by_contact", e)
 
-    def get_user_by_id(self, user_id: int) -> UserBase:
+    async def get_user_by_id(self, user_id: int) -> UserBase:
         """Get user by ID."""
         try:
-            with self.Session() as session:
-                user = session.scalar(select(UserBase).where(UserBase.id == user_id))
+            async with self.Session() as session:
+                user = await session.scalar(select(UserBase).where(UserBase.id == user_id))
                 return user
         except Exception as e:
             print(f"Error in get_user_by_id: {e}")
             LoggerService.error(__name__, "get_user_by_id", e)
 
-    def get_user_by_chat_id(self, chat_id: int) -> UserBase:
+    async def get_user_by_chat_id(self, chat_id: int) -> UserBase:
         """Get user by chat_id."""
         try:
-            with self.Session() as session:
-                user = session.scalar(
+            async with self.Session() as session:
+                user = await session.scalar(
                     select(UserBase).where(UserBase.chat_id == chat_id)
                 )
                 return user
@@ -80,17 +80,17 @@ class UserRepository(BaseRepository):
             LoggerService.error(__name__, "get_user_by_chat_id", e)
             return None
 
-    def update_user_contact(self, chat_id: int, contact: str) -> UserBase:
+    async def update_user_contact(self, chat_id: int, contact: str) -> UserBase:
         """Update user's contact (phone/email). Creates user if not found."""
-        with self.Session() as session:
+        async with self.Session() as session:
             try:
-                user = session.scalar(select(UserBase).where(UserBase.chat_id == chat_id))
+                user = await session.scalar(select(UserBase).where(UserBase.chat_id == chat_id))
                 if not user:
                     # Try to find user by contact
-                    user = session.scalar(select(UserBase).where(UserBase.contact == contact))
+                    user = await session.scalar(select(UserBase).where(UserBase.contact == contact))
                     if user:
                         # Check if this chat_id is already assigned to a different user
-                        existing_user_with_chat = session.scalar(
+                        existing_user_with_chat = await session.scalar(
                             select(UserBase).where(
                                 and_(
                                     UserBase.chat_id == chat_id,
@@ -114,8 +114,8 @@ class UserRepository(BaseRepository):
 
                         # User exists with this contact but without chat_id - update it
                         user.chat_id = chat_id
-                        session.commit()
-                        session.refresh(user)
+                        await session.commit()
+                        await session.refresh(user)
                         LoggerService.info(
                             __name__,
                             "Found user by contact, added chat_id",
@@ -126,8 +126,8 @@ class UserRepository(BaseRepository):
                         # Create new user
                         user = UserBase(chat_id=chat_id, contact=contact, is_active=True)
                         session.add(user)
-                        session.commit()
-                        session.refresh(user)
+                        await session.commit()
+                        await session.refresh(user)
                         LoggerService.info(
                             __name__,
                             "Created new user with contact",
@@ -136,7 +136,7 @@ class UserRepository(BaseRepository):
                         return user
 
                 # Check if contact is already assigned to another user
-                existing_user = session.scalar(
+                existing_user = await session.scalar(
                     select(UserBase).where(
                         and_(
                             UserBase.contact == contact,
@@ -158,16 +158,18 @@ class UserRepository(BaseRepository):
                     existing_user.contact = contact
 
                     # Reassign any bookings that belong to user (the bot-side duplicate) to existing_user
-                    session.query(BookingBase).filter(
-                        BookingBase.user_id == user.id
-                    ).update({"user_id": existing_user.id})
-                    session.flush()
+                    await session.execute(
+                        update(BookingBase)
+                        .where(BookingBase.user_id == user.id)
+                        .values(user_id=existing_user.id)
+                    )
+                    await session.flush()
 
                     # Delete the bot-side duplicate (it had chat_id but no admin bookings)
-                    session.delete(user)
-                    session.flush()
-                    session.commit()
-                    session.refresh(existing_user)
+                    await session.delete(user)
+                    await session.flush()
+                    await session.commit()
+                    await session.refresh(existing_user)
 
                     LoggerService.info(
                         __name__,
@@ -182,8 +184,8 @@ class UserRepository(BaseRepository):
                     return existing_user
 
                 user.contact = contact
-                session.commit()
-                session.refresh(user)  # Refresh to keep object valid after session closes
+                await session.commit()
+                await session.refresh(user)  # Refresh to keep object valid after session closes
 
                 LoggerService.info(
                     __name__,
@@ -193,17 +195,17 @@ class UserRepository(BaseRepository):
                 return user
 
             except Exception as e:
-                session.rollback()
+                await session.rollback()
                 print(f"Error in update_user_contact: {e}")
                 LoggerService.error(__name__, "update_user_contact", exception=e)
                 raise
 
-    def update_user_chat_id(self, user_name: str, chat_id: int) -> UserBase:
+    async def update_user_chat_id(self, user_name: str, chat_id: int) -> UserBase:
         """Update or set chat_id for user. Reactivates deactivated users. Handles duplicates gracefully."""
-        with self.Session() as session:
+        async with self.Session() as session:
             try:
                 # Check if user with this chat_id already exists
-                user = session.scalar(
+                user = await session.scalar(
                     select(UserBase).where(UserBase.chat_id == chat_id)
                 )
 
@@ -211,8 +213,8 @@ class UserRepository(BaseRepository):
                     # User already has this chat_id, check if user_name needs update
                     if user_name and user.user_name != user_name:
                         user.user_name = user_name
-                        session.commit()
-                        session.refresh(user)
+                        await session.commit()
+                        await session.refresh(user)
                         LoggerService.info(
                             __name__,
                             "Updated user_name for existing user",
@@ -224,8 +226,8 @@ class UserRepository(BaseRepository):
                             },
                         )
                     else:
-                        session.commit()  # Commit empty transaction to avoid ROLLBACK in logs
-                        session.refresh(user)
+                        await session.commit()  # Commit empty transaction to avoid ROLLBACK in logs
+                        await session.refresh(user)
                         LoggerService.info(
                             __name__,
                             "User already has this chat_id",
@@ -240,13 +242,13 @@ class UserRepository(BaseRepository):
                 if not user:
                     if user_name is not None and user_name != "":
                         # Check if user with this user_name exists (including deactivated)
-                        user = session.scalar(
+                        user = await session.scalar(
                             select(UserBase).where(UserBase.user_name == user_name)
                         )
 
                         if user:
                             # Check if this chat_id is already assigned to a different user
-                            existing_user_with_chat = session.scalar(
+                            existing_user_with_chat = await session.scalar(
                                 select(UserBase).where(
                                     and_(
                                         UserBase.chat_id == chat_id,
@@ -281,8 +283,8 @@ class UserRepository(BaseRepository):
                                         "new_chat_id": chat_id,
                                     },
                                 )
-                            session.commit()
-                            session.refresh(user)
+                            await session.commit()
+                            await session.refresh(user)
                             LoggerService.info(
                                 __name__,
                                 "Updated chat_id for user",
@@ -302,8 +304,8 @@ class UserRepository(BaseRepository):
                                 is_active=True,
                             )
                             session.add(user)
-                            session.commit()
-                            session.refresh(user)
+                            await session.commit()
+                            await session.refresh(user)
                             LoggerService.info(
                                 __name__,
                                 "Created new user with chat_id",
@@ -323,8 +325,8 @@ class UserRepository(BaseRepository):
                             is_active=True,
                         )
                         session.add(user)
-                        session.commit()
-                        session.refresh(user)
+                        await session.commit()
+                        await session.refresh(user)
                         LoggerService.info(
                             __name__,
                             "Created new user without user_name",
@@ -337,22 +339,22 @@ class UserRepository(BaseRepository):
                 return user
 
             except Exception as e:
-                session.rollback()
+                await session.rollback()
                 print(f"Error in update_user_chat_id: {e}")
                 LoggerService.error(__name__, "update_user_chat_id", exception=e)
                 raise
 
-    def get_all_user_chat_ids(self) -> list[int]:
+    async def get_all_user_chat_ids(self) -> list[int]:
         """Get all chat IDs from active UserBase."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 # Use distinct() to get unique chat_ids from UserBase
                 # Filter out null values and inactive users
-                chat_ids = session.scalars(
+                chat_ids = (await session.scalars(
                     select(UserBase.chat_id).where(
                         and_(UserBase.chat_id.isnot(None), UserBase.is_active == True)
                     )
-                ).all()
+                )).all()
 
                 # Convert to list and return
                 return list(chat_ids)
@@ -361,11 +363,11 @@ class UserRepository(BaseRepository):
             LoggerService.error(__name__, "get_all_user_chat_ids", e)
             return []  # Return empty list on error
 
-    def get_user_chat_ids_with_bookings(self) -> list[int]:
+    async def get_user_chat_ids_with_bookings(self) -> list[int]:
         """Get chat IDs of active users who have at least one booking."""
         try:
-            with self.Session() as session:
-                chat_ids = session.scalars(
+            async with self.Session() as session:
+                chat_ids = (await session.scalars(
                     select(UserBase.chat_id).where(
                         and_(
                             UserBase.chat_id.isnot(None),
@@ -373,18 +375,18 @@ class UserRepository(BaseRepository):
                             UserBase.is_active == True,
                         )
                     )
-                ).all()
+                )).all()
                 return list(chat_ids)
         except Exception as e:
             print(f"Error in get_user_chat_ids_with_bookings: {e}")
             LoggerService.error(__name__, "get_user_chat_ids_with_bookings", e)
             return []
 
-    def get_user_chat_ids_without_bookings(self) -> list[int]:
+    async def get_user_chat_ids_without_bookings(self) -> list[int]:
         """Get chat IDs of active users who have never made a booking."""
         try:
-            with self.Session() as session:
-                chat_ids = session.scalars(
+            async with self.Session() as session:
+                chat_ids = (await session.scalars(
                     select(UserBase.chat_id).where(
                         and_(
                             UserBase.chat_id.isnot(None),
@@ -392,25 +394,25 @@ class UserRepository(BaseRepository):
                             UserBase.is_active == True,
                         )
                     )
-                ).all()
+                )).all()
                 return list(chat_ids)
         except Exception as e:
             print(f"Error in get_user_chat_ids_without_bookings: {e}")
             LoggerService.error(__name__, "get_user_chat_ids_without_bookings", e)
             return []
 
-    def deactivate_user(self, chat_id: int) -> bool:
+    async def deactivate_user(self, chat_id: int) -> bool:
         """Deactivate user by chat_id (set is_active=False). Returns True if found."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 # Find user with this chat_id
-                user = session.scalar(
+                user = await session.scalar(
                     select(UserBase).where(UserBase.chat_id == chat_id)
                 )
 
                 if user:
                     user.is_active = False
-                    session.commit()
+                    await session.commit()
                     print(f"Deactivated user {user.id} with chat_id {chat_id}")
                     return True
                 else:
@@ -420,49 +422,76 @@ class UserRepository(BaseRepository):
             LoggerService.error(__name__, "deactivate_user", e)
             return False
 
-    def increment_booking_count(self, user_id: int) -> None:
+    async def deactivate_users(self, chat_ids: list[int]) -> int:
+        """Deactivate users by chat_ids in one transaction. Returns number of deactivated users."""
+        if not chat_ids:
+            return 0
+
+        async with self.Session() as session:
+            try:
+                deactivated = 0
+                # Chunked to stay below driver bind parameter limits
+                for offset in range(0, len(chat_ids), 1000):
+                    result = await session.execute(
+                        update(UserBase)
+                        .where(
+                            UserBase.chat_id.in_(chat_ids[offset:offset + 1000]),
+                            UserBase.is_active.is_(True),
+                        )
+                        .values(is_active=False)
+                    )
+                    deactivated += result.rowcount
+                await session.commit()
+                return deactivated
+            except Exception as e:
+                await session.rollback()
+                print(f"Error in deactivate_users: {e}")
+                LoggerService.error(__name__, "deactivate_users", e)
+                raise
+
+    async def increment_booking_count(self, user_id: int) -> None:
         """Increment booking counters for user."""
         try:
-            with self.Session() as session:
-                user = session.scalar(select(UserBase).where(UserBase.id == user_id))
+            async with self.Session() as session:
+                user = await session.scalar(select(UserBase).where(UserBase.id == user_id))
                 if user:
                     user.has_bookings = True
                     user.total_bookings = (user.total_bookings or 0) + 1
-                    session.commit()
+                    await session.commit()
         except Exception as e:
             LoggerService.error(__name__, "increment_booking_count", e)
 
-    def increment_completed_bookings(self, user_id: int) -> None:
+    async def increment_completed_bookings(self, user_id: int) -> None:
         """Increment completed booking counter for user."""
         try:
-            with self.Session() as session:
-                user = session.scalar(select(UserBase).where(UserBase.id == user_id))
+            async with self.Session() as session:
+                user = await session.scalar(select(UserBase).where(UserBase.id == user_id))
                 if user:
                     user.completed_bookings = (user.completed_bookings or 0) + 1
-                    session.commit()
+                    await session.commit()
         except Exception as e:
             LoggerService.error(__name__, "increment_completed_bookings", e)
 
-    def get_total_users_count(self) -> int:
+    async def get_total_users_count(self) -> int:
         """Get total count of users in system."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 from sqlalchemy import func
 
-                count = session.scalar(select(func.count(UserBase.id)))
+                count = await session.scalar(select(func.count(UserBase.id)))
                 return int(count) if count else 0
         except Exception as e:
             print(f"Error in get_total_users_count: {e}")
             LoggerService.error(__name__, "get_total_users_count", e)
             return 0
 
-    def get_users_with_bookings_count(self) -> int:
+    async def get_users_with_bookings_count(self) -> int:
         """Get count of users with at least one booking."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 from sqlalchemy import func
 
-                count = session.scalar(
+                count = await session.scalar(
                     select(func.count(UserBase.id)).where(UserBase.has_bookings == True)
                 )
                 return int(count) if count else 0
@@ -471,13 +500,13 @@ class UserRepository(BaseRepository):
             LoggerService.error(__name__, "get_users_with_bookings_count", e)
             return 0
 
-    def get_users_with_completed_count(self) -> int:
+    async def get_users_with_completed_count(self) -> int:
         """Get count of users with at least one completed booking."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 from sqlalchemy import func
 
-                count = session.scalar(
+                count = await session.scalar(
                     select(func.count(UserBase.id)).where(
                         UserBase.completed_bookings > 0
                     )
@@ -488,13 +517,13 @@ class UserRepository(BaseRepository):
             LoggerService.error(__name__, "get_users_with_completed_count", e)
             return 0
 
-    def get_active_users_count(self) -> int:
+    async def get_active_users_count(self) -> int:
         """Get count of active users."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 from sqlalchemy import func
 
-                count = session.scalar(
+                count = await session.scalar(
                     select(func.count(UserBase.id)).where(UserBase.is_active == True)
                 )
                 return int(count) if count else 0
@@ -503,13 +532,13 @@ class UserRepository(BaseRepository):
             LoggerService.error(__name__, "get_active_users_count", e)
             return 0
 
-    def get_deactivated_users_count(self) -> int:
+    async def get_deactivated_users_count(self) -> int:
         """Get count of deactivated users."""
         try:
-            with self.Session() as session:
+            async with self.Session() as session:
                 from sqlalchemy import func
 
-                count = session.scalar(
+                count = await session.scalar(
                     select(func.count(UserBase.id)).where(UserBase.is_active == False)
                 )
                 return int(count) if count else 0
@@ -518,13 +547,13 @@ class UserRepository(BaseRepository):
             LoggerService.error(__name__, "get_deactivated_users_count", e)
             return 0
 
-    def get_users_without_chat_id(self) -> list[UserBase]:
+    async def get_users_without_chat_id(self) -> list[UserBase]:
         """Get all users without chat_id."""
         try:
-            with self.Session() as session:
-                users = session.scalars(
+            async with self.Session() as session:
+                users = (await session.scalars(
                     select(UserBase).where(UserBase.chat_id.is_(None))
-                ).all()
+                )).all()
                 return list(users)
         except Exception as e:
             print(f"Error in get_users_without_chat_id: {e}")
@@ -5,6 +5,7 @@ This service provides backward compatibility by delegating to specialized reposi
 - UserRepository: User-related operations
 - GiftRepository: Gift certificate operations
 - BookingRepository: Booking operations
+- StatisticsRepository: Aggregates for /statistics
 
 For new code, prefer using the specialized repositories directly from:
 src.services.database import UserRepository, GiftRepository, BookingRepository
@@ -16,7 +17,12 @@ import sys
 import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from src.services.database import UserRepository, GiftRepository, BookingRepository
+from src.services.database import (
+    UserRepository,
+    GiftRepository,
+    BookingRepository,
+    StatisticsRepository,
+)
 from src.services.database.promocode_repository import PromocodeRepository
 from db.models.user import UserBase
 from db.models.gift import GiftBase
@@ -33,7 +39,8 @@ class DatabaseService:
     Facade for database operations. Delegates to specialized repositories.
 
     This class maintains backward compatibility while organizing code into
-    separate repositories by entity type.
+    separate repositories by entity type. All operations are coroutines backed
+    by an AsyncSession, so handlers must await them.
     """
 
     def __init__(self):
@@ -41,6 +48,7 @@ class DatabaseService:
         self.gift_repository = GiftRepository()
         self.booking_repository = BookingRepository()
         self.promocode_repository = PromocodeRepository()
+        self.statistics_repository = StatisticsRepository()
 
         # For backward compatibility
         self.engine = self.user_repository.engine
@@ -48,57 +56,61 @@ class DatabaseService:
 
     # ========== User Operations ==========
 
-    def add_user(self, contact: str) -> UserBase:
+    async def add_user(self, contact: str) -> UserBase:
         """Add a new user to the database."""
-        return self.user_repository.add_user(contact)
+        return await self.user_repository.add_user(contact)
 
-    def get_or_create_user(self, contact: str) -> UserBase:
+    async def get_or_create_user(self, contact: str) -> UserBase:
         """Get existing user or create new one."""
-        return self.user_repository.get_or_create_user(contact)
+        return await self.user_repository.get_or_create_user(contact)
 
-    def get_user_by_contact(self, contact: str) -> UserBase:
+    async def get_user_by_contact(self, contact: str) -> UserBase:
         """Get user by contact (username or phone)."""
-        return self.user_repository.get_user_by_contact(contact)
+        return await self.user_repository.get_user_by_contact(contact)
 
-    def get_user_by_id(self, user_id: int) -> UserBase:
+    async def get_user_by_id(self, user_id: int) -> UserBase:
         """Get user by ID."""
-        return self.user_repository.get_user_by_id(user_id)
+        return await self.user_repository.get_user_by_id(user_id)
 
-    def get_user_by_chat_id(self, chat_id: int) -> UserBase:
+    async def get_user_by_chat_id(self, chat_id: int) -> UserBase:
         """Get user by chat_id."""
-        return self.user_repository.get_user_by_chat_id(chat_id)
+        return await self.user_repository.get_user_by_chat_id(chat_id)
 
-    def update_user_contact(self, chat_id: int, contact: str) -> UserBase:
+    async def update_user_contact(self, chat_id: int, contact: str) -> UserBase:
         """Update user's contact (phone/email)."""
-        return self.user_repository.update_user_contact(chat_id, contact)
+        return await self.user_repository.update_user_contact(chat_id, contact)
 
-    def update_user_chat_id(self, contact: str, chat_id: int) -> UserBase:
+    async def update_user_chat_id(self, contact: str, chat_id: int) -> UserBase:
         """Update or set chat_id for user. Handles duplicates gracefully."""
-        return self.user_repository.update_user_chat_id(contact, chat_id)
+        return await self.user_repository.update_user_chat_id(contact, chat_id)
 
-    def get_all_user_chat_ids(self) -> list[int]:
+    async def get_all_user_chat_ids(self) -> list[int]:
         """Get all chat IDs from UserBase."""
-        return self.user_repository.get_all_user_chat_ids()
+        return await self.user_repository.get_all_user_chat_ids()
 
-    def get_user_chat_ids_with_bookings(self) -> list[int]:
+    async def get_user_chat_ids_with_bookings(self) -> list[int]:
         """Get chat IDs of users who have at least one booking."""
-        return self.user_repository.get_user_chat_ids_with_bookings()
+        return await self.user_repository.get_user_chat_ids_with_bookings()
 
-    def get_user_chat_ids_without_bookings(self) -> list[int]:
+    async def get_user_chat_ids_without_bookings(self) -> list[int]:
         """Get chat IDs of users who have never made a booking."""
-        return self.user_repository.get_user_chat_ids_without_bookings()
+        return await self.user_repository.get_user_chat_ids_without_bookings()
 
-    def deactivate_user(self, chat_id: int) -> bool:
+    async def deactivate_user(self, chat_id: int) -> bool:
         """Deactivate user by chat_id (set is_active=False). Returns True if found."""
-        return self.user_repository.deactivate_user(chat_id)
+        return await self.user_repository.deactivate_user(chat_id)
 
-    def increment_completed_bookings(self, user_id: int) -> None:
+    async def deactivate_users(self, chat_ids: list[int]) -> int:
+        """Deactivate users by chat_ids in one transaction. Returns number of deactivated users."""
+        return await self.user_repository.deactivate_users(chat_ids)
+
+    async def increment_completed_bookings(self, user_id: int) -> None:
         """Increment completed booking counter for user."""
-        return self.user_repository.increment_completed_bookings(user_id)
+        return await self.user_repository.increment_completed_bookings(user_id)
 
     # ========== Gift Operations ==========
 
-    def add_gift(
+    async def add_gift(
         self,
         buyer_contact: str,
         tariff: Tariff,
@@ -109,7 +121,7 @@ class DatabaseService:
         code: str,
     ) -> GiftBase:
         """Add a new gift certificate to the database."""
-        return self.gift_repository.add_gift(
+        return await self.gift_repository.add_gift(
             buyer_contact,
             tariff,
             has_sauna,
@@ -119,7 +131,7 @@ class DatabaseService:
             code,
         )
 
-    def update_gift(
+    async def update_gift(
         self,
         gift_id: int,
         user_id: int = None,
@@ -128,21 +140,21 @@ class DatabaseService:
         is_done: bool = None,
     ) -> GiftBase:
         """Update gift certificate fields."""
-        return self.gift_repository.update_gift(
+        return await self.gift_repository.update_gift(
             gift_id, user_id, date_expired, is_paymented, is_done
         )
 
-    def get_gift_by_code(self, code: str) -> GiftBase:
+    async def get_gift_by_code(self, code: str) -> GiftBase:
         """Get valid gift certificate by code."""
-        return self.gift_repository.get_gift_by_code(code)
+        return await self.gift_repository.get_gift_by_code(code)
 
-    def get_gift_by_id(self, id: int) -> GiftBase:
+    async def get_gift_by_id(self, id: int) -> GiftBase:
         """Get gift certificate by ID."""
-        return self.gift_repository.get_gift_by_id(id)
+        return await self.gift_repository.get_gift_by_id(id)
 
     # ========== Promocode Operations ==========
 
-    def add_promocode(
+    async def add_promocode(
         self,
         name: str,
         date_from: date,
@@ -152,39 +164,39 @@ class DatabaseService:
         promocode_type: int = 1,
     ) -> PromocodeBase:
         """Add a new promocode to the database."""
-        return self.promocode_repository.add_promocode(
+        return await self.promocode_repository.add_promocode(
             name, date_from, date_to, discount_percentage, applicable_tariffs, promocode_type
         )
 
-    def get_promocode_by_name(self, name: str) -> Optional[PromocodeBase]:
+    async def get_promocode_by_name(self, name: str) -> Optional[PromocodeBase]:
         """Get promocode by name."""
-        return self.promocode_repository.get_promocode_by_name(name)
+        return await self.promocode_repository.get_promocode_by_name(name)
 
-    def get_promocode_by_id(self, promocode_id: int) -> Optional[PromocodeBase]:
+    async def get_promocode_by_id(self, promocode_id: int) -> Optional[PromocodeBase]:
         """Get promocode by ID."""
-        return self.promocode_repository.get_promocode_by_id(promocode_id)
+        return await self.promocode_repository.get_promocode_by_id(promocode_id)
 
-    def validate_promocode(
+    async def validate_promocode(
         self, name: str, booking_date: date, tariff: Tariff
     ) -> tuple[bool, str, Optional[PromocodeBase]]:
         """Validate promocode against booking parameters."""
-        return self.promocode_repository.validate_promocode(name, booking_date, tariff)
+        return await self.promocode_repository.validate_promocode(name, booking_date, tariff)
 
-    def list_active_promocodes(self) -> list[PromocodeBase]:
+    async def list_active_promocodes(self) -> list[PromocodeBase]:
         """Get all active promocodes."""
-        return self.promocode_repository.list_active_promocodes()
+        return await self.promocode_repository.list_active_promocodes()
 
-    def deactivate_promocode(self, promocode_id: int) -> bool:
+    async def deactivate_promocode(self, promocode_id: int) -> bool:
         """Deactivate a promocode (soft delete)."""
-        return self.promocode_repository.deactivate_promocode(promocode_id)
+        return await self.promocode_repository.deactivate_promocode(promocode_id)
 
-    def deactivate_expired_promocodes(self) -> int:
+    async def deactivate_expired_promocodes(self) -> int:
         """Deactivate all expired promocodes. Returns count of deactivated promocodes."""
-        return self.promocode_repository.deactivate_expired_promocodes()
+        return await self.promocode_repository.deactivate_expired_promocodes()
 
     # ========== Booking Operations ==========
 
-    def add_booking(
+    async def add_booking(
         self,
         user_contact: str,
         start_date: datetime,
@@ -205,7 +217,7 @@ class DatabaseService:
         prepayment_price: float = None,
     ) -> BookingBase:
         """Add a new booking to the database."""
-        return self.booking_repository.add_booking(
+        return await self.booking_repository.add_booking(
             user_contact,
             start_date,
             end_date,
@@ -225,78 +237,84 @@ class DatabaseService:
             prepayment_price,
         )
 
-    def get_booking_by_start_date_user(
+    async def get_booking_by_start_date_user(
         self, user_contact: str, start_date: date
     ) -> BookingBase:
         """Get booking for specific user by start date."""
-        return self.booking_repository.get_booking_by_start_date_user(
+        return await self.booking_repository.get_booking_by_start_date_user(
             user_contact, start_date
         )
 
-    def get_booking_by_start_date(self, start_date: date):
+    async def get_booking_by_start_date(self, start_date: date):
         """Get all bookings starting on a specific date."""
-        return self.booking_repository.get_booking_by_start_date(start_date)
+        return await self.booking_repository.get_booking_by_start_date(start_date)
 
-    def get_booking_by_finish_date(self, end_date: date):
+    async def get_booking_by_finish_date(self, end_date: date):
         """Get all bookings ending on a specific date."""
-        return self.booking_repository.get_booking_by_finish_date(end_date)
+        return await self.booking_repository.get_booking_by_finish_date(end_date)
 
-    def get_booking_by_start_date_period(
+    async def get_booking_by_start_date_period(
         self, from_date: date, to_date: date, is_admin: bool = False
     ) -> Sequence[BookingBase]:
         """Get bookings within a date range based on start_date."""
-        return self.booking_repository.get_booking_by_start_date_period(
+        return await self.booking_repository.get_booking_by_start_date_period(
             from_date, to_date, is_admin
         )
 
-    def get_booking_by_finish_date_period(
+    async def get_booking_by_finish_date_period(
         self, from_date: date, to_date: date, is_admin: bool = False
     ) -> Sequence[BookingBase]:
         """Get bookings within a date range based on end_date."""
-        return self.booking_repository.get_booking_by_finish_date_period(
+        return await self.booking_repository.get_booking_by_finish_date_period(
             from_date, to_date, is_admin
         )
 
-    def get_booking_by_day(
+    async def get_booking_by_day(
         self, target_date: date, except_booking_id: int = None
     ) -> Sequence[BookingBase]:
         """Get all bookings overlapping with a specific day."""
-        return self.booking_repository.get_booking_by_day(
+        return await self.booking_repository.get_booking_by_day(
             target_date, except_booking_id
         )
 
-    def get_bookings_by_month(
+    async def get_bookings_by_month(
         self, target_month: int, target_year: int
     ) -> Sequence[BookingBase]:
         """Get all bookings overlapping with a specific month."""
-        return self.booking_repository.get_bookings_by_month(target_month, target_year)
+        return await self.booking_repository.get_bookings_by_month(target_month, target_year)
 
-    def is_booking_between_dates(self, start: datetime, end: datetime) -> bool:
+    async def is_booking_between_dates(self, start: datetime, end: datetime) -> bool:
         """Check if there are any bookings between the given dates."""
-        return self.booking_repository.is_booking_between_dates(start, end)
+        return await self.booking_repository.is_booking_between_dates(start, end)
 
-    def get_booking_by_id(self, booking_id: int) -> BookingBase:
+    async def get_booking_by_id(self, booking_id: int) -> BookingBase:
         """Get booking by ID."""
-        return self.booking_repository.get_booking_by_id(booking_id)
+        return await self.booking_repository.get_booking_by_id(booking_id)
 
-    def get_booking_by_user_contact(self, user_contact: str) -> list[BookingBase]:
+    async def get_booking_by_user_contact(self, user_contact: str) -> list[BookingBase]:
         """Get all active bookings for a user."""
-        return self.booking_repository.get_booking_by_user_contact(user_contact)
+        return await self.booking_repository.get_booking_by_user_contact(user_contact)
 
-    def get_unpaid_bookings(self) -> Sequence[BookingBase]:
+    async def get_unpaid_bookings(self) -> Sequence[BookingBase]:
         """Get all unpaid, active bookings."""
-        return self.booking_repository.get_unpaid_bookings()
+        return await self.booking_repository.get_unpaid_bookings()
+
+    async def get_admin_booking_list(
+        self, from_date: date, to_date: date, limit: int = 100
+    ) -> Sequence[BookingBase]:
+        """Get bookings in the period plus unpaid active ones, with users, in one query."""
+        return await self.booking_repository.get_admin_booking_list(from_date, to_date, limit)
 
-    def get_all_chat_ids(self) -> list[int]:
+    async def get_all_chat_ids(self) -> list[int]:
         """Get all unique chat IDs from bookings (legacy method)."""
-        return self.booking_repository.get_all_chat_ids()
+        return await self.booking_repository.get_all_chat_ids()
 
-    def get_done_booking_count(self, user_id: int) -> int:
+    async def get_done_booking_count(self, user_id: int) -> int:
         """Get count of completed bookings for a user from user.completed_bookings."""
-        user = self.user_repository.get_user_by_id(user_id)
+        user = await self.user_repository.get_user_by_id(user_id)
         return user.completed_bookings if user else 0
 
-    def update_booking(
+    async def update_booking(
         self,
         booking_id: int,
         start_date: datetime = None,
@@ -313,7 +331,7 @@ class DatabaseService:
         feedback_submitted: bool = None,
     ) -> BookingBase:
         """Update booking fields."""
-        return self.booking_repository.update_booking(
+        return await self.booking_repository.update_booking(
             booking_id,
             start_date,
             end_date,
@@ -330,73 +348,83 @@ class DatabaseService:
         )
 
     # Statistics methods
-    def get_bookings_count_by_period(
+    async def get_booking_statistics(
+        self, periods: dict[str, tuple[datetime, datetime]]
+    ) -> dict[str, dict]:
+        """Get booking metrics for several periods in one query."""
+        return await self.statistics_repository.get_booking_statistics(periods)
+
+    async def get_user_and_gift_statistics(self) -> dict:
+        """Get user and gift certificate metrics in one query."""
+        return await self.statistics_repository.get_user_and_gift_statistics()
+
+    async def get_bookings_count_by_period(
         self,
         start_date: datetime = None,
         end_date: datetime = None,
         is_completed: bool = None,
     ) -> int:
         """Get count of bookings in a period with optional completion filter."""
-        return self.booking_repository.get_bookings_count_by_period(
+        return await self.booking_repository.get_bookings_count_by_period(
             start_date, end_date, is_completed
         )
 
-    def get_revenue_by_period(
+    async def get_revenue_by_period(
         self, start_date: datetime = None, end_date: datetime = None
     ) -> float:
         """Get total revenue from completed bookings in a period."""
-        return self.booking_repository.get_revenue_by_period(start_date, end_date)
+        return await self.booking_repository.get_revenue_by_period(start_date, end_date)
 
-    def get_canceled_bookings_count(
+    async def get_canceled_bookings_count(
         self, start_date: datetime = None, end_date: datetime = None
     ) -> int:
         """Get count of canceled bookings in a period."""
-        return self.booking_repository.get_canceled_bookings_count(start_date, end_date)
+        return await self.booking_repository.get_canceled_bookings_count(start_date, end_date)
 
-    def get_active_bookings_count(
+    async def get_active_bookings_count(
         self, start_date: datetime = None, end_date: datetime = None
     ) -> int:
         """Get count of active/upcoming bookings in a period."""
-        return self.booking_repository.get_active_bookings_count(start_date, end_date)
+        return await self.booking_repository.get_active_bookings_count(start_date, end_date)
 
-    def get_total_users_count(self) -> int:
+    async def get_total_users_count(self) -> int:
         """Get total count of users in system."""
-        return self.user_repository.get_total_users_count()
+        return await self.user_repository.get_total_users_count()
 
-    def get_users_with_bookings_count(self) -> int:
+    async def get_users_with_bookings_count(self) -> int:
         """Get count of users with at least one booking."""
-        return self.user_repository.get_users_with_bookings_count()
+        return await self.user_repository.get_users_with_bookings_count()
 
-    def get_users_with_completed_count(self) -> int:
+    async def get_users_with_completed_count(self) -> int:
         """Get count of users with at least one completed booking."""
-        return self.user_repository.get_users_with_completed_count()
+        return await self.user_repository.get_users_with_completed_count()
 
-    def get_active_users_count(self) -> int:
+    async def get_active_users_count(self) -> int:
         """Get count of active users."""
-        return self.user_repository.get_active_users_count()
+        return await self.user_repository.get_active_users_count()
 
-    def get_deactivated_users_count(self) -> int:
+    async def get_deactivated_users_count(self) -> int:
         """Get count of deactivated users."""
-        return self.user_repository.get_deactivated_users_count()
+        return await self.user_repository.get_deactivated_users_count()
 
-    def get_users_without_chat_id(self) -> list:
+    async def get_users_without_chat_id(self) -> list:
         """Get all users without chat_id."""
-        return self.user_repository.get_users_without_chat_id()
+        return await self.user_repository.get_users_without_chat_id()
 
     # ========== Gift Statistics ==========
 
-    def get_total_gifts_count(self) -> int:
+    async def get_total_gifts_count(self) -> int:
         """Get total count of gift certificates."""
-        return self.gift_repository.get_total_gifts_count()
+        return await self.gift_repository.get_total_gifts_count()
 
-    def get_paid_gifts_count(self) -> int:
+    async def get_paid_gifts_count(self) -> int:
         """Get count of paid gift certificates."""
-        return self.gift_repository.get_paid_gifts_count()
+        return await self.gift_repository.get_paid_gifts_count()
 
-    def get_used_gifts_count(self) -> int:
+    async def get_used_gifts_count(self) -> int:
         """Get count of used gift certificates."""
-        return self.gift_repository.get_used_gifts_count()
+        return await self.gift_repository.get_used_gifts_count()
 
-    def get_gift_revenue(self) -> float:
+    async def get_gift_revenue(self) -> float:
         """Get total revenue from paid gift certificates."""
-        return self.gift_repository.get_gift_revenue()
+        return await self.gift_repository.get_gift_revenue()
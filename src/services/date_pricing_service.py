@@ -1,7 +1,8 @@
 import sys
 import os
-from datetime import date
-from typing import List, Optional
+from bisect import bisect_right
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
 from singleton_decorator import singleton
 from src.models.date_pricing_rule import DatePricingRule
 from src.services.file_service import FileService
@@ -9,27 +10,82 @@ from src.services.file_service import FileService
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 
+class DateRuleIndex:
+    """
+    Active rules split into non-overlapping date segments.
+
+    Every rule start and day after a rule end is a boundary; the rules
+    applying between two boundaries are stored sorted by rule_id, so a
+    lookup is one bisect.
+    """
+
+    def __init__(self, rules: List[DatePricingRule]):
+        active = [rule for rule in rules if rule.is_active]
+        self.boundaries: List[date] = sorted(
+            {rule.start_date_obj for rule in active}
+            | {rule.end_date_obj + timedelta(days=1) for rule in active}
+        )
+        # segments[i] covers [boundaries[i], boundaries[i + 1])
+        self.segments: List[Tuple[DatePricingRule, ...]] = [
+            tuple(
+                sorted(
+                    (
+                        rule
+                        for rule in active
+                        if rule.start_date_obj <= start <= rule.end_date_obj
+                    ),
+                    key=lambda rule: rule.rule_id,
+                )
+            )
+            for start in self.boundaries[:-1]
+        ]
+
+    def get(self, target_date: date) -> Tuple[DatePricingRule, ...]:
+        index = bisect_right(self.boundaries, target_date) - 1
+        if 0 <= index < len(self.segments):
+            return self.segments[index]
+        return ()
+
+    def get_range(self, start: date, end: date) -> List[Tuple[DatePricingRule, ...]]:
+        """get() for every day from start to end inclusive, walking the segments once."""
+        result = []
+        index = bisect_right(self.boundaries, start) - 1
+        day = start
+        while day <= end:
+            rules = self.segments[index] if 0 <= index < len(self.segments) else ()
+            if index + 1 < len(self.boundaries):
+                segment_end = min(end, self.boundaries[index + 1] - timedelta(days=1))
+            else:
+                segment_end = end
+            result.extend([rules] * ((segment_end - day).days + 1))
+            day = segment_end + timedelta(days=1)
+            index += 1
+        return result
+
+
 @singleton
 class DatePricingService:
     _rules: List[DatePricingRule] = []
+    # Built from _rules, rebuilt when _rules is replaced
+    _index: Optional[DateRuleIndex] = None
+    _index_source: Optional[List[DatePricingRule]] = None
 
     def get_applicable_rules(self, target_date: date) -> List[DatePricingRule]:
-        """Get all active rules that apply to the target date, sorted by priority (highest first)."""
-        rules = self._try_load_rules()
-        applicable = []
-
-        for rule in rules:
-            if rule.applies_to_date(target_date):
-                applicable.append(rule)
-
-        # Sort by rule_id for consistent ordering
-        return sorted(applicable, key=lambda x: x.rule_id)
+        """Get all active rules that apply to the target date, sorted by rule_id."""
+        return list(self._get_index().get(target_date))
 
     def get_effective_rule(self, target_date: date) -> Optional[DatePricingRule]:
         """Get the highest priority rule that applies to the target date."""
-        applicable_rules = self.get_applicable_rules(target_date)
+        applicable_rules = self._get_index().get(target_date)
         return applicable_rules[0] if applicable_rules else None
 
+    def get_effective_rules(self, start: date, end: date) -> List[Optional[DatePricingRule]]:
+        """get_effective_rule() for every day from start to end inclusive."""
+        return [
+            rules[0] if rules else None
+            for rules in self._get_index().get_range(start, end)
+        ]
+
     def has_date_override(self, target_date: date) -> bool:
         """Check if there's any pricing override for the target date."""
         effective_rule = self.get_effective_rule(target_date)
@@ -57,3 +113,28 @@ class DatePricingService:
             file_service = FileService()
             self._rules = file_service.get_date_pricing_rules()
         return self._rules
+
+    def load_rules(self) -> Tuple[List[DatePricingRule], DateRuleIndex]:
+        """Read, validate and index the rules file without touching the rules in use."""
+        rules = FileService().get_date_pricing_rules()
+        rule_ids = [rule.rule_id for rule in rules]
+        if len(set(rule_ids)) != len(rule_ids):
+            raise ValueError("Duplicate rule_id in date pricing rules")
+        return rules, DateRuleIndex(rules)
+
+    def set_rules(self, rules: List[DatePricingRule], index: DateRuleIndex):
+        """Swap in rules returned by load_rules."""
+        self._index = index
+        self._index_source = rules
+        self._rules = rules
+
+    def refresh_rules(self) -> List[DatePricingRule]:
+        self.set_rules(*self.load_rules())
+        return self._rules
+
+    def _get_index(self) -> DateRuleIndex:
+        rules = self._try_load_rules()
+        if self._index_source is not rules:
+            self._index = DateRuleIndex(rules)
+            self._index_source = rules
+        return self._index
@@ -2,7 +2,7 @@ from io import BytesIO
 import os
 import json
 from telegram import InputMediaPhoto
-from typing import List
+from typing import List, Optional
 from singleton_decorator import singleton
 from src.models.rental_price import RentalPrice
 from src.models.date_pricing_rule import DatePricingRule
@@ -18,23 +18,26 @@ class FileService:
     _HOLIDAY_PREPAYMENT_RULES_JSON = "src/config/holiday_prepayment_rules.json"
 
     def get_price_media(self) -> List[InputMediaPhoto]:
-        if not os.path.exists(self._IMAGE_FOLDER):
-            raise FileNotFoundError(f"Папка {self._IMAGE_FOLDER} не существует.")
-
-        image_files = [
-            f for f in os.listdir(self._IMAGE_FOLDER) if f.endswith((".jpg", ".png"))
-        ]
-        if not image_files:
+        image_names = self.get_price_image_names()
+        if not image_names:
             return "Нет изображений для загрузки."
 
         media_list = []
-        for image_name in image_files:
+        for image_name in image_names:
             image_path = os.path.join(self._IMAGE_FOLDER, image_name)
             with open(image_path, "rb") as image_file:
                 media = InputMediaPhoto(image_file)
                 media_list.append(media)
         return media_list
 
+    def get_price_image_names(self) -> List[str]:
+        if not os.path.exists(self._IMAGE_FOLDER):
+            raise FileNotFoundError(f"Папка {self._IMAGE_FOLDER} не существует.")
+
+        return sorted(
+            f for f in os.listdir(self._IMAGE_FOLDER) if f.endswith((".jpg", ".png"))
+        )
+
     def get_tariff_rates(self) -> List[RentalPrice]:
         if not os.path.exists(self._TARIFF_JSON):
             raise FileNotFoundError(f"Файл {self._TARIFF_JSON} не существует.")
@@ -46,8 +49,8 @@ class FileService:
         return tariff_list
 
     def get_image(self, image_name: str):
-        image_path = os.path.join(self._IMAGE_FOLDER, image_name)
-        if not os.path.exists(image_path):
+        image_path = self.get_image_path(image_name)
+        if image_path is None:
             return None
 
         with open(image_path, "rb") as image_file:
@@ -55,6 +58,12 @@ class FileService:
             image_bytes.seek(0)
             return image_bytes
 
+    def get_image_path(self, image_name: str) -> Optional[str]:
+        image_path = os.path.join(self._IMAGE_FOLDER, image_name)
+        if not os.path.exists(image_path):
+            return None
+        return image_path
+
     def get_date_pricing_rules(self) -> List[DatePricingRule]:
         if not os.path.exists(self._DATE_PRICING_RULES_JSON):
             raise FileNotFoundError(
@@ -13,6 +13,11 @@ from telegram.ext import Application, CallbackContext, JobQueue
 from singleton_decorator import singleton
 from src.services.database_service import DatabaseService
 from src.services.chat_validation_service import ChatValidationService
+from src.services.availability_service import AvailabilityService
+from src.services.calendar_sync_service import CalendarSyncService
+from src.services.metrics_service import timed_job
+from src.services.pricing_reload_service import PricingReloadService
+from src.config.config import PRICING_RELOAD_INTERVAL
 
 logging.basicConfig(level=logging.INFO)
 database_service = DatabaseService()
@@ -41,16 +46,16 @@ class JobService:
 
         if not context.job_queue.get_jobs_by_name("send_booking_details"):
             context.job_queue.run_daily(
-                self.send_booking_details, time=job_time, name="send_booking_details"
+                timed_job(self.send_booking_details), time=job_time, name="send_booking_details"
             )
         if not context.job_queue.get_jobs_by_name("send_feeback"):
             context.job_queue.run_daily(
-                self.send_feeback, time=job_time, name="send_feeback"
+                timed_job(self.send_feeback), time=job_time, name="send_feeback"
             )
         if not context.job_queue.get_jobs_by_name("cleanup_invalid_chats"):
             # Run weekly - every 7 days, first run 10 seconds after start for testing
             context.job_queue.run_repeating(
-                self.cleanup_invalid_chats,
+                timed_job(self.cleanup_invalid_chats),
                 interval=timedelta(days=7),
                 first=timedelta(seconds=10),
                 name="cleanup_invalid_chats",
@@ -58,14 +63,43 @@ class JobService:
         if not context.job_queue.get_jobs_by_name("cleanup_expired_promocodes"):
             # Run daily at midnight (00:00)
             context.job_queue.run_daily(
-                self.cleanup_expired_promocodes,
+                timed_job(self.cleanup_expired_promocodes),
                 time=time(0, 0, tzinfo=timezone),
                 name="cleanup_expired_promocodes",
             )
 
+    def register_background_jobs(self, job_queue: JobQueue):
+        """Jobs that run from application start, not only after the first /start."""
+        if not job_queue.get_jobs_by_name("calendar_outbox"):
+            job_queue.run_repeating(
+                timed_job(CalendarSyncService().process_outbox),
+                interval=timedelta(seconds=30),
+                first=timedelta(seconds=10),
+                name="calendar_outbox",
+            )
+        if not job_queue.get_jobs_by_name("refresh_availability"):
+            # Bookings written outside the bot (web) are picked up by this reload
+            job_queue.run_repeating(
+                timed_job(self.refresh_availability),
+                interval=timedelta(hours=1),
+                first=timedelta(hours=1),
+                name="refresh_availability",
+            )
+        if not job_queue.get_jobs_by_name("reload_pricing"):
+            # Prices edited in src/config/*.json apply without a restart
+            job_queue.run_repeating(
+                timed_job(PricingReloadService().check),
+                interval=timedelta(seconds=PRICING_RELOAD_INTERVAL),
+                first=timedelta(seconds=PRICING_RELOAD_INTERVAL),
+                name="reload_pricing",
+            )
+
+    async def refresh_availability(self, context: CallbackContext):
+        await AvailabilityService().reload()
+
     async def send_booking_details(self, context: CallbackContext):
         tomorrow = date.today() + timedelta(days=1)
-        bookings = database_service.get_booking_by_start_date_period(date.today(), tomorrow)
+        bookings = await database_service.get_booking_by_start_date_period(date.today(), tomorrow)
         LoggerService.info(
             __name__,
             f"Found {len(bookings)} bookings for {tomorrow}",
@@ -100,7 +134,7 @@ class JobService:
     async def send_feeback(self, context: CallbackContext):
         today = date.today()
         seven_days_ago = today - timedelta(days=7)
-        bookings = database_service.get_booking_by_finish_date_period(seven_days_ago, today)
+        bookings = await database_service.get_booking_by_finish_date_period(seven_days_ago, today)
         if not bookings:
             LoggerService.info(
                 __name__,
@@ -117,7 +151,7 @@ class JobService:
 
         for booking in bookings:
             try:
-                database_service.update_booking(booking.id, is_done=True)
+                await database_service.update_booking(booking.id, is_done=True)
                 await admin_handler.send_feedback(context, booking)
                 LoggerService.info(
                     __name__,
@@ -145,7 +179,7 @@ class JobService:
         """Weekly job to validate all chat IDs and remove invalid ones."""
         try:
             # Get all chat IDs from users
-            chat_ids = database_service.get_all_user_chat_ids()
+            chat_ids = await database_service.get_all_user_chat_ids()
 
             if not chat_ids:
                 LoggerService.info(
@@ -165,24 +199,18 @@ class JobService:
                 self._application.bot, chat_ids
             )
 
-            # Deactivate users with invalid chat IDs
-            deactivated_count = 0
-            for invalid_chat_id in results["invalid_ids"]:
-                try:
-                    if database_service.deactivate_user(invalid_chat_id):
-                        deactivated_count += 1
-                        LoggerService.info(
-                            __name__,
-                            "Deactivated user with invalid chat_id",
-                            **{"chat_id": invalid_chat_id},
-                        )
-                except Exception as e:
-                    LoggerService.error(
-                        __name__,
-                        "Failed to deactivate user",
-                        exception=e,
-                        **{"chat_id": invalid_chat_id},
-                    )
+            # Deactivate users with invalid chat IDs in one transaction
+            deactivated_count = await database_service.deactivate_users(
+                results["invalid_ids"]
+            )
+            # Kept until now, so a failed deactivation is retried next run
+            validation_service.clear_checkpoint()
+            if results["invalid_ids"]:
+                LoggerService.info(
+                    __name__,
+                    "Deactivated users with invalid chat_id",
+                    **{"chat_ids": results["invalid_ids"], "deactivated": deactivated_count},
+                )
 
             # Log summary
             LoggerService.info(
@@ -202,7 +230,7 @@ class JobService:
     async def cleanup_expired_promocodes(self, context: CallbackContext):
         """Daily job to deactivate expired promocodes."""
         try:
-            count = database_service.deactivate_expired_promocodes()
+            count = await database_service.deactivate_expired_promocodes()
             if count > 0:
                 LoggerService.info(
                     __name__,
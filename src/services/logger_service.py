@@ -2,14 +2,102 @@ import sys
 import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+import atexit
 import logging
+import queue
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from logtail import LogtailHandler
-from src.config.config import LOGTAIL_TOKEN, LOGTAIL_SOURCE, DEBUG
+from src.services.metrics_service import MetricsService
+from src.config.config import (
+    LOGTAIL_TOKEN,
+    LOGTAIL_SOURCE,
+    DEBUG,
+    LOG_LEVEL,
+    LOG_INFO_SAMPLE_RATE,
+    LOG_QUEUE_SIZE,
+    LOG_BATCH_SIZE,
+    LOG_FLUSH_INTERVAL,
+)
+
+
+# getLevelName maps a known name to its number, anything else to a string
+_LEVEL = logging.getLevelName(LOG_LEVEL)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks the caller.
+
+    When the queue is full new records are dropped, except errors, which
+    evict the oldest queued record instead. The number of dropped records
+    is reported with the first record that fits again.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue stays in this process, so formatting is left to the listener thread
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        if not self._put(record):
+            return
+
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            notice = logging.makeLogRecord(
+                {
+                    "name": __name__,
+                    "levelno": logging.WARNING,
+                    "levelname": logging.getLevelName(logging.WARNING),
+                    "msg": f"Log queue was full, dropped {dropped} records",
+                }
+            )
+            if not self._put(notice):
+                self.dropped += dropped
+
+    def _put(self, record: logging.LogRecord) -> bool:
+        try:
+            self.queue.put_nowait(record)
+            return True
+        except queue.Full:
+            pass
+
+        if record.levelno >= logging.ERROR:
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+                self.queue.put_nowait(record)
+                return True
+            except (queue.Empty, queue.Full):
+                pass
+
+        self.dropped += 1
+        return False
 
 
 class LoggerService:
+    """
+    Static logging facade used across the bot.
+
+    Records go through one in-memory queue to a listener thread that feeds a
+    single LogtailHandler, which uploads them in batches of LOG_BATCH_SIZE or
+    every LOG_FLUSH_INTERVAL seconds. A call from a handler only puts a record
+    on the queue. LOG_LEVEL filters records and LOG_INFO_SAMPLE_RATE samples
+    INFO records before any work is done.
+    """
+
     loggers: Dict[str, logging.Logger] = {}
+    queue_handler: Optional[DroppingQueueHandler] = None
+    listener: Optional[QueueListener] = None
+    setup_lock = threading.Lock()
+    level: int = _LEVEL if isinstance(_LEVEL, int) else logging.INFO
+    info_sample_rate: float = LOG_INFO_SAMPLE_RATE
 
     @staticmethod
     def info(file_name: str, message: str, update=None, **kwargs: Any):
@@ -17,6 +105,14 @@ class LoggerService:
             print(f"INFO {file_name}: {message}")
             return
 
+        if not LoggerService.__is_enabled__(logging.INFO):
+            return
+        if (
+            LoggerService.info_sample_rate < 1
+            and random.random() >= LoggerService.info_sample_rate
+        ):
+            return
+
         logger = LoggerService.__get_logger__(file_name)
 
         if update:
@@ -36,6 +132,9 @@ class LoggerService:
             print(f"ERROR {message}: {exception}")
             return
 
+        if not LoggerService.__is_enabled__(logging.ERROR):
+            return
+
         logger = LoggerService.__get_logger__(file_name)
 
         if update:
@@ -52,6 +151,9 @@ class LoggerService:
             print(f"WARNING {message}")
             return
 
+        if not LoggerService.__is_enabled__(logging.WARNING):
+            return
+
         logger = LoggerService.__get_logger__(file_name)
 
         if update:
@@ -59,6 +161,26 @@ class LoggerService:
 
         logger.warning(message, extra=kwargs)
 
+    @staticmethod
+    def shutdown():
+        """Stop the listener and upload what is still queued."""
+        listener = LoggerService.listener
+        if not listener:
+            return
+
+        LoggerService.listener = None
+        try:
+            listener.stop()
+        except queue.Full:
+            # No room for the stop sentinel, the listener thread is a daemon
+            pass
+        for handler in listener.handlers:
+            handler.flush()
+
+    @staticmethod
+    def __is_enabled__(level: int) -> bool:
+        return level >= LoggerService.level
+
     @staticmethod
     def __get_chat_id__(update):
         if update.message:
@@ -67,18 +189,50 @@ class LoggerService:
             return update.callback_query.message.chat.id
 
     @staticmethod
-    def __get_logger__(file_name: str) -> logging.Logger:
-        if file_name in LoggerService.loggers:
-            return LoggerService.loggers[file_name]
+    def __get_queue_handler__() -> DroppingQueueHandler:
+        # Loggers are also created from worker threads (asyncio.to_thread)
+        with LoggerService.setup_lock:
+            if not LoggerService.queue_handler:
+                LoggerService.queue_handler = LoggerService.__start_listener__()
+        return LoggerService.queue_handler
 
+    @staticmethod
+    def __start_listener__() -> DroppingQueueHandler:
+        log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
         logtail_handler = LogtailHandler(
             source_token=LOGTAIL_TOKEN,
             host=LOGTAIL_SOURCE,
+            buffer_capacity=LOG_BATCH_SIZE,
+            flush_interval=LOG_FLUSH_INTERVAL,
+            drop_extra_events=True,
+        )
+        LoggerService.listener = QueueListener(
+            log_queue, logtail_handler, respect_handler_level=True
         )
+        LoggerService.listener.start()
+        atexit.register(LoggerService.shutdown)
+
+        queue_handler = DroppingQueueHandler(log_queue)
+        MetricsService().gauge(
+            "log_queue_depth",
+            "Log records waiting for the listener thread",
+            lambda: {(): log_queue.qsize()},
+        )
+        MetricsService().gauge(
+            "log_records_dropped",
+            "Log records dropped since the last drop notice",
+            lambda: {(): queue_handler.dropped},
+        )
+        return queue_handler
+
+    @staticmethod
+    def __get_logger__(file_name: str) -> logging.Logger:
+        if file_name in LoggerService.loggers:
+            return LoggerService.loggers[file_name]
 
         logger = logging.getLogger(file_name)
-        logger.setLevel(logging.INFO)
+        logger.setLevel(LoggerService.level)
         logger.handlers = []
-        logger.addHandler(logtail_handler)
+        logger.addHandler(LoggerService.__get_queue_handler__())
         LoggerService.loggers[file_name] = logger
         return logger
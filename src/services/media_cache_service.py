@@ -0,0 +1,147 @@
+import sys
+import os
+import hashlib
+import time
+from typing import Dict, List, Optional, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.services.file_service import FileService
+from src.services.logger_service import LoggerService
+from src.services.redis.redis_connection import RedisConnection
+from singleton_decorator import singleton
+from telegram import InputMediaPhoto, Message
+from telegram.error import BadRequest
+
+
+@singleton
+class MediaCacheService:
+    """
+    Telegram file_ids of images from assets/images.
+
+    An image is uploaded the first time it is sent; the file_id Telegram
+    returns is stored in Redis under the SHA-256 of the file, and later
+    sends reuse it. Editing an image changes its hash, so it is uploaded
+    again. Hashes are recomputed only when the file's mtime or size changes.
+    Without Redis every send uploads the file, as before.
+    """
+
+    KEY_PREFIX = "media_file_id"
+
+    def __init__(self):
+        self._redis = None
+        self._retry_at = 0.0
+        self._retry_interval = 60
+        self._file_service = FileService()
+        # path -> (mtime_ns, size, digest)
+        self._digests: Dict[str, Tuple[int, int, str]] = {}
+
+    async def send_photo(self, bot, chat_id: int, image_name: str, **kwargs) -> Message:
+        """bot.send_photo with an image from assets/images, by file_id once known."""
+        path = self._get_path(image_name)
+        digest = self._get_digest(path)
+        file_id = self._get_file_id(digest)
+
+        if file_id:
+            try:
+                return await bot.send_photo(chat_id=chat_id, photo=file_id, **kwargs)
+            except BadRequest as e:
+                LoggerService.warning(
+                    __name__, "cached file_id rejected, uploading again",
+                    **{"image": image_name, "error": str(e)},
+                )
+
+        with open(path, "rb") as image_file:
+            message = await bot.send_photo(chat_id=chat_id, photo=image_file, **kwargs)
+        self._set_file_id(digest, message.photo[-1].file_id)
+        return message
+
+    async def send_price_media(self, bot, chat_id: int) -> List[Message]:
+        """Send the price images as one album."""
+        paths = [self._get_path(name) for name in self._file_service.get_price_image_names()]
+        digests = [self._get_digest(path) for path in paths]
+        file_ids = self._get_file_ids(digests)
+
+        if all(file_ids):
+            try:
+                return await bot.send_media_group(
+                    chat_id=chat_id,
+                    media=[InputMediaPhoto(file_id) for file_id in file_ids],
+                )
+            except BadRequest as e:
+                LoggerService.warning(
+                    __name__, "cached file_ids rejected, uploading again", **{"error": str(e)}
+                )
+                file_ids = [None] * len(paths)
+
+        media = []
+        for path, file_id in zip(paths, file_ids):
+            if file_id:
+                media.append(InputMediaPhoto(file_id))
+                continue
+            with open(path, "rb") as image_file:
+                media.append(InputMediaPhoto(image_file))
+
+        messages = await bot.send_media_group(chat_id=chat_id, media=media)
+        for digest, message in zip(digests, messages):
+            if message.photo:
+                self._set_file_id(digest, message.photo[-1].file_id)
+        return messages
+
+    def _get_path(self, image_name: str) -> str:
+        path = self._file_service.get_image_path(image_name)
+        if path is None:
+            raise FileNotFoundError(f"Файл {image_name} не существует.")
+        return path
+
+    def _get_digest(self, path: str) -> str:
+        stat = os.stat(path)
+        cached = self._digests.get(path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        with open(path, "rb") as image_file:
+            digest = hashlib.sha256(image_file.read()).hexdigest()
+        self._digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def _get_file_id(self, digest: str) -> Optional[str]:
+        return self._get_file_ids([digest])[0]
+
+    def _get_file_ids(self, digests: List[str]) -> List[Optional[str]]:
+        client = self._get_client()
+        if client is None or not digests:
+            return [None] * len(digests)
+
+        try:
+            return client.mget([self._get_key(digest) for digest in digests])
+        except Exception as e:
+            print(f"Error in _get_file_ids: {e}")
+            LoggerService.error(__name__, "_get_file_ids", e)
+            return [None] * len(digests)
+
+    def _set_file_id(self, digest: str, file_id: str):
+        client = self._get_client()
+        if client is None:
+            return
+
+        try:
+            # file_ids do not expire for the bot that received them
+            client.set(self._get_key(digest), file_id)
+        except Exception as e:
+            print(f"Error in _set_file_id: {e}")
+            LoggerService.error(__name__, "_set_file_id", e)
+
+    def _get_client(self):
+        if self._redis is None:
+            if time.monotonic() < self._retry_at:
+                return None
+            try:
+                self._redis = RedisConnection()
+            except Exception:
+                self._retry_at = time.monotonic() + self._retry_interval
+                LoggerService.warning(__name__, "Media cache is disabled without Redis")
+                return None
+        return self._redis.client
+
+    def _get_key(self, digest: str) -> str:
+        return f"{self.KEY_PREFIX}:{digest}"
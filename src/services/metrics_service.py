@@ -0,0 +1,210 @@
+import sys
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from singleton_decorator import singleton
+
+# Seconds; handlers and queries are expected well under a second
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Histogram:
+    """Cumulative histogram with fixed buckets, one series per label set."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Tuple[str, ...],
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        # label values -> [count per bucket..., +Inf count, sum]
+        self._series: Dict[LabelValues, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, *label_values: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started_at, *label_values)
+
+    def collect(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = {labels: list(values) for labels, values in self._series.items()}
+
+        for label_values, values in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), values):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                labels = _format_labels(self.label_names + ("le",), label_values + (le,))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {values[-1]}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class CallbackMetric:
+    """Gauge or counter read from its source at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        label_names: Tuple[str, ...],
+        callback: Callable[[], Dict[LabelValues, float]],
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.metric_type = metric_type
+        self.label_names = label_names
+        self.callback = callback
+
+    def collect(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        for label_values, value in sorted(self.callback().items()):
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}{labels} {value}")
+        return lines
+
+
+@singleton
+class MetricsService:
+    """
+    In-process metrics registry rendered in the Prometheus text format.
+
+    Histograms are updated from the bot loop and worker threads; callback
+    metrics (queue depths, query totals) are read from their services when
+    /metrics is scraped.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+        self.handler_duration = self.histogram(
+            "telegram_handler_duration_seconds",
+            "Duration of callback handlers wrapped by safe_callback_query",
+            ("handler",),
+        )
+        self.update_duration = self.histogram(
+            "telegram_update_duration_seconds",
+            "Duration of processing one update, by handler",
+            ("handler",),
+        )
+        self.repository_duration = self.histogram(
+            "repository_call_duration_seconds",
+            "Duration of repository method calls",
+            ("method",),
+        )
+        self.job_duration = self.histogram(
+            "job_run_duration_seconds",
+            "Duration of job queue runs",
+            ("job",),
+        )
+        self.calendar_duration = self.histogram(
+            "google_calendar_request_duration_seconds",
+            "Duration of Google Calendar API requests",
+            ("operation",),
+        )
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Dict[LabelValues, float]],
+        label_names: Tuple[str, ...] = (),
+    ) -> CallbackMetric:
+        return self._register(
+            CallbackMetric(name, documentation, "gauge", label_names, callback)
+        )
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Dict[LabelValues, float]],
+        label_names: Tuple[str, ...] = (),
+    ) -> CallbackMetric:
+        return self._register(
+            CallbackMetric(name, documentation, "counter", label_names, callback)
+        )
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            try:
+                lines += metric.collect()
+            except Exception as e:
+                # One broken source must not hide the other metrics
+                print(f"Error collecting metric {metric.name}: {e}")
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric):
+        with self._lock:
+            # Re-registering (e.g. a service created twice) keeps the first one
+            return self._metrics.setdefault(metric.name, metric)
+
+
+def timed_job(callback):
+    """Record the duration of a job queue callback under its job name."""
+
+    @wraps(callback)
+    async def wrapper(context):
+        job_name = context.job.name if context.job else callback.__name__
+        with MetricsService().job_duration.time(job_name):
+            return await callback(context)
+
+    return wrapper
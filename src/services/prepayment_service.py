@@ -1,7 +1,7 @@
 import sys
 import os
-from datetime import date
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
 from singleton_decorator import singleton
 from src.models.holiday_prepayment_rule import HolidayPrepaymentRule
 from src.services.file_service import FileService
@@ -9,23 +9,42 @@ from src.services.logger_service import LoggerService
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+# Percentage of the price paid upfront on days without a holiday rule
+STANDARD_PREPAYMENT_PERCENTAGE = 50
+
+
+class HolidayRuleIndex:
+    """Active rules by date and by (month, day) for recurring ones, in file order."""
+
+    def __init__(self, rules: List[HolidayPrepaymentRule]):
+        self.by_date: Dict[date, List[Tuple[int, HolidayPrepaymentRule]]] = {}
+        self.by_month_day: Dict[Tuple[int, int], List[Tuple[int, HolidayPrepaymentRule]]] = {}
+        for position, rule in enumerate(rules):
+            if not rule.is_active:
+                continue
+            index = self.by_month_day if rule.is_recurring else self.by_date
+            index.setdefault(rule.date_key, []).append((position, rule))
+
+    def get(self, target_date: date) -> List[HolidayPrepaymentRule]:
+        dated = self.by_date.get(target_date, [])
+        recurring = self.by_month_day.get((target_date.month, target_date.day), [])
+        if dated and recurring:
+            return [rule for _, rule in sorted(dated + recurring, key=lambda item: item[0])]
+        return [rule for _, rule in dated or recurring]
+
 
 @singleton
 class PrepaymentService:
     """Service for calculating prepayment with holiday rules."""
 
     _rules: List[HolidayPrepaymentRule] = []
+    # Built from _rules, rebuilt when _rules is replaced
+    _index: Optional[HolidayRuleIndex] = None
+    _index_source: Optional[List[HolidayPrepaymentRule]] = None
 
     def get_applicable_rules(self, target_date: date) -> List[HolidayPrepaymentRule]:
-        """Get all active rules for the specified date."""
-        rules = self._try_load_rules()
-        applicable = []
-
-        for rule in rules:
-            if rule.applies_to_date(target_date):
-                applicable.append(rule)
-
-        return applicable
+        """Get all active rules for the specified date, in file order."""
+        return self._get_index().get(target_date)
 
     def get_effective_rule(
         self, target_date: date
@@ -37,6 +56,19 @@ class PrepaymentService:
         applicable_rules = self.get_applicable_rules(target_date)
         return applicable_rules[0] if applicable_rules else None
 
+    def get_prepayment_percentages(self, start: date, end: date) -> List[int]:
+        """Prepayment percentage for every day from start to end inclusive."""
+        index = self._get_index()
+        percentages = []
+        day = start
+        while day <= end:
+            rules = index.get(day)
+            percentages.append(
+                rules[0].prepayment_percentage if rules else STANDARD_PREPAYMENT_PERCENTAGE
+            )
+            day += timedelta(days=1)
+        return percentages
+
     def is_holiday(self, target_date: date) -> bool:
         """Check if the date is a holiday."""
         return self.get_effective_rule(target_date) is not None
@@ -68,7 +100,7 @@ class PrepaymentService:
             )
         else:
             # REGULAR DAY: 50% prepayment
-            prepayment = total_price * 0.5
+            prepayment = total_price * (STANDARD_PREPAYMENT_PERCENTAGE / 100.0)
 
             LoggerService.info(
                 __name__,
@@ -100,3 +132,28 @@ class PrepaymentService:
             file_service = FileService()
             self._rules = file_service.get_holiday_prepayment_rules()
         return self._rules
+
+    def load_rules(self) -> Tuple[List[HolidayPrepaymentRule], HolidayRuleIndex]:
+        """Read, validate and index the rules file without touching the rules in use."""
+        rules = FileService().get_holiday_prepayment_rules()
+        rule_ids = [rule.rule_id for rule in rules]
+        if len(set(rule_ids)) != len(rule_ids):
+            raise ValueError("Duplicate rule_id in holiday prepayment rules")
+        return rules, HolidayRuleIndex(rules)
+
+    def set_rules(self, rules: List[HolidayPrepaymentRule], index: HolidayRuleIndex):
+        """Swap in rules returned by load_rules."""
+        self._index = index
+        self._index_source = rules
+        self._rules = rules
+
+    def refresh_rules(self) -> List[HolidayPrepaymentRule]:
+        self.set_rules(*self.load_rules())
+        return self._rules
+
+    def _get_index(self) -> HolidayRuleIndex:
+        rules = self._try_load_rules()
+        if self._index_source is not rules:
+            self._index = HolidayRuleIndex(rules)
+            self._index_source = rules
+        return self._index
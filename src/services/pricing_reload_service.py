@@ -0,0 +1,94 @@
+import sys
+import os
+import asyncio
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.services.calculation_rate_service import CalculationRateService
+from src.services.date_pricing_service import DatePricingService
+from src.services.file_service import FileService
+from src.services.logger_service import LoggerService
+from src.services.prepayment_service import PrepaymentService
+from singleton_decorator import singleton
+
+
+@dataclass
+class PricingSource:
+    """A pricing JSON file and the service methods that load and apply it."""
+
+    path: str
+    load: Callable[[], tuple]
+    apply: Callable[..., None]
+
+
+@singleton
+class PricingReloadService:
+    """
+    Reloads tariff, date pricing and holiday prepayment JSON without a restart.
+
+    check() runs as a repeating job. File stats and the loading of a changed
+    file happen in a worker thread, where the new file is parsed, validated
+    and compiled; the result is swapped in on the event loop in one step, so
+    handlers never see half-loaded prices. A file that fails to load is
+    logged and the previous prices stay in use until the file changes again.
+    """
+
+    def __init__(self):
+        rate_service = CalculationRateService()
+        date_pricing_service = DatePricingService()
+        prepayment_service = PrepaymentService()
+        file_service = FileService()
+        self._sources = [
+            PricingSource(file_service._TARIFF_JSON, rate_service.load_rates, rate_service.set_rates),
+            PricingSource(
+                file_service._DATE_PRICING_RULES_JSON,
+                date_pricing_service.load_rules,
+                date_pricing_service.set_rules,
+            ),
+            PricingSource(
+                file_service._HOLIDAY_PREPAYMENT_RULES_JSON,
+                prepayment_service.load_rules,
+                prepayment_service.set_rules,
+            ),
+        ]
+        # path -> (mtime_ns, size) last seen
+        self._versions: Dict[str, Optional[Tuple[int, int]]] = {
+            source.path: self._get_version(source.path) for source in self._sources
+        }
+
+    async def check(self, context=None) -> List[str]:
+        """Reload the files changed since the last check; returns the reloaded paths."""
+        changed = await asyncio.to_thread(self._get_changed_sources)
+        reloaded = []
+        for source in changed:
+            try:
+                snapshot = await asyncio.to_thread(source.load)
+            except Exception as e:
+                print(f"Error reloading {source.path}: {e}")
+                LoggerService.error(__name__, "check", e, **{"path": source.path})
+                continue
+
+            source.apply(*snapshot)
+            reloaded.append(source.path)
+            LoggerService.info(__name__, f"Pricing reloaded from {source.path}")
+        return reloaded
+
+    def _get_changed_sources(self) -> List[PricingSource]:
+        changed = []
+        for source in self._sources:
+            version = self._get_version(source.path)
+            if version is None or version == self._versions.get(source.path):
+                continue
+            # Marked as seen even if loading fails, so a broken file is logged once
+            self._versions[source.path] = version
+            changed.append(source)
+        return changed
+
+    @staticmethod
+    def _get_version(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,155 @@
+import sys
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.config.config import QUERY_BUDGET
+from src.services.logger_service import LoggerService
+from src.services.metrics_service import MetricsService
+from singleton_decorator import singleton
+from sqlalchemy import event
+
+
+@dataclass
+class QueryScope:
+    """Queries run while handling one update."""
+
+    handler: str
+    chat_id: Optional[int] = None
+    queries: int = 0
+    db_seconds: float = 0.0
+    # Set by the outermost decorated handler, nested handlers keep its name
+    is_named: bool = False
+
+
+@dataclass
+class HandlerQueryStats:
+    """Totals per handler since start."""
+
+    updates: int = 0
+    queries: int = 0
+    db_seconds: float = 0.0
+    max_queries: int = 0
+    over_budget: int = 0
+
+
+_current_scope: ContextVar[Optional[QueryScope]] = ContextVar(
+    "query_scope", default=None
+)
+
+
+@singleton
+class QueryMetricsService:
+    """
+    Counts SQL queries and database time per Telegram update.
+
+    SQLAlchemy cursor events add to the scope of the update being handled,
+    found through a context variable, so concurrent updates do not mix.
+    When the scope closes the numbers go into per-handler totals and a
+    warning is logged if the handler ran more than QUERY_BUDGET queries.
+    """
+
+    def __init__(self, budget: int = QUERY_BUDGET):
+        self._budget = budget
+        self._stats: Dict[str, HandlerQueryStats] = {}
+        self._register_metrics()
+
+    def instrument(self, engine):
+        """Attach the cursor hooks to a sync Engine (async_engine.sync_engine for asyncio)."""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    @contextmanager
+    def track(self, handler: str, chat_id: Optional[int] = None) -> Iterator[QueryScope]:
+        """Collect the queries run inside the block, e.g. one update."""
+        scope = QueryScope(handler=handler, chat_id=chat_id)
+        token = _current_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _current_scope.reset(token)
+            self._record(scope)
+
+    def track_update(self, update) -> Iterator[QueryScope]:
+        """track() named after the update until its handler calls set_handler."""
+        return self.track(*self._describe_update(update))
+
+    def set_handler(self, handler: str):
+        """Name the handler of the update being tracked, once it is known."""
+        scope = _current_scope.get()
+        if scope and not scope.is_named:
+            scope.handler = handler
+            scope.is_named = True
+
+    def get_stats(self) -> Dict[str, HandlerQueryStats]:
+        return dict(self._stats)
+
+    def _register_metrics(self):
+        metrics = MetricsService()
+        for name, documentation, field in (
+            ("db_queries_total", "SQL queries run while handling updates", "queries"),
+            ("db_query_seconds_total", "Database time spent handling updates", "db_seconds"),
+            ("db_query_budget_exceeded_total", "Updates that ran more queries than QUERY_BUDGET", "over_budget"),
+        ):
+            metrics.counter(
+                name,
+                documentation,
+                lambda field=field: {
+                    (handler,): getattr(stats, field)
+                    for handler, stats in self.get_stats().items()
+                },
+                ("handler",),
+            )
+
+    def _record(self, scope: QueryScope):
+        stats = self._stats.setdefault(scope.handler, HandlerQueryStats())
+        stats.updates += 1
+        stats.queries += scope.queries
+        stats.db_seconds += scope.db_seconds
+        stats.max_queries = max(stats.max_queries, scope.queries)
+
+        if scope.queries > self._budget:
+            stats.over_budget += 1
+            LoggerService.warning(
+                __name__,
+                f"Query budget exceeded in {scope.handler}",
+                **{
+                    "handler": scope.handler,
+                    "chat_id": scope.chat_id,
+                    "queries": scope.queries,
+                    "budget": self._budget,
+                    "db_ms": round(scope.db_seconds * 1000, 1),
+                },
+            )
+
+    @staticmethod
+    def _describe_update(update) -> tuple:
+        callback_query = getattr(update, "callback_query", None)
+        message = getattr(update, "effective_message", None)
+        chat = getattr(update, "effective_chat", None)
+        chat_id = chat.id if chat else None
+
+        if callback_query and callback_query.data:
+            # Callback data looks like "BOOKING-PAY_1", the prefix names the action
+            return f"callback:{callback_query.data.split('_')[0]}", chat_id
+        if message and message.text and message.text.startswith("/"):
+            return f"command:{message.text.split()[0]}", chat_id
+        if message:
+            return "message", chat_id
+        return type(update).__name__, chat_id
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_started_at = time.perf_counter()
+
+    @staticmethod
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        scope = _current_scope.get()
+        if scope is None:
+            return
+        scope.queries += 1
+        scope.db_seconds += time.perf_counter() - context._query_started_at
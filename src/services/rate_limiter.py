@@ -0,0 +1,42 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Async token bucket shared by concurrent senders.
+
+    Refills `rate` tokens per second up to `capacity`. `pause` stops every
+    caller until the given delay has passed, e.g. after a Telegram RetryAfter.
+    """
+
+    def __init__(self, rate: float, capacity: int = None):
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        # Refill restarts once the pause is over
+        self._tokens = 0.0
+        self._updated_at = self._paused_until
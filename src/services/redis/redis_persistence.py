@@ -14,6 +14,7 @@ class RedisPersistence(BasePersistence):
     """
     Custom persistence implementation using Redis.
     Stores conversation states to allow seamless bot restarts.
+    Each conversation name is a Redis hash with one field per (chat_id, user_id).
     """
 
     def __init__(self):
@@ -30,40 +31,35 @@ class RedisPersistence(BasePersistence):
         self._conversations: Dict[str, ConversationDict] = {}
         self._conversation_key_prefix = "conversation_state"
         self._ttl = 259200  # 3 dayes
+        self._scan_batch_size = 500
 
     async def get_conversations(self, name: str) -> ConversationDict:
         """Retrieve conversation states from Redis"""
         try:
-            key = f"{self._conversation_key_prefix}:{name}"
-            data = self._redis.client.get(key)
-
-            if data:
-                # Parse JSON and convert keys back to tuples
-                raw_dict = json.loads(data)
-                result = {}
-                for key_str, state in raw_dict.items():
-                    # Convert "chat_id,user_id" back to (chat_id, user_id) tuple
-                    parts = key_str.split(",")
-                    if len(parts) == 2:
-                        conversation_key = (int(parts[0]), int(parts[1]))
-                        result[conversation_key] = state
-                        LoggerService.info(
-                            __name__,
-                            f"Restored conversation state: key={conversation_key}, state={state}, name='{name}'"
-                        )
-
+            key = self._get_conversation_key(name)
+            self._migrate_legacy_conversations(key)
+
+            # HSCAN walks the hash in batches instead of loading it in one reply
+            result = {}
+            for key_str, state in self._redis.client.hscan_iter(
+                key, count=self._scan_batch_size
+            ):
+                conversation_key = self._parse_conversation_key(key_str)
+                if conversation_key:
+                    result[conversation_key] = json.loads(state)
+
+            if result:
                 LoggerService.info(
                     __name__,
                     f"Loaded {len(result)} conversation states for '{name}'"
                 )
-                return result
             else:
                 LoggerService.info(
                     __name__,
                     f"No conversation states found for '{name}'"
                 )
 
-            return {}
+            return result
         except Exception as e:
             LoggerService.error(
                 __name__,
@@ -77,28 +73,19 @@ class RedisPersistence(BasePersistence):
     ) -> None:
         """Update conversation state in Redis"""
         try:
-            redis_key = f"{self._conversation_key_prefix}:{name}"
+            redis_key = self._get_conversation_key(name)
 
-            # Get existing conversations
-            existing_data = self._redis.client.get(redis_key)
-            conversations = json.loads(existing_data) if existing_data else {}
-
-            # Convert tuple key to string for JSON serialization
+            # Convert tuple key to string hash field
             key_str = ",".join(map(str, key))
 
+            # One round-trip: write only this conversation's field, refresh TTL
+            pipe = self._redis.client.pipeline(transaction=False)
             if new_state is None:
-                # Remove conversation
-                conversations.pop(key_str, None)
+                pipe.hdel(redis_key, key_str)
             else:
-                # Update conversation state
-                conversations[key_str] = new_state
-
-            # Save back to Redis with TTL
-            self._redis.client.setex(
-                redis_key,
-                self._ttl,
-                json.dumps(conversations)
-            )
+                pipe.hset(redis_key, key_str, json.dumps(new_state))
+            pipe.expire(redis_key, self._ttl)
+            pipe.execute()
 
         except Exception as e:
             LoggerService.error(
@@ -108,6 +95,41 @@ class RedisPersistence(BasePersistence):
                 **{"key": key, "new_state": new_state}
             )
 
+    def _get_conversation_key(self, name: str) -> str:
+        return f"{self._conversation_key_prefix}:{name}"
+
+    @staticmethod
+    def _parse_conversation_key(key_str: str) -> Optional[Tuple[int, int]]:
+        """Convert "chat_id,user_id" back to (chat_id, user_id) tuple"""
+        parts = key_str.split(",")
+        if len(parts) != 2:
+            return None
+        return (int(parts[0]), int(parts[1]))
+
+    def _migrate_legacy_conversations(self, key: str) -> None:
+        """Convert a conversation stored as one JSON string into a hash"""
+        if self._redis.client.type(key) != "string":
+            return
+
+        data = self._redis.client.get(key)
+        conversations = json.loads(data) if data else {}
+        pipe = self._redis.client.pipeline()
+        pipe.delete(key)
+        if conversations:
+            pipe.hset(
+                key,
+                mapping={
+                    key_str: json.dumps(state)
+                    for key_str, state in conversations.items()
+                },
+            )
+            pipe.expire(key, self._ttl)
+        pipe.execute()
+        LoggerService.info(
+            __name__,
+            f"Migrated {len(conversations)} conversation states to hash '{key}'"
+        )
+
     async def get_user_data(self) -> Dict:
         """Not implemented - user data not stored"""
         return {}
@@ -2,8 +2,10 @@
 Redis session service for managing booking and feedback data.
 Provides high-level operations for storing and retrieving session data.
 """
+import json
 from datetime import datetime, timedelta
 from typing import Optional
+from redis.exceptions import ResponseError
 from singleton_decorator import singleton
 from telegram import Update
 from src.models.booking_draft import BookingDraft
@@ -23,8 +25,21 @@ class RedisSessionService:
     """
     Service for managing booking and feedback session data in Redis.
     Uses RedisConnection singleton for client access.
+
+    Each draft is a Redis hash with one JSON-encoded field per dataclass
+    attribute, so single fields can be read and written without
+    deserializing the whole draft.
     """
 
+    _DRAFT_TYPES = {
+        "booking": BookingDraft,
+        "feedback": Feedback,
+        "cancel_booking": CancelBookingDraft,
+        "change_booking": ChangeBookingDraft,
+        "gift_certificate": GiftCertificateDraft,
+        "user_booking": UserBookingDraft,
+    }
+
     def __init__(self, ttl_hours: int = 24):
         """
         Initialize Redis session service.
@@ -47,21 +62,14 @@ class RedisSessionService:
     def set_booking(self, update: Update, booking: BookingDraft) -> None:
         """Store booking object in Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"booking:{chat_id}"
-            self._redis.client.setex(key, self._ttl, booking.to_json())
+            self._write_draft(update, "booking", booking)
         except Exception as e:
             LoggerService.error(__name__, "Failed to save booking", exception=e)
 
     def get_booking(self, update: Update) -> Optional[BookingDraft]:
         """Retrieve booking object from Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"booking:{chat_id}"
-            data = self._redis.client.get(key)
-            if data:
-                return BookingDraft.from_json(data)
-            return None
+            return self._read_draft(update, "booking")
         except Exception as e:
             LoggerService.error(__name__, "Failed to get booking", exception=e)
             return None
@@ -69,35 +77,25 @@ class RedisSessionService:
     def update_booking_field(self, update: Update, field: str, value) -> None:
         """Update a single field in booking object."""
         try:
-            booking = self.get_booking(update)
-            if not booking:
-                booking = BookingDraft()
-
-            value = self._cast_field(field, value)
-            setattr(booking, field, value)
-            self.set_booking(update, booking)
+            self._write_fields(update, "booking", {field: self._cast_field(field, value)})
         except Exception as e:
             LoggerService.error(__name__, f"Failed to update booking field: {field}", exception=e)
 
     def update_booking_fields(self, update: Update, fields: dict) -> None:
         """Update multiple fields in booking object."""
         try:
-            booking = self.get_booking(update)
-            if not booking:
-                booking = BookingDraft()
-
-            for field, value in fields.items():
-                setattr(booking, field, self._cast_field(field, value))
-
-            self.set_booking(update, booking)
+            self._write_fields(
+                update,
+                "booking",
+                {field: self._cast_field(field, value) for field, value in fields.items()},
+            )
         except Exception as e:
             LoggerService.error(__name__, "Failed to update booking fields", exception=e)
 
     def clear_booking(self, update: Update) -> None:
         """Clear booking data from Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"booking:{chat_id}"
+            key = self._get_key(update, "booking")
             self._redis.client.delete(key)
         except Exception as e:
             LoggerService.error(__name__, "Failed to clear booking", exception=e)
@@ -112,21 +110,14 @@ class RedisSessionService:
     def set_feedback(self, update: Update, feedback: Feedback) -> None:
         """Store feedback object in Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"feedback:{chat_id}"
-            self._redis.client.setex(key, self._ttl, feedback.to_json())
+            self._write_draft(update, "feedback", feedback)
         except Exception as e:
             LoggerService.error(__name__, "Failed to save feedback", exception=e)
 
     def get_feedback(self, update: Update) -> Optional[Feedback]:
         """Retrieve feedback object from Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"feedback:{chat_id}"
-            data = self._redis.client.get(key)
-            if data:
-                return Feedback.from_json(data)
-            return None
+            return self._read_draft(update, "feedback")
         except Exception as e:
             LoggerService.error(__name__, "Failed to get feedback", exception=e)
             return None
@@ -134,25 +125,107 @@ class RedisSessionService:
     def update_feedback_field(self, update: Update, field: str, value) -> None:
         """Update a single field in feedback object."""
         try:
-            feedback = self.get_feedback(update)
-            if not feedback:
-                feedback = Feedback()
-            setattr(feedback, field, value)
-            self.set_feedback(update, feedback)
+            self._write_fields(update, "feedback", {field: value})
         except Exception as e:
             LoggerService.error(__name__, f"Failed to update feedback field: {field}", exception=e)
 
     def clear_feedback(self, update: Update) -> None:
         """Clear feedback data from Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"feedback:{chat_id}"
+            key = self._get_key(update, "feedback")
             self._redis.client.delete(key)
         except Exception as e:
             LoggerService.error(__name__, "Failed to clear feedback", exception=e)
 
+    # ============ Field Level Operations ============
+
+    def update_fields(self, update: Update, draft_name: str, fields: dict) -> None:
+        """Write several fields of a draft in one pipelined round-trip."""
+        try:
+            self._write_fields(update, draft_name, fields)
+        except Exception as e:
+            LoggerService.error(__name__, f"Failed to update {draft_name} fields", exception=e)
+
+    def get_field(self, update: Update, draft_name: str, field: str):
+        """Read one field of a draft without deserializing the whole draft."""
+        try:
+            key = self._get_key(update, draft_name)
+            data = self._call_on_hash(key, lambda: self._redis.client.hget(key, field))
+            if data is None:
+                return None
+            draft_type = self._DRAFT_TYPES[draft_name]
+            return getattr(draft_type.from_dict({field: json.loads(data)}), field)
+        except Exception as e:
+            LoggerService.error(__name__, f"Failed to get {draft_name} field: {field}", exception=e)
+            return None
+
     # ============ Private Helper Methods ============
 
+    def _get_key(self, update: Update, draft_name: str) -> str:
+        return f"{draft_name}:{self._get_chat_id(update)}"
+
+    def _write_draft(self, update: Update, draft_name: str, draft) -> None:
+        """Replace the whole draft hash."""
+        key = self._get_key(update, draft_name)
+        pipe = self._redis.client.pipeline()
+        pipe.delete(key)
+        pipe.hset(key, mapping=self._encode_fields(draft.to_dict(encode_json=True)))
+        pipe.expire(key, self._ttl)
+        pipe.execute()
+
+    def _read_draft(self, update: Update, draft_name: str):
+        key = self._get_key(update, draft_name)
+        data = self._call_on_hash(key, lambda: self._redis.client.hgetall(key))
+        if not data:
+            return None
+        fields = {field: json.loads(value) for field, value in data.items()}
+        return self._DRAFT_TYPES[draft_name].from_dict(fields)
+
+    def _write_fields(self, update: Update, draft_name: str, fields: dict) -> None:
+        """HSET only the given fields and refresh TTL in one round-trip."""
+        if not fields:
+            return
+
+        key = self._get_key(update, draft_name)
+        # Encode through the dataclass so dates, enums and nested drafts
+        # are stored exactly as in a full draft
+        encoded = self._DRAFT_TYPES[draft_name](**fields).to_dict(encode_json=True)
+
+        def write():
+            pipe = self._redis.client.pipeline(transaction=False)
+            pipe.hset(
+                key, mapping=self._encode_fields({field: encoded[field] for field in fields})
+            )
+            pipe.expire(key, self._ttl)
+            return pipe.execute()
+
+        self._call_on_hash(key, write)
+
+    @staticmethod
+    def _encode_fields(fields: dict) -> dict:
+        return {field: json.dumps(value) for field, value in fields.items()}
+
+    def _call_on_hash(self, key: str, operation):
+        """Run a hash operation, converting a draft stored as JSON string first."""
+        try:
+            return operation()
+        except ResponseError as e:
+            if "WRONGTYPE" not in str(e):
+                raise
+            self._migrate_legacy_draft(key)
+            return operation()
+
+    def _migrate_legacy_draft(self, key: str) -> None:
+        """Convert a draft saved with SETEX as one JSON string into a hash."""
+        data = self._redis.client.get(key)
+        pipe = self._redis.client.pipeline()
+        pipe.delete(key)
+        if data:
+            pipe.hset(key, mapping=self._encode_fields(json.loads(data)))
+            pipe.expire(key, self._ttl)
+        pipe.execute()
+
+
     def _get_chat_id(self, update: Update) -> int:
         """Extract chat_id from Update object."""
         return self._navigation_service.get_chat_id(update)
@@ -176,21 +249,14 @@ class RedisSessionService:
     def set_cancel_booking(self, update: Update, draft: CancelBookingDraft) -> None:
         """Store cancel booking draft in Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"cancel_booking:{chat_id}"
-            self._redis.client.setex(key, self._ttl, draft.to_json())
+            self._write_draft(update, "cancel_booking", draft)
         except Exception as e:
             LoggerService.error(__name__, "Failed to save cancel booking draft", exception=e)
 
     def get_cancel_booking(self, update: Update) -> Optional[CancelBookingDraft]:
         """Retrieve cancel booking draft from Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"cancel_booking:{chat_id}"
-            data = self._redis.client.get(key)
-            if data:
-                return CancelBookingDraft.from_json(data)
-            return None
+            return self._read_draft(update, "cancel_booking")
         except Exception as e:
             LoggerService.error(__name__, "Failed to get cancel booking draft", exception=e)
             return None
@@ -198,19 +264,14 @@ class RedisSessionService:
     def update_cancel_booking_field(self, update: Update, field: str, value) -> None:
         """Update a single field in cancel booking draft."""
         try:
-            draft = self.get_cancel_booking(update)
-            if not draft:
-                draft = CancelBookingDraft()
-            setattr(draft, field, value)
-            self.set_cancel_booking(update, draft)
+            self._write_fields(update, "cancel_booking", {field: value})
         except Exception as e:
             LoggerService.error(__name__, f"Failed to update cancel booking field: {field}", exception=e)
 
     def clear_cancel_booking(self, update: Update) -> None:
         """Clear cancel booking draft from Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"cancel_booking:{chat_id}"
+            key = self._get_key(update, "cancel_booking")
             self._redis.client.delete(key)
         except Exception as e:
             LoggerService.error(__name__, "Failed to clear cancel booking draft", exception=e)
@@ -225,21 +286,14 @@ class RedisSessionService:
     def set_change_booking(self, update: Update, draft: ChangeBookingDraft) -> None:
         """Store change booking draft in Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"change_booking:{chat_id}"
-            self._redis.client.setex(key, self._ttl, draft.to_json())
+            self._write_draft(update, "change_booking", draft)
         except Exception as e:
             LoggerService.error(__name__, "Failed to save change booking draft", exception=e)
 
     def get_change_booking(self, update: Update) -> Optional[ChangeBookingDraft]:
         """Retrieve change booking draft from Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"change_booking:{chat_id}"
-            data = self._redis.client.get(key)
-            if data:
-                return ChangeBookingDraft.from_json(data)
-            return None
+            return self._read_draft(update, "change_booking")
         except Exception as e:
             LoggerService.error(__name__, "Failed to get change booking draft", exception=e)
             return None
@@ -247,19 +301,14 @@ class RedisSessionService:
     def update_change_booking_field(self, update: Update, field: str, value) -> None:
         """Update a single field in change booking draft."""
         try:
-            draft = self.get_change_booking(update)
-            if not draft:
-                draft = ChangeBookingDraft()
-            setattr(draft, field, value)
-            self.set_change_booking(update, draft)
+            self._write_fields(update, "change_booking", {field: value})
         except Exception as e:
             LoggerService.error(__name__, f"Failed to update change booking field: {field}", exception=e)
 
     def clear_change_booking(self, update: Update) -> None:
         """Clear change booking draft from Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"change_booking:{chat_id}"
+            key = self._get_key(update, "change_booking")
             self._redis.client.delete(key)
         except Exception as e:
             LoggerService.error(__name__, "Failed to clear change booking draft", exception=e)
@@ -274,21 +323,14 @@ class RedisSessionService:
     def set_gift_certificate(self, update: Update, draft: GiftCertificateDraft) -> None:
         """Store gift certificate draft in Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"gift_certificate:{chat_id}"
-            self._redis.client.setex(key, self._ttl, draft.to_json())
+            self._write_draft(update, "gift_certificate", draft)
         except Exception as e:
             LoggerService.error(__name__, "Failed to save gift certificate draft", exception=e)
 
     def get_gift_certificate(self, update: Update) -> Optional[GiftCertificateDraft]:
         """Retrieve gift certificate draft from Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"gift_certificate:{chat_id}"
-            data = self._redis.client.get(key)
-            if data:
-                return GiftCertificateDraft.from_json(data)
-            return None
+            return self._read_draft(update, "gift_certificate")
         except Exception as e:
             LoggerService.error(__name__, "Failed to get gift certificate draft", exception=e)
             return None
@@ -296,19 +338,14 @@ class RedisSessionService:
     def update_gift_certificate_field(self, update: Update, field: str, value) -> None:
         """Update a single field in gift certificate draft."""
         try:
-            draft = self.get_gift_certificate(update)
-            if not draft:
-                draft = GiftCertificateDraft()
-            setattr(draft, field, value)
-            self.set_gift_certificate(update, draft)
+            self._write_fields(update, "gift_certificate", {field: value})
         except Exception as e:
             LoggerService.error(__name__, f"Failed to update gift certificate field: {field}", exception=e)
 
     def clear_gift_certificate(self, update: Update) -> None:
         """Clear gift certificate draft from Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"gift_certificate:{chat_id}"
+            key = self._get_key(update, "gift_certificate")
             self._redis.client.delete(key)
         except Exception as e:
             LoggerService.error(__name__, "Failed to clear gift certificate draft", exception=e)
@@ -323,21 +360,14 @@ class RedisSessionService:
     def set_user_booking(self, update: Update, draft: UserBookingDraft) -> None:
         """Store user booking draft in Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"user_booking:{chat_id}"
-            self._redis.client.setex(key, self._ttl, draft.to_json())
+            self._write_draft(update, "user_booking", draft)
         except Exception as e:
             LoggerService.error(__name__, "Failed to save user booking draft", exception=e)
 
     def get_user_booking(self, update: Update) -> Optional[UserBookingDraft]:
         """Retrieve user booking draft from Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"user_booking:{chat_id}"
-            data = self._redis.client.get(key)
-            if data:
-                return UserBookingDraft.from_json(data)
-            return None
+            return self._read_draft(update, "user_booking")
         except Exception as e:
             LoggerService.error(__name__, "Failed to get user booking draft", exception=e)
             return None
@@ -345,19 +375,14 @@ class RedisSessionService:
     def update_user_booking_field(self, update: Update, field: str, value) -> None:
         """Update a single field in user booking draft."""
         try:
-            draft = self.get_user_booking(update)
-            if not draft:
-                draft = UserBookingDraft()
-            setattr(draft, field, value)
-            self.set_user_booking(update, draft)
+            self._write_fields(update, "user_booking", {field: value})
         except Exception as e:
             LoggerService.error(__name__, f"Failed to update user booking field: {field}", exception=e)
 
     def clear_user_booking(self, update: Update) -> None:
         """Clear user booking draft from Redis."""
         try:
-            chat_id = self._get_chat_id(update)
-            key = f"user_booking:{chat_id}"
+            key = self._get_key(update, "user_booking")
             self._redis.client.delete(key)
         except Exception as e:
             LoggerService.error(__name__, "Failed to clear user booking draft", exception=e)
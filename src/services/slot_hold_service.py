@@ -0,0 +1,156 @@
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.config.config import CLEANING_HOURS, SLOT_HOLD_MINUTES
+from src.services.logger_service import LoggerService
+from src.services.redis.redis_connection import RedisConnection
+from singleton_decorator import singleton
+
+
+@singleton
+class SlotHoldService:
+    """
+    Short-lived holds on booking slots while a user goes through checkout.
+
+    The held time (booking plus cleaning, like the database constraint) is
+    split into hourly buckets, each taken with SET NX and a TTL, so two
+    users cannot reach payment for the same slot and abandoned holds expire
+    on their own. Holds are advisory: without Redis every hold succeeds and
+    the database still rejects overlapping bookings.
+    """
+
+    KEY_PREFIX = "slot_hold"
+    BUCKET = timedelta(hours=1)
+
+    def __init__(self):
+        self._redis = None
+        # Without Redis, reconnect at most once a minute instead of on every render
+        self._retry_at = 0.0
+        self._retry_interval = 60
+        self._cleaning = timedelta(hours=CLEANING_HOURS)
+        self._ttl = timedelta(minutes=SLOT_HOLD_MINUTES)
+
+    def hold(self, owner: int, start: datetime, end: datetime) -> bool:
+        """
+        Hold [start, end) for owner, replacing the owner's previous hold.
+
+        Holding again the slot the owner already has extends its TTL.
+        Returns False if any part of the slot is held by someone else.
+        """
+        client = self._get_client()
+        if client is None:
+            return True
+
+        try:
+            self.release(owner)
+            keys = [self._get_key(bucket) for bucket in self._get_buckets(start, end)]
+            pipe = client.pipeline(transaction=False)
+            for key in keys:
+                pipe.set(key, owner, nx=True, ex=self._ttl)
+            taken = [key for key, is_set in zip(keys, pipe.execute()) if is_set]
+
+            if len(taken) < len(keys):
+                # Only the buckets set above are ours to roll back
+                if taken:
+                    client.delete(*taken)
+                LoggerService.info(
+                    __name__,
+                    "slot is held by another user",
+                    **{"owner": owner, "start": start, "end": end},
+                )
+                return False
+
+            client.set(self._get_owner_key(owner), ",".join(keys), ex=self._ttl)
+            return True
+        except Exception as e:
+            print(f"Error in hold: {e}")
+            LoggerService.error(__name__, "hold", e)
+            return True
+
+    def release(self, owner: int):
+        """Drop the owner's hold, e.g. after the booking is saved or abandoned."""
+        client = self._get_client()
+        if client is None:
+            return
+
+        try:
+            owner_key = self._get_owner_key(owner)
+            keys = client.get(owner_key)
+            client.delete(owner_key)
+            if not keys:
+                return
+
+            keys = keys.split(",")
+            # A bucket that expired may already belong to someone else
+            owned = [
+                key for key, value in zip(keys, client.mget(keys)) if value == str(owner)
+            ]
+            if owned:
+                client.delete(*owned)
+        except Exception as e:
+            print(f"Error in release: {e}")
+            LoggerService.error(__name__, "release", e)
+
+    def get_held_intervals(
+        self, from_date: datetime, to_date: datetime, except_owner: Optional[int] = None
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Held slots overlapping [from_date, to_date), shaped like
+        AvailabilityService busy intervals (cleaning before and after).
+        """
+        client = self._get_client()
+        if client is None:
+            return []
+
+        # Up to to_date + cleaning: a bucket blocks the cleaning before it too
+        buckets = self._get_buckets(from_date, to_date)
+        try:
+            values = client.mget([self._get_key(bucket) for bucket in buckets])
+        except Exception as e:
+            print(f"Error in get_held_intervals: {e}")
+            LoggerService.error(__name__, "get_held_intervals", e)
+            return []
+
+        intervals = []
+        for bucket, value in zip(buckets, values):
+            if value is None or value == str(except_owner):
+                continue
+            if intervals and intervals[-1][1] == bucket:
+                intervals[-1][1] = bucket + self.BUCKET
+            else:
+                intervals.append([bucket, bucket + self.BUCKET])
+
+        # Buckets already cover the cleaning after the booking
+        return [(start - self._cleaning, end) for start, end in intervals]
+
+    def _get_buckets(self, start: datetime, end: datetime) -> List[datetime]:
+        """Hourly buckets covering [start, end + cleaning)."""
+        bucket = start.replace(minute=0, second=0, microsecond=0, tzinfo=None)
+        end = end.replace(tzinfo=None) + self._cleaning
+        buckets = []
+        while bucket < end:
+            buckets.append(bucket)
+            bucket += self.BUCKET
+        return buckets
+
+    def _get_client(self):
+        if self._redis is None:
+            if time.monotonic() < self._retry_at:
+                return None
+            try:
+                self._redis = RedisConnection()
+            except Exception:
+                self._retry_at = time.monotonic() + self._retry_interval
+                LoggerService.warning(__name__, "Slot holds are disabled without Redis")
+                return None
+        return self._redis.client
+
+    def _get_key(self, bucket: datetime) -> str:
+        return f"{self.KEY_PREFIX}:{bucket.strftime('%Y%m%d%H')}"
+
+    def _get_owner_key(self, owner: int) -> str:
+        return f"{self.KEY_PREFIX}:owner:{owner}"
@@ -64,7 +64,7 @@ class StatisticsService:
     def __init__(self):
         self.db = DatabaseService()
 
-    def get_complete_statistics(self) -> Statistics:
+    async def get_complete_statistics(self) -> Statistics:
         """Generate complete statistics report for all time periods."""
         now = datetime.now()
         year_start = datetime(now.year, 1, 1)
@@ -78,22 +78,22 @@ class StatisticsService:
             next_month = datetime(now.year, now.month + 1, 1)
             month_end = next_month - timedelta(seconds=1)
 
-        # All-time stats
-        all_time = self._get_booking_stats(start_date=None, end_date=None)
-
-        # Year (full year, not just to date)
-        ytd = self._get_booking_stats(start_date=year_start, end_date=year_end)
-
-        # Current month (full month, not just to date)
-        current_month = self._get_booking_stats(
-            start_date=month_start, end_date=month_end
+        # All booking metrics in one query, users and gifts in another
+        booking_stats = await self.db.get_booking_statistics(
+            {
+                "all_time": (None, None),
+                # Full year and full month, not just to date
+                "year": (year_start, year_end),
+                "month": (month_start, month_end),
+            }
         )
+        user_and_gift_stats = await self.db.get_user_and_gift_statistics()
 
-        # User stats
-        user_stats = self._get_user_stats()
-
-        # Gift stats
-        gift_stats = self._get_gift_stats()
+        all_time = self._get_booking_stats(booking_stats["all_time"])
+        ytd = self._get_booking_stats(booking_stats["year"])
+        current_month = self._get_booking_stats(booking_stats["month"])
+        user_stats = self._get_user_stats(user_and_gift_stats, all_time.total_bookings)
+        gift_stats = self._get_gift_stats(user_and_gift_stats)
 
         # Total revenue (bookings + gifts)
         total_revenue = all_time.total_revenue + gift_stats.gift_revenue
@@ -108,55 +108,27 @@ class StatisticsService:
             generated_at=now,
         )
 
-    def _get_booking_stats(
-        self, start_date: datetime, end_date: datetime
-    ) -> BookingStats:
-        """Calculate booking statistics for a specific period."""
-        # Total bookings (prepaid only)
-        total = self.db.get_bookings_count_by_period(
-            start_date, end_date, is_completed=None
-        )
-
-        # Completed bookings
-        completed = self.db.get_bookings_count_by_period(
-            start_date, end_date, is_completed=True
-        )
-
-        # Canceled bookings
-        canceled = self.db.get_canceled_bookings_count(start_date, end_date)
-
-        # Active bookings
-        active = self.db.get_active_bookings_count(start_date, end_date)
+    def _get_booking_stats(self, metrics: dict) -> BookingStats:
+        """Build booking statistics for a period from aggregated metrics."""
+        completed = metrics["completed"]
+        revenue = metrics["revenue"]
 
-        # Revenue (only from completed bookings)
-        revenue = self.db.get_revenue_by_period(start_date, end_date)
-
-        # Average price
+        # Average price (revenue comes only from completed bookings)
         avg_price = revenue / completed if completed > 0 else 0
 
         return BookingStats(
-            total_bookings=total,
+            total_bookings=metrics["total"],
             completed_bookings=completed,
-            canceled_bookings=canceled,
-            active_bookings=active,
+            canceled_bookings=metrics["canceled"],
+            active_bookings=metrics["active"],
             total_revenue=revenue,
             average_price=avg_price,
         )
 
-    def _get_user_stats(self) -> UserStats:
-        """Calculate user-related statistics."""
-        # Total users
-        total_users = self.db.get_total_users_count()
-
-        # Active and deactivated users
-        active_users = self.db.get_active_users_count()
-        deactivated_users = self.db.get_deactivated_users_count()
-
-        # Users with at least 1 booking
-        users_with_bookings = self.db.get_users_with_bookings_count()
-
-        # Users with at least 1 completed booking
-        users_with_completed = self.db.get_users_with_completed_count()
+    def _get_user_stats(self, metrics: dict, total_bookings: int) -> UserStats:
+        """Build user-related statistics from aggregated metrics."""
+        total_users = metrics["total_users"]
+        users_with_bookings = metrics["users_with_bookings"]
 
         # Conversion rate (users with bookings / total users)
         conversion_rate = (
@@ -165,43 +137,29 @@ class StatisticsService:
 
         # Average bookings per active user
         avg_bookings = (
-            self.db.get_bookings_count_by_period(None, None, is_completed=None)
-            / users_with_bookings
-            if users_with_bookings > 0
-            else 0
+            total_bookings / users_with_bookings if users_with_bookings > 0 else 0
         )
 
         return UserStats(
             total_users=total_users,
-            active_users=active_users,
-            deactivated_users=deactivated_users,
+            active_users=metrics["active_users"],
+            deactivated_users=metrics["deactivated_users"],
             users_with_bookings=users_with_bookings,
-            users_with_completed=users_with_completed,
+            users_with_completed=metrics["users_with_completed"],
             conversion_rate=conversion_rate,
             avg_bookings_per_user=avg_bookings,
         )
 
-    def _get_gift_stats(self) -> GiftStats:
-        """Calculate gift certificate statistics."""
-        # Total gifts
-        total_gifts = self.db.get_total_gifts_count()
-
-        # Paid gifts
-        paid_gifts = self.db.get_paid_gifts_count()
-
-        # Used gifts
-        used_gifts = self.db.get_used_gifts_count()
-
-        # Unused gifts (paid but not used)
-        unused_gifts = paid_gifts - used_gifts
-
-        # Gift revenue
-        gift_revenue = self.db.get_gift_revenue()
+    def _get_gift_stats(self, metrics: dict) -> GiftStats:
+        """Build gift certificate statistics from aggregated metrics."""
+        paid_gifts = metrics["paid_gifts"]
+        used_gifts = metrics["used_gifts"]
 
         return GiftStats(
-            total_gifts=total_gifts,
+            total_gifts=metrics["total_gifts"],
             paid_gifts=paid_gifts,
             used_gifts=used_gifts,
-            unused_gifts=unused_gifts,
-            gift_revenue=gift_revenue,
+            # Unused gifts (paid but not used)
+            unused_gifts=paid_gifts - used_gifts,
+            gift_revenue=metrics["gift_revenue"],
         )
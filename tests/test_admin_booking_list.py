@@ -0,0 +1,89 @@
+import pytest
+import pytest_asyncio
+import sys
+import os
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from src.services.database_service import DatabaseService  # registers all mappers
+from src.services.database import BookingRepository
+from src.models.enum.tariff import Tariff
+from db.models.base import Base
+from db.models.booking import BookingBase
+from db.models.user import UserBase
+
+
+@pytest_asyncio.fixture
+async def repository(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bookings.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    Session = async_sessionmaker(bind=engine, expire_on_commit=False)
+    today = datetime.combine(date.today(), datetime.min.time())
+    async with Session() as session:
+        user = UserBase(contact="@guest")
+        session.add(user)
+        await session.flush()
+
+        def booking(booking_id, days, **flags):
+            start = today + timedelta(days=days, hours=12)
+            return BookingBase(
+                id=booking_id,
+                user_id=user.id,
+                start_date=start,
+                end_date=start + timedelta(hours=12),
+                tariff=Tariff.DAY,
+                number_of_guests=2,
+                is_prepaymented=flags.get("is_prepaymented", True),
+                is_canceled=flags.get("is_canceled", False),
+            )
+
+        session.add_all(
+            [
+                booking(1, 5),
+                booking(2, 2, is_canceled=True),
+                booking(3, -3, is_prepaymented=False),
+                booking(4, -3),
+                booking(5, 400),
+                booking(6, 1, is_prepaymented=False),
+            ]
+        )
+        await session.commit()
+
+    repository = BookingRepository.__wrapped__.__new__(BookingRepository.__wrapped__)
+    repository.engine = engine
+    repository.Session = Session
+    yield repository
+    await engine.dispose()
+
+
+class TestAdminBookingList:
+    """Test the single-query admin booking list."""
+
+    @pytest.mark.asyncio
+    async def test_future_and_unpaid_bookings_sorted(self, repository):
+        today = date.today()
+        bookings = await repository.get_admin_booking_list(today, today + timedelta(days=60))
+
+        # Past unpaid (3) is kept, past paid (4) and out-of-range (5) are not
+        assert [booking.id for booking in bookings] == [3, 6, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_users_loaded_in_same_query(self, repository):
+        statements = []
+        event.listen(
+            repository.engine.sync_engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        today = date.today()
+
+        bookings = await repository.get_admin_booking_list(today, today + timedelta(days=60), limit=2)
+
+        assert len(statements) == 1
+        assert len(bookings) == 2
+        assert all(booking.user.contact == "@guest" for booking in bookings)
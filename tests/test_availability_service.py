@@ -0,0 +1,153 @@
+import asyncio
+import pytest
+import sys
+import os
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.helpers import date_time_helper
+from src.services.availability_service import AvailabilityService
+
+
+def make_booking(booking_id, start, end, is_prepaymented=True, is_canceled=False, is_done=False):
+    return SimpleNamespace(
+        id=booking_id,
+        start_date=start,
+        end_date=end,
+        is_prepaymented=is_prepaymented,
+        is_canceled=is_canceled,
+        is_done=is_done,
+    )
+
+
+@pytest.fixture
+def day():
+    return date.today() + timedelta(days=10)
+
+
+@pytest.fixture
+def service(day):
+    service = AvailabilityService()
+    start = datetime.combine(day, time(12, 0))
+    service.load(
+        [
+            make_booking(1, start, start + timedelta(hours=4)),
+            make_booking(2, start + timedelta(days=1), start + timedelta(days=3)),
+            make_booking(3, start, start + timedelta(hours=2), is_prepaymented=False),
+            make_booking(4, start, start + timedelta(hours=2), is_canceled=True),
+        ]
+    )
+    return service
+
+
+class TestAvailabilityService:
+    """Test the in-memory availability index."""
+
+    def test_load_keeps_only_active_prepaid_bookings(self, service, day):
+        day_start = datetime.combine(day, time(0, 0))
+        intervals = service.get_busy_intervals(day_start, day_start + timedelta(days=5))
+        assert intervals == [
+            (day_start + timedelta(hours=10), day_start + timedelta(hours=18)),
+            (day_start + timedelta(days=1, hours=10), day_start + timedelta(days=3, hours=14)),
+        ]
+
+    def test_busy_intervals_include_bookings_started_earlier(self, service, day):
+        second_day = datetime.combine(day + timedelta(days=2), time(0, 0))
+        intervals = service.get_busy_intervals(second_day, second_day + timedelta(days=1))
+        assert len(intervals) == 1
+
+    def test_apply_booking_updates_index(self, service, day):
+        start = datetime.combine(day + timedelta(days=5), time(10, 0))
+        service.apply_booking(make_booking(5, start, start + timedelta(hours=3)))
+        assert len(service.get_busy_intervals(start, start + timedelta(hours=1))) == 1
+
+        service.apply_booking(make_booking(5, start, start + timedelta(hours=3), is_canceled=True))
+        assert service.get_busy_intervals(start, start + timedelta(hours=1)) == []
+
+    def test_apply_booking_moves_changed_dates(self, service, day):
+        start = datetime.combine(day + timedelta(days=7), time(10, 0))
+        service.apply_booking(make_booking(1, start, start + timedelta(hours=3)))
+        day_start = datetime.combine(day, time(0, 0))
+        assert service.get_busy_intervals(day_start, day_start + timedelta(days=1)) == []
+        assert len(service.get_busy_intervals(start, start + timedelta(hours=1))) == 1
+
+    @pytest.mark.asyncio
+    async def test_free_time_slots_match_helper(self, service, day):
+        start = datetime.combine(day, time(12, 0))
+        bookings = [make_booking(1, start, start + timedelta(hours=4))]
+        expected = date_time_helper.get_free_time_slots(bookings, day)
+        assert await service.get_free_time_slots(day) == expected
+
+    @pytest.mark.asyncio
+    async def test_free_time_slots_exclude_booking(self, service, day):
+        slots = await service.get_free_time_slots(day, except_booking_id=1)
+        assert slots == date_time_helper.get_free_time_slots([], day)
+
+    @pytest.mark.asyncio
+    async def test_free_days_skip_fully_booked_days(self, service, day):
+        fully_booked = day + timedelta(days=2)
+        free_days = await service.get_free_days(fully_booked.month, fully_booked.year)
+        assert fully_booked not in free_days
+        assert day in free_days or day.month != fully_booked.month
+
+
+class StubBookingRepository:
+    """Returns the bookings of a reload query, optionally once released."""
+
+    def __init__(self, bookings=None, error=None):
+        self.bookings = bookings or []
+        self.error = error
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.release.set()
+
+    def __call__(self):
+        return self
+
+    async def get_active_bookings(self, from_date):
+        self.started.set()
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return self.bookings
+
+
+@pytest.fixture
+def empty_service():
+    return AvailabilityService.__wrapped__()
+
+
+class TestAvailabilityReload:
+    """Test rebuilding the index while bookings are written."""
+
+    @pytest.mark.asyncio
+    async def test_booking_written_during_reload_is_kept(self, empty_service, day, monkeypatch):
+        start = datetime.combine(day, time(12, 0))
+        empty_service.load([])
+        repository = StubBookingRepository()
+        repository.release.clear()
+        monkeypatch.setattr(
+            "src.services.database.booking_repository.BookingRepository", repository
+        )
+
+        reload = asyncio.create_task(empty_service.reload())
+        await repository.started.wait()
+        # Committed after the reload query read the table
+        empty_service.apply_booking(make_booking(7, start, start + timedelta(hours=4)))
+        repository.release.set()
+        await reload
+
+        assert len(empty_service.get_busy_intervals(start, start + timedelta(hours=1))) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_first_load_raises(self, empty_service, day, monkeypatch):
+        monkeypatch.setattr(
+            "src.services.database.booking_repository.BookingRepository",
+            StubBookingRepository(error=OSError("database is down")),
+        )
+
+        with pytest.raises(OSError):
+            await empty_service.get_free_days(day.month, day.year)
+        assert not empty_service.is_loaded
@@ -0,0 +1,59 @@
+import sys
+import os
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.helpers import date_time_helper, string_helper
+
+
+def make_booking(start, end):
+    return SimpleNamespace(start_date=start, end_date=end)
+
+
+class TestFreeIntervals:
+    """Test the shared sweep-line helpers."""
+
+    def test_merge_overlapping_and_touching(self):
+        assert date_time_helper.merge_intervals([(5, 7), (1, 3), (2, 4), (4, 5)]) == [(1, 7)]
+
+    def test_free_intervals_inside_window(self):
+        busy = [(0, 2), (5, 8), (6, 7), (12, 20)]
+        assert date_time_helper.get_free_intervals(busy, 1, 15) == [(2, 5), (8, 12)]
+
+    def test_free_intervals_without_busy(self):
+        assert date_time_helper.get_free_intervals([], 3, 9) == [(3, 9)]
+
+
+class TestGenerateAvailableSlots:
+    """Test the grouped per-day message for the available dates screen."""
+
+    def test_empty_month(self):
+        message = string_helper.generate_available_slots(
+            [], datetime(2030, 3, 1), datetime(2030, 4, 1)
+        )
+        assert message == "Весь месяц свободен."
+
+    def test_booking_splits_day(self):
+        booking = make_booking(datetime(2030, 3, 1, 12, 0), datetime(2030, 3, 1, 16, 0))
+        message = string_helper.generate_available_slots(
+            [booking],
+            datetime(2030, 3, 1),
+            datetime(2030, 3, 3),
+            cleaning_time=timedelta(hours=2),
+        )
+        assert message == (
+            "📍 <b>01-03</b>\n00:00 - 09:00, 18:00 - 23:59\n\n"
+            "📍 <b>02-03</b>\n00:00 - 23:59\n\n"
+        )
+
+    def test_multi_day_booking_and_single_slot(self):
+        booking = make_booking(datetime(2030, 3, 1, 3, 0), datetime(2030, 3, 2, 21, 0))
+        message = string_helper.generate_available_slots(
+            [booking],
+            datetime(2030, 3, 1),
+            datetime(2030, 3, 3),
+            cleaning_time=timedelta(hours=2),
+        )
+        assert message == "📍 <b>01-03</b>\n00:00\n\n📍 <b>02-03</b>\n23:00\n\n"
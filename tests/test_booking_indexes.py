@@ -0,0 +1,122 @@
+import pytest
+import pytest_asyncio
+import sys
+import os
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from src.services.database_service import DatabaseService  # registers all mappers
+from src.services.database import BookingRepository, UserRepository
+from src.models.enum.tariff import Tariff
+from db.models.base import Base
+from db.models.booking import BookingBase
+from db.models.user import UserBase
+
+
+@pytest_asyncio.fixture
+async def repository(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'indexes.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    Session = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with Session() as session:
+        user = UserBase(contact="@guest")
+        session.add(user)
+        await session.flush()
+        session.add_all(
+            [
+                BookingBase(
+                    user_id=user.id,
+                    start_date=datetime(2030, 3, 1, 12, 0),
+                    end_date=datetime(2030, 3, 2, 12, 0),
+                    tariff=Tariff.DAY,
+                    number_of_guests=2,
+                    is_prepaymented=True,
+                ),
+                BookingBase(
+                    user_id=user.id,
+                    start_date=datetime(2030, 3, 1, 23, 59),
+                    end_date=datetime(2030, 3, 2, 23, 59),
+                    tariff=Tariff.DAY,
+                    number_of_guests=2,
+                    is_prepaymented=True,
+                ),
+                BookingBase(
+                    user_id=user.id,
+                    start_date=datetime(2030, 3, 2, 0, 0),
+                    end_date=datetime(2030, 3, 3, 0, 0),
+                    tariff=Tariff.DAY,
+                    number_of_guests=2,
+                    is_prepaymented=True,
+                ),
+            ]
+        )
+        await session.commit()
+
+    user_repository = UserRepository.__wrapped__.__new__(UserRepository.__wrapped__)
+    user_repository.Session = Session
+    repository = BookingRepository.__wrapped__.__new__(BookingRepository.__wrapped__)
+    repository.engine = engine
+    repository.Session = Session
+    repository.user_service = user_repository
+    yield repository
+    await engine.dispose()
+
+
+async def explain_booking_queries(repository, call) -> list[str]:
+    """Run a repository call and return the query plan of its booking SELECTs."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM booking" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(repository.engine.sync_engine, "before_cursor_execute", capture)
+    await call()
+    event.remove(repository.engine.sync_engine, "before_cursor_execute", capture)
+
+    plans = []
+    async with repository.engine.connect() as connection:
+        for statement, parameters in statements:
+            rows = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plans.append(" ".join(row[-1] for row in rows))
+    return plans
+
+
+class TestBookingDatePredicates:
+    """Test the half-open day predicates and the indexes they rely on."""
+
+    @pytest.mark.asyncio
+    async def test_day_range_is_half_open(self, repository):
+        bookings = await repository.get_booking_by_start_date(date(2030, 3, 1))
+        assert sorted(booking.start_date.hour for booking in bookings) == [12, 23]
+
+        bookings = await repository.get_booking_by_finish_date(date(2030, 3, 2))
+        assert len(bookings) == 2
+
+    @pytest.mark.asyncio
+    async def test_start_date_query_uses_partial_index(self, repository):
+        plans = await explain_booking_queries(
+            repository, lambda: repository.get_booking_by_start_date(date(2030, 3, 1))
+        )
+        # A range search, not a scan of the whole index
+        assert "SEARCH booking USING INDEX ix_booking_active_start_date (start_date>? AND start_date<?)" in plans[0]
+
+    @pytest.mark.asyncio
+    async def test_finish_date_query_uses_partial_index(self, repository):
+        plans = await explain_booking_queries(
+            repository, lambda: repository.get_booking_by_finish_date(date(2030, 3, 2))
+        )
+        assert "SEARCH booking USING INDEX ix_booking_active_end_date (end_date>? AND end_date<?)" in plans[0]
+
+    @pytest.mark.asyncio
+    async def test_user_day_query_uses_index(self, repository):
+        plans = await explain_booking_queries(
+            repository,
+            lambda: repository.get_booking_by_start_date_user("@guest", date(2030, 3, 1)),
+        )
+        assert "SEARCH booking USING INDEX ix_booking_user_id_start_date (user_id=? AND start_date>? AND start_date<?)" in plans[0]
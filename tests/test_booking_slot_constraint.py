@@ -0,0 +1,119 @@
+import pytest
+import pytest_asyncio
+import sys
+import os
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from src.services.database_service import DatabaseService  # registers all mappers
+from src.services.database import BookingRepository, SlotTakenError, UserRepository
+from src.models.enum.tariff import Tariff
+from db.models.base import Base
+from db.models.booking import BookingBase
+from db.models.user import UserBase
+
+# sqlite stand-in for the PostgreSQL booking_period_excl constraint:
+# active bookings may not overlap including two hours of cleaning
+EXCLUSION_TRIGGER = """
+CREATE TRIGGER booking_period_excl BEFORE UPDATE ON booking
+WHEN NEW.is_prepaymented = 1 AND NEW.is_canceled = 0 AND NEW.is_done = 0
+BEGIN
+    SELECT RAISE(ABORT, 'conflicting key value violates exclusion constraint "booking_period_excl"')
+    WHERE EXISTS (
+        SELECT 1 FROM booking
+        WHERE id != NEW.id
+          AND is_prepaymented = 1 AND is_canceled = 0 AND is_done = 0
+          AND start_date < datetime(NEW.end_date, '+2 hours')
+          AND NEW.start_date < datetime(end_date, '+2 hours')
+    );
+END
+"""
+
+START = datetime(2030, 5, 10, 12, 0)
+
+
+@pytest_asyncio.fixture
+async def repository(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'slots.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(text(EXCLUSION_TRIGGER))
+
+    Session = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with Session() as session:
+        user = UserBase(contact="@guest")
+        session.add(user)
+        await session.flush()
+
+        def booking(booking_id, start, is_prepaymented):
+            return BookingBase(
+                id=booking_id,
+                user_id=user.id,
+                start_date=start,
+                end_date=start + timedelta(hours=12),
+                tariff=Tariff.DAY,
+                number_of_guests=2,
+                is_prepaymented=is_prepaymented,
+            )
+
+        session.add_all(
+            [
+                booking(1, START, True),
+                # Starts one hour into the cleaning after booking 1
+                booking(2, START + timedelta(hours=13), False),
+                booking(3, START + timedelta(hours=14), False),
+            ]
+        )
+        await session.commit()
+
+    user_repository = UserRepository.__wrapped__.__new__(UserRepository.__wrapped__)
+    user_repository.Session = Session
+    repository = BookingRepository.__wrapped__.__new__(BookingRepository.__wrapped__)
+    repository.engine = engine
+    repository.Session = Session
+    repository.user_service = user_repository
+    repository.availability_service = MagicMock()
+    yield repository
+    await engine.dispose()
+
+
+class TestBookingSlotConstraint:
+    """Test mapping the period exclusion constraint to SlotTakenError."""
+
+    @pytest.mark.asyncio
+    async def test_prepayment_in_taken_slot_raises(self, repository):
+        with pytest.raises(SlotTakenError) as error:
+            await repository.update_booking(2, is_prepaymented=True)
+
+        assert error.value.booking_id == 2
+        booking = await repository.get_booking_by_id(2)
+        assert booking.is_prepaymented is False
+
+    @pytest.mark.asyncio
+    async def test_prepayment_after_cleaning_succeeds(self, repository):
+        booking = await repository.update_booking(3, is_prepaymented=True)
+
+        assert booking.is_prepaymented is True
+        repository.availability_service.apply_booking.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_moving_into_taken_slot_raises(self, repository):
+        await repository.update_booking(3, is_prepaymented=True)
+
+        with pytest.raises(SlotTakenError):
+            await repository.update_booking(
+                3,
+                start_date=START + timedelta(hours=6),
+                end_date=START + timedelta(hours=18),
+            )
+
+    def test_other_integrity_errors_are_not_slot_taken(self):
+        from sqlalchemy.exc import IntegrityError
+
+        error = IntegrityError("UPDATE booking", {}, Exception("FOREIGN KEY constraint failed"))
+
+        assert not BookingRepository.__wrapped__._is_slot_taken(error)
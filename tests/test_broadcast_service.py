@@ -0,0 +1,218 @@
+import asyncio
+import sys
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from telegram.error import Forbidden, RetryAfter
+from src.services.broadcast_service import BroadcastService
+from src.services.rate_limiter import TokenBucket
+
+
+class MemoryRedis:
+    """The subset of redis.Redis used by BroadcastService, kept in memory."""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        return MemoryPipeline(self)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value)
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def expire(self, key, ttl):
+        return True
+
+    def hset(self, key, mapping):
+        self.data.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hincrby(self, key, field, amount):
+        values = self.data.setdefault(key, {})
+        values[field] = str(int(values.get(field, 0)) + amount)
+
+    def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(str(m) for m in members)
+
+    def srem(self, key, member):
+        self.data.get(key, set()).discard(str(member))
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+
+class MemoryPipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self._calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in self._calls]
+
+
+@pytest.fixture
+def redis_client():
+    return MemoryRedis()
+
+
+@pytest.fixture
+def service(redis_client):
+    service = BroadcastService.__wrapped__.__new__(BroadcastService.__wrapped__)
+    service._redis = SimpleNamespace(client=redis_client)
+    service._bucket = TokenBucket(rate=1000)
+    service._concurrency = 4
+    service._max_retries = 3
+    service._progress_interval = 0.01
+    service._ttl = 60
+    return service
+
+
+@pytest.fixture
+def bot():
+    bot = MagicMock()
+    bot.send_message = AsyncMock(return_value=SimpleNamespace(message_id=99))
+    bot.edit_message_text = AsyncMock()
+    return bot
+
+
+class TestTokenBucket:
+    """Test the shared send rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_limits_rate_after_burst(self):
+        bucket = TokenBucket(rate=50, capacity=5)
+        started = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(15)))
+        # 5 from the burst, 10 more at 50/s
+        assert time.monotonic() - started >= 0.18
+
+    @pytest.mark.asyncio
+    async def test_pause_holds_every_caller(self):
+        bucket = TokenBucket(rate=1000)
+        bucket.pause(0.1)
+        started = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - started >= 0.09
+
+
+class TestBroadcastService:
+    """Test the concurrent broadcast engine."""
+
+    @pytest.mark.asyncio
+    async def test_sends_to_all_and_edits_single_progress_message(self, service, bot, redis_client):
+        result = await service.start(bot, [1, 2, 3, 4, 5], "hello")
+
+        assert result["sent"] == 5
+        assert result["failed"] == 0
+        # One progress message plus five broadcast messages
+        assert bot.send_message.await_count == 6
+        assert "Рассылка завершена" in bot.edit_message_text.await_args.kwargs["text"]
+        assert redis_client.data == {}
+
+    @pytest.mark.asyncio
+    async def test_blocked_chats_are_counted_as_failed(self, service, bot):
+        async def send_message(chat_id, **kwargs):
+            if chat_id == 2:
+                raise Forbidden("bot was blocked by the user")
+            return SimpleNamespace(message_id=99)
+
+        bot.send_message = AsyncMock(side_effect=send_message)
+
+        result = await service.start(bot, [1, 2, 3], "hello")
+
+        assert (result["sent"], result["failed"]) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_retry_after_requeues_chat(self, service, bot):
+        calls = []
+
+        async def send_message(chat_id, **kwargs):
+            calls.append(chat_id)
+            if chat_id == 2 and calls.count(2) == 1:
+                raise RetryAfter(0)
+            return SimpleNamespace(message_id=99)
+
+        bot.send_message = AsyncMock(side_effect=send_message)
+
+        result = await service.start(bot, [1, 2, 3], "hello")
+
+        assert result["sent"] == 3
+        assert calls.count(2) == 2
+
+    @pytest.mark.asyncio
+    async def test_second_broadcast_is_rejected_while_running(self, service, bot, redis_client):
+        redis_client.set(service.ACTIVE_KEY, "1")
+
+        assert await service.start(bot, [1], "hello") is None
+        bot.send_message.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_audience_is_not_started(self, service, bot, redis_client):
+        result = await service.start(bot, [], "hello")
+
+        assert (result["total_users"], result["sent"], result["failed"]) == (0, 0, 0)
+        bot.send_message.assert_not_awaited()
+        assert redis_client.data == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_setup_releases_lock(self, service, bot, redis_client):
+        bot.send_message = AsyncMock(side_effect=OSError("offline"))
+
+        with pytest.raises(OSError):
+            await service.start(bot, [1, 2], "hello")
+
+        assert redis_client.data == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_summary_still_releases_lock(self, service, bot, redis_client):
+        bot.edit_message_text = AsyncMock(side_effect=OSError("offline"))
+
+        with pytest.raises(OSError):
+            await service.start(bot, [1, 2], "hello")
+
+        assert redis_client.data == {}
+
+    @pytest.mark.asyncio
+    async def test_resume_sends_only_pending_chats(self, service, bot, redis_client):
+        redis_client.set(service.ACTIVE_KEY, "1")
+        redis_client.hset(
+            "broadcast:1",
+            mapping={
+                "message": "hello",
+                "total": 4,
+                "sent": 2,
+                "failed": 0,
+                "started_at": time.time(),
+                "progress_message_id": 99,
+            },
+        )
+        redis_client.sadd("broadcast:1:pending", 3, 4)
+
+        result = await service.resume(bot)
+
+        assert sorted(call.kwargs["chat_id"] for call in bot.send_message.await_args_list) == [3, 4]
+        assert (result["total_users"], result["sent"]) == (4, 4)
@@ -0,0 +1,126 @@
+import pytest
+import sys
+import os
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.enum.tariff import Tariff
+from src.models.rental_price import RentalPrice
+from src.services.calculation_rate_service import (
+    CalculationRateService,
+    CompiledTariff,
+    split_days,
+)
+from src.services.prepayment_service import PrepaymentService
+
+
+def make_rental_price(tariff=Tariff.DAY, price=700, **kwargs):
+    fields = dict(
+        tariff=tariff.value,
+        name="Test",
+        duration_hours=24,
+        price=price,
+        sauna_price=100,
+        secret_room_price=0,
+        second_bedroom_price=50,
+        extra_hour_price=30,
+        extra_people_price=20,
+        photoshoot_price=80,
+        max_people=2,
+        is_check_in_time_limit=False,
+        is_photoshoot=True,
+        is_transfer=False,
+        multi_day_prices={"1": 700, "2": 1100, "4": 1900},
+    )
+    fields.update(kwargs)
+    return RentalPrice(**fields)
+
+
+@pytest.fixture
+def service():
+    service = CalculationRateService.__wrapped__()
+    service._rates = [
+        make_rental_price(),
+        make_rental_price(Tariff.HOURS_12, price=300, duration_hours=12, multi_day_prices={}),
+    ]
+    return service
+
+
+class TestCompiledTariff:
+    """Test the precomputed multi-day and add-on lookups."""
+
+    def test_multi_day_prices_are_indexed_by_day(self):
+        compiled = CompiledTariff.compile(make_rental_price())
+
+        assert compiled.get_multi_day_price(2) == 1100
+        assert compiled.get_multi_day_price(3) is None
+        assert compiled.get_multi_day_price(5) is None
+
+    def test_add_on_prices_match_flags(self):
+        compiled = CompiledTariff.compile(make_rental_price())
+
+        assert compiled.get_add_on_price(True, True, True, True, 4) == 100 + 50 + 80 + 2 * 20
+        assert compiled.get_add_on_price(False, False, False, False, 1) == 0
+
+    def test_leftover_hours_over_fifteen_count_as_a_day(self):
+        assert split_days(24 + 15) == (1, 15)
+        assert split_days(24 + 16) == (2, 0)
+
+
+class TestCalculationRateService:
+    """Test prices computed from the compiled table."""
+
+    def test_lookup_by_tariff(self, service):
+        assert service.get_price(Tariff.HOURS_12) == 300
+        assert service.get_by_tariff(Tariff.DAY).price == 700
+        with pytest.raises(ValueError):
+            service.get_by_tariff(Tariff.WORKER)
+
+    def test_calculate_price_for_days_and_hours(self, service):
+        day = service.get_by_tariff(Tariff.DAY)
+        hours_12 = service.get_by_tariff(Tariff.HOURS_12)
+
+        assert service.calculate_price(day, True, False, False, duration_hours=48 + 2) == 1100 + 60 + 100
+        assert service.calculate_price(hours_12, False, False, True, duration_hours=14) == 300 + 60 + 50
+
+    def test_edited_rental_price_is_not_served_from_table(self, service):
+        day = make_rental_price(sauna_price=10)
+
+        assert service.calculate_price(day, True, False, False, duration_hours=24) == 710
+
+    def test_replacing_rates_rebuilds_table(self, service):
+        assert service.get_price(Tariff.DAY) == 700
+
+        service._rates = [make_rental_price(price=900)]
+
+        assert service.get_price(Tariff.DAY) == 900
+
+
+class TestQuotePeriod:
+    """Test batch quotes against the per-day calculation."""
+
+    @pytest.mark.parametrize(
+        "tariff, duration_hours",
+        [(Tariff.DAY, 24), (Tariff.HOURS_12, 14), (Tariff.DAY_FOR_COUPLE, 72)],
+    )
+    def test_quotes_match_per_day_prices(self, tariff, duration_hours):
+        service = CalculationRateService()
+        prepayment_service = PrepaymentService()
+        start = date(2025, 12, 1)
+
+        quotes = service.quote_period(start, start + timedelta(days=183), tariff, duration_hours)
+
+        assert len(quotes) == 184
+        for offset, quote in enumerate(quotes):
+            day = start + timedelta(days=offset)
+            price = service.get_effective_price_for_date(day, tariff, duration_hours)
+            assert quote.day == day
+            assert quote.price == price
+            assert quote.prepayment == prepayment_service.calculate_prepayment(price, day)
+
+    def test_quote_month_covers_every_day(self):
+        quotes = CalculationRateService().quote_month(2028, 2, Tariff.DAY, 24)
+
+        assert [quote.day.day for quote in quotes] == list(range(1, 30))
+
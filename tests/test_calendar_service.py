@@ -0,0 +1,168 @@
+import json
+import sys
+import os
+from datetime import datetime
+from email import message_from_bytes
+from email.policy import HTTP
+from types import SimpleNamespace
+
+import httplib2
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.enum.calendar_action import CalendarAction
+from src.models.enum.tariff import Tariff
+from src.services.calendar_service import CalendarService
+
+
+class LocalCalendarTransport:
+    """httplib2 stand-in answering Calendar API calls, single and batched."""
+
+    def __init__(self, statuses=None):
+        # (method, event_id or None) -> HTTP status, 200 by default
+        self.statuses = statuses or {}
+        self.requests = []
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        self.requests.append((method, uri))
+        if uri.endswith("/batch/calendar/v3"):
+            return self._batch(body, headers)
+        status, content = self._answer(method, uri, body)
+        return httplib2.Response({"status": status}), content.encode()
+
+    def _answer(self, method, uri, body):
+        path = uri.split("?")[0]
+        event_id = path.rsplit("/events/", 1)[1] if "/events/" in path else None
+        event = json.loads(body) if body else {}
+        event_id = event_id or event.get("id") or "generated"
+        status = self.statuses.get((method, event_id), 200)
+        if status != 200:
+            return status, json.dumps({"error": {"code": status, "message": "error"}})
+        return status, json.dumps({"id": event_id, "summary": "📱 Рабочий", **event})
+
+    def _batch(self, body, headers):
+        if isinstance(body, str):
+            body = body.encode()
+        content_type = headers["content-type"]
+        message = message_from_bytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + body, policy=HTTP
+        )
+        boundary = "response_boundary"
+        parts = []
+        for part in message.iter_parts():
+            request = part.get_payload(decode=True).decode().replace("\r\n", "\n")
+            head, _, request_body = request.partition("\n\n")
+            method, uri, _ = head.splitlines()[0].split(" ")
+            status, content = self._answer(method, uri, request_body)
+            self.requests.append((f"batch {method}", uri))
+            content_id = part["Content-ID"].strip("<>")
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} OK\r\n"
+                "Content-Type: application/json\r\n\r\n"
+                f"{content}\r\n"
+            )
+        response = "".join(parts) + f"--{boundary}--\r\n"
+        return (
+            httplib2.Response(
+                {"status": 200, "content-type": f"multipart/mixed; boundary={boundary}"}
+            ),
+            response.encode(),
+        )
+
+
+def make_booking(booking_id, calendar_event_id=None):
+    return SimpleNamespace(
+        id=booking_id,
+        calendar_event_id=calendar_event_id,
+        source="bot",
+        tariff=Tariff.WORKER,
+        start_date=datetime(2030, 3, 1, 12, 0),
+        end_date=datetime(2030, 3, 1, 16, 0),
+    )
+
+
+@pytest.fixture
+def transport():
+    return LocalCalendarTransport()
+
+
+@pytest.fixture
+def service(transport, monkeypatch):
+    monkeypatch.setattr("src.services.calendar_service.CALENDAR_ID", "primary")
+    monkeypatch.setattr(
+        "src.helpers.string_helper.generate_booking_info_message",
+        lambda booking, user: f"booking {booking.id}",
+    )
+    return CalendarService.__wrapped__(http=transport)
+
+
+class TestCalendarService:
+    """Test Google Calendar requests against a local transport."""
+
+    def test_move_is_single_patch(self, service, transport):
+        service.move_event(
+            "booking000010", datetime(2030, 3, 2, 12, 0), datetime(2030, 3, 2, 16, 0)
+        )
+
+        assert [method for method, _ in transport.requests] == ["PATCH"]
+
+    def test_cancel_with_booking_skips_get(self, service, transport):
+        service.cancel_event("booking000010", make_booking(10, "booking000010"))
+
+        assert [method for method, _ in transport.requests] == ["PATCH"]
+
+    def test_sync_bookings_sends_one_batch(self, service, transport):
+        results = service.sync_bookings(
+            [
+                (CalendarAction.ADD, make_booking(10), None),
+                (CalendarAction.MOVE, make_booking(11, "booking000011"), None),
+                (CalendarAction.CANCEL, make_booking(12, "booking000012"), None),
+            ]
+        )
+
+        assert results == ["booking000010", "booking000011", "booking000012"]
+        assert [method for method, _ in transport.requests] == [
+            "POST",
+            "batch POST",
+            "batch PATCH",
+            "batch PATCH",
+        ]
+
+    def test_repeated_add_is_success(self, transport, service):
+        transport.statuses[("POST", "booking000010")] = 409
+
+        assert service.sync_booking(CalendarAction.ADD, make_booking(10), None) == "booking000010"
+
+    def test_failed_item_does_not_fail_batch(self, transport, service):
+        transport.statuses[("PATCH", "booking000011")] = 404
+
+        results = service.sync_bookings(
+            [
+                (CalendarAction.UPDATE, make_booking(11, "booking000011"), None),
+                (CalendarAction.UPDATE, make_booking(12, "booking000012"), None),
+            ]
+        )
+
+        assert results[0].status_code == 404
+        assert results[1] == "booking000012"
+
+    def test_failed_batch_keeps_skipped_items(self, service, monkeypatch):
+        def fail(batch):
+            raise OSError("offline")
+
+        monkeypatch.setattr(service, "_execute_batch", fail)
+
+        results = service.sync_bookings(
+            [
+                (CalendarAction.UPDATE, make_booking(11, "booking000011"), None),
+                (CalendarAction.MOVE, make_booking(12), None),
+                (CalendarAction.ADD, make_booking(13, "booking000013"), None),
+            ]
+        )
+
+        assert isinstance(results[0], OSError)
+        assert results[1:] == [None, "booking000013"]
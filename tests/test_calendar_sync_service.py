@@ -0,0 +1,230 @@
+import pytest
+import pytest_asyncio
+import sys
+import asyncio
+import os
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from src.services.database_service import DatabaseService  # registers all mappers
+from src.models.enum.calendar_action import CalendarAction
+from src.services.calendar_sync_service import CalendarSyncService
+from src.services.database.calendar_outbox_repository import CalendarOutboxRepository
+from db.models.base import Base
+from db.models.calendar_outbox import CalendarOutboxBase
+
+
+def make_entry(entry_id, booking_id, action, attempts=0, next_attempt_at=None):
+    return SimpleNamespace(
+        id=entry_id,
+        booking_id=booking_id,
+        action=action.value,
+        attempts=attempts,
+        version=0,
+        next_attempt_at=next_attempt_at or datetime.now() - timedelta(seconds=1),
+    )
+
+
+@pytest.fixture
+def service():
+    # The real repositories need a database, attach mocks instead
+    service = CalendarSyncService.__wrapped__.__new__(CalendarSyncService.__wrapped__)
+    service._batch_size = 20
+    service._max_rounds = 10
+    service._max_attempts = 8
+    service._base_delay = timedelta(seconds=30)
+    service._max_delay = timedelta(hours=1)
+    service._lock = asyncio.Lock()
+    service._tasks = set()
+    service.outbox_repository = MagicMock()
+    service.outbox_repository.mark_done = AsyncMock(return_value=True)
+    service.outbox_repository.mark_retry = AsyncMock()
+    service.outbox_repository.mark_failed = AsyncMock()
+    service.booking_repository = MagicMock()
+    service.booking_repository.get_bookings_by_ids = AsyncMock(
+        side_effect=lambda booking_ids: {
+            booking_id: SimpleNamespace(id=booking_id, calendar_event_id=None, user=None)
+            for booking_id in booking_ids
+        }
+    )
+    service.booking_repository.update_booking = AsyncMock()
+    service._calendar_service = MagicMock()
+    return service
+
+
+@pytest_asyncio.fixture
+async def outbox_repository(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    repository = CalendarOutboxRepository.__wrapped__.__new__(CalendarOutboxRepository.__wrapped__)
+    repository.engine = engine
+    repository.Session = async_sessionmaker(bind=engine, expire_on_commit=False)
+    yield repository
+    await engine.dispose()
+
+
+async def get_statuses(repository):
+    async with repository.Session() as session:
+        entries = await session.scalars(select(CalendarOutboxBase).order_by(CalendarOutboxBase.id))
+        return [(entry.action, entry.status) for entry in entries]
+
+
+class TestCalendarSyncService:
+    """Test the Google Calendar outbox worker."""
+
+    @pytest.mark.asyncio
+    async def test_add_writes_event_id_back(self, service):
+        service.outbox_repository.get_pending_entries = AsyncMock(
+            side_effect=[[make_entry(1, 10, CalendarAction.ADD)], []]
+        )
+        service._calendar_service.sync_bookings.return_value = ["booking000010"]
+
+        await service.process_outbox()
+
+        service.booking_repository.update_booking.assert_awaited_once_with(
+            10, calendar_event_id="booking000010"
+        )
+        service.outbox_repository.mark_done.assert_awaited_once_with(1, 0)
+
+    @pytest.mark.asyncio
+    async def test_failure_schedules_retry(self, service):
+        service.outbox_repository.get_pending_entries = AsyncMock(
+            side_effect=[
+                [
+                    make_entry(1, 10, CalendarAction.ADD),
+                    make_entry(3, 11, CalendarAction.UPDATE),
+                ],
+                [],
+            ]
+        )
+        service._calendar_service.sync_bookings.return_value = [OSError("offline"), "event"]
+
+        await service.process_outbox()
+
+        items = service._calendar_service.sync_bookings.call_args.args[0]
+        assert [(action, booking.id) for action, booking, _ in items] == [
+            (CalendarAction.ADD, 10),
+            (CalendarAction.UPDATE, 11),
+        ]
+        service.outbox_repository.mark_retry.assert_awaited_once()
+        assert service.outbox_repository.mark_retry.await_args.args[0] == 1
+        service.outbox_repository.mark_done.assert_awaited_once_with(3, 0)
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, service):
+        service.outbox_repository.get_pending_entries = AsyncMock(
+            side_effect=[[make_entry(1, 10, CalendarAction.UPDATE, attempts=7)], []]
+        )
+        service._calendar_service.sync_bookings.side_effect = OSError("offline")
+
+        await service.process_outbox()
+
+        service.outbox_repository.mark_failed.assert_awaited_once()
+        service.outbox_repository.mark_retry.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_next_round_sends_following_action(self, service):
+        add = make_entry(1, 10, CalendarAction.ADD)
+        cancel = make_entry(2, 10, CalendarAction.CANCEL)
+        service.outbox_repository.get_pending_entries = AsyncMock(
+            side_effect=[[add], [cancel], []]
+        )
+        service._calendar_service.sync_bookings.side_effect = [
+            ["booking000010"],
+            ["booking000010"],
+        ]
+
+        await service.process_outbox()
+
+        assert service._calendar_service.sync_bookings.call_count == 2
+        assert [call.args[0] for call in service.outbox_repository.mark_done.await_args_list] == [1, 2]
+
+
+class TestCalendarOutboxRepository:
+    """Test the outbox queue against a database."""
+
+    @pytest.mark.asyncio
+    async def test_change_during_send_keeps_entry_pending(self, outbox_repository):
+        entry = await outbox_repository.add_entry(10, CalendarAction.MOVE)
+
+        # Rescheduled again while the worker sends the first read
+        await outbox_repository.add_entry(10, CalendarAction.MOVE)
+
+        assert not await outbox_repository.mark_done(entry.id, entry.version)
+        assert await get_statuses(outbox_repository) == [(CalendarAction.MOVE.value, "pending")]
+
+        [pending] = await outbox_repository.get_pending_entries(20)
+        assert await outbox_repository.mark_done(pending.id, pending.version)
+        assert await get_statuses(outbox_repository) == [(CalendarAction.MOVE.value, "done")]
+
+    @pytest.mark.asyncio
+    async def test_later_actions_wait_for_first_entry_of_booking(self, outbox_repository):
+        add = await outbox_repository.add_entry(10, CalendarAction.ADD)
+        await outbox_repository.add_entry(10, CalendarAction.CANCEL)
+        update = await outbox_repository.add_entry(11, CalendarAction.UPDATE)
+
+        assert [entry.id for entry in await outbox_repository.get_pending_entries(20)] == [
+            add.id,
+            update.id,
+        ]
+
+        await outbox_repository.mark_retry(add.id, "offline", datetime.now() + timedelta(minutes=5))
+
+        assert [entry.id for entry in await outbox_repository.get_pending_entries(20)] == [update.id]
+
+    @pytest.mark.asyncio
+    async def test_entries_in_backoff_do_not_block_due_ones(self, outbox_repository):
+        later = datetime.now() + timedelta(minutes=5)
+        for booking_id in range(1, 26):
+            entry = await outbox_repository.add_entry(booking_id, CalendarAction.UPDATE)
+            await outbox_repository.mark_retry(entry.id, "offline", later)
+        due = await outbox_repository.add_entry(100, CalendarAction.UPDATE)
+
+        assert [entry.id for entry in await outbox_repository.get_pending_entries(20)] == [due.id]
+
+    @pytest.mark.asyncio
+    async def test_booking_changed_between_read_and_mark_done_is_sent_again(
+        self, service, outbox_repository
+    ):
+        loop = asyncio.get_running_loop()
+        await outbox_repository.add_entry(10, CalendarAction.MOVE)
+        sent = []
+
+        def sync_bookings(items):
+            # Runs in a worker thread, like the Google batch request
+            sent.append(items[0][1].start_date)
+            if len(sent) == 1:
+                bookings[10].start_date = datetime(2030, 6, 2, 14, 0)
+                asyncio.run_coroutine_threadsafe(
+                    outbox_repository.add_entry(10, CalendarAction.MOVE), loop
+                ).result()
+            return ["booking000010"]
+
+        bookings = {
+            10: SimpleNamespace(
+                id=10,
+                calendar_event_id="booking000010",
+                user=None,
+                start_date=datetime(2030, 6, 1, 14, 0),
+            )
+        }
+        service.outbox_repository = outbox_repository
+        service.booking_repository.get_bookings_by_ids = AsyncMock(
+            side_effect=lambda booking_ids: {
+                booking_id: SimpleNamespace(**vars(bookings[booking_id]))
+                for booking_id in booking_ids
+            }
+        )
+        service._calendar_service.sync_bookings.side_effect = sync_bookings
+
+        await service.process_outbox()
+
+        assert sent == [datetime(2030, 6, 1, 14, 0), datetime(2030, 6, 2, 14, 0)]
+        assert await get_statuses(outbox_repository) == [(CalendarAction.MOVE.value, "done")]
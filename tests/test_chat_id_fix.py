@@ -1,15 +1,18 @@
 #!/usr/bin/env python3
 """Test script to verify chat_id handling for users with empty chat_id."""
 
+import asyncio
 import sys
 import os
+import pytest
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), ".")))
 
 from src.services.database_service import DatabaseService
 from src.services.logger_service import LoggerService
 
-def test_update_user_chat_id_existing_user():
+@pytest.mark.asyncio
+async def test_update_user_chat_id_existing_user():
     """Test update_user_chat_id with existing user without chat_id."""
     print("\n" + "="*70)
     print("TEST 1: update_user_chat_id with existing user (no chat_id)")
@@ -27,7 +30,7 @@ def test_update_user_chat_id_existing_user():
     print(f"   - Assigning chat_id: {test_chat_id}")
 
     # Check user before update
-    user_before = db_service.get_user_by_contact("@1")
+    user_before = await db_service.get_user_by_contact("@1")
     if user_before:
         print(f"\n✅ User found in database:")
         print(f"   - ID: {user_before.id}")
@@ -42,7 +45,7 @@ def test_update_user_chat_id_existing_user():
     # Update chat_id
     print(f"\n🔄 Calling update_user_chat_id('{user_name}', {test_chat_id})...")
     try:
-        user_after = db_service.update_user_chat_id(user_name, test_chat_id)
+        user_after = await db_service.update_user_chat_id(user_name, test_chat_id)
         print(f"\n✅ Update successful!")
         print(f"   - ID: {user_after.id}")
         print(f"   - Contact: {user_after.contact}")
@@ -50,7 +53,7 @@ def test_update_user_chat_id_existing_user():
         print(f"   - Chat ID: {user_after.chat_id}")
 
         # Verify in database
-        user_verify = db_service.get_user_by_chat_id(test_chat_id)
+        user_verify = await db_service.get_user_by_chat_id(test_chat_id)
         if user_verify and user_verify.chat_id == test_chat_id:
             print(f"\n✅ Verification: chat_id saved correctly in database!")
         else:
@@ -62,7 +65,8 @@ def test_update_user_chat_id_existing_user():
         traceback.print_exc()
 
 
-def test_update_user_contact_existing_user():
+@pytest.mark.asyncio
+async def test_update_user_contact_existing_user():
     """Test update_user_contact with existing user."""
     print("\n" + "="*70)
     print("TEST 2: update_user_contact with existing user")
@@ -79,7 +83,7 @@ def test_update_user_contact_existing_user():
     print(f"   - New contact: {new_contact}")
 
     # Check user before update
-    user_before = db_service.get_user_by_chat_id(test_chat_id)
+    user_before = await db_service.get_user_by_chat_id(test_chat_id)
     if user_before:
         print(f"\n✅ User found by chat_id:")
         print(f"   - ID: {user_before.id}")
@@ -93,7 +97,7 @@ def test_update_user_contact_existing_user():
     # Update contact
     print(f"\n🔄 Calling update_user_contact({test_chat_id}, '{new_contact}')...")
     try:
-        user_after = db_service.update_user_contact(test_chat_id, new_contact)
+        user_after = await db_service.update_user_contact(test_chat_id, new_contact)
         print(f"\n✅ Update successful!")
         print(f"   - ID: {user_after.id}")
         print(f"   - Contact: {user_after.contact}")
@@ -101,7 +105,7 @@ def test_update_user_contact_existing_user():
         print(f"   - Chat ID: {user_after.chat_id}")
 
         # Verify in database
-        user_verify = db_service.get_user_by_contact(new_contact)
+        user_verify = await db_service.get_user_by_contact(new_contact)
         if user_verify and user_verify.contact == new_contact:
             print(f"\n✅ Verification: contact updated correctly in database!")
             # Verify chat_id is still there
@@ -118,7 +122,7 @@ def test_update_user_contact_existing_user():
         traceback.print_exc()
 
 
-def cleanup_test_data():
+async def cleanup_test_data():
     """Clean up test data."""
     print("\n" + "="*70)
     print("CLEANUP: Removing test data")
@@ -128,7 +132,7 @@ def cleanup_test_data():
     test_chat_id = 999888777
 
     # Get user
-    user = db_service.get_user_by_chat_id(test_chat_id)
+    user = await db_service.get_user_by_chat_id(test_chat_id)
     if user:
         print(f"\n🧹 Resetting user {user.id} data:")
         print(f"   - Restoring contact to: @1")
@@ -154,8 +158,8 @@ if __name__ == "__main__":
 
     try:
         # Run tests
-        test_update_user_chat_id_existing_user()
-        test_update_user_contact_existing_user()
+        asyncio.run(test_update_user_chat_id_existing_user())
+        asyncio.run(test_update_user_contact_existing_user())
 
         print("\n" + "="*70)
         print("✅ ALL TESTS COMPLETED")
@@ -166,7 +170,7 @@ if __name__ == "__main__":
         # For automated testing, skip input
         # response = input().strip().lower()
         # if response == 'y':
-        #     cleanup_test_data()
+        #     asyncio.run(cleanup_test_data())
 
     except Exception as e:
         print(f"\n❌ Test suite failed: {e}")
@@ -1,12 +1,16 @@
 import pytest
 import sys
 import os
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
-from telegram.error import Forbidden, BadRequest
+import fakeredis
+from telegram.error import Forbidden, BadRequest, RetryAfter
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from sqlalchemy.orm import sessionmaker
+from db.database import engine
 from src.services.database_service import DatabaseService
 from src.services.chat_validation_service import ChatValidationService
 from db.models.user import UserBase
@@ -23,8 +27,8 @@ class TestDatabaseServiceChatMethods:
         yield
         # Clean up after test
         try:
-            # Remove test users
-            with self.db_service.Session() as session:
+            # Remove test users (sync engine: fixture runs outside the event loop)
+            with sessionmaker(bind=engine)() as session:
                 test_contacts = [
                     "test_user_1",
                     "test_user_2",
@@ -39,56 +43,59 @@ class TestDatabaseServiceChatMethods:
         except Exception:
             pass
 
-    def test_update_user_chat_id_new_user(self):
+    @pytest.mark.asyncio
+    async def test_update_user_chat_id_new_user(self):
         """Test creating a new user with chat_id."""
         contact = "test_user_1"
         chat_id = 123456789
 
-        user = self.db_service.update_user_chat_id(contact, chat_id)
+        user = await self.db_service.update_user_chat_id(contact, chat_id)
 
         assert user is not None
         assert user.contact == contact
         assert user.chat_id == chat_id
 
         # Verify it's in database
-        retrieved_user = self.db_service.get_user_by_contact(contact)
+        retrieved_user = await self.db_service.get_user_by_contact(contact)
         assert retrieved_user is not None
         assert retrieved_user.chat_id == chat_id
 
-    def test_update_user_chat_id_duplicate_handling(self):
+    @pytest.mark.asyncio
+    async def test_update_user_chat_id_duplicate_handling(self):
         """Test that duplicate chat_id removes old user's chat_id."""
         contact_a = "test_user_2"
         contact_b = "test_user_3"
         chat_id = 987654321
 
         # User A gets chat_id first
-        user_a = self.db_service.update_user_chat_id(contact_a, chat_id)
+        user_a = await self.db_service.update_user_chat_id(contact_a, chat_id)
         assert user_a.chat_id == chat_id
 
         # User B tries to use same chat_id
-        user_b = self.db_service.update_user_chat_id(contact_b, chat_id)
+        user_b = await self.db_service.update_user_chat_id(contact_b, chat_id)
         assert user_b.chat_id == chat_id
 
         # Verify User A's chat_id was set to None
-        user_a_updated = self.db_service.get_user_by_contact(contact_a)
+        user_a_updated = await self.db_service.get_user_by_contact(contact_a)
         assert user_a_updated.chat_id is None
 
         # Verify User B has the chat_id
-        user_b_updated = self.db_service.get_user_by_contact(contact_b)
+        user_b_updated = await self.db_service.get_user_by_contact(contact_b)
         assert user_b_updated.chat_id == chat_id
 
-    def test_get_all_user_chat_ids(self):
+    @pytest.mark.asyncio
+    async def test_get_all_user_chat_ids(self):
         """Test getting all user chat IDs filters out None values."""
         # Create users with chat_ids
-        self.db_service.update_user_chat_id("test_user_1", 111111)
-        self.db_service.update_user_chat_id("test_user_2", 222222)
-        self.db_service.update_user_chat_id("test_user_3", 333333)
+        await self.db_service.update_user_chat_id("test_user_1", 111111)
+        await self.db_service.update_user_chat_id("test_user_2", 222222)
+        await self.db_service.update_user_chat_id("test_user_3", 333333)
 
         # Create user without chat_id
-        self.db_service.get_or_create_user("test_user_4")
+        await self.db_service.get_or_create_user("test_user_4")
 
         # Get all chat_ids
-        chat_ids = self.db_service.get_all_user_chat_ids()
+        chat_ids = await self.db_service.get_all_user_chat_ids()
 
         # Should return only 3 chat_ids (excludes the None value)
         assert len(chat_ids) == 3
@@ -96,25 +103,26 @@ class TestDatabaseServiceChatMethods:
         assert 222222 in chat_ids
         assert 333333 in chat_ids
 
-    def test_remove_user_chat_id(self):
+    @pytest.mark.asyncio
+    async def test_remove_user_chat_id(self):
         """Test removing chat_id from user."""
         contact = "test_user_1"
         chat_id = 555555
 
         # Create user with chat_id
-        user = self.db_service.update_user_chat_id(contact, chat_id)
+        user = await self.db_service.update_user_chat_id(contact, chat_id)
         assert user.chat_id == chat_id
 
         # Remove chat_id
-        result = self.db_service.remove_user_chat_id(chat_id)
+        result = await self.db_service.remove_user_chat_id(chat_id)
         assert result is True
 
         # Verify chat_id is None
-        user_updated = self.db_service.get_user_by_contact(contact)
+        user_updated = await self.db_service.get_user_by_contact(contact)
         assert user_updated.chat_id is None
 
         # Try removing non-existent chat_id
-        result = self.db_service.remove_user_chat_id(999999)
+        result = await self.db_service.remove_user_chat_id(999999)
         assert result is False
 
 
@@ -123,8 +131,10 @@ class TestChatValidationService:
 
     @pytest.fixture(autouse=True)
     def setup(self):
-        """Set up test validation service."""
-        self.validation_service = ChatValidationService()
+        """Set up test validation service with an in-memory checkpoint store."""
+        self.redis_client = fakeredis.FakeRedis(decode_responses=True)
+        self.validation_service = ChatValidationService.__wrapped__()
+        self.validation_service._redis = SimpleNamespace(client=self.redis_client)
 
     @pytest.mark.asyncio
     async def test_is_chat_valid_with_valid_chat(self):
@@ -195,3 +205,46 @@ class TestChatValidationService:
         assert 222 in results["invalid_ids"]
         assert 333 in results["invalid_ids"]
         assert 111 not in results["invalid_ids"]
+
+    @pytest.mark.asyncio
+    async def test_validate_all_chat_ids_retries_after_flood_control(self):
+        """Test RetryAfter is retried instead of marking the chat invalid."""
+        mock_bot = AsyncMock()
+        mock_bot.send_chat_action = AsyncMock(side_effect=[RetryAfter(0), True])
+
+        results = await self.validation_service.validate_all_chat_ids(mock_bot, [111])
+
+        assert results["valid"] == 1
+        assert mock_bot.send_chat_action.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_validate_all_chat_ids_resumes_from_checkpoint(self):
+        """Test chats from an interrupted run are not checked again."""
+        self.redis_client.sadd(self.validation_service.CHECKED_KEY, 111, 222)
+        self.redis_client.sadd(self.validation_service.INVALID_KEY, 222)
+        mock_bot = AsyncMock()
+        mock_bot.send_chat_action = AsyncMock(return_value=True)
+
+        results = await self.validation_service.validate_all_chat_ids(
+            mock_bot, [111, 222, 333]
+        )
+
+        mock_bot.send_chat_action.assert_called_once_with(chat_id=333, action="typing")
+        assert results["invalid_ids"] == [222]
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_is_kept_until_cleared(self):
+        """Test invalid ids survive until the caller has deactivated them."""
+        mock_bot = AsyncMock()
+        mock_bot.send_chat_action = AsyncMock(side_effect=[True, Forbidden("Blocked")])
+        self.validation_service._checkpoint_size = 1
+
+        await self.validation_service.validate_all_chat_ids(mock_bot, [111, 222])
+
+        assert self.redis_client.smembers(self.validation_service.INVALID_KEY) == {"222"}
+
+        self.validation_service.clear_checkpoint()
+
+        assert not self.redis_client.exists(
+            self.validation_service.CHECKED_KEY, self.validation_service.INVALID_KEY
+        )
@@ -1,7 +1,7 @@
 import pytest
 import sys
 import os
-from datetime import date
+from datetime import date, timedelta
 from unittest.mock import patch, MagicMock
 
 # Add src to path for imports
@@ -10,7 +10,7 @@ sys.path.insert(
 )
 
 from models.date_pricing_rule import DatePricingRule
-from services.date_pricing_service import DatePricingService
+from services.date_pricing_service import DatePricingService, DateRuleIndex
 
 
 class TestDatePricingRule:
@@ -252,3 +252,58 @@ class TestDatePricingService:
         # Refresh rules
         refreshed_rules = service.refresh_rules()
         assert len(refreshed_rules) == 3
+
+
+class TestDateRuleIndex:
+    """Test the date segment index built from the rules."""
+
+    def make_rule(self, rule_id, start_date, end_date, is_active=True):
+        return DatePricingRule(
+            rule_id=rule_id,
+            start_date=start_date,
+            end_date=end_date,
+            price_override=1000,
+            is_active=is_active,
+        )
+
+    def test_overlapping_rules_are_sorted_by_rule_id(self):
+        index = DateRuleIndex(
+            [
+                self.make_rule("b_week", "2024-12-28", "2025-01-03"),
+                self.make_rule("a_new_year", "2025-01-01", "2025-01-01"),
+            ]
+        )
+
+        assert [rule.rule_id for rule in index.get(date(2024, 12, 31))] == ["b_week"]
+        assert [rule.rule_id for rule in index.get(date(2025, 1, 1))] == ["a_new_year", "b_week"]
+        assert [rule.rule_id for rule in index.get(date(2025, 1, 3))] == ["b_week"]
+
+    def test_dates_outside_rules_have_no_rules(self):
+        index = DateRuleIndex(
+            [
+                self.make_rule("summer", "2024-06-01", "2024-06-10"),
+                self.make_rule("autumn", "2024-09-01", "2024-09-01"),
+                self.make_rule("disabled", "2024-07-01", "2024-07-31", is_active=False),
+            ]
+        )
+
+        assert index.get(date(2024, 5, 31)) == ()
+        assert index.get(date(2024, 6, 11)) == ()
+        assert index.get(date(2024, 7, 15)) == ()
+        assert index.get(date(2024, 9, 2)) == ()
+        assert DateRuleIndex([]).get(date(2024, 6, 1)) == ()
+
+    def test_range_matches_single_day_lookups(self):
+        index = DateRuleIndex(
+            [
+                self.make_rule("b_week", "2024-12-28", "2025-01-03"),
+                self.make_rule("a_new_year", "2025-01-01", "2025-01-01"),
+                self.make_rule("later", "2025-01-10", "2025-01-12"),
+            ]
+        )
+        start = date(2024, 12, 20)
+        days = [start + timedelta(days=offset) for offset in range(40)]
+
+        assert index.get_range(days[0], days[-1]) == [index.get(day) for day in days]
+        assert index.get_range(date(2025, 1, 2), date(2025, 1, 1)) == []
+
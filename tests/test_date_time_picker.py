@@ -0,0 +1,80 @@
+import sys
+import os
+from datetime import date, time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.date_time_picker import calendar_picker, hours_picker
+
+MIN_DATE = date(2030, 5, 1)
+MAX_DATE = date(2030, 11, 1)
+
+
+def create_calendar(available_days, selected_date=date(2030, 6, 1)):
+    return calendar_picker.create_calendar(
+        selected_date,
+        min_date=MIN_DATE,
+        max_date=MAX_DATE,
+        action_text="Назад",
+        callback_prefix="-START",
+        available_days=available_days,
+    )
+
+
+def button_texts(markup):
+    return [button.text for row in markup.inline_keyboard for button in row]
+
+
+class TestCalendarPicker:
+    """Test the cached calendar keyboard."""
+
+    def test_available_mask_ignores_other_months(self):
+        days = [date(2030, 6, 1), date(2030, 6, 30), date(2030, 7, 1)]
+
+        assert calendar_picker.get_available_mask(2030, 6, days) == 1 | 1 << 29
+        assert calendar_picker.get_available_mask(2030, 6, None) is None
+
+    def test_same_month_and_availability_reuse_keyboard(self):
+        days = [date(2030, 6, 10), date(2030, 6, 11)]
+
+        first = create_calendar(days)
+        # Same days for a different order or day of the month
+        second = create_calendar(list(reversed(days)), selected_date=date(2030, 6, 20))
+
+        assert first is second
+        assert "10" in button_texts(first) and "12" not in button_texts(first)
+
+    def test_availability_change_builds_new_keyboard(self):
+        before = create_calendar([date(2030, 6, 10)])
+        after = create_calendar([date(2030, 6, 10), date(2030, 6, 12)])
+
+        assert before is not after
+        assert "12" in button_texts(after)
+
+
+class TestHoursPicker:
+    """Test the cached hours keyboard."""
+
+    def test_free_slots_mark_occupied_hours(self):
+        markup = hours_picker.create_hours_picker(
+            date=date(2030, 6, 1),
+            free_slots=[(time(10, 0), time(12, 0))],
+            action_text="Назад",
+            callback_prefix="-START",
+        )
+        texts = button_texts(markup)
+
+        assert texts[10:13] == ["10:00", "11:00", "12:00"]
+        assert texts[9] == "⛔ 09:00"
+        assert texts[-2] == "⛔ 23:59"
+
+    def test_same_slots_reuse_keyboard(self):
+        def create():
+            return hours_picker.create_hours_picker(
+                date=date(2030, 6, 1),
+                free_slots=[(time(8, 0), time(20, 0))],
+                action_text="Назад",
+                callback_prefix="-FINISH",
+            )
+
+        assert create() is create()
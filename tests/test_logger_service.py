@@ -0,0 +1,103 @@
+import pytest
+import sys
+import os
+import logging
+import queue
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.services.logger_service as logger_module
+from src.services.logger_service import DroppingQueueHandler, LoggerService
+
+
+def make_record(level, message):
+    return logging.makeLogRecord(
+        {"name": "test", "levelno": level, "levelname": logging.getLevelName(level), "msg": message}
+    )
+
+
+def drain(log_queue):
+    records = []
+    while not log_queue.empty():
+        records.append(log_queue.get_nowait())
+    return records
+
+
+@pytest.fixture
+def log_queue(monkeypatch):
+    """Route LoggerService to an in-memory queue instead of Logtail."""
+    log_queue = queue.Queue(maxsize=100)
+    monkeypatch.setattr(logger_module, "DEBUG", False)
+    monkeypatch.setattr(LoggerService, "queue_handler", DroppingQueueHandler(log_queue))
+    monkeypatch.setattr(LoggerService, "loggers", {})
+    monkeypatch.setattr(LoggerService, "level", logging.INFO)
+    monkeypatch.setattr(LoggerService, "info_sample_rate", 1.0)
+    yield log_queue
+    logging.getLogger("test_logger_service").handlers = []
+
+
+class TestDroppingQueueHandler:
+    """Test the drop policy of the logging queue."""
+
+    def test_full_queue_drops_new_records(self):
+        log_queue = queue.Queue(maxsize=2)
+        handler = DroppingQueueHandler(log_queue)
+
+        for index in range(4):
+            handler.handle(make_record(logging.INFO, f"info {index}"))
+
+        assert [record.msg for record in drain(log_queue)] == ["info 0", "info 1"]
+        assert handler.dropped == 2
+
+    def test_error_evicts_oldest_record(self):
+        log_queue = queue.Queue(maxsize=2)
+        handler = DroppingQueueHandler(log_queue)
+        handler.handle(make_record(logging.INFO, "old"))
+        handler.handle(make_record(logging.INFO, "new"))
+
+        handler.handle(make_record(logging.ERROR, "error"))
+
+        assert [record.msg for record in drain(log_queue)] == ["new", "error"]
+
+    def test_dropped_count_is_reported_when_room_returns(self):
+        log_queue = queue.Queue(maxsize=1)
+        handler = DroppingQueueHandler(log_queue)
+        handler.handle(make_record(logging.INFO, "first"))
+        handler.handle(make_record(logging.INFO, "lost"))
+        drain(log_queue)
+        log_queue.maxsize = 2
+
+        handler.handle(make_record(logging.INFO, "next"))
+
+        messages = [record.msg for record in drain(log_queue)]
+        assert messages == ["next", "Log queue was full, dropped 1 records"]
+        assert handler.dropped == 0
+
+
+class TestLoggerService:
+    """Test level and sampling controls in front of the queue."""
+
+    def test_records_are_queued_with_extra(self, log_queue):
+        LoggerService.info("test_logger_service", "hello", **{"booking_id": 7})
+
+        (record,) = drain(log_queue)
+        assert record.getMessage() == "hello"
+        assert record.booking_id == 7
+
+    def test_level_filters_before_queueing(self, log_queue, monkeypatch):
+        monkeypatch.setattr(LoggerService, "level", logging.WARNING)
+
+        LoggerService.info("test_logger_service", "skipped")
+        LoggerService.warning("test_logger_service", "kept")
+
+        assert [record.msg for record in drain(log_queue)] == ["kept"]
+
+    def test_info_sampling_keeps_errors(self, log_queue, monkeypatch):
+        monkeypatch.setattr(LoggerService, "info_sample_rate", 0.0)
+
+        LoggerService.info("test_logger_service", "sampled out")
+        LoggerService.error("test_logger_service", "failed", ValueError("boom"))
+
+        (record,) = drain(log_queue)
+        assert record.msg == "failed"
+        assert record.exc_info[0] is ValueError
@@ -0,0 +1,131 @@
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from telegram.error import BadRequest
+from src.services.file_service import FileService
+from src.services.media_cache_service import MediaCacheService
+
+
+class MemoryRedis:
+    """The subset of redis.Redis used by MediaCacheService, kept in memory."""
+
+    def __init__(self):
+        self.data = {}
+
+    def set(self, key, value):
+        self.data[key] = str(value)
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+
+class RecordingBot:
+    """Returns a photo message per send and records what was sent."""
+
+    def __init__(self):
+        self.sent = []
+        self.rejected_file_ids = set()
+        self._uploads = 0
+
+    async def send_photo(self, chat_id, photo, **kwargs):
+        return self._send(photo)
+
+    async def send_media_group(self, chat_id, media):
+        return [self._send(item.media) for item in media]
+
+    def _send(self, photo):
+        if isinstance(photo, str):
+            if photo in self.rejected_file_ids:
+                raise BadRequest("Wrong file identifier")
+            self.sent.append(photo)
+            file_id = photo
+        else:
+            self._uploads += 1
+            self.sent.append("upload")
+            file_id = f"file-{self._uploads}"
+        return SimpleNamespace(photo=[SimpleNamespace(file_id=file_id)])
+
+
+@pytest.fixture
+def images(tmp_path):
+    (tmp_path / "key.jpg").write_bytes(b"key")
+    (tmp_path / "prices.png").write_bytes(b"prices")
+    return tmp_path
+
+
+@pytest.fixture
+def redis_client():
+    return MemoryRedis()
+
+
+@pytest.fixture
+def service(images, redis_client):
+    service = MediaCacheService.__wrapped__()
+    service._file_service = FileService.__wrapped__()
+    service._file_service._IMAGE_FOLDER = f"{images}/"
+    service._redis = SimpleNamespace(client=redis_client)
+    return service
+
+
+class TestMediaCacheService:
+    """Test reusing Telegram file_ids for asset images."""
+
+    @pytest.mark.asyncio
+    async def test_image_is_uploaded_once(self, service):
+        bot = RecordingBot()
+
+        await service.send_photo(bot, 1, "key.jpg", caption="a")
+        await service.send_photo(bot, 2, "key.jpg", caption="b")
+
+        assert bot.sent == ["upload", "file-1"]
+
+    @pytest.mark.asyncio
+    async def test_changed_image_is_uploaded_again(self, service, images):
+        bot = RecordingBot()
+        await service.send_photo(bot, 1, "key.jpg")
+
+        (images / "key.jpg").write_bytes(b"new key")
+        await service.send_photo(bot, 1, "key.jpg")
+
+        assert bot.sent == ["upload", "upload"]
+
+    @pytest.mark.asyncio
+    async def test_rejected_file_id_falls_back_to_upload(self, service):
+        bot = RecordingBot()
+        await service.send_photo(bot, 1, "key.jpg")
+        bot.rejected_file_ids.add("file-1")
+
+        await service.send_photo(bot, 1, "key.jpg")
+        await service.send_photo(bot, 1, "key.jpg")
+
+        assert bot.sent == ["upload", "upload", "file-2"]
+
+    @pytest.mark.asyncio
+    async def test_price_media_reuses_known_file_ids(self, service):
+        bot = RecordingBot()
+        await service.send_photo(bot, 1, "key.jpg")
+
+        await service.send_price_media(bot, 1)
+        await service.send_price_media(bot, 1)
+
+        assert bot.sent == ["upload", "file-1", "upload", "file-1", "file-2"]
+
+    @pytest.mark.asyncio
+    async def test_without_redis_every_send_uploads(self, service):
+        service._redis = None
+        service._retry_at = float("inf")
+        bot = RecordingBot()
+
+        await service.send_photo(bot, 1, "key.jpg")
+        await service.send_photo(bot, 1, "key.jpg")
+
+        assert bot.sent == ["upload", "upload"]
+
+    @pytest.mark.asyncio
+    async def test_missing_image_raises(self, service):
+        with pytest.raises(FileNotFoundError):
+            await service.send_photo(RecordingBot(), 1, "missing.jpg")
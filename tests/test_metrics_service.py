@@ -0,0 +1,85 @@
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.metrics_service import Histogram, MetricsService, timed_job
+from src.services.database import BaseRepository
+
+
+@pytest.fixture
+def metrics():
+    return MetricsService.__wrapped__()
+
+
+class TestHistogram:
+    """Test histogram buckets and text rendering."""
+
+    def test_buckets_are_cumulative(self):
+        histogram = Histogram("h_seconds", "Test", ("handler",), buckets=(0.1, 1))
+        histogram.observe(0.05, "a")
+        histogram.observe(0.1, "a")
+        histogram.observe(5, "a")
+
+        lines = histogram.collect()
+
+        assert 'h_seconds_bucket{handler="a",le="0.1"} 2' in lines
+        assert 'h_seconds_bucket{handler="a",le="1.0"} 2' in lines
+        assert 'h_seconds_bucket{handler="a",le="+Inf"} 3' in lines
+        assert 'h_seconds_count{handler="a"} 3' in lines
+        assert 'h_seconds_sum{handler="a"} 5.15' in lines
+
+    def test_label_values_are_escaped(self):
+        histogram = Histogram("h_seconds", "Test", ("handler",), buckets=(1,))
+        histogram.observe(0.5, 'say "hi"')
+
+        assert 'h_seconds_count{handler="say \\"hi\\""} 1' in histogram.collect()
+
+
+class TestMetricsService:
+    """Test the registry and the instrumentation helpers."""
+
+    def test_render_includes_callback_metrics(self, metrics):
+        metrics.gauge("queue_depth", "Depth", lambda: {(): 3})
+        metrics.counter("db_queries_total", "Queries", lambda: {("menu",): 7}, ("handler",))
+
+        text = metrics.render()
+
+        assert "# TYPE telegram_handler_duration_seconds histogram" in text
+        assert "queue_depth 3" in text
+        assert 'db_queries_total{handler="menu"} 7' in text
+
+    def test_broken_callback_does_not_break_render(self, metrics):
+        metrics.gauge("broken", "Broken", lambda: 1 / 0)
+        metrics.gauge("fine", "Fine", lambda: {(): 1})
+
+        assert "fine 1" in metrics.render()
+
+    @pytest.mark.asyncio
+    async def test_timed_job_records_job_name(self):
+        async def callback(context):
+            return "done"
+
+        result = await timed_job(callback)(SimpleNamespace(job=SimpleNamespace(name="nightly")))
+
+        assert result == "done"
+        assert 'job_run_duration_seconds_count{job="nightly"} 1' in MetricsService().render()
+
+    @pytest.mark.asyncio
+    async def test_repository_methods_are_timed(self):
+        class SampleRepository(BaseRepository):
+            async def get_sample(self):
+                return 1
+
+            async def _helper(self):
+                return 2
+
+        repository = SampleRepository.__new__(SampleRepository)
+
+        assert await repository.get_sample() == 1
+        assert await repository._helper() == 2
+        text = MetricsService().render()
+        assert 'repository_call_duration_seconds_count{method="SampleRepository.get_sample"} 1' in text
+        assert "SampleRepository._helper" not in text
@@ -13,6 +13,7 @@ if os.name == "nt":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
 
+from src.models.holiday_prepayment_rule import HolidayPrepaymentRule
 from src.services.prepayment_service import PrepaymentService
 
 
@@ -172,3 +173,23 @@ if __name__ == "__main__":
 
         traceback.print_exc()
         sys.exit(1)
+
+
+def test_dated_and_recurring_rules_keep_file_order():
+    """Test that a date matching both rule kinds returns them in file order."""
+    service = PrepaymentService.__wrapped__()
+    service._rules = [
+        HolidayPrepaymentRule("inactive", "2026-05-01", False, 30, "Inactive", is_active=False),
+        HolidayPrepaymentRule("dated", "2026-05-01", False, 70, "Dated"),
+        HolidayPrepaymentRule("recurring", "05-01", True, 100, "Recurring"),
+    ]
+
+    assert [rule.rule_id for rule in service.get_applicable_rules(date(2026, 5, 1))] == [
+        "dated",
+        "recurring",
+    ]
+    assert [rule.rule_id for rule in service.get_applicable_rules(date(2027, 5, 1))] == [
+        "recurring"
+    ]
+    assert service.calculate_prepayment(1000.0, date(2026, 5, 1)) == 700.0
+
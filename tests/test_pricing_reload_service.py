@@ -0,0 +1,137 @@
+import pytest
+import sys
+import os
+import json
+from datetime import date
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.enum.tariff import Tariff
+from src.services.calculation_rate_service import CalculationRateService
+from src.services.date_pricing_service import DatePricingService
+from src.services.file_service import FileService
+from src.services.pricing_reload_service import PricingReloadService, PricingSource
+
+
+def make_rate(tariff=Tariff.DAY, price=700):
+    return {
+        "tariff": tariff.value,
+        "name": "Test",
+        "duration_hours": 24,
+        "price": price,
+        "sauna_price": 100,
+        "secret_room_price": 0,
+        "second_bedroom_price": 0,
+        "extra_hour_price": 30,
+        "extra_people_price": 0,
+        "photoshoot_price": 100,
+        "max_people": 6,
+        "is_check_in_time_limit": False,
+        "is_photoshoot": True,
+        "is_transfer": False,
+        "multi_day_prices": {"1": price},
+    }
+
+
+def make_rule(rule_id="promo", price_override=1000):
+    return {
+        "rule_id": rule_id,
+        "start_date": "2030-06-01",
+        "end_date": "2030-06-01",
+        "price_override": price_override,
+    }
+
+
+class PricingFiles:
+    def __init__(self, tmp_path):
+        self.tariffs = tmp_path / "tariff_rate.json"
+        self.rules = tmp_path / "date_pricing_rules.json"
+        self._tick = 0
+
+    def write_tariffs(self, rates):
+        self._write(self.tariffs, json.dumps({"rental_prices": rates}))
+
+    def write_rules(self, rules):
+        self._write(self.rules, json.dumps({"pricing_rules": rules}))
+
+    def _write(self, path, text):
+        path.write_text(text, encoding="utf-8")
+        # mtime resolution differs between filesystems, move it forward explicitly
+        self._tick += 1
+        os.utime(path, ns=(self._tick * 10**9, self._tick * 10**9))
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    files = PricingFiles(tmp_path)
+    files.write_tariffs([make_rate(), make_rate(Tariff.HOURS_12, price=300)])
+    files.write_rules([make_rule()])
+    file_service = FileService()
+    monkeypatch.setattr(file_service, "_TARIFF_JSON", str(files.tariffs), raising=False)
+    monkeypatch.setattr(file_service, "_DATE_PRICING_RULES_JSON", str(files.rules), raising=False)
+    return files
+
+
+@pytest.fixture
+def rate_service(files):
+    service = CalculationRateService.__wrapped__()
+    service.refresh_rates()
+    return service
+
+
+@pytest.fixture
+def date_service(files):
+    service = DatePricingService.__wrapped__()
+    service.refresh_rules()
+    return service
+
+
+@pytest.fixture
+def reload_service(files, rate_service, date_service):
+    service = PricingReloadService.__wrapped__.__new__(PricingReloadService.__wrapped__)
+    service._sources = [
+        PricingSource(str(files.tariffs), rate_service.load_rates, rate_service.set_rates),
+        PricingSource(str(files.rules), date_service.load_rules, date_service.set_rules),
+    ]
+    service._versions = {
+        source.path: service._get_version(source.path) for source in service._sources
+    }
+    return service
+
+
+class TestPricingReloadService:
+    """Test reloading pricing files when they change on disk."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_are_not_reloaded(self, reload_service):
+        assert await reload_service.check() == []
+
+    @pytest.mark.asyncio
+    async def test_changed_files_are_swapped_in(self, files, reload_service, rate_service, date_service):
+        files.write_tariffs([make_rate(price=900), make_rate(Tariff.HOURS_12, price=300)])
+        files.write_rules([make_rule(price_override=1500)])
+
+        assert await reload_service.check() == [str(files.tariffs), str(files.rules)]
+        assert rate_service.get_price(Tariff.DAY) == 900
+        assert date_service.get_price_override(date(2030, 6, 1), 24) == 1500
+
+    @pytest.mark.asyncio
+    async def test_invalid_file_keeps_previous_prices(self, files, reload_service, rate_service):
+        files.write_tariffs([make_rate(price=900)])  # HOURS_12 removed
+        assert await reload_service.check() == []
+        assert rate_service.get_price(Tariff.HOURS_12) == 300
+
+        files.write_tariffs("not a list")
+        assert await reload_service.check() == []
+        assert rate_service.get_price(Tariff.DAY) == 700
+
+        files.write_tariffs([make_rate(price=800), make_rate(Tariff.HOURS_12, price=300)])
+        assert await reload_service.check() == [str(files.tariffs)]
+        assert rate_service.get_price(Tariff.DAY) == 800
+
+    @pytest.mark.asyncio
+    async def test_duplicate_rule_ids_are_rejected(self, files, reload_service, date_service):
+        files.write_rules([make_rule(price_override=1500), make_rule(price_override=2000)])
+
+        assert await reload_service.check() == []
+        assert date_service.get_price_override(date(2030, 6, 1), 24) == 1000
@@ -0,0 +1,85 @@
+import pytest
+import pytest_asyncio
+import sys
+import os
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.services.query_metrics_service import QueryMetricsService
+
+
+@pytest.fixture
+def service():
+    return QueryMetricsService.__wrapped__(budget=2)
+
+
+@pytest_asyncio.fixture
+async def engine(service):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    service.instrument(engine.sync_engine)
+    yield engine
+    await engine.dispose()
+
+
+async def run_queries(engine, count):
+    async with engine.connect() as connection:
+        for _ in range(count):
+            await connection.execute(text("SELECT 1"))
+
+
+def make_update(data=None, text_message=None, chat_id=42):
+    return SimpleNamespace(
+        callback_query=SimpleNamespace(data=data) if data else None,
+        effective_message=SimpleNamespace(text=text_message) if text_message or data else None,
+        effective_chat=SimpleNamespace(id=chat_id),
+    )
+
+
+class TestQueryMetricsService:
+    """Test per-update query counting."""
+
+    @pytest.mark.asyncio
+    async def test_counts_queries_of_each_scope(self, service, engine):
+        async def handle(name, count):
+            with service.track(name) as scope:
+                await run_queries(engine, count)
+            return scope
+
+        first, second = await asyncio.gather(handle("a", 1), handle("b", 2))
+
+        assert (first.queries, second.queries) == (1, 2)
+        assert first.db_seconds > 0
+        stats = service.get_stats()
+        assert stats["b"].updates == 1
+        assert stats["b"].max_queries == 2
+
+    @pytest.mark.asyncio
+    async def test_queries_outside_scope_are_ignored(self, service, engine):
+        await run_queries(engine, 1)
+
+        assert service.get_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_budget_exceeded_is_logged(self, service, engine):
+        with patch("src.services.query_metrics_service.LoggerService.warning") as warning:
+            with service.track("busy", chat_id=7):
+                await run_queries(engine, 3)
+
+        assert service.get_stats()["busy"].over_budget == 1
+        kwargs = warning.call_args.kwargs
+        assert (kwargs["handler"], kwargs["chat_id"], kwargs["queries"]) == ("busy", 7, 3)
+
+    def test_update_names_and_outer_handler_wins(self, service):
+        with service.track_update(make_update(data="BOOKING-PAY_1")) as scope:
+            assert (scope.handler, scope.chat_id) == ("callback:BOOKING-PAY", 42)
+            service.set_handler("booking_handler.pay")
+            service.set_handler("booking_handler.back_navigation")
+
+        assert scope.handler == "booking_handler.pay"
+        with service.track_update(make_update(text_message="/start now")) as scope:
+            assert scope.handler == "command:/start"
@@ -0,0 +1,85 @@
+import pytest
+import pytest_asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from aiohttp import FormData, web
+from aiohttp.test_utils import TestClient, TestServer
+from src.api.receipt_upload import UploadTooLargeError, read_receipt_upload
+
+
+async def describe_upload(request):
+    try:
+        upload = await read_receipt_upload(request, max_bytes=1000, spool_bytes=100)
+    except UploadTooLargeError:
+        return web.json_response({"error": "too large"}, status=413)
+    try:
+        return web.json_response(
+            {
+                "booking_id": upload.booking_id,
+                "filename": upload.filename,
+                "is_image": upload.is_image,
+                "size": upload.size,
+                "on_disk": upload.file._rolled if upload.file else None,
+                "data": upload.file.read().decode() if upload.file else None,
+            }
+        )
+    finally:
+        upload.close()
+
+
+@pytest_asyncio.fixture
+async def client():
+    app = web.Application()
+    app.router.add_post("/upload", describe_upload)
+    async with TestClient(TestServer(app)) as client:
+        yield client
+
+
+def make_form(content: bytes, booking_id="5", content_type="application/pdf"):
+    form = FormData()
+    if booking_id:
+        form.add_field("booking_id", booking_id)
+    form.add_field("file", content, filename="receipt.pdf", content_type=content_type)
+    return form
+
+
+class TestReadReceiptUpload:
+    """Test streaming the receipt form into a spooled file."""
+
+    @pytest.mark.asyncio
+    async def test_small_file_stays_in_memory(self, client):
+        response = await client.post("/upload", data=make_form(b"paid", content_type="image/jpeg"))
+        body = await response.json()
+
+        assert body == {
+            "booking_id": "5",
+            "filename": "receipt.pdf",
+            "is_image": True,
+            "size": 4,
+            "on_disk": False,
+            "data": "paid",
+        }
+
+    @pytest.mark.asyncio
+    async def test_larger_file_is_spooled_to_disk(self, client):
+        response = await client.post("/upload", data=make_form(b"x" * 500))
+        body = await response.json()
+
+        assert (body["size"], body["on_disk"], body["is_image"]) == (500, True, False)
+
+    @pytest.mark.asyncio
+    async def test_file_over_cap_is_rejected(self, client):
+        response = await client.post("/upload", data=make_form(b"x" * 1001))
+
+        assert response.status == 413
+
+    @pytest.mark.asyncio
+    async def test_missing_fields_are_left_empty(self, client):
+        response = await client.post("/upload", data=make_form(b"paid", booking_id=None))
+        body = await response.json()
+
+        assert body["booking_id"] is None
+        assert body["data"] == "paid"
@@ -0,0 +1,72 @@
+import pytest
+import sys
+import os
+import json
+from types import SimpleNamespace
+
+import fakeredis
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.redis.redis_persistence import RedisPersistence
+
+KEY = "conversation_state:booking"
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+def make_persistence(redis_client):
+    # __init__ opens a real RedisConnection, so attach the fake client instead
+    persistence = RedisPersistence.__new__(RedisPersistence)
+    persistence._redis = SimpleNamespace(client=redis_client)
+    persistence._conversations = {}
+    persistence._conversation_key_prefix = "conversation_state"
+    persistence._ttl = 259200
+    persistence._scan_batch_size = 500
+    return persistence
+
+
+@pytest.fixture
+def persistence(redis_client):
+    return make_persistence(redis_client)
+
+
+class TestRedisPersistence:
+    """Test conversation states stored as one Redis hash per conversation."""
+
+    @pytest.mark.asyncio
+    async def test_update_conversation_sets_and_clears_state(self, persistence, redis_client):
+        await persistence.update_conversation("booking", (1, 2), 3)
+        await persistence.update_conversation("booking", (1, 5), 4)
+
+        assert redis_client.hgetall(KEY) == {"1,2": "3", "1,5": "4"}
+        assert redis_client.ttl(KEY) > 0
+
+        await persistence.update_conversation("booking", (1, 2), None)
+
+        assert redis_client.hgetall(KEY) == {"1,5": "4"}
+
+    @pytest.mark.asyncio
+    async def test_states_are_loaded_after_reload(self, persistence, redis_client):
+        await persistence.update_conversation("booking", (1, 2), 3)
+        await persistence.update_conversation("booking", (-100, 7), "PAYMENT")
+
+        reloaded = make_persistence(redis_client)
+
+        assert await reloaded.get_conversations("booking") == {(1, 2): 3, (-100, 7): "PAYMENT"}
+        assert await reloaded.get_conversations("feedback") == {}
+
+    @pytest.mark.asyncio
+    async def test_legacy_string_key_is_migrated_to_hash(self, persistence, redis_client):
+        redis_client.set(KEY, json.dumps({"1,2": 3, "4,5": "PAYMENT"}), ex=60)
+
+        assert await persistence.get_conversations("booking") == {(1, 2): 3, (4, 5): "PAYMENT"}
+        assert redis_client.type(KEY) == "hash"
+        assert redis_client.hgetall(KEY) == {"1,2": "3", "4,5": '"PAYMENT"'}
+
+        await persistence.update_conversation("booking", (1, 2), None)
+
+        assert await persistence.get_conversations("booking") == {(4, 5): "PAYMENT"}
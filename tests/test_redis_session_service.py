@@ -0,0 +1,101 @@
+import pytest
+import sys
+import os
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import fakeredis
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.booking_draft import BookingDraft
+from src.models.enum.tariff import Tariff
+from src.services.redis.redis_session_service import RedisSessionService
+
+CHAT_ID = 42
+KEY = f"booking:{CHAT_ID}"
+
+
+class StubNavigationService:
+    def get_chat_id(self, update):
+        return update.chat_id
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def service(redis_client):
+    service = RedisSessionService.__wrapped__.__new__(RedisSessionService.__wrapped__)
+    service._redis = SimpleNamespace(client=redis_client)
+    service._ttl = 3600
+    service._navigation_service = StubNavigationService()
+    return service
+
+
+@pytest.fixture
+def update():
+    return SimpleNamespace(chat_id=CHAT_ID)
+
+
+def make_booking():
+    return BookingDraft(
+        user_contact="@guest",
+        start_booking_date=datetime(2030, 6, 1, 14, 0, tzinfo=timezone.utc),
+        finish_booking_date=datetime(2030, 6, 2, 12, 0, tzinfo=timezone.utc),
+        tariff=Tariff.DAY,
+        is_sauna_included=True,
+        number_of_guests=2,
+        price=700.0,
+    )
+
+
+class TestRedisSessionService:
+    """Test drafts stored as Redis hashes with one field per attribute."""
+
+    def test_booking_round_trip(self, service, update, redis_client):
+        service.set_booking(update, make_booking())
+
+        booking = service.get_booking(update)
+
+        assert booking == make_booking()
+        assert isinstance(booking.start_booking_date, datetime)
+        assert booking.tariff is Tariff.DAY
+        assert redis_client.type(KEY) == "hash"
+        assert redis_client.ttl(KEY) > 0
+
+    def test_update_fields_touches_only_given_fields(self, service, update, redis_client):
+        service.set_booking(update, make_booking())
+        before = redis_client.hgetall(KEY)
+
+        service.update_fields(update, "booking", {"tariff": Tariff.WORKER, "number_of_guests": 4})
+
+        after = redis_client.hgetall(KEY)
+        changed = {field for field in after if after[field] != before[field]}
+        assert changed == {"tariff", "number_of_guests"}
+        assert service.get_field(update, "booking", "tariff") is Tariff.WORKER
+
+        booking = service.get_booking(update)
+        assert booking.number_of_guests == 4
+        assert booking.start_booking_date == datetime(2030, 6, 1, 14, 0, tzinfo=timezone.utc)
+        assert booking.is_sauna_included is True
+
+    def test_legacy_string_draft_is_migrated(self, service, update, redis_client):
+        # Drafts used to be saved with SETEX as one JSON string
+        redis_client.set(KEY, make_booking().to_json(), ex=60)
+
+        service.update_fields(update, "booking", {"number_of_guests": 3})
+
+        assert redis_client.type(KEY) == "hash"
+        booking = service.get_booking(update)
+        assert booking.number_of_guests == 3
+        assert booking.tariff is Tariff.DAY
+        assert booking.start_booking_date == datetime(2030, 6, 1, 14, 0, tzinfo=timezone.utc)
+
+    def test_legacy_string_draft_is_readable(self, service, update, redis_client):
+        redis_client.set(KEY, make_booking().to_json(), ex=60)
+
+        assert service.get_booking(update) == make_booking()
+        assert redis_client.type(KEY) == "hash"
@@ -0,0 +1,108 @@
+import pytest
+import sys
+import os
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+import fakeredis
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.availability_service import AvailabilityService
+from src.services.slot_hold_service import SlotHoldService
+
+
+START = datetime(2030, 6, 1, 12, 0)
+
+
+def get_buckets(redis_client):
+    return {key: redis_client.get(key) for key in redis_client.keys("slot_hold:20*")}
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def service(redis_client):
+    service = SlotHoldService.__wrapped__()
+    service._redis = SimpleNamespace(client=redis_client)
+    return service
+
+
+class TestSlotHoldService:
+    """Test checkout holds on hourly buckets."""
+
+    def test_hold_covers_booking_and_cleaning(self, service, redis_client):
+        assert service.hold(1, START, START + timedelta(hours=3))
+
+        held = sorted(get_buckets(redis_client))
+        # 12:00-15:00 plus two hours of cleaning
+        assert held == [f"slot_hold:20300601{hour}" for hour in range(12, 17)]
+        assert 0 < redis_client.ttl(held[0]) <= service._ttl.total_seconds()
+
+    def test_overlapping_hold_is_rejected_and_rolled_back(self, service, redis_client):
+        service.hold(1, START, START + timedelta(hours=3))
+
+        assert not service.hold(2, START + timedelta(hours=4), START + timedelta(hours=8))
+        # Buckets 17:00+ were set by user 2 before the conflict, then removed
+        assert set(get_buckets(redis_client).values()) == {"1"}
+
+    def test_hold_after_cleaning_succeeds(self, service):
+        service.hold(1, START, START + timedelta(hours=3))
+
+        assert service.hold(2, START + timedelta(hours=5), START + timedelta(hours=8))
+
+    def test_rehold_replaces_own_hold(self, service, redis_client):
+        service.hold(1, START, START + timedelta(hours=3))
+
+        assert service.hold(1, START + timedelta(hours=1), START + timedelta(hours=4))
+        assert not redis_client.exists("slot_hold:2030060112")
+
+    def test_release_keeps_buckets_of_other_owners(self, service, redis_client):
+        service.hold(1, START, START + timedelta(hours=1))
+        # Bucket expired and was taken by someone else
+        redis_client.set("slot_hold:2030060112", 2)
+
+        service.release(1)
+
+        assert redis_client.keys("*") == ["slot_hold:2030060112"]
+        assert redis_client.get("slot_hold:2030060112") == "2"
+
+    def test_held_intervals_merge_buckets_and_skip_own(self, service):
+        service.hold(1, START, START + timedelta(hours=3))
+        day_start = datetime.combine(START.date(), time(0, 0))
+
+        intervals = service.get_held_intervals(day_start, day_start + timedelta(days=1))
+
+        assert intervals == [(START - timedelta(hours=2), START + timedelta(hours=5))]
+        assert service.get_held_intervals(day_start, day_start + timedelta(days=1), except_owner=1) == []
+
+    def test_without_redis_holds_always_succeed(self):
+        service = SlotHoldService.__wrapped__()
+        service._get_client = lambda: None
+
+        assert service.hold(1, START, START + timedelta(hours=1))
+        assert service.get_held_intervals(START, START + timedelta(days=1)) == []
+
+
+class TestAvailabilityWithHolds:
+    """Test that the booking calendars treat other users' holds as busy."""
+
+    @pytest.mark.asyncio
+    async def test_free_slots_exclude_held_time(self, service):
+        day = date.today() + timedelta(days=10)
+        start = datetime.combine(day, time(12, 0))
+        service.hold(1, start, start + timedelta(hours=4))
+        availability = AvailabilityService.__wrapped__()
+        availability.load([])
+        availability._slot_hold_service = service
+
+        other_slots = await availability.get_free_time_slots(day, hold_owner=2)
+        own_slots = await availability.get_free_time_slots(day, hold_owner=1)
+
+        assert len(own_slots) == 24
+        # 10:00-18:00 is busy for everyone else (hold plus cleaning on both sides)
+        assert [start for start, _ in other_slots if time(10, 0) <= start < time(18, 0)] == []
+        assert (time(9, 0), time(10, 0)) in other_slots
@@ -0,0 +1,150 @@
+import pytest
+import pytest_asyncio
+import sys
+import os
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from src.services.database_service import DatabaseService
+from src.services.database import BookingRepository, GiftRepository, StatisticsRepository, UserRepository
+from src.services.statistics_service import StatisticsService
+from src.models.enum.tariff import Tariff
+from db.models.base import Base
+from db.models.booking import BookingBase
+from db.models.gift import GiftBase
+from db.models.user import UserBase
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'statistics.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    Session = async_sessionmaker(bind=engine, expire_on_commit=False)
+    now = datetime.now()
+    async with Session() as session:
+        users = [
+            UserBase(contact="a", has_bookings=True, completed_bookings=1),
+            UserBase(contact="b", has_bookings=True, is_active=False),
+            UserBase(contact="c"),
+        ]
+        session.add_all(users)
+        await session.flush()
+
+        def booking(days, price, **flags):
+            start = now + timedelta(days=days)
+            return BookingBase(
+                user_id=users[0].id,
+                start_date=start,
+                end_date=start + timedelta(hours=12),
+                tariff=Tariff.DAY,
+                number_of_guests=2,
+                price=price,
+                is_prepaymented=flags.get("is_prepaymented", True),
+                is_done=flags.get("is_done", False),
+                is_canceled=flags.get("is_canceled", False),
+            )
+
+        session.add_all(
+            [
+                booking(0, 300, is_done=True),
+                booking(0, 200),
+                booking(-400, 500, is_done=True),
+                booking(-400, 100, is_canceled=True),
+                booking(1, 900, is_prepaymented=False),
+                GiftBase(buyer_contact="a", date_expired=now, tariff=Tariff.DAY, price=150, is_paymented=True, code="G1"),
+                GiftBase(buyer_contact="b", date_expired=now, tariff=Tariff.DAY, price=250, is_paymented=True, is_done=True, code="G2"),
+                GiftBase(buyer_contact="c", date_expired=now, tariff=Tariff.DAY, price=350, code="G3"),
+            ]
+        )
+        await session.commit()
+
+    yield engine, Session
+    await engine.dispose()
+
+
+@pytest.fixture
+def repositories(session_factory):
+    engine, Session = session_factory
+    repositories = []
+    for repository_class in (StatisticsRepository, BookingRepository, UserRepository, GiftRepository):
+        repository = repository_class.__wrapped__.__new__(repository_class.__wrapped__)
+        repository.engine = engine
+        repository.Session = Session
+        repositories.append(repository)
+    return repositories
+
+
+class TestStatisticsRepository:
+    """Test the single-statement statistics aggregates."""
+
+    @pytest.mark.asyncio
+    async def test_booking_statistics_match_per_metric_queries(self, repositories):
+        statistics_repository, booking_repository, _, _ = repositories
+        now = datetime.now()
+        periods = {
+            "all_time": (None, None),
+            "recent": (now - timedelta(days=30), now + timedelta(days=30)),
+        }
+
+        result = await statistics_repository.get_booking_statistics(periods)
+
+        for name, (start, end) in periods.items():
+            assert result[name] == {
+                "total": await booking_repository.get_bookings_count_by_period(start, end),
+                "completed": await booking_repository.get_bookings_count_by_period(start, end, True),
+                "canceled": await booking_repository.get_canceled_bookings_count(start, end),
+                "active": await booking_repository.get_active_bookings_count(start, end),
+                "revenue": await booking_repository.get_revenue_by_period(start, end),
+            }
+        assert result["all_time"]["total"] == 4
+        assert result["recent"]["revenue"] == 300
+
+    @pytest.mark.asyncio
+    async def test_booking_statistics_is_one_query(self, session_factory, repositories):
+        engine, _ = session_factory
+        statements = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        await repositories[0].get_booking_statistics({"a": (None, None), "b": (datetime.now(), None)})
+
+        assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+
+    @pytest.mark.asyncio
+    async def test_user_and_gift_statistics(self, repositories):
+        assert await repositories[0].get_user_and_gift_statistics() == {
+            "total_users": 3,
+            "active_users": 2,
+            "deactivated_users": 1,
+            "users_with_bookings": 2,
+            "users_with_completed": 1,
+            "total_gifts": 3,
+            "paid_gifts": 2,
+            "used_gifts": 1,
+            "gift_revenue": 400.0,
+        }
+
+
+class TestStatisticsService:
+    """Test the /statistics report built from the aggregates."""
+
+    @pytest.mark.asyncio
+    async def test_complete_statistics(self, repositories):
+        service = StatisticsService.__wrapped__.__new__(StatisticsService.__wrapped__)
+        service.db = DatabaseService.__wrapped__.__new__(DatabaseService.__wrapped__)
+        service.db.statistics_repository = repositories[0]
+
+        statistics = await service.get_complete_statistics()
+
+        assert statistics.all_time.total_bookings == 4
+        assert statistics.all_time.completed_bookings == 2
+        assert statistics.all_time.average_price == 400
+        assert statistics.current_month.total_bookings == 2
+        assert statistics.users.conversion_rate == pytest.approx(200 / 3)
+        assert statistics.users.avg_bookings_per_user == 2
+        assert statistics.gifts.unused_gifts == 1
+        assert statistics.total_revenue == 1200